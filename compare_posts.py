@@ -8,6 +8,7 @@ sys.stdout.reconfigure(encoding='utf-8') if hasattr(sys.stdout, 'reconfigure') e
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from crowdwave_engine.crowdwave import CrowdwaveEngine
+from crowdwave_engine.variants import compare_variants
 
 engine = CrowdwaveEngine()
 
@@ -62,38 +63,46 @@ questions = [
     },
 ]
 
-print('\n' + '='*60)
-print('POST A: Origin Story (Founder narrative)')
-print('='*60)
-print('"I\'ve spent much of my career doing market research..."')
-print('- Personal journey, Harvard podcast, tension with AI')
-print('- ~280 words, narrative style')
-
-result_a = engine.simulate(config, questions)
-scores_a = {}
-for qr in result_a.results:
-    print(f"\n{qr.question_text[:50]}...")
-    for opt, pct in qr.distribution.items():
-        print(f"   {opt}: {pct:.1f}%")
-        if "Yes" in opt or "hooked" in opt or "clear" in opt or "differentiated" in opt:
-            scores_a[qr.question_id] = pct
+variants = [
+    {
+        "name": "Post A",
+        "title": "Origin Story (Founder narrative)",
+        "message": "I've spent much of my career doing market research...",
+        "notes": ["Personal journey, Harvard podcast, tension with AI", "~280 words, narrative style"],
+    },
+    {
+        "name": "Post B",
+        "title": "Simulation Results (Demo/data)",
+        "message": "Crowdwave Simulated Feedback: LinkedIn Message...",
+        "notes": ["Tables, percentages, ChatGPT prompt", "~200 words, technical format"],
+    },
+]
 
-print('\n' + '='*60)
-print('POST B: Simulation Results (Demo/data)')
-print('='*60)
-print('"Crowdwave Simulated Feedback: LinkedIn Message..."')
-print('- Tables, percentages, ChatGPT prompt')
-print('- ~200 words, technical format')
+# Both posts against the same questions in one batched comparison
+comparison = compare_variants(
+    config,
+    [{"name": v["name"], "message": v["message"]} for v in variants],
+    questions,
+    engine=engine,
+)
 
-result_b = engine.simulate(config, questions)
-scores_b = {}
-for qr in result_b.results:
-    print(f"\n{qr.question_text[:50]}...")
-    for opt, pct in qr.distribution.items():
-        print(f"   {opt}: {pct:.1f}%")
-        if "Yes" in opt or "hooked" in opt or "clear" in opt or "differentiated" in opt:
-            scores_b[qr.question_id] = pct
+for variant, report in zip(variants, comparison.reports):
+    print('\n' + '='*60)
+    print(f"{variant['name'].upper()}: {variant['title']}")
+    print('='*60)
+    print(f'"{variant["message"]}"')
+    for note in variant["notes"]:
+        print(f"- {note}")
+    for qr in report.results:
+        print(f"\n{qr.question_text[:50]}...")
+        for opt, pct in qr.distribution.items():
+            print(f"   {opt}: {pct:.1f}%")
 
 print('\n' + '='*60)
 print('COMPARISON SUMMARY')
 print('='*60)
+for question_id in comparison.question_ids:
+    for d in comparison.ranked(question_id):
+        flag = "significant" if d.significant else "not significant"
+        print(f"{question_id}: {d.metric} {d.variant} {d.value:.1f} vs {comparison.baseline} "
+              f"{d.baseline:.1f} ({d.delta:+.1f}, p={d.p_value:.3f}, {flag})")
@@ -14,92 +14,154 @@ API Server:
     run_server(port=8000)
 """
 
-from .crowdwave import (
-    CrowdwaveEngine,
-    SurveyConfig,
-    Question,
-    SimulationResult,
-    SimulationReport,
-)
-
-from .calibration import (
-    AccuracyZone,
-    NPS_BENCHMARKS,
-    DEMOGRAPHIC_MULTIPLIERS,
-    EXECUTIVE_MULTIPLIERS,
-    CONSTRUCT_CORRECTIONS,
-    get_benchmark,
-    get_nps_benchmark,
-    requires_partisan_segmentation,
-)
-
-from .bias_corrections import (
-    BiasType,
-    detect_biases,
-    validate_distribution,
-)
-
-from .prompts import (
-    build_simulation_prompt,
-    get_quick_calibration_insert,
-)
-
-# LLM integration (optional - requires anthropic/openai packages)
-try:
-    from .llm_integration import (
-        EnhancedCrowdwaveEngine,
-        PriorSearcher,
-        create_enhanced_engine,
-    )
-    LLM_AVAILABLE = True
-except ImportError:
-    LLM_AVAILABLE = False
-    EnhancedCrowdwaveEngine = None
-    PriorSearcher = None
-    create_enhanced_engine = None
-
-# Evaluation framework
-from .evaluation import (
-    EvaluationTracker,
-    CalibrationMetrics,
-    PredictionRecord,
-    calculate_mae,
-    calculate_mape,
-    calculate_rmse,
-    calculate_calibration_score,
-)
-
-# Distribution generators
-from .distributions import (
-    generate_beta_distribution,
-    generate_truncated_normal,
-    generate_skewed_distribution,
-    generate_bimodal_distribution,
-    generate_nps_distribution,
-    generate_likert_distribution,
-    calculate_distribution_stats,
-    adjust_distribution_for_bias,
-)
-
-# Batch processing
-from .batch import (
-    BatchProcessor,
-    BatchJob,
-    BatchResult,
-    run_batch_from_file,
-)
-
-# Client (optional - requires requests)
-try:
-    from .client import (
-        CrowdwaveClient,
-        quick_simulate,
-    )
-    CLIENT_AVAILABLE = True
-except ImportError:
-    CLIENT_AVAILABLE = False
-    CrowdwaveClient = None
-    quick_simulate = None
+from importlib import import_module
+
+# Public names are resolved on first access (PEP 562) so that
+# `import crowdwave_engine`, the CLI and serverless cold starts only pay
+# for the subsystems they actually touch. numpy (metrics), sqlite3
+# (evaluation_store), concurrent.futures (batch) and the LLM SDKs are
+# never imported by a bare package import.
+_LAZY_ATTRS = {
+    # Main engine
+    "CrowdwaveEngine": "crowdwave",
+    "SurveyConfig": "crowdwave",
+    "Question": "crowdwave",
+    "SimulationResult": "crowdwave",
+    "SimulationReport": "crowdwave",
+    "CompiledSurvey": "crowdwave",
+    "AudienceComparison": "crowdwave",
+    "SegmentedReport": "crowdwave",
+
+    # Calibration
+    "AccuracyZone": "calibration",
+    "NPS_BENCHMARKS": "calibration",
+    "DEMOGRAPHIC_MULTIPLIERS": "calibration",
+    "EXECUTIVE_MULTIPLIERS": "calibration",
+    "CONSTRUCT_CORRECTIONS": "calibration",
+    "get_benchmark": "calibration",
+    "get_nps_benchmark": "calibration",
+    "requires_partisan_segmentation": "calibration",
+
+    # Bias corrections
+    "BiasType": "bias_corrections",
+    "detect_biases": "bias_corrections",
+    "validate_distribution": "bias_corrections",
+
+    # Prompts
+    "build_simulation_prompt": "prompts",
+    "get_quick_calibration_insert": "prompts",
+
+    # LLM integration (optional - requires anthropic/openai packages)
+    "EnhancedCrowdwaveEngine": "llm_integration",
+    "PriorSearcher": "llm_integration",
+    "create_enhanced_engine": "llm_integration",
+
+    # Evaluation framework
+    "EvaluationTracker": "evaluation",
+    "CalibrationMetrics": "evaluation",
+    "PredictionRecord": "evaluation",
+    "calculate_mae": "evaluation",
+    "calculate_mape": "evaluation",
+    "calculate_rmse": "evaluation",
+    "calculate_calibration_score": "evaluation",
+    "SQLiteEvaluationTracker": "evaluation_store",
+    "migrate_json_to_sqlite": "evaluation_store",
+    "MetricEstimate": "metrics",
+    "bootstrap_mean": "metrics",
+    "bootstrap_group_means": "metrics",
+    "bootstrap_ece": "metrics",
+
+    # Distribution generators
+    "generate_beta_distribution": "distributions",
+    "generate_truncated_normal": "distributions",
+    "generate_skewed_distribution": "distributions",
+    "generate_bimodal_distribution": "distributions",
+    "generate_nps_distribution": "distributions",
+    "generate_likert_distribution": "distributions",
+    "calculate_distribution_stats": "distributions",
+    "adjust_distribution_for_bias": "distributions",
+    "DistributionBatch": "distributions",
+    "beta_distributions": "distributions",
+    "truncated_normal_distributions": "distributions",
+    "skewed_distributions": "distributions",
+    "bimodal_distributions": "distributions",
+    "nps_distributions": "distributions",
+    "DistributionFit": "distributions",
+    "fit_distributions": "distributions",
+    "fit_distribution": "distributions",
+
+    # Calibration retrieval
+    "CalibrationIndex": "retrieval",
+
+    # Variant comparison
+    "compare_variants": "variants",
+    "VariantComparison": "variants",
+
+    # Scenario sweeps
+    "sweep": "scenarios",
+    "SweepResult": "scenarios",
+
+    # Incremental re-simulation
+    "IncrementalSimulator": "incremental",
+    "IncrementalReport": "incremental",
+
+    # Compact result storage
+    "CompactResults": "compact",
+
+    # Respondent synthesis
+    "CopulaSampler": "respondents",
+    "construct_correlation": "respondents",
+
+    # Batch processing
+    "BatchProcessor": "batch",
+    "BatchJob": "batch",
+    "BatchResult": "batch",
+    "run_batch_from_file": "batch",
+
+    # Client (optional - requires requests)
+    "CrowdwaveClient": "client",
+    "quick_simulate": "client",
+}
+
+# Subsystems whose names resolve to None (and whose *_AVAILABLE flag is
+# False) when their third-party dependencies are missing.
+_OPTIONAL_MODULES = {
+    "LLM_AVAILABLE": "llm_integration",
+    "CLIENT_AVAILABLE": "client",
+}
+
+
+def _load_optional(module: str):
+    try:
+        return import_module(f".{module}", __name__)
+    except ImportError:
+        return None
+
+
+def __getattr__(name):
+    if name in _OPTIONAL_MODULES:
+        available = _load_optional(_OPTIONAL_MODULES[name]) is not None
+        globals()[name] = available
+        return available
+
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if module in _OPTIONAL_MODULES.values():
+        loaded = _load_optional(module)
+        value = getattr(loaded, name) if loaded is not None else None
+    else:
+        value = getattr(import_module(f".{module}", __name__), name)
+
+    # Cache so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_OPTIONAL_MODULES))
+
 
 __version__ = "1.0.2"
 __author__ = "Crowdwave"
@@ -111,6 +173,9 @@ __all__ = [
     "Question",
     "SimulationResult",
     "SimulationReport",
+    "CompiledSurvey",
+    "AudienceComparison",
+    "SegmentedReport",
     
     # Calibration
     "AccuracyZone",
@@ -139,6 +204,12 @@ __all__ = [
     "calculate_mape",
     "calculate_rmse",
     "calculate_calibration_score",
+    "SQLiteEvaluationTracker",
+    "migrate_json_to_sqlite",
+    "MetricEstimate",
+    "bootstrap_mean",
+    "bootstrap_group_means",
+    "bootstrap_ece",
     
     # Distributions
     "generate_beta_distribution",
@@ -149,6 +220,37 @@ __all__ = [
     "generate_likert_distribution",
     "calculate_distribution_stats",
     "adjust_distribution_for_bias",
+    "DistributionBatch",
+    "beta_distributions",
+    "truncated_normal_distributions",
+    "skewed_distributions",
+    "bimodal_distributions",
+    "nps_distributions",
+    "DistributionFit",
+    "fit_distributions",
+    "fit_distribution",
+    
+    # Calibration retrieval
+    "CalibrationIndex",
+    
+    # Variant comparison
+    "compare_variants",
+    "VariantComparison",
+    
+    # Scenario sweeps
+    "sweep",
+    "SweepResult",
+    
+    # Incremental re-simulation
+    "IncrementalSimulator",
+    "IncrementalReport",
+    
+    # Compact result storage
+    "CompactResults",
+    
+    # Respondent synthesis
+    "CopulaSampler",
+    "construct_correlation",
     
     # Batch processing
     "BatchProcessor",
@@ -19,12 +19,13 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-from .crowdwave import CrowdwaveEngine
 from .calibration import get_nps_benchmark, requires_partisan_segmentation, NPS_BENCHMARKS
 
 
 def cmd_simulate(args):
     """Run a quick simulation."""
+    from .crowdwave import CrowdwaveEngine
+    
     engine = CrowdwaveEngine()
     
     config = {
@@ -81,7 +82,12 @@ def cmd_server(args):
     try:
         from .api import run_server
         print(f"🚀 Starting Crowdwave API server on port {args.port}...")
-        run_server(host=args.host or "0.0.0.0", port=args.port or 8000)
+        run_server(
+            host=args.host or "0.0.0.0",
+            port=args.port or 8000,
+            profile=args.profile,
+            calibration_snapshot=args.calibration,
+        )
     except ImportError as e:
         print(f"Error: {e}")
         print("Install API dependencies: pip install crowdwave-engine[api]")
@@ -147,6 +153,38 @@ def cmd_partisan(args):
         print("   Results may differ by 20-40 points across parties.")
 
 
+def cmd_calibration(args):
+    """Build or verify a precompiled calibration snapshot, or regenerate pipeline outputs."""
+    from .calibration_snapshot import SnapshotError, build_snapshot, verify_snapshot
+    
+    if args.action == "pipeline":
+        from .pipeline_table import build_pipeline_outputs
+        entries = build_pipeline_outputs()
+        print(f"\n✅ Pipeline outputs regenerated")
+        print(f"   Entries: {entries}")
+        return
+    
+    if args.action == "build":
+        checksum = build_snapshot(args.path, version=args.version)
+        info = verify_snapshot(args.path)
+        print(f"\n✅ Calibration snapshot built")
+        print(f"   Path: {info['path']}")
+        print(f"   Version: {info['version']}")
+        print(f"   Tables: {info['tables']} ({info['bytes']:,} bytes)")
+        print(f"   SHA-256: {checksum}")
+        return
+    
+    try:
+        info = verify_snapshot(args.path)
+    except (OSError, SnapshotError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"\n✅ Calibration snapshot OK")
+    print(f"   Version: {info['version']}")
+    print(f"   Tables: {info['tables']}")
+    print(f"   SHA-256: {info['checksum']}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Crowdwave Survey Simulation Engine",
@@ -171,6 +209,12 @@ Examples:
 
   # Check partisan requirement
   python -m crowdwave_engine partisan "climate change policy"
+
+  # Precompile calibration tables for workers
+  python -m crowdwave_engine calibration build calibration.cwsnap --version 2026.02
+
+  # Regenerate precomputed outputs for calibrated distributions
+  python -m crowdwave_engine calibration pipeline
 """
     )
     
@@ -193,6 +237,10 @@ Examples:
     srv_parser = subparsers.add_parser("server", help="Start API server")
     srv_parser.add_argument("-p", "--port", type=int, default=8000, help="Port")
     srv_parser.add_argument("--host", default="0.0.0.0", help="Host")
+    srv_parser.add_argument("--profile", action="store_true",
+                            help="Record per-phase timings (served at /profile)")
+    srv_parser.add_argument("--calibration", metavar="SNAPSHOT",
+                            help="Serve this calibration snapshot and hot-reload it on change")
     
     # Batch command
     batch_parser = subparsers.add_parser("batch", help="Run batch processing")
@@ -209,6 +257,13 @@ Examples:
     part_parser = subparsers.add_parser("partisan", help="Check partisan segmentation")
     part_parser.add_argument("topic", help="Topic to check")
     
+    # Calibration snapshot command
+    cal_parser = subparsers.add_parser("calibration", help="Build or verify a calibration snapshot")
+    cal_parser.add_argument("action", choices=["build", "verify", "pipeline"],
+                            help="Action (pipeline regenerates pipeline_outputs.py)")
+    cal_parser.add_argument("path", nargs="?", default="calibration.cwsnap", help="Snapshot file")
+    cal_parser.add_argument("--version", help="Version label to embed (build only)")
+    
     args = parser.parse_args()
     
     if args.command == "simulate":
@@ -221,6 +276,8 @@ Examples:
         cmd_benchmark(args)
     elif args.command == "partisan":
         cmd_partisan(args)
+    elif args.command == "calibration":
+        cmd_calibration(args)
     else:
         parser.print_help()
 
@@ -5,9 +5,11 @@ Generate detailed accuracy reports for simulation validation.
 
 import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from . import metrics
+
 
 @dataclass
 class CalibrationRecord:
@@ -20,6 +22,7 @@ class CalibrationRecord:
     date: str
     passed: bool
     error: float
+    accuracy_zone: str = "unknown"
 
 
 @dataclass
@@ -33,6 +36,14 @@ class AccuracyReport:
     calibrations: List[CalibrationRecord]
     sources_used: List[str]
     coverage_areas: List[str]
+    error_by_type: Dict[str, float] = field(default_factory=dict)
+    error_by_zone: Dict[str, float] = field(default_factory=dict)
+    error_by_topic: Dict[str, float] = field(default_factory=dict)
+    # Populated by generate_report(confidence_intervals=True)
+    mae_ci: Optional[Tuple[float, float]] = None
+    error_by_type_ci: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    error_by_zone_ci: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    error_by_topic_ci: Dict[str, Tuple[float, float]] = field(default_factory=dict)
 
 
 class AccuracyReporter:
@@ -49,7 +60,8 @@ class AccuracyReporter:
         predicted: float,
         actual: float,
         source: str,
-        tolerance: float = 5.0
+        tolerance: float = 5.0,
+        accuracy_zone: str = "unknown"
     ):
         """Add a calibration validation result."""
         error = abs(predicted - actual)
@@ -63,23 +75,41 @@ class AccuracyReporter:
             source=source,
             date=datetime.now().strftime("%Y-%m-%d"),
             passed=passed,
-            error=error
+            error=error,
+            accuracy_zone=accuracy_zone
         )
         
         self.calibrations.append(record)
         self.sources.add(source)
     
-    def generate_report(self) -> AccuracyReport:
-        """Generate a comprehensive accuracy report."""
+    def generate_report(
+        self,
+        confidence_intervals: bool = False,
+        n_resamples: int = 1000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None
+    ) -> AccuracyReport:
+        """
+        Generate a comprehensive accuracy report.
+        
+        Binary (percentage) and scale (points) errors are on different
+        scales, so the report also breaks MAE down by question type, as
+        well as by accuracy zone and topic.
+        """
         total = len(self.calibrations)
         passed = sum(1 for c in self.calibrations if c.passed)
         
         errors = [c.error for c in self.calibrations]
+        breakdowns = {
+            "type": [c.question_type for c in self.calibrations],
+            "zone": [c.accuracy_zone for c in self.calibrations],
+            "topic": [c.topic for c in self.calibrations],
+        }
         mae = sum(errors) / len(errors) if errors else 0
         
         coverage = list(set(c.topic for c in self.calibrations))
         
-        return AccuracyReport(
+        report = AccuracyReport(
             generated_at=datetime.now().isoformat(),
             total_calibrations=total,
             passed_calibrations=passed,
@@ -87,8 +117,24 @@ class AccuracyReporter:
             mean_absolute_error=mae,
             calibrations=self.calibrations,
             sources_used=list(self.sources),
-            coverage_areas=coverage
+            coverage_areas=coverage,
         )
+        for name, groups in breakdowns.items():
+            setattr(report, f"error_by_{name}", metrics.group_means(errors, groups))
+        
+        if confidence_intervals and errors:
+            report.mae_ci = metrics.bootstrap_mean(
+                errors, n_resamples, confidence, seed
+            ).ci
+            for name, groups in breakdowns.items():
+                setattr(report, f"error_by_{name}_ci", {
+                    group: estimate.ci
+                    for group, estimate in metrics.bootstrap_group_means(
+                        errors, groups, n_resamples, confidence, seed
+                    ).items()
+                })
+        
+        return report
     
     def to_markdown(self, report: AccuracyReport) -> str:
         """Convert report to markdown format."""
@@ -103,8 +149,17 @@ Generated: {report.generated_at}
 | Total Calibrations | {report.total_calibrations} |
 | Passed | {report.passed_calibrations} |
 | Pass Rate | {report.pass_rate:.1%} |
-| Mean Absolute Error | {report.mean_absolute_error:.2f} |
+| Mean Absolute Error | {report.mean_absolute_error:.2f}{_format_ci(report.mae_ci)} |
+"""
+        for qtype, error in sorted(report.error_by_type.items()):
+            ci = _format_ci(report.error_by_type_ci.get(qtype))
+            md += f"| MAE ({qtype}) | {error:.2f}{ci} |\n"
+        if set(report.error_by_zone) != {"unknown"}:
+            for zone, error in sorted(report.error_by_zone.items()):
+                ci = _format_ci(report.error_by_zone_ci.get(zone))
+                md += f"| MAE (zone {zone}) | {error:.2f}{ci} |\n"
 
+        md += f"""
 ## Calibrations
 
 | Topic | Type | Predicted | Actual | Error | Status |
@@ -139,6 +194,19 @@ Generated: {report.generated_at}
                 "passed_calibrations": report.passed_calibrations,
                 "pass_rate": report.pass_rate,
                 "mean_absolute_error": report.mean_absolute_error,
+                "mae_ci": list(report.mae_ci) if report.mae_ci else None,
+                "error_by_type": report.error_by_type,
+                "error_by_type_ci": {
+                    qtype: list(ci) for qtype, ci in report.error_by_type_ci.items()
+                },
+                "error_by_zone": report.error_by_zone,
+                "error_by_zone_ci": {
+                    zone: list(ci) for zone, ci in report.error_by_zone_ci.items()
+                },
+                "error_by_topic": report.error_by_topic,
+                "error_by_topic_ci": {
+                    topic: list(ci) for topic, ci in report.error_by_topic_ci.items()
+                },
             },
             "calibrations": [
                 {
@@ -150,6 +218,7 @@ Generated: {report.generated_at}
                     "date": c.date,
                     "passed": c.passed,
                     "error": c.error,
+                    "accuracy_zone": c.accuracy_zone,
                 }
                 for c in report.calibrations
             ],
@@ -159,6 +228,10 @@ Generated: {report.generated_at}
         return json.dumps(data, indent=2)
 
 
+def _format_ci(ci: Optional[Tuple[float, float]]) -> str:
+    return f" (CI {ci[0]:.2f}-{ci[1]:.2f})" if ci else ""
+
+
 def generate_current_report() -> AccuracyReport:
     """Generate report based on current calibrations."""
     reporter = AccuracyReporter()
@@ -3,16 +3,21 @@ Crowdwave API Wrapper
 FastAPI-based REST API for survey simulation.
 """
 
+import asyncio
+import hashlib
 import json
-from typing import Dict, List, Optional, Any
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 # Check if FastAPI is available
 try:
-    from fastapi import FastAPI, HTTPException
+    from fastapi import FastAPI, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import FileResponse
+    from fastapi.responses import FileResponse, PlainTextResponse
+    from starlette.concurrency import run_in_threadpool
     from pydantic import BaseModel
     import os
     FASTAPI_AVAILABLE = True
@@ -21,13 +26,11 @@ except ImportError:
     BaseModel = object  # Fallback
 
 from .crowdwave import CrowdwaveEngine
-from .calibration import (
-    get_nps_benchmark,
-    requires_partisan_segmentation,
-    DEMOGRAPHIC_MULTIPLIERS,
-    EXECUTIVE_MULTIPLIERS,
-    NPS_BENCHMARKS,
-)
+from .incremental import IncrementalSimulator
+from .calibration_registry import CalibrationRegistry, default_registry
+from .calibration_snapshot import SnapshotError
+from .profiling import SimulationProfiler
+from .telemetry import REGISTRY, MetricsRegistry, _escape, profiler_collector, record_cache
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -54,6 +57,7 @@ if FASTAPI_AVAILABLE:
     class SimulationRequest(BaseModel):
         config: SurveyConfig
         questions: List[QuestionInput]
+        timeout: Optional[float] = None  # seconds; overrides the server default
 
     class BenchmarkRequest(BaseModel):
         industry: str
@@ -67,12 +71,134 @@ if FASTAPI_AVAILABLE:
         distribution: Dict[str, float]
 
 
+# ═══════════════════════════════════════════════════════════════
+# REQUEST COALESCING
+# ═══════════════════════════════════════════════════════════════
+
+def payload_key(*parts: Any) -> str:
+    """Hash of JSON-serializable parts, independent of dict key order."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CoalescingCache:
+    """
+    Single-flight execution of identical requests, with a short-TTL
+    cache of their responses behind it.
+    
+    Concurrent get() calls with the same key share one computation.
+    Each caller waits with its own timeout, and a caller that times out
+    or is cancelled leaves the others waiting. The computation itself
+    is cancelled only once every caller has gone; for /simulate that
+    stops a simulation still queued for a worker slot, while one already
+    running in a worker thread finishes under its slot (see
+    run_simulation in create_app) and its result is dropped. Successful responses
+    are then served from the cache for `ttl` seconds; failures are not
+    cached. Lookups are recorded as hits or misses of the "result"
+    cache. A call that joins an in-flight computation counts as a hit.
+    """
+    
+    def __init__(self, ttl: float = 2.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    def clear(self):
+        self._cache.clear()
+    
+    async def get(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """The cached or shared response for `key`, computing it if needed."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                record_cache("result", True)
+                return entry[1]
+            del self._cache[key]
+        
+        task = self._inflight.get(key)
+        record_cache("result", task is not None)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._finish(key, done))
+        
+        self._waiters[key] += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        finally:
+            self._leave(key, task)
+    
+    def _leave(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is not task:
+            return
+        self._waiters[key] -= 1
+        if self._waiters[key] == 0 and not task.done():
+            # Nobody is waiting any more: stop the computation, and let
+            # the next identical request start a fresh one
+            del self._inflight[key]
+            del self._waiters[key]
+            task.cancel()
+    
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._waiters[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.ttl > 0:
+            self._cache[key] = (time.monotonic() + self.ttl, task.result())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+
 # ═══════════════════════════════════════════════════════════════
 # API SETUP
 # ═══════════════════════════════════════════════════════════════
 
-def create_app() -> 'FastAPI':
-    """Create and configure the FastAPI application."""
+def create_app(
+    profile: bool = False,
+    max_concurrent_simulations: int = 4,
+    calibration: Optional[CalibrationRegistry] = None,
+    max_surveys: int = 1024,
+    result_cache_ttl: float = 2.0,
+    simulation_timeout: Optional[float] = None
+) -> 'FastAPI':
+    """
+    Create and configure the FastAPI application.
+    
+    Per-phase simulation timings are always collected and served from
+    GET /profile and GET /metrics. With profile=True, the matched
+    base-distribution rule of every question is also traced.
+    
+    Simulations run in a worker thread pool, at most
+    `max_concurrent_simulations` at a time; further requests queue.
+    
+    Calibration data comes from `calibration` (default: the process-wide
+    registry). GET /calibration reports the active version and
+    POST /calibration/reload re-reads the watched snapshot without a restart;
+    simulations already running finish on the version they started with.
+    
+    POST /surveys/{survey_id}/simulate keeps the last report of up to
+    `max_surveys` surveys and re-simulates only edited questions.
+    
+    Identical concurrent POST /simulate requests share one simulation,
+    and responses are reused for `result_cache_ttl` seconds (0 disables
+    reuse; see CoalescingCache). A request waits at most its `timeout`
+    (default `simulation_timeout`, None for no limit) and gets a 504
+    after that.
+    """
     if not FASTAPI_AVAILABLE:
         raise ImportError("FastAPI not installed. Run: pip install fastapi uvicorn")
     
@@ -94,13 +220,72 @@ def create_app() -> 'FastAPI':
     )
     
     # Initialize engine
-    engine = CrowdwaveEngine()
+    profiler = SimulationProfiler(trace_rules=profile)
+    registry = calibration or default_registry()
+    engine = CrowdwaveEngine(profiler=profiler, calibration=registry)
+    incremental = IncrementalSimulator(engine, max_surveys=max_surveys)
+    simulation_slots = asyncio.Semaphore(max_concurrent_simulations)
+    responses = CoalescingCache(ttl=result_cache_ttl)
+    
+    # Operational metrics (GET /metrics)
+    metrics = MetricsRegistry()
+    request_latency = metrics.histogram(
+        "crowdwave_http_request_duration_seconds",
+        "HTTP request latency by route.",
+        ("method", "route"),
+    )
+    requests_total = metrics.counter(
+        "crowdwave_http_requests_total",
+        "HTTP requests by route and status code.",
+        ("method", "route", "status"),
+    )
+    errors_total = metrics.counter(
+        "crowdwave_http_errors_total",
+        "HTTP requests that failed with a server error.",
+        ("route",),
+    )
+    simulations_in_flight = metrics.gauge(
+        "crowdwave_simulations_in_flight",
+        "Simulations currently running.",
+    )
+    simulation_queue_depth = metrics.gauge(
+        "crowdwave_simulation_queue_depth",
+        "Simulations waiting for a worker slot.",
+    )
+    metrics.add_collector(profiler_collector(profiler))
+    
+    def calibration_info() -> List[str]:
+        bundle = registry.current()
+        return [
+            "# HELP crowdwave_calibration_info Active calibration version.",
+            "# TYPE crowdwave_calibration_info gauge",
+            f'crowdwave_calibration_info{{version="{_escape(bundle.version)}",'
+            f'checksum="{_escape(bundle.checksum or "")}"}} 1',
+        ]
+    
+    metrics.add_collector(calibration_info)
     
     # Static files directory
     static_dir = os.path.join(os.path.dirname(__file__), "static")
     if os.path.exists(static_dir):
         app.mount("/static", StaticFiles(directory=static_dir), name="static")
     
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            # Label by route template so path parameters don't explode cardinality
+            route = getattr(request.scope.get("route"), "path", "unmatched")
+            request_latency.observe(time.perf_counter() - start, method=request.method, route=route)
+            requests_total.inc(method=request.method, route=route, status=str(status))
+            if status >= 500:
+                errors_total.inc(route=route)
+    
     # ═══════════════════════════════════════════════════════════════
     # ENDPOINTS
     # ═══════════════════════════════════════════════════════════════
@@ -139,63 +324,131 @@ def create_app() -> 'FastAPI':
             }
         }
     
+    def request_inputs(request: SimulationRequest):
+        """(config, questions) dicts for the engine from a simulation request."""
+        config = {
+            "audience": request.config.audience,
+            "geography": request.config.geography,
+            "sample_size": request.config.sample_size,
+            "topic": request.config.topic,
+            "screeners": request.config.screeners,
+            "stimuli": request.config.stimuli,
+        }
+        
+        questions = [
+            {
+                "id": q.id,
+                "text": q.text,
+                "type": q.type,
+                "options": q.options or [],
+                "scale": q.scale,
+                "labels": q.labels,
+            }
+            for q in request.questions
+        ]
+        return config, questions
+    
+    async def run_simulation(fn, *args):
+        """Run a simulation in the worker pool, waiting for a free slot."""
+        simulation_queue_depth.inc()
+        try:
+            await simulation_slots.acquire()
+        finally:
+            simulation_queue_depth.dec()
+        
+        # A worker thread can't be interrupted, so once started the work
+        # holds its slot until the thread returns, even if the caller is
+        # cancelled or times out; shielding keeps the slot and gauge honest
+        simulations_in_flight.inc()
+        work = asyncio.ensure_future(run_in_threadpool(fn, *args))
+        
+        def release(done):
+            simulations_in_flight.dec()
+            simulation_slots.release()
+            if not done.cancelled():
+                done.exception()  # retrieved here in case the caller has gone
+        
+        work.add_done_callback(release)
+        return await asyncio.shield(work)
+    
+    def report_payload(report) -> Dict[str, Any]:
+        """Convert a report to JSON-serializable format."""
+        results = []
+        for r in report.results:
+            results.append({
+                "question_id": r.question_id,
+                "question_text": r.question_text,
+                "distribution": r.distribution,
+                "mean": r.mean,
+                "sd": r.sd,
+                "confidence": r.confidence,
+                "accuracy_zone": r.accuracy_zone.value,
+                "biases_detected": r.biases_detected,
+                "corrections_applied": r.corrections_applied,
+                "warnings": r.validation_warnings,
+            })
+        
+        return {
+            "status": "success",
+            "calibration_version": report.calibration_version,
+            "overall_confidence": report.overall_confidence,
+            "flags": report.flags,
+            "results": results,
+        }
+    
     @app.post("/simulate")
     async def simulate(request: SimulationRequest):
         """
         Run a survey simulation.
         
         Returns calibrated distribution predictions with confidence scores.
+        Identical requests in flight at the same time, or repeated within
+        the result cache TTL, share one simulation.
         """
         try:
-            config = {
-                "audience": request.config.audience,
-                "geography": request.config.geography,
-                "sample_size": request.config.sample_size,
-                "topic": request.config.topic,
-                "screeners": request.config.screeners,
-                "stimuli": request.config.stimuli,
-            }
-            
-            questions = [
-                {
-                    "id": q.id,
-                    "text": q.text,
-                    "type": q.type,
-                    "options": q.options or [],
-                    "scale": q.scale,
-                    "labels": q.labels,
-                }
-                for q in request.questions
-            ]
+            config, questions = request_inputs(request)
+            bundle = registry.current()
+            key = payload_key(config, questions, bundle.version, bundle.checksum)
             
-            report = engine.simulate(config, questions)
+            async def compute():
+                return report_payload(await run_simulation(engine.simulate, config, questions))
             
-            # Convert to JSON-serializable format
-            results = []
-            for r in report.results:
-                results.append({
-                    "question_id": r.question_id,
-                    "question_text": r.question_text,
-                    "distribution": r.distribution,
-                    "mean": r.mean,
-                    "sd": r.sd,
-                    "confidence": r.confidence,
-                    "accuracy_zone": r.accuracy_zone.value,
-                    "biases_detected": r.biases_detected,
-                    "corrections_applied": r.corrections_applied,
-                    "warnings": r.validation_warnings,
-                })
+            timeout = request.timeout if request.timeout is not None else simulation_timeout
+            return await responses.get(key, compute, timeout)
             
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Simulation timed out")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    @app.post("/surveys/{survey_id}/simulate")
+    async def simulate_incremental(survey_id: str, request: SimulationRequest):
+        """
+        Re-simulate an edited survey, recomputing only the questions whose
+        inputs changed since its last run (see incremental.py).
+        
+        Returns the same payload as /simulate plus the ids of the
+        recomputed questions.
+        """
+        try:
+            config, questions = request_inputs(request)
+            update = await run_simulation(incremental.simulate, survey_id, config, questions)
             return {
-                "status": "success",
-                "overall_confidence": report.overall_confidence,
-                "flags": report.flags,
-                "results": results,
+                **report_payload(update.report),
+                "survey_id": survey_id,
+                "recomputed": update.recomputed,
             }
             
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
+    @app.delete("/surveys/{survey_id}")
+    async def forget_survey(survey_id: str):
+        """Drop a survey's cached report."""
+        if not incremental.forget(survey_id):
+            raise HTTPException(status_code=404, detail=f"Survey {survey_id!r} not found")
+        return {"status": "success", "survey_id": survey_id}
+    
     @app.post("/benchmark")
     async def benchmark(request: BenchmarkRequest):
         """
@@ -204,22 +457,18 @@ def create_app() -> 'FastAPI':
         Based on Survicate 2025 data (N=5.4M responses).
         """
         try:
-            nps = get_nps_benchmark(request.industry, request.b2b)
+            queries = registry.current().queries
+            nps = queries.nps_benchmark(request.industry, request.b2b)
             
-            # Get full industry data if available
-            industry_key = request.industry.lower().replace(" ", "_")
-            industry_data = None
-            for key, data in NPS_BENCHMARKS["by_industry"].items():
-                if industry_key in key:
-                    industry_data = data
-                    break
+            # Full data for the same industry entry the benchmark came from
+            match = queries.nps_industry(request.industry)
             
             return {
                 "industry": request.industry,
                 "b2b": request.b2b,
                 "nps_benchmark": nps,
-                "industry_data": industry_data,
-                "overall_median": NPS_BENCHMARKS["overall_median"],
+                "industry_data": match[1] if match else None,
+                "overall_median": queries.tables["NPS_BENCHMARKS"]["overall_median"],
                 "source": "Survicate NPS Benchmark 2025 (N=5.4M)"
             }
             
@@ -252,35 +501,85 @@ def create_app() -> 'FastAPI':
     @app.get("/calibrations")
     async def get_calibrations():
         """
-        Get available calibration multipliers.
+        Get available calibration multipliers from the active bundle.
         """
+        tables = registry.current().tables
+        executive = tables["EXECUTIVE_MULTIPLIERS"]
         return {
-            "demographics": list(DEMOGRAPHIC_MULTIPLIERS.keys()),
-            "executive_roles": list(EXECUTIVE_MULTIPLIERS.get("by_role", {}).keys()),
-            "executive_regions": list(EXECUTIVE_MULTIPLIERS.get("by_region", {}).keys()),
-            "industries_nps": list(NPS_BENCHMARKS["by_industry"].keys()),
+            "demographics": list(tables["DEMOGRAPHIC_MULTIPLIERS"].keys()),
+            "executive_roles": list(executive.get("by_role", {}).keys()),
+            "executive_regions": list(executive.get("by_region", {}).keys()),
+            "industries_nps": list(tables["NPS_BENCHMARKS"]["by_industry"].keys()),
         }
     
     @app.get("/calibrations/{category}")
     async def get_calibration_details(category: str):
         """
-        Get detailed calibration data for a category.
+        Get detailed calibration data for a category from the active bundle.
         """
+        tables = registry.current().tables
         if category == "demographics":
-            return DEMOGRAPHIC_MULTIPLIERS
+            return tables["DEMOGRAPHIC_MULTIPLIERS"]
         elif category == "executive":
-            return EXECUTIVE_MULTIPLIERS
+            return tables["EXECUTIVE_MULTIPLIERS"]
         elif category == "nps":
-            return NPS_BENCHMARKS
+            return tables["NPS_BENCHMARKS"]
         else:
             raise HTTPException(status_code=404, detail=f"Category not found: {category}")
     
+    @app.get("/calibration")
+    async def get_calibration_version():
+        """
+        Get the active calibration version, checksum and swap history.
+        """
+        return registry.info()
+    
+    @app.post("/calibration/reload")
+    async def reload_calibration():
+        """
+        Re-read the watched snapshot file from disk and activate it.
+        
+        Only the snapshot the server was started with (`--calibration`,
+        see CalibrationRegistry.watch) can be loaded; clients cannot name
+        a file.
+        """
+        path = registry.info()["watching"]
+        if not path:
+            raise HTTPException(status_code=400, detail="No calibration snapshot is being watched")
+        try:
+            await run_in_threadpool(registry.load, path)
+        except (OSError, SnapshotError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        return registry.info()
+    
+    @app.get("/profile")
+    async def get_profile(reset: bool = False):
+        """
+        Get aggregated per-phase simulation timings and rule-match counts.
+        """
+        snapshot = profiler.snapshot()
+        if reset:
+            profiler.reset()
+        return {"rule_tracing": profiler.trace_rules, **snapshot}
+    
+    @app.get("/metrics")
+    async def get_metrics():
+        """
+        Prometheus text-format metrics: request latency, in-flight and
+        queued simulations, cache hit ratios, LLM latency/tokens/errors
+        and per-phase simulation timings.
+        """
+        return PlainTextResponse(
+            metrics.render() + REGISTRY.render(),
+            media_type="text/plain; version=0.0.4",
+        )
+    
     @app.get("/check-partisan/{topic}")
     async def check_partisan(topic: str):
         """
         Check if a topic requires partisan segmentation.
         """
-        requires = requires_partisan_segmentation(topic)
+        requires = registry.current().queries.requires_partisan_segmentation(topic)
         return {
             "topic": topic,
             "requires_partisan_segmentation": requires,
@@ -294,15 +593,32 @@ def create_app() -> 'FastAPI':
 # STANDALONE SERVER
 # ═══════════════════════════════════════════════════════════════
 
-def run_server(host: str = "0.0.0.0", port: int = 8000):
-    """Run the API server."""
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    profile: bool = False,
+    calibration_snapshot: Optional[str] = None,
+    calibration_reload_interval: float = 5.0
+):
+    """
+    Run the API server.
+    
+    With `calibration_snapshot`, the snapshot is loaded at startup and
+    polled every `calibration_reload_interval` seconds; rebuilding it
+    hot-swaps the calibration data.
+    """
     try:
         import uvicorn
     except ImportError:
         print("uvicorn not installed. Run: pip install uvicorn")
         return
     
-    app = create_app()
+    registry = None
+    if calibration_snapshot:
+        registry = CalibrationRegistry()
+        registry.watch(calibration_snapshot, interval=calibration_reload_interval)
+    
+    app = create_app(profile=profile, calibration=registry)
     uvicorn.run(app, host=host, port=port)
 
 
@@ -12,6 +12,7 @@ from pathlib import Path
 import time
 
 from .crowdwave import CrowdwaveEngine, SimulationReport
+from .profiling import SimulationProfiler
 
 
 @dataclass
@@ -50,10 +51,14 @@ class BatchProcessor:
         
         # Export
         processor.export_csv(results, "output.csv")
+    
+    With profile=True, per-phase timings and matched rules are aggregated
+    across all jobs and reported under "profile" in summary().
     """
     
-    def __init__(self, max_workers: int = 4):
-        self.engine = CrowdwaveEngine()
+    def __init__(self, max_workers: int = 4, profile: bool = False):
+        self.profiler = SimulationProfiler() if profile else None
+        self.engine = CrowdwaveEngine(profiler=self.profiler)
         self.max_workers = max_workers
         self.jobs: List[BatchJob] = []
         
@@ -303,7 +308,7 @@ class BatchProcessor:
                             zones[z] += 1
                             break
         
-        return {
+        summary = {
             "total_jobs": total,
             "successful": successful,
             "failed": failed,
@@ -312,6 +317,11 @@ class BatchProcessor:
             "avg_duration_ms": avg_duration,
             "accuracy_zones": zones,
         }
+        
+        if self.profiler:
+            summary["profile"] = self.profiler.snapshot()
+        
+        return summary
     
     def clear(self):
         """Clear all jobs."""
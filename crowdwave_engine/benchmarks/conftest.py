@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the Crowdwave benchmark suite.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from crowdwave_engine import CrowdwaveEngine
+
+
+DEMO_SURVEY = Path(__file__).parent.parent / "examples" / "demo_survey.json"
+
+
+@pytest.fixture(scope="session")
+def engine():
+    return CrowdwaveEngine()
+
+
+@pytest.fixture(scope="session")
+def demo_survey():
+    """(config, questions) from examples/demo_survey.json."""
+    with open(DEMO_SURVEY, "r") as f:
+        data = json.load(f)
+    questions = data.pop("questions")
+    return data, questions
+
+
+@pytest.fixture(scope="session")
+def demo_report(engine, demo_survey):
+    config, questions = demo_survey
+    return engine.simulate(config, questions)
@@ -0,0 +1,57 @@
+"""
+Run the Crowdwave benchmark suite against a saved baseline.
+
+Usage:
+    # Record a baseline (stored under benchmarks/.benchmarks/)
+    python benchmarks/run.py save
+
+    # Compare against the latest baseline; fails if any benchmark's
+    # mean regresses by more than the threshold
+    python benchmarks/run.py compare --threshold 15
+
+Extra arguments after "--" are passed to pytest (e.g. -- -k simulate).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+
+BENCH_DIR = Path(__file__).parent
+STORAGE = BENCH_DIR / ".benchmarks"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Crowdwave benchmark suite")
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("--name", default="baseline", help="Name for a saved run")
+    parser.add_argument("--against", help="Saved run id to compare against (default: latest)")
+    parser.add_argument("--threshold", type=float, default=15.0,
+                        help="Allowed mean regression in percent (default: 15)")
+    args, extra = parser.parse_known_args(argv)
+    if extra and extra[0] == "--":
+        extra = extra[1:]
+
+    pytest_args = [
+        str(BENCH_DIR),
+        f"--benchmark-storage=file://{STORAGE}",
+        "--benchmark-columns=min,mean,stddev,rounds",
+        "-q",
+    ]
+
+    if args.command == "save":
+        pytest_args.append(f"--benchmark-save={args.name}")
+    elif args.command == "compare":
+        compare = "--benchmark-compare" + (f"={args.against}" if args.against else "")
+        pytest_args.extend([
+            compare,
+            f"--benchmark-compare-fail=mean:{args.threshold:g}%",
+        ])
+
+    return pytest.main(pytest_args + extra)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Benchmarks for batch processing.
+"""
+
+import itertools
+import tracemalloc
+from dataclasses import replace
+
+import pytest
+
+from crowdwave_engine import BatchProcessor
+
+
+N_JOBS = 40
+
+
+def _processor(demo_survey) -> BatchProcessor:
+    config, questions = demo_survey
+    processor = BatchProcessor(max_workers=4)
+    for i in range(N_JOBS):
+        processor.add_job(f"job_{i:03d}", config, questions)
+    return processor
+
+
+@pytest.mark.benchmark(group="batch")
+@pytest.mark.parametrize("parallel", [False, True], ids=["serial", "parallel"])
+def test_batch_run(benchmark, demo_survey, parallel):
+    processor = _processor(demo_survey)
+    results = benchmark(processor.run, parallel=parallel)
+    assert len(results) == N_JOBS
+    assert all(r.success for r in results)
+
+
+SWEEP_AXES = {
+    "generation": ["Gen Z", "Millennials", "Gen X", "Boomers"],
+    "party": ["Democrats", "Republicans", "Independents"],
+    "topic": ["immigration", "climate policy"],
+    "stimuli": [[], ["Ad: a new plan for the economy"]],
+}
+
+
+def _sweep_jobs(demo_survey) -> BatchProcessor:
+    """The sweep grid as one naive BatchJob per scenario."""
+    from crowdwave_engine.scenarios import _point_config
+
+    config, questions = demo_survey
+    processor = BatchProcessor(max_workers=4)
+    names = list(SWEEP_AXES)
+    for i, point in enumerate(itertools.product(*SWEEP_AXES.values())):
+        processor.add_job(f"job_{i:03d}", _point_config(config, names, point), questions)
+    return processor
+
+
+@pytest.mark.benchmark(group="sweep")
+def test_sweep_naive_batch(benchmark, demo_survey):
+    processor = _sweep_jobs(demo_survey)
+    results = benchmark(processor.run, parallel=False)
+    assert all(r.success for r in results)
+
+
+@pytest.mark.benchmark(group="sweep")
+def test_sweep(benchmark, engine, demo_survey):
+    from crowdwave_engine.scenarios import sweep
+
+    config, questions = demo_survey
+    result = benchmark(sweep, questions, SWEEP_AXES, config, engine)
+    assert result.distributions.shape[:4] == (4, 3, 2, 2)
+
+
+N_RESULTS = 100_000
+
+
+def _fresh_results(report, n):
+    """n results with their own dicts and lists, as n separate simulations would produce."""
+    for i in range(n):
+        r = report.results[i % len(report.results)]
+        trace = r.methodology_trace
+        yield replace(
+            r,
+            distribution=dict(r.distribution),
+            biases_detected=list(r.biases_detected),
+            corrections_applied=list(r.corrections_applied),
+            validation_warnings=list(r.validation_warnings),
+            methodology_trace={**trace, "ensemble_runs": [dict(run) for run in trace["ensemble_runs"]]},
+        )
+
+
+@pytest.mark.benchmark(group="result_memory")
+@pytest.mark.parametrize("layout", ["dataclasses", "compact", "compact_slim"])
+def test_result_memory(benchmark, demo_report, layout):
+    """Hold 100k question results; record bytes per result and peak traced memory."""
+    from crowdwave_engine.compact import CompactResults
+
+    def run():
+        tracemalloc.start()
+        if layout == "dataclasses":
+            held = list(_fresh_results(demo_report, N_RESULTS))
+        else:
+            held = CompactResults(slim=layout == "compact_slim")
+            held.extend(_fresh_results(demo_report, N_RESULTS))
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        benchmark.extra_info["bytes_per_result"] = round(current / N_RESULTS)
+        benchmark.extra_info["peak_mb"] = round(peak / 1e6, 1)
+        return len(held)
+
+    assert benchmark.pedantic(run, rounds=1, iterations=1) == N_RESULTS
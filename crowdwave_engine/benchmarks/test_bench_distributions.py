@@ -0,0 +1,152 @@
+"""
+Benchmarks for the distribution generators: one vectorized call over a
+scenario grid versus a loop of scalar calls, and exact (CDF-difference)
+discretization versus the midpoint approximation, in speed and accuracy,
+and inverse fitting of distributions to target mean / SD / T2B.
+"""
+
+import numpy as np
+import pytest
+
+from crowdwave_engine.distributions import (
+    _exact_row,
+    _fit_index,
+    beta_distributions,
+    fit_distribution,
+    fit_distributions,
+    generate_beta_distribution,
+    generate_skewed_distribution,
+    generate_truncated_normal,
+    skewed_distributions,
+    truncated_normal_distributions,
+)
+
+
+# 10,000 (mean, sd, skew) scenarios on a 5-point scale
+_rng = np.random.default_rng(0)
+GRID_MEANS = _rng.uniform(1.5, 4.5, 10_000)
+GRID_SDS = _rng.uniform(0.5, 1.5, 10_000)
+GRID_SKEWS = _rng.uniform(-1.5, 1.5, 10_000)
+
+
+@pytest.mark.benchmark(group="distribution_grid")
+def test_truncated_normal_batch(benchmark):
+    batch = benchmark(truncated_normal_distributions, GRID_MEANS, GRID_SDS)
+    assert batch.probabilities.shape == (10_000, 5)
+
+
+@pytest.mark.benchmark(group="distribution_grid")
+def test_truncated_normal_scalar_loop(benchmark):
+    def run():
+        return [generate_truncated_normal(m, s) for m, s in zip(GRID_MEANS.tolist(), GRID_SDS.tolist())]
+
+    dists = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert len(dists) == 10_000
+
+
+@pytest.mark.benchmark(group="distribution_grid")
+def test_skewed_batch(benchmark):
+    batch = benchmark(skewed_distributions, GRID_MEANS, GRID_SDS, GRID_SKEWS)
+    assert batch.probabilities.shape == (10_000, 5)
+
+
+@pytest.mark.benchmark(group="distribution_grid")
+def test_skewed_batch_to_dicts(benchmark):
+    dists = benchmark.pedantic(
+        lambda: skewed_distributions(GRID_MEANS, GRID_SDS, GRID_SKEWS).to_dicts(),
+        rounds=3, iterations=1,
+    )
+    assert len(dists) == 10_000
+
+
+@pytest.mark.benchmark(group="distribution_grid")
+def test_skewed_scalar_loop(benchmark):
+    def run():
+        return [
+            generate_skewed_distribution(m, s, k)
+            for m, s, k in zip(GRID_MEANS.tolist(), GRID_SDS.tolist(), GRID_SKEWS.tolist())
+        ]
+
+    dists = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert len(dists) == 10_000
+
+
+@pytest.mark.benchmark(group="exact_distribution")
+@pytest.mark.parametrize("kind", ["beta", "truncated_normal"])
+def test_exact_batch(benchmark, kind):
+    generate = beta_distributions if kind == "beta" else truncated_normal_distributions
+    batch = benchmark.pedantic(
+        generate, args=(GRID_MEANS, GRID_SDS), kwargs={"exact": True}, rounds=3, iterations=1
+    )
+    assert batch.probabilities.shape == (10_000, 5)
+
+
+@pytest.mark.benchmark(group="exact_distribution")
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "cold"])
+def test_exact_scalar_beta(benchmark, cached):
+    def run():
+        if not cached:
+            _exact_row.cache_clear()
+        return generate_beta_distribution(3.7, 0.9, exact=True)
+
+    dist = benchmark(run)
+    assert len(dist) == 5
+
+
+@pytest.mark.benchmark(group="exact_distribution")
+@pytest.mark.parametrize("kind", ["beta", "truncated_normal"])
+def test_midpoint_accuracy(benchmark, kind):
+    """
+    Time the midpoint approximation over a (mean, sd) grid and record how
+    far it lands from the exact bin probabilities, in percentage points.
+    """
+    generate = beta_distributions if kind == "beta" else truncated_normal_distributions
+    means, sds = np.meshgrid(np.linspace(1.2, 4.8, 37), np.linspace(0.3, 2.0, 35))
+    means, sds = means.ravel(), sds.ravel()
+
+    approx = benchmark(generate, means, sds).probabilities
+    exact = generate(means, sds, exact=True).probabilities
+
+    error = np.abs(approx - exact) * 100
+    points = np.arange(1, 6)
+    benchmark.extra_info["max_abs_pp"] = round(float(error.max()), 2)
+    benchmark.extra_info["mean_abs_pp"] = round(float(error.mean()), 3)
+    benchmark.extra_info["rows_off_by_1pp"] = round(float((error.max(axis=1) > 1).mean()), 3)
+    benchmark.extra_info["max_mean_shift"] = round(float(np.abs((approx - exact) @ points).max()), 3)
+    assert error.max() < 25
+
+
+def _grid_targets():
+    """Mean, SD and T2B (%) of the skewed grid distributions."""
+    probs = skewed_distributions(GRID_MEANS, GRID_SDS, GRID_SKEWS).probabilities
+    points = np.arange(1, 6)
+    mean = probs @ points
+    return mean, np.sqrt(probs @ points ** 2 - mean ** 2), probs[:, -2:].sum(axis=1) * 100
+
+
+@pytest.mark.benchmark(group="inverse_fit")
+def test_fit_batch(benchmark):
+    mean, sd, t2b = _grid_targets()
+    _fit_index(5)  # index build is a one-off per scale, timed separately
+    fit = benchmark.pedantic(fit_distributions, args=(mean, sd, t2b), rounds=5, iterations=1)
+    benchmark.extra_info["converged"] = float(fit.converged.mean())
+    if benchmark.stats is not None:  # None under --benchmark-disable
+        benchmark.extra_info["us_per_fit"] = round(benchmark.stats.stats.mean / len(fit) * 1e6, 2)
+    assert fit.converged.all()
+
+
+@pytest.mark.benchmark(group="inverse_fit")
+def test_fit_scalar(benchmark):
+    _fit_index(5)
+    dist = benchmark(fit_distribution, 3.9, 0.95, 70)
+    assert len(dist) == 5
+
+
+@pytest.mark.benchmark(group="inverse_fit")
+def test_fit_index_build(benchmark):
+    def run():
+        _fit_index.cache_clear()
+        return _fit_index(11)
+
+    index = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert index.features.shape == (11, 3)
@@ -0,0 +1,242 @@
+"""
+Benchmarks for the core simulation pipeline.
+"""
+
+import tracemalloc
+from dataclasses import replace
+
+import pytest
+
+from crowdwave_engine import validate_distribution
+from crowdwave_engine.calibration_queries import builtin_queries
+from crowdwave_engine.crowdwave import SimulationReport
+from crowdwave_engine.respondents import CopulaSampler
+
+
+# Questions that match no calibrated rule, so _get_base_distribution walks
+# every keyword branch before falling through to its defaults.
+FALL_THROUGH_CONFIG = {"audience": "Adults", "topic": "Zyxwv"}
+FALL_THROUGH_QUESTIONS = [
+    {"id": "B1", "text": "Qwerty zxcvb?", "type": "binary", "options": ["Alpha", "Beta"]},
+    {"id": "S1", "text": "Qwerty zxcvb?", "type": "scale", "scale": [1, 5]},
+    {"id": "S2", "text": "Qwerty zxcvb?", "type": "scale", "scale": [0, 10]},
+    {"id": "M1", "text": "Qwerty zxcvb?", "type": "multiple_choice",
+     "options": ["Alpha", "Beta", "Gamma", "Delta"]},
+]
+
+
+@pytest.mark.benchmark(group="simulate")
+def test_simulate_demo_survey(benchmark, engine, demo_survey):
+    config, questions = demo_survey
+    report = benchmark(engine.simulate, config, questions)
+    assert len(report.results) == len(questions)
+
+
+@pytest.mark.benchmark(group="simulate")
+def test_simulate_fall_through(benchmark, engine):
+    report = benchmark(engine.simulate, FALL_THROUGH_CONFIG, FALL_THROUGH_QUESTIONS)
+    assert len(report.results) == len(FALL_THROUGH_QUESTIONS)
+
+
+AUDIENCES = [
+    f"{generation} {segment}"
+    for generation in ["Gen Z", "Millennial", "Gen X", "Boomer", "Seniors 65+"]
+    for segment in ["Democrats", "Republicans", "Independents", "pet owners", "parents", "CEOs"]
+]
+
+
+@pytest.mark.benchmark(group="audiences")
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "simulate_loop"])
+def test_simulate_audiences(benchmark, engine, demo_survey, compiled):
+    config, questions = demo_survey
+    survey = engine.compile(questions, config)
+
+    def run():
+        if compiled:
+            return survey.simulate_audiences(AUDIENCES).reports
+        return [engine.simulate({**config, "audience": audience}, questions) for audience in AUDIENCES]
+
+    reports = benchmark(run)
+    assert len(reports) == len(AUDIENCES)
+
+
+@pytest.mark.benchmark(group="segments")
+def test_simulate_segmented(benchmark, engine, demo_survey):
+    config, questions = demo_survey
+    config = {**config, "audience": "US parents of teens"}
+    segmented = benchmark(engine.simulate_segmented, config, questions)
+    assert len(segmented.total.results) == len(questions)
+
+
+@pytest.mark.benchmark(group="variants")
+@pytest.mark.parametrize("n_variants", [2, 1000])
+def test_compare_variants(benchmark, engine, demo_survey, n_variants):
+    from crowdwave_engine.variants import compare_variants
+
+    config, questions = demo_survey
+    variants = [f"Message variant {i}" for i in range(n_variants)]
+    comparison = benchmark(compare_variants, config, variants, questions, engine)
+    assert comparison.values.shape == (n_variants, len(questions))
+
+
+@pytest.mark.benchmark(group="incremental")
+@pytest.mark.parametrize("incremental", [False, True], ids=["full", "incremental"])
+def test_resimulate_one_edit(benchmark, engine, demo_survey, incremental):
+    """Re-run after editing one question: full simulate vs IncrementalSimulator."""
+    from crowdwave_engine.incremental import IncrementalSimulator
+
+    config, questions = demo_survey
+    simulator = IncrementalSimulator(engine)
+    simulator.simulate("survey", config, questions)
+    edits = [
+        [{**q, "text": q["text"] + suffix} if i == 0 else q for i, q in enumerate(questions)]
+        for suffix in ("?", " today?")
+    ]
+    calls = iter(range(10 ** 9))
+
+    def run():
+        edited = edits[next(calls) % 2]
+        if incremental:
+            return simulator.simulate("survey", config, edited).report
+        return engine.simulate(config, edited)
+
+    report = benchmark(run)
+    assert len(report.results) == len(questions)
+
+
+@pytest.mark.benchmark(group="base_distribution")
+def test_base_distribution_fall_through(benchmark, engine):
+    from crowdwave_engine.crowdwave import Question
+    
+    question = Question(id="B1", text="Qwerty zxcvb?", type="binary", options=["Alpha", "Beta"])
+    base = benchmark(engine._get_base_distribution, question, [], "Zyxwv", "Adults")
+    assert base == {"Alpha": 52.0, "Beta": 48.0}
+
+
+@pytest.mark.benchmark(group="bias_detection")
+@pytest.mark.parametrize("cached", [True, False], ids=["warm", "cold"])
+def test_detect_biases(benchmark, cached):
+    from crowdwave_engine.bias_corrections import detect_biases
+    from crowdwave_engine.matching import TRIGGERS
+
+    def run():
+        if not cached:
+            TRIGGERS.clear_cache()
+        return detect_biases(
+            "How concerned are you about the cost of medical treatment for your dog?",
+            "Senior pet owners",
+            "scale",
+        )
+
+    biases = benchmark(run)
+    assert biases
+
+
+@pytest.mark.benchmark(group="question_features")
+@pytest.mark.parametrize("shared", [True, False], ids=["shared", "per_phase"])
+def test_question_phases(benchmark, engine, demo_survey, shared):
+    """
+    Text-dependent phases for every demo question, given one shared
+    QuestionFeatures per question versus each phase normalizing and
+    scanning the text itself.
+    """
+    from crowdwave_engine.crowdwave import Question, SurveyConfig
+    from crowdwave_engine.features import QuestionFeatures
+    from crowdwave_engine.bias_corrections import detect_biases
+
+    config, raw = demo_survey
+    survey = SurveyConfig(audience=config["audience"], topic=config.get("topic", ""))
+    questions = [
+        Question(id=q["id"], text=q["text"], type=q["type"], options=q.get("options", []),
+                 scale=tuple(q["scale"]) if q.get("scale") else (1, 5))
+        for q in raw
+    ]
+    tables = engine.calibration.current().tables
+
+    def run():
+        features = (
+            QuestionFeatures.extract_all(questions, survey.topic, survey.audience)
+            if shared else [None] * len(questions)
+        )
+        priors = engine._establish_priors(survey, questions, tables, features if shared else None)
+        for question, f in zip(questions, features):
+            detect_biases(question.text, survey.audience, question.type, f.audience_hits if f else None)
+            engine._determine_accuracy_zone(question, f)
+            engine._get_base_distribution(question, priors, survey.topic, survey.audience, tables, f)
+        return engine._check_calibration_coverage(survey, questions, features if shared else None)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="respondents")
+@pytest.mark.parametrize("n", [10_000, 100_000])
+def test_generate_respondents(benchmark, engine, demo_report, n):
+    respondents = benchmark.pedantic(
+        engine.generate_respondents, args=(demo_report, n), rounds=3, iterations=1
+    )
+    assert len(respondents) == n
+
+
+@pytest.mark.benchmark(group="respondents")
+@pytest.mark.parametrize("n", [10_000, 100_000])
+def test_generate_correlated_respondents(benchmark, engine, demo_report, n):
+    respondents = benchmark.pedantic(
+        engine.generate_respondents, args=(demo_report, n),
+        kwargs={"correlation": "construct", "seed": 0}, rounds=3, iterations=1
+    )
+    assert len(respondents) == n
+
+
+@pytest.mark.benchmark(group="respondents_copula")
+def test_copula_1m_by_200(benchmark, demo_report):
+    """Stream 1M respondents x 200 questions; record peak traced memory."""
+    results = [replace(r, question_id=f"{r.question_id}_{i}") for i in range(34) for r in demo_report.results][:200]
+    report = SimulationReport(demo_report.config, results, [], 0.7, [])
+
+    def run():
+        sampler = CopulaSampler(report, seed=0)
+        tracemalloc.start()
+        total = sum(len(codes) for codes in sampler.chunks(1_000_000))
+        benchmark.extra_info["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 1)
+        tracemalloc.stop()
+        return total
+
+    assert benchmark.pedantic(run, rounds=1, iterations=1) == 1_000_000
+
+
+CALIBRATION_QUERIES = [
+    ("nps_benchmark", ("SaaS software", True)),
+    ("nps_benchmark", ("regional grocery", False)),
+    ("demographic_modifier", ("Women 60+ pet owners", "digital_adoption")),
+    ("requires_partisan_segmentation", ("Attitudes to climate change policy",)),
+    ("current_calibration", ("Netflix subscription churn",)),
+    ("benchmark", ("Healthcare services", "satisfaction")),
+    ("executive_context", ("CFOs at mid-size firms", "cyber security and AI adoption")),
+]
+
+
+@pytest.mark.benchmark(group="calibration_queries")
+@pytest.mark.parametrize("memoized", [True, False], ids=["memoized", "indexed"])
+def test_calibration_queries(benchmark, memoized):
+    queries = builtin_queries()
+
+    def run():
+        if not memoized:
+            queries.clear_cache()
+        return [getattr(queries, name)(*args) for name, args in CALIBRATION_QUERIES]
+
+    answers = benchmark(run)
+    assert answers[0] == 29
+
+
+@pytest.mark.benchmark(group="serialize")
+def test_to_json(benchmark, engine, demo_report):
+    payload = benchmark(engine.to_json, demo_report)
+    assert payload.startswith("{")
+
+
+@pytest.mark.benchmark(group="validate")
+def test_validate_distribution(benchmark):
+    distribution = {"1": 5.2, "2": 12.1, "3": 23.4, "4": 35.8, "5": 23.5}
+    result = benchmark(validate_distribution, distribution, "scale", "Parents of teens")
+    assert result.passed
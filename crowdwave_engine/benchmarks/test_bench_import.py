@@ -0,0 +1,73 @@
+"""
+Import-time benchmarks.
+
+Each round starts a fresh interpreter, so the timings include interpreter
+startup; the package's own share, as reported by `python -X importtime`,
+is attached to each benchmark as extra_info["import_us"].
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Modules a bare `import crowdwave_engine` must not pull in
+HEAVY_MODULES = (
+    "numpy",
+    "sqlite3",
+    "concurrent.futures",
+    "crowdwave_engine.llm_integration",
+    "crowdwave_engine.evaluation_store",
+    "crowdwave_engine.batch",
+)
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_us(stderr: str, module: str) -> int:
+    """Cumulative microseconds for `module` from -X importtime output."""
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("statement", [
+    "import crowdwave_engine",
+    "from crowdwave_engine import CrowdwaveEngine",
+], ids=["package", "engine"])
+def test_import_time(benchmark, statement):
+    benchmark.pedantic(_run, args=("-c", statement), rounds=5, iterations=1)
+    profile = _run("-X", "importtime", "-c", statement)
+    benchmark.extra_info["import_us"] = _import_us(profile.stderr, "crowdwave_engine")
+
+
+@pytest.mark.benchmark(group="import")
+def test_cli_startup(benchmark):
+    result = benchmark.pedantic(
+        _run, args=("-m", "crowdwave_engine", "benchmark", "--list"), rounds=5, iterations=1
+    )
+    assert "NPS Benchmarks" in result.stdout
+
+
+def test_bare_import_stays_light():
+    check = (
+        "import sys, crowdwave_engine; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = _run("-c", check).stdout.strip()
+    assert loaded == "", f"bare import pulled in: {loaded}"
@@ -0,0 +1,192 @@
+"""
+Benchmarks for calibration retrieval: recall and latency of the TF-IDF
+index against the keyword cascade in _get_base_distribution, on
+questions the cascade was written for and on paraphrases of them.
+"""
+
+import sys
+
+import pytest
+
+from crowdwave_engine import CrowdwaveEngine, Question
+from crowdwave_engine.retrieval import CalibrationIndex, builtin_index
+
+
+# (type, canonical question the cascade matches, relevant table entries,
+# paraphrases). The cascade branch the canonical question reaches, and
+# table entries whose ids start with a listed prefix, are the relevant
+# calibrations for all of them.
+RECALL_SET = [
+    ("scale", "How worried are you about AI taking jobs?", ("AI_JOB_CONCERNS_2026", "AI_JOB_FEARS_2026"), [
+        "How anxious are you that automation will eliminate your position?",
+        "To what extent do you fear losing your job to artificial intelligence?",
+    ]),
+    ("scale", "How much do you trust the news media?", ("NEWS_TRUST_2026", "NEWS_CONSUMPTION_2025"), [
+        "How much confidence do you have in journalists and newspapers?",
+        "Rate your trust in the press.",
+    ]),
+    ("scale", "How satisfied are you with remote work?", (
+        "REMOTE_WORK", "SATISFACTION_BENCHMARKS.remote_work",
+    ), [
+        "How happy are you with your WFH arrangement?",
+        "Rate your satisfaction with telecommuting.",
+    ]),
+    ("scale", "How concerned are you about the cost of healthcare?", ("HEALTHCARE_COSTS_2026",), [
+        "How worried are you about affording medical bills?",
+        "Rate your concern about health insurance expenses.",
+    ]),
+    ("scale", "How concerned are you about climate change?", ("CLIMATE_CHANGE_2025", "CLIMATE_CHANGE_2026"), [
+        "How worried are you about global warming?",
+        "How serious a problem is the changing climate for you?",
+    ]),
+    ("scale", "How much do you trust the CDC on vaccines?", (
+        "TRUST_GOVERNMENT_2026.trust_cdc", "INSTITUTIONAL_TRUST.cdc",
+    ), [
+        "How much confidence do you have in health authorities' vaccine guidance?",
+        "Rate your trust in vaccination recommendations from public health agencies.",
+    ]),
+    ("scale", "How likely is a recession in the economy this year?", ("EXECUTIVE_RISK_CONCERNS.economic_recession",), [
+        "How likely is an economic downturn in the next twelve months?",
+        "Rate the chance the economy slides into recession.",
+    ]),
+    ("binary", "Do you own a pet?", ("PET_OWNERSHIP_2025", "PET_OWNERSHIP_2026"), [
+        "Is there a pet living in your household?",
+        "Do you have any pets at home?",
+    ]),
+    ("binary", "Do you plan to watch the Super Bowl?", ("SPORTS_VIEWERSHIP_2026.super_bowl",), [
+        "Will you be watching the NFL championship game?",
+        "Are you planning on viewing the big football game this February?",
+    ]),
+    ("binary", "Do you own any cryptocurrency?", ("CRYPTO_2026",), [
+        "Do you hold bitcoin or other crypto assets?",
+        "Do you currently have any crypto holdings?",
+    ]),
+    ("binary", "Is a college degree worth the cost?", ("COLLEGE_VALUE_2025", "COLLEGE_VALUE_2026"), [
+        "Is a university education worth the money?",
+        "Is higher education still worth its value?",
+    ]),
+    ("binary", "Do you have a gym membership?", ("FITNESS_2025.gym_membership",), [
+        "Are you a member of a fitness club?",
+        "Do you belong to a gym?",
+    ]),
+    ("binary", "Do you support legalizing marijuana?", ("MARIJUANA_2025",), [
+        "Should recreational cannabis be legal?",
+        "Do you support legal weed?",
+    ]),
+    ("binary", "Are you worried Social Security benefits will be cut?", ("SOCIAL_SECURITY_2026",), [
+        "Are you concerned your Social Security check will be reduced?",
+        "Do you expect cuts to retirement benefits from Social Security?",
+    ]),
+    ("binary", "Do you trust scientists?", ("TRUST_SCIENCE_2026",), [
+        "Do you have confidence in scientific experts?",
+        "Do you trust what science tells us?",
+    ]),
+]
+
+OPTIONS = {"scale": [], "binary": ["Yes", "No"]}
+
+
+def _question(question_type, text):
+    return Question(
+        id="q", text=text, type=question_type, options=OPTIONS[question_type],
+        scale=(1, 5) if question_type == "scale" else None,
+    )
+
+
+def _cascade_branch(engine, question):
+    """Line number of the cascade return statement a question reaches."""
+    code = CrowdwaveEngine._get_base_distribution.__code__
+    line = []
+
+    def trace(frame, event, arg):
+        if frame.f_code is not code:
+            return None
+
+        def local(frame, event, arg):
+            if event == "return":
+                line.append(frame.f_lineno)
+            return local
+        return local
+
+    sys.settrace(trace)
+    try:
+        engine._get_base_distribution(question, [])
+    finally:
+        sys.settrace(None)
+    return f"crowdwave.py:{line[-1]}"
+
+
+def _labelled(engine):
+    """
+    (question, cascade branch, relevant id prefixes) for every canonical
+    and paraphrased question.
+    """
+    cases = []
+    for question_type, canonical, tables, paraphrases in RECALL_SET:
+        branch = _cascade_branch(engine, _question(question_type, canonical))
+        cases.extend(
+            (_question(question_type, text), branch, (branch,) + tables)
+            for text in [canonical, *paraphrases]
+        )
+    return cases
+
+
+def _recall(found):
+    """Recall over all questions, and over paraphrases only."""
+    paraphrased = [hit for i, hit in enumerate(found) if i % 3]
+    return round(sum(found) / len(found), 3), round(sum(paraphrased) / len(paraphrased), 3)
+
+
+@pytest.fixture(scope="module")
+def labelled(engine):
+    return _labelled(engine)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return builtin_index()
+
+
+@pytest.mark.benchmark(group="retrieval")
+def test_keyword_cascade(benchmark, engine, labelled):
+    def run():
+        return [engine._get_base_distribution(question, []) for question, _, _ in labelled]
+
+    benchmark(run)
+    reached = [_cascade_branch(engine, question) == branch for question, branch, _ in labelled]
+    recall, paraphrase_recall = _recall(reached)
+    benchmark.extra_info["recall"] = recall
+    benchmark.extra_info["paraphrase_recall"] = paraphrase_recall
+    if benchmark.stats is not None:  # None under --benchmark-disable
+        benchmark.extra_info["us_per_query"] = round(benchmark.stats.stats.mean / len(labelled) * 1e6, 1)
+    assert all(reached[::3])  # the canonical questions define the answers
+
+
+@pytest.mark.benchmark(group="retrieval")
+@pytest.mark.parametrize("batched", [True, False], ids=["batch", "single"])
+def test_index_search(benchmark, index, labelled, batched):
+    questions = [question for question, _, _ in labelled]
+
+    def run():
+        if batched:
+            return index.search_questions(questions, k=5)
+        return [index.search(q.text, 5, q.type) for q in questions]
+
+    results = benchmark(run)
+    for k in (1, 3, 5):
+        found = [
+            any(hit.document.id.startswith(relevant) for hit in hits[:k])
+            for hits, (_, _, relevant) in zip(results, labelled)
+        ]
+        recall, paraphrase_recall = _recall(found)
+        benchmark.extra_info[f"recall_at_{k}"] = recall
+        benchmark.extra_info[f"paraphrase_recall_at_{k}"] = paraphrase_recall
+    if benchmark.stats is not None:  # None under --benchmark-disable
+        benchmark.extra_info["us_per_query"] = round(benchmark.stats.stats.mean / len(questions) * 1e6, 1)
+    assert len(results) == len(questions)
+
+
+@pytest.mark.benchmark(group="retrieval")
+def test_index_build(benchmark):
+    index = benchmark.pedantic(CalibrationIndex.build, rounds=3, iterations=1)
+    assert len(index) > 0
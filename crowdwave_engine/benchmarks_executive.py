@@ -113,6 +113,48 @@ REGIONAL_MULTIPLIERS = {
     },
 }
 
+# detect_executive_context() vocabularies
+EXECUTIVE_AUDIENCE_KEYWORDS = [
+    "executive", "c-suite", "c-level", "ceo", "cfo", "cmo",
+    "chro", "coo", "cto", "board", "director", "vp",
+    "vice president", "senior leader",
+]
+
+# Audience phrase -> role, checked in order
+EXECUTIVE_ROLE_PATTERNS = {
+    "ceo": "CEO",
+    "chief executive": "CEO",
+    "cfo": "CFO",
+    "chief financial": "CFO",
+    "cmo": "CMO",
+    "chief marketing": "CMO",
+    "chro": "CHRO",
+    "chief human": "CHRO",
+    "hr leader": "CHRO",
+}
+
+# Topic keyword -> EXECUTIVE_RISK_CONCERNS key
+EXECUTIVE_TOPIC_KEYWORDS = {
+    "cyber": "cyberattacks",
+    "hack": "cyberattacks",
+    "security": "cyberattacks",
+    "recession": "economic_recession",
+    "economy": "economic_recession",
+    "ai": "ai_impact",
+    "artificial intelligence": "ai_impact",
+    "automation": "automation_impact",
+    "supply chain": "supply_chain_disruptions",
+    "talent": "finding_qualified_workers",
+    "hiring": "finding_qualified_workers",
+    "workforce": "worker_shortages",
+    "inflation": "inflation",
+    "tariff": "tariffs",
+    "regulation": "regulation",
+    "climate": "esg_regulations",
+    "esg": "esg_regulations",
+}
+
+
 def get_executive_benchmark(topic: str, role: str = None, region: str = None) -> float:
     """
     Get calibrated executive concern level.
@@ -125,17 +167,8 @@ def get_executive_benchmark(topic: str, role: str = None, region: str = None) ->
     Returns:
         Calibrated percentage (0-1)
     """
-    base = EXECUTIVE_RISK_CONCERNS.get(topic, 0.20)  # Default 20%
-    
-    if role and role in ROLE_MULTIPLIERS:
-        role_mult = ROLE_MULTIPLIERS[role].get(topic, 1.0)
-        base *= role_mult
-    
-    if region and region in REGIONAL_MULTIPLIERS:
-        region_mult = REGIONAL_MULTIPLIERS[region].get(topic, 1.0)
-        base *= region_mult
-    
-    return min(base, 0.95)  # Cap at 95%
+    from .calibration_queries import builtin_queries
+    return builtin_queries().executive_benchmark(topic, role, region)
 
 
 def detect_executive_context(audience: str, topic: str) -> dict:
@@ -147,66 +180,5 @@ def detect_executive_context(audience: str, topic: str) -> dict:
     - role: detected role if any
     - topics: matched risk topics
     """
-    audience_lower = audience.lower()
-    topic_lower = topic.lower()
-    
-    result = {
-        "is_executive": False,
-        "role": None,
-        "matched_topics": [],
-    }
-    
-    # Detect executive audience
-    exec_keywords = ["executive", "c-suite", "c-level", "ceo", "cfo", "cmo", 
-                     "chro", "coo", "cto", "board", "director", "vp", 
-                     "vice president", "senior leader"]
-    
-    for kw in exec_keywords:
-        if kw in audience_lower:
-            result["is_executive"] = True
-            break
-    
-    # Detect specific role
-    role_map = {
-        "ceo": "CEO",
-        "chief executive": "CEO",
-        "cfo": "CFO", 
-        "chief financial": "CFO",
-        "cmo": "CMO",
-        "chief marketing": "CMO",
-        "chro": "CHRO",
-        "chief human": "CHRO",
-        "hr leader": "CHRO",
-    }
-    
-    for pattern, role in role_map.items():
-        if pattern in audience_lower:
-            result["role"] = role
-            break
-    
-    # Match topics
-    topic_keywords = {
-        "cyber": "cyberattacks",
-        "hack": "cyberattacks",
-        "security": "cyberattacks",
-        "recession": "economic_recession",
-        "economy": "economic_recession",
-        "ai": "ai_impact",
-        "artificial intelligence": "ai_impact",
-        "automation": "automation_impact",
-        "supply chain": "supply_chain_disruptions",
-        "talent": "finding_qualified_workers",
-        "hiring": "finding_qualified_workers",
-        "workforce": "worker_shortages",
-        "inflation": "inflation",
-        "tariff": "tariffs",
-        "regulation": "regulation",
-        "climate": "esg_regulations",
-        "esg": "esg_regulations",
-    }
-    
-    for keyword, topic_key in topic_keywords.items():
-        if keyword in topic_lower:
-            result["matched_topics"].append(topic_key)
-    
-    return result
+    from .calibration_queries import builtin_queries
+    return builtin_queries().executive_context(audience, topic)
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+from .matching import TRIGGERS, TriggerHits
+
 
 class BiasType(Enum):
     EMOTIONAL_BONDING = "emotional_bonding"
@@ -66,18 +68,48 @@ VALUES_FACTOR_TRIGGERS = [
     "corporate responsibility", "social impact", "environment", "trust"
 ]
 
+# All of the above, plus the gating keywords used by detect_biases, are
+# compiled into the shared trigger scanner so each question/audience text
+# is scanned once.
+_EMOTIONAL_BONDING = TRIGGERS.add("bias.emotional_bonding", EMOTIONAL_BONDING_TRIGGERS)
+_SENIOR_DIGITAL = TRIGGERS.add("bias.senior_digital", SENIOR_DIGITAL_TRIGGERS)
+_HEALTHCARE_CONCERN = TRIGGERS.add("bias.healthcare_concern", HEALTHCARE_CONCERN_TRIGGERS)
+_POLITICAL_REGULATORY = TRIGGERS.add("bias.political_regulatory", POLITICAL_REGULATORY_TRIGGERS)
+_ECONOMIC_FACTOR = TRIGGERS.add("bias.economic_factor", ECONOMIC_FACTOR_TRIGGERS)
+_VALUES_FACTOR = TRIGGERS.add("bias.values_factor", VALUES_FACTOR_TRIGGERS)
+
+_SENIOR_AGE = TRIGGERS.add("bias.senior_age", ["60+", "65+", "70+", "senior", "older", "retired"])
+_DIGITAL_USE = TRIGGERS.add("bias.digital_use", ["online", "digital", "social media", "smartphone", "streaming"])
+_FEMALE = TRIGGERS.add("bias.female", ["women", "female"])
+_HEALTH = TRIGGERS.add("bias.health", ["health", "medical", "treatment", "medication"])
+_CONCERN = TRIGGERS.add("bias.concern", ["concern", "worry", "worried", "anxiety", "fear", "risk"])
+_CHILD = TRIGGERS.add("bias.child", ["child", "children", "pediatric"])
+_BUSINESS = TRIGGERS.add("bias.business", ["executive", "ceo", "business", "company", "investment"])
+_REGULATORY = TRIGGERS.add("bias.regulatory", ["regulatory", "political", "policy", "uncertainty"])
+
 
 # ═══════════════════════════════════════════════════════════════
 # BIAS DETECTION
 # ═══════════════════════════════════════════════════════════════
 
-def detect_biases(question_text: str, audience: str, question_type: str) -> List[BiasDetection]:
-    """Detect applicable biases for a question."""
-    text = f"{question_text} {audience}".lower()
+def detect_biases(
+    question_text: str,
+    audience: str,
+    question_type: str,
+    hits: Optional[TriggerHits] = None
+) -> List[BiasDetection]:
+    """
+    Detect applicable biases for a question.
+
+    `hits` may carry an existing scan of the question text followed by
+    the audience (QuestionFeatures.audience_hits) to skip re-scanning.
+    """
+    if hits is None:
+        hits = TRIGGERS.scan(f"{question_text} {audience}".lower())
     detections = []
     
     # Check Emotional Bonding Underestimation
-    triggers = [t for t in EMOTIONAL_BONDING_TRIGGERS if t in text]
+    triggers = hits.hits(_EMOTIONAL_BONDING)
     if len(triggers) >= 2:
         detections.append(BiasDetection(
             bias_type=BiasType.EMOTIONAL_BONDING,
@@ -87,12 +119,10 @@ def detect_biases(question_text: str, audience: str, question_type: str) -> List
         ))
     
     # Check Senior Digital Adoption Underestimation
-    age_trigger = any(t in text for t in ["60+", "65+", "70+", "senior", "older", "retired"])
-    digital_trigger = any(t in text for t in ["online", "digital", "social media", "smartphone", "streaming"])
-    if age_trigger and digital_trigger:
-        triggers = [t for t in SENIOR_DIGITAL_TRIGGERS if t in text]
+    if hits.any(_SENIOR_AGE) and hits.any(_DIGITAL_USE):
+        triggers = hits.hits(_SENIOR_DIGITAL)
         # Determine gender for multiplier
-        multiplier = 1.35 if "women" in text or "female" in text else 1.30
+        multiplier = 1.35 if hits.any(_FEMALE) else 1.30
         detections.append(BiasDetection(
             bias_type=BiasType.SENIOR_DIGITAL,
             confidence=0.85,
@@ -101,12 +131,10 @@ def detect_biases(question_text: str, audience: str, question_type: str) -> List
         ))
     
     # Check Healthcare Concern Dampening
-    health_trigger = any(t in text for t in ["health", "medical", "treatment", "medication"])
-    concern_trigger = any(t in text for t in ["concern", "worry", "worried", "anxiety", "fear", "risk"])
-    if health_trigger and concern_trigger:
-        triggers = [t for t in HEALTHCARE_CONCERN_TRIGGERS if t in text]
+    if hits.any(_HEALTH) and hits.any(_CONCERN):
+        triggers = hits.hits(_HEALTHCARE_CONCERN)
         # Higher correction for children's health
-        uplift = 1.30 if any(t in text for t in ["child", "children", "pediatric"]) else 1.20
+        uplift = 1.30 if hits.any(_CHILD) else 1.20
         detections.append(BiasDetection(
             bias_type=BiasType.HEALTHCARE_CONCERN,
             confidence=0.80,
@@ -115,10 +143,8 @@ def detect_biases(question_text: str, audience: str, question_type: str) -> List
         ))
     
     # Check Political/Regulatory Underweighting
-    business_trigger = any(t in text for t in ["executive", "ceo", "business", "company", "investment"])
-    regulatory_trigger = any(t in text for t in ["regulatory", "political", "policy", "uncertainty"])
-    if business_trigger and regulatory_trigger:
-        triggers = [t for t in POLITICAL_REGULATORY_TRIGGERS if t in text]
+    if hits.any(_BUSINESS) and hits.any(_REGULATORY):
+        triggers = hits.hits(_POLITICAL_REGULATORY)
         detections.append(BiasDetection(
             bias_type=BiasType.POLITICAL_REGULATORY,
             confidence=0.75,
@@ -127,13 +153,11 @@ def detect_biases(question_text: str, audience: str, question_type: str) -> List
         ))
     
     # Check Economic Factor Overweighting
-    economic_trigger = any(t in text for t in ECONOMIC_FACTOR_TRIGGERS)
-    values_trigger = any(t in text for t in VALUES_FACTOR_TRIGGERS)
-    if economic_trigger and values_trigger:
+    if hits.any(_ECONOMIC_FACTOR) and hits.any(_VALUES_FACTOR):
         detections.append(BiasDetection(
             bias_type=BiasType.ECONOMIC_OVERWEIGHT,
             confidence=0.70,
-            triggers=[t for t in ECONOMIC_FACTOR_TRIGGERS + VALUES_FACTOR_TRIGGERS if t in text],
+            triggers=hits.hits(_ECONOMIC_FACTOR) + hits.hits(_VALUES_FACTOR),
             correction={
                 "type": "rebalance",
                 "economic_factor": 0.85,
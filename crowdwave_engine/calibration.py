@@ -498,12 +498,32 @@ HEALTH_IMPORTANCE_BENCHMARKS = {
         "ease": (55, 65),
         "enjoyability": (42, 55),
     },
+    
+    # 5-point importance distributions by attribute (health context)
+    "distributions": {
+        "effectiveness": {"1": 3.0, "2": 5.0, "3": 17.0, "4": 44.0, "5": 31.0},   # 75% T2B
+        "safety": {"1": 3.0, "2": 6.0, "3": 21.0, "4": 46.0, "5": 24.0},          # 70% T2B
+        "affordability": {"1": 3.0, "2": 5.0, "3": 19.0, "4": 43.0, "5": 30.0},   # 73% T2B
+        "privacy": {"1": 3.0, "2": 7.0, "3": 24.0, "4": 42.0, "5": 24.0},         # 66% T2B
+        "convenience": {"1": 3.0, "2": 6.0, "3": 24.0, "4": 47.0, "5": 20.0},     # 67% T2B
+        "enjoyability": {"1": 5.0, "2": 12.0, "3": 35.0, "4": 36.0, "5": 12.0},   # 48% T2B
+    },
 }
 
 
-def get_mental_health_distribution(attribute: str, question_type: str = "importance") -> dict:
-    """Get calibrated distribution for mental health survey questions."""
-    benchmarks = MENTAL_HEALTH_BENCHMARKS
+def get_mental_health_distribution(
+    attribute: str,
+    question_type: str = "importance",
+    benchmarks: Optional[dict] = None
+) -> dict:
+    """
+    Get calibrated distribution for mental health survey questions.
+    
+    `benchmarks` defaults to MENTAL_HEALTH_BENCHMARKS; the engine passes
+    the active calibration bundle's copy.
+    """
+    if benchmarks is None:
+        benchmarks = MENTAL_HEALTH_BENCHMARKS
     
     # Determine which distribution set to use
     if question_type in ["concept", "rating", "rate"]:
@@ -701,48 +721,23 @@ ACCURACY_BY_QUESTION_TYPE = {
 
 def get_benchmark(context: str, question_type: str) -> Optional[Benchmark]:
     """Look up the appropriate benchmark for a question context."""
-    key = f"{context}_{question_type}".lower().replace(" ", "_")
-    
-    # Try satisfaction benchmarks
-    if question_type in ["satisfaction", "satisfied"]:
-        for bm_key, bm in SATISFACTION_BENCHMARKS.items():
-            if bm_key in key or context.lower() in bm_key:
-                return bm
-        return SATISFACTION_BENCHMARKS.get("general_population")
-    
-    return None
+    from .calibration_queries import builtin_queries
+    return builtin_queries().benchmark(context, question_type)
 
 
 def get_demographic_modifier(demographic: str, construct: str) -> float:
     """Get the multiplier for a demographic-construct combination."""
-    demo_key = demographic.lower().replace(" ", "_").replace("-", "_")
-    
-    for key, modifiers in DEMOGRAPHIC_MULTIPLIERS.items():
-        if key in demo_key or demo_key in key:
-            return modifiers.get(construct, 1.0)
-    
-    return 1.0
+    from .calibration_queries import builtin_queries
+    return builtin_queries().demographic_modifier(demographic, construct)
 
 
 def requires_partisan_segmentation(topic: str) -> bool:
     """Check if a topic requires mandatory partisan breakdown."""
-    topic_lower = topic.lower()
-    for partisan_topic in PARTISAN_TOPICS:
-        if partisan_topic in topic_lower:
-            return PARTISAN_TOPICS[partisan_topic].get("required", False)
-    return False
+    from .calibration_queries import builtin_queries
+    return builtin_queries().requires_partisan_segmentation(topic)
 
 
 def get_nps_benchmark(industry: str, b2b: bool = False) -> int:
     """Get the NPS benchmark for an industry."""
-    industry_key = industry.lower().replace(" ", "_").replace("-", "_")
-    
-    for key, data in NPS_BENCHMARKS["by_industry"].items():
-        if key in industry_key or industry_key in key:
-            if b2b and "b2b" in data:
-                return data["b2b"]
-            elif not b2b and "b2c" in data:
-                return data["b2c"]
-            return data["median"]
-    
-    return NPS_BENCHMARKS["b2b_median" if b2b else "b2c_median"]
+    from .calibration_queries import builtin_queries
+    return builtin_queries().nps_benchmark(industry, b2b)
@@ -3,6 +3,9 @@ Crowdwave Current Topic Calibrations
 Real-time polling data for recent topics (February 2026)
 """
 
+from typing import Any, Mapping
+
+
 # Immigration Enforcement (Feb 2026)
 # Sources: NPR/PBS/Marist Poll, USA Today
 IMMIGRATION_ENFORCEMENT_FEB2026 = {
@@ -1274,58 +1277,54 @@ TRUST_SCIENCE_2026 = {
 }
 
 
-def get_current_calibration(topic: str, question_type: str = None) -> dict:
-    """
-    Get current calibrations for a topic.
-    
-    Returns dict with calibrated values and confidence level.
-    """
-    topic_lower = topic.lower()
-    
+# Topic keyword rules for get_current_calibration, in priority order:
+# (keywords, table, entry, confidence, is_partisan, note)
+CURRENT_CALIBRATION_RULES = (
     # Immigration
-    if any(kw in topic_lower for kw in ["immigration", "ice", "deportation", "border", "enforcement"]):
-        return {
-            "data": IMMIGRATION_ENFORCEMENT_FEB2026,
-            "confidence": "high",
-            "is_partisan": True,
-            "note": "MUST segment by party - 60+ point gap between R and D"
-        }
-    
+    (("immigration", "ice", "deportation", "border", "enforcement"),
+     "IMMIGRATION_ENFORCEMENT_FEB2026", None, "high", True,
+     "MUST segment by party - 60+ point gap between R and D"),
     # AI/Jobs
-    if any(kw in topic_lower for kw in ["ai ", "artificial intelligence", "automation", "job loss", "workplace ai"]):
-        return {
-            "data": AI_JOB_CONCERNS_2026,
-            "confidence": "high",
-            "is_partisan": False,
-            "note": "Varies significantly by generation"
-        }
-    
+    (("ai ", "artificial intelligence", "automation", "job loss", "workplace ai"),
+     "AI_JOB_CONCERNS_2026", None, "high", False,
+     "Varies significantly by generation"),
     # Vaccines
-    if any(kw in topic_lower for kw in ["vaccine", "vaccination", "mmr", "measles", "immuniz"]):
-        return {
-            "data": VACCINATION_RATES_US,
-            "confidence": "high",
-            "is_partisan": True,
-            "note": "Varies significantly by state and political affiliation"
-        }
-    
+    (("vaccine", "vaccination", "mmr", "measles", "immuniz"),
+     "VACCINATION_RATES_US", None, "high", True,
+     "Varies significantly by state and political affiliation"),
     # CDC/Health institutions
-    if any(kw in topic_lower for kw in ["cdc", "health authority", "public health"]):
-        return {
-            "data": INSTITUTIONAL_TRUST["cdc"],
-            "confidence": "medium",
-            "is_partisan": True,
-        }
-    
+    (("cdc", "health authority", "public health"),
+     "INSTITUTIONAL_TRUST", "cdc", "medium", True, None),
     # Streaming
-    if any(kw in topic_lower for kw in ["streaming", "netflix", "disney", "hbo", "subscription"]):
-        return {
-            "data": STREAMING_BENCHMARKS,
-            "confidence": "medium",
-            "is_partisan": False,
-        }
+    (("streaming", "netflix", "disney", "hbo", "subscription"),
+     "STREAMING_BENCHMARKS", None, "medium", False, None),
+)
+
+
+def resolve_current_calibration(rule: tuple, tables: Mapping[str, Any]) -> dict:
+    """Build the get_current_calibration() result for one rule from `tables`."""
+    _, table, entry, confidence, is_partisan, note = rule
+    data = tables[table]
+    if entry is not None:
+        data = data[entry]
+    result = {
+        "data": data,
+        "confidence": confidence,
+        "is_partisan": is_partisan,
+    }
+    if note:
+        result["note"] = note
+    return result
+
+
+def get_current_calibration(topic: str, question_type: str = None) -> dict:
+    """
+    Get current calibrations for a topic.
     
-    return None
+    Returns dict with calibrated values and confidence level.
+    """
+    from .calibration_queries import builtin_queries
+    return builtin_queries().current_calibration(topic)
 
 
 def apply_current_calibration(base_distribution: dict, topic: str, audience: str) -> dict:
@@ -0,0 +1,247 @@
+"""
+Crowdwave Calibration Queries
+Indexed lookups over one set of calibration tables. The substring scans
+behind get_benchmark(), get_nps_benchmark(), get_demographic_modifier(),
+requires_partisan_segmentation(), get_current_calibration() and the
+executive helpers are answered from indexes built once per set of
+tables, and repeated queries are memoized.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+from .matching import KeywordMatcher
+
+
+# Memoized answers kept per CalibrationQueries (oldest evicted first)
+QUERY_CACHE_SIZE = 4096
+
+_MISSING = object()
+
+
+class SubstringIndex:
+    """
+    The first key, in table order, that occurs in a query or contains it:
+    the first key for which `key in inside or within in key`.
+
+    Keys occurring in the query come from one compiled KeywordMatcher
+    scan; keys containing the query from a dict of every substring of
+    every key (calibration keys are short, so this stays small).
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self.keys = tuple(keys)
+        self._inside = KeywordMatcher([[key] for key in self.keys])
+        self._within: Dict[str, int] = {}
+        for index, key in enumerate(self.keys):
+            for start in range(len(key) + 1):
+                for end in range(start, len(key) + 1):
+                    self._within.setdefault(key[start:end], index)
+
+    def first(self, inside: str, within: Optional[str] = None) -> Optional[int]:
+        """Index of the first matching key; `within` defaults to `inside`."""
+        found = self._inside.first(inside)
+        contained = self._within.get(inside if within is None else within)
+        if contained is not None and (found is None or contained < found):
+            return contained
+        return found
+
+
+def _normalize(text: str) -> str:
+    return text.lower().replace(" ", "_").replace("-", "_")
+
+
+class CalibrationQueries:
+    """
+    Calibration lookups over `tables` (a CalibrationBundle's tables, a
+    CalibrationSnapshot, or collect_tables() for the built-in library).
+
+    Usage:
+        queries = builtin_queries()            # or bundle.queries
+        queries.nps_benchmark("saas", b2b=True)
+        queries.requires_partisan_segmentation("climate policy")
+
+    Answers match the original linear scans (first matching key in table
+    order). Indexes are built on construction and answers are memoized
+    by arguments. Lookups are too cheap (~1µs) to count in telemetry,
+    which would triple their cost. Returned dicts are copies; table data
+    inside them is shared and must be treated as read-only.
+    """
+
+    def __init__(self, tables: Mapping[str, Any], cache_size: int = QUERY_CACHE_SIZE):
+        from .benchmarks_executive import (
+            EXECUTIVE_AUDIENCE_KEYWORDS,
+            EXECUTIVE_ROLE_PATTERNS,
+            EXECUTIVE_TOPIC_KEYWORDS,
+        )
+
+        self.tables = tables
+        self.cache_size = cache_size
+        self._cache: Dict[Hashable, Any] = {}
+
+        self._satisfaction = SubstringIndex(tables["SATISFACTION_BENCHMARKS"])
+        self._industries = SubstringIndex(tables["NPS_BENCHMARKS"]["by_industry"])
+        self._demographics = SubstringIndex(tables["DEMOGRAPHIC_MULTIPLIERS"])
+
+        # The "note" entry of PARTISAN_TOPICS is commentary, not a topic
+        self._partisan_topics = [
+            (topic, spec) for topic, spec in tables["PARTISAN_TOPICS"].items()
+            if isinstance(spec, Mapping)
+        ]
+        self._partisan = KeywordMatcher([[topic] for topic, _ in self._partisan_topics])
+
+        self._current_rules = tables["CURRENT_CALIBRATION_RULES"]
+        self._current = KeywordMatcher([rule[0] for rule in self._current_rules])
+
+        self._executive_audience = KeywordMatcher([EXECUTIVE_AUDIENCE_KEYWORDS])
+        self._executive_roles = list(EXECUTIVE_ROLE_PATTERNS.values())
+        self._executive_role = KeywordMatcher([[pattern] for pattern in EXECUTIVE_ROLE_PATTERNS])
+        self._executive_topics = list(EXECUTIVE_TOPIC_KEYWORDS.values())
+        self._executive_topic = KeywordMatcher([[keyword] for keyword in EXECUTIVE_TOPIC_KEYWORDS])
+
+    def _memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        cache = self._cache
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = compute()
+        if len(cache) >= self.cache_size:
+            try:
+                cache.pop(next(iter(cache)), None)
+            except (StopIteration, RuntimeError):
+                pass
+        cache[key] = value
+        return value
+
+    def clear_cache(self):
+        self._cache = {}
+
+    # ───────────────────────────────────────────────────────────
+    # Benchmarks
+    # ───────────────────────────────────────────────────────────
+
+    def benchmark(self, context: str, question_type: str) -> Optional[Any]:
+        """get_benchmark(): the Benchmark for a question context."""
+        def compute():
+            if question_type not in ["satisfaction", "satisfied"]:
+                return None
+            benchmarks = self.tables["SATISFACTION_BENCHMARKS"]
+            key = f"{context}_{question_type}".lower().replace(" ", "_")
+            index = self._satisfaction.first(key, context.lower())
+            if index is None:
+                return benchmarks.get("general_population")
+            return benchmarks[self._satisfaction.keys[index]]
+
+        return self._memo(("benchmark", context, question_type), compute)
+
+    def nps_industry(self, industry: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(key, data) of the NPS_BENCHMARKS industry get_nps_benchmark() uses."""
+        def compute():
+            index = self._industries.first(_normalize(industry))
+            if index is None:
+                return None
+            key = self._industries.keys[index]
+            return key, self.tables["NPS_BENCHMARKS"]["by_industry"][key]
+
+        return self._memo(("nps_industry", industry), compute)
+
+    def nps_benchmark(self, industry: str, b2b: bool = False) -> int:
+        """get_nps_benchmark(): the NPS benchmark for an industry."""
+        match = self.nps_industry(industry)
+        if match is None:
+            return self.tables["NPS_BENCHMARKS"]["b2b_median" if b2b else "b2c_median"]
+        data = match[1]
+        if b2b and "b2b" in data:
+            return data["b2b"]
+        elif not b2b and "b2c" in data:
+            return data["b2c"]
+        return data["median"]
+
+    def demographic(self, demographic: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(key, modifiers) of the DEMOGRAPHIC_MULTIPLIERS entry for a demographic."""
+        def compute():
+            index = self._demographics.first(_normalize(demographic))
+            if index is None:
+                return None
+            key = self._demographics.keys[index]
+            return key, self.tables["DEMOGRAPHIC_MULTIPLIERS"][key]
+
+        return self._memo(("demographic", demographic), compute)
+
+    def demographic_modifier(self, demographic: str, construct: str) -> float:
+        """get_demographic_modifier(): the multiplier for a demographic-construct pair."""
+        match = self.demographic(demographic)
+        if match is None:
+            return 1.0
+        return match[1].get(construct, 1.0)
+
+    # ───────────────────────────────────────────────────────────
+    # Topics
+    # ───────────────────────────────────────────────────────────
+
+    def requires_partisan_segmentation(self, topic: str) -> bool:
+        """requires_partisan_segmentation(): whether a topic needs a party breakdown."""
+        def compute():
+            index = self._partisan.first(topic.lower())
+            if index is None:
+                return False
+            return self._partisan_topics[index][1].get("required", False)
+
+        return self._memo(("partisan", topic), compute)
+
+    def current_calibration(self, topic: str) -> Optional[dict]:
+        """get_current_calibration(): current calibrations for a topic."""
+        from .calibration_current import resolve_current_calibration
+
+        def compute():
+            index = self._current.first(topic.lower())
+            if index is None:
+                return None
+            return resolve_current_calibration(self._current_rules[index], self.tables)
+
+        result = self._memo(("current", topic), compute)
+        return dict(result) if result is not None else None
+
+    # ───────────────────────────────────────────────────────────
+    # Executives
+    # ───────────────────────────────────────────────────────────
+
+    def executive_benchmark(self, topic: str, role: str = None, region: str = None) -> float:
+        """get_executive_benchmark(): calibrated executive concern level (0-1)."""
+        def compute():
+            base = self.tables["EXECUTIVE_RISK_CONCERNS"].get(topic, 0.20)  # Default 20%
+            roles = self.tables["ROLE_MULTIPLIERS"]
+            if role and role in roles:
+                base *= roles[role].get(topic, 1.0)
+            regions = self.tables["REGIONAL_MULTIPLIERS"]
+            if region and region in regions:
+                base *= regions[region].get(topic, 1.0)
+            return min(base, 0.95)  # Cap at 95%
+
+        return self._memo(("executive", topic, role, region), compute)
+
+    def executive_context(self, audience: str, topic: str) -> dict:
+        """detect_executive_context(): executive audience, role and risk topics."""
+        def compute():
+            audience_lower = audience.lower()
+            role = self._executive_role.first(audience_lower)
+            return {
+                "is_executive": self._executive_audience.first(audience_lower) is not None,
+                "role": self._executive_roles[role] if role is not None else None,
+                "matched_topics": tuple(
+                    self._executive_topics[index]
+                    for index in sorted(self._executive_topic.matches(topic.lower()))
+                ),
+            }
+
+        result = self._memo(("executive_context", audience, topic), compute)
+        return {**result, "matched_topics": list(result["matched_topics"])}
+
+
+@lru_cache(maxsize=None)
+def builtin_queries() -> CalibrationQueries:
+    """Queries over the calibration tables shipped with the package."""
+    from .calibration_snapshot import collect_tables
+
+    return CalibrationQueries(collect_tables())
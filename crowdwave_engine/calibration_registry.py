@@ -0,0 +1,235 @@
+"""
+Crowdwave Calibration Registry
+Versioned calibration bundles that can be swapped at runtime without a
+restart or a code deploy.
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+# Snapshot loaded by default_registry() when set (see calibration_snapshot)
+SNAPSHOT_ENV_VAR = "CROWDWAVE_CALIBRATION_SNAPSHOT"
+
+
+@dataclass(frozen=True)
+class CalibrationBundle:
+    """
+    One immutable version of the calibration tables.
+
+    `tables` maps table names (e.g. "PARTY_IDENTIFICATION_2025") to their
+    data, and must be treated as read-only: in-flight simulations keep
+    reading a bundle after a newer one has been activated.
+    """
+    version: str
+    tables: Mapping[str, Any]
+    checksum: Optional[str] = None
+    source: str = "builtin"
+    loaded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @cached_property
+    def queries(self) -> "CalibrationQueries":
+        """Indexed lookups over this bundle's tables (built on first use)."""
+        from .calibration_queries import CalibrationQueries
+        return CalibrationQueries(self.tables)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "checksum": self.checksum,
+            "source": self.source,
+            "loaded_at": self.loaded_at,
+        }
+
+
+def builtin_bundle() -> CalibrationBundle:
+    """The calibration tables shipped with the installed package."""
+    from . import __version__
+    from .calibration_snapshot import collect_tables
+
+    return CalibrationBundle(version=f"{__version__}+builtin", tables=collect_tables())
+
+
+def load_bundle(path: str, verify: bool = True) -> CalibrationBundle:
+    """Open a calibration snapshot file as a bundle."""
+    from .calibration_snapshot import CalibrationSnapshot
+
+    snapshot = CalibrationSnapshot(path, verify=verify)
+    return CalibrationBundle(
+        version=snapshot.version,
+        tables=snapshot,
+        checksum=snapshot.checksum,
+        source=os.path.abspath(path),
+    )
+
+
+class CalibrationRegistry:
+    """
+    Holds the active CalibrationBundle and swaps it atomically.
+
+    Usage:
+        registry = CalibrationRegistry()
+        registry.watch("calibration.cwsnap", interval=5.0)
+        engine = CrowdwaveEngine(calibration=registry)
+
+    Readers call current(), a single attribute read with no lock, and use
+    the returned bundle for the whole unit of work (CrowdwaveEngine reads
+    it once per simulate() call). Writers build the new bundle completely
+    before publishing it, so a reader sees either the old version or the
+    new one, never a mix. Replaced bundles are freed once the last
+    simulation using them finishes.
+    """
+
+    def __init__(self, bundle: Optional[CalibrationBundle] = None):
+        self._active = bundle or builtin_bundle()
+        self._swap_lock = threading.Lock()
+        self._history: List[Dict[str, Any]] = [self._active.info()]
+
+        self._watch_path: Optional[str] = None
+        self._watch_stamp: Optional[Tuple[int, int, int]] = None
+        self._watch_stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+
+    # ───────────────────────────────────────────────────────────
+    # Reading (hot path)
+    # ───────────────────────────────────────────────────────────
+
+    def current(self) -> CalibrationBundle:
+        """The active bundle. Lock-free."""
+        return self._active
+
+    @property
+    def version(self) -> str:
+        return self._active.version
+
+    # ───────────────────────────────────────────────────────────
+    # Swapping
+    # ───────────────────────────────────────────────────────────
+
+    def activate(self, bundle: CalibrationBundle) -> CalibrationBundle:
+        """Publish `bundle` as the active version and return the previous one."""
+        with self._swap_lock:
+            previous = self._active
+            self._active = bundle
+            self._history.append(bundle.info())
+        return previous
+
+    def load(self, path: str, verify: bool = True) -> CalibrationBundle:
+        """
+        Load a snapshot file and activate it.
+
+        On any error (missing file, bad checksum, wrong format) the active
+        bundle is left untouched and the exception propagates.
+        """
+        stamp = _file_stamp(path)
+        bundle = load_bundle(path, verify=verify)
+        self.activate(bundle)
+        self._watch_stamp = stamp
+        return bundle
+
+    def reload(self) -> bool:
+        """
+        Re-load the watched snapshot if the file has changed since it was
+        last loaded. Returns True if a new bundle was activated.
+        """
+        path = self._watch_path
+        if path is None:
+            return False
+        try:
+            stamp = _file_stamp(path)
+            if stamp == self._watch_stamp:
+                return False
+            self.load(path)
+        except Exception as e:
+            # Keep serving the last good version
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        self.last_error = None
+        return True
+
+    def watch(self, path: str, interval: Optional[float] = 5.0) -> CalibrationBundle:
+        """
+        Load `path` now and, if `interval` is set, poll it in a daemon
+        thread, activating each new version as it is written. Snapshots
+        built with build_snapshot() are renamed into place, so a poll never
+        sees a half-written file.
+        """
+        self.stop()
+        bundle = self.load(path)
+        self._watch_path = path
+
+        if interval:
+            self._watch_stop.clear()
+            self._watcher = threading.Thread(
+                target=self._poll, args=(interval,), name="calibration-watcher", daemon=True
+            )
+            self._watcher.start()
+        return bundle
+
+    def _poll(self, interval: float):
+        while not self._watch_stop.wait(interval):
+            self.reload()
+
+    def stop(self):
+        """Stop the watcher thread, if any."""
+        if self._watcher is not None:
+            self._watch_stop.set()
+            self._watcher.join()
+            self._watcher = None
+
+    # ───────────────────────────────────────────────────────────
+    # Reporting
+    # ───────────────────────────────────────────────────────────
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Active version plus activation history, e.g. for health endpoints.
+
+        "not_reloadable" lists the question-cascade rules whose
+        distributions are written in the code (see
+        cascade.fixed_base_rules); a snapshot cannot change them.
+        """
+        from .cascade import fixed_base_rules
+
+        with self._swap_lock:
+            history = list(self._history)
+        return {
+            **self._active.info(),
+            "watching": self._watch_path,
+            "last_error": self.last_error,
+            "history": history,
+            "not_reloadable": fixed_base_rules(),
+        }
+
+
+def _file_stamp(path: str) -> Tuple[int, int, int]:
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+_default_registry: Optional[CalibrationRegistry] = None
+_default_lock = threading.Lock()
+
+
+def default_registry() -> CalibrationRegistry:
+    """
+    The process-wide registry used by engines created without one.
+
+    Starts from the snapshot named by $CROWDWAVE_CALIBRATION_SNAPSHOT if
+    set, otherwise from the built-in tables.
+    """
+    global _default_registry
+    registry = _default_registry
+    if registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                path = os.environ.get(SNAPSHOT_ENV_VAR)
+                bundle = load_bundle(path) if path else None
+                _default_registry = CalibrationRegistry(bundle)
+            registry = _default_registry
+    return registry
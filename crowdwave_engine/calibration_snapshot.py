@@ -0,0 +1,314 @@
+"""
+Crowdwave Calibration Snapshots
+Compile the calibration library into a versioned, checksummed binary file
+that worker processes memory-map read-only.
+
+Build once per calibration change:
+    python -m crowdwave_engine calibration build -o calibration.cwsnap
+
+Then, in every worker:
+    snapshot = CalibrationSnapshot("calibration.cwsnap")
+    snapshot["NPS_BENCHMARKS"]
+    snapshot.current_calibration("border enforcement")
+
+The file is mapped with mmap(ACCESS_READ), so forked and spawned workers
+share the same page-cache pages, and each table is only decoded the first
+time it is read.
+"""
+
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import sys
+from dataclasses import asdict
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .matching import KeywordMatcher
+
+
+SNAPSHOT_MAGIC = b"CWCALSNP"
+SNAPSHOT_FORMAT = 2
+
+# Marshal format 2 predates object back-references, so the same tables
+# always serialize to the same bytes (and the same checksum).
+MARSHAL_VERSION = 2
+
+# magic, format, marshal version, index length, body length, sha256(body)
+_HEADER = struct.Struct("<8sHHQQ32s")
+
+# Modules whose upper-case tables make up the calibration library
+SOURCE_MODULES = ("calibration", "calibration_current", "benchmarks_executive")
+
+
+class SnapshotError(ValueError):
+    """A snapshot file is malformed, corrupt or built for another runtime."""
+
+
+# ═══════════════════════════════════════════════════════════════
+# ENCODING
+# ═══════════════════════════════════════════════════════════════
+
+# marshal only handles builtin types; Benchmark and AccuracyZone values
+# are stored as single-key tagged dicts and rebuilt on decode.
+_BENCHMARK_TAG = "__benchmark__"
+_ZONE_TAG = "__accuracy_zone__"
+
+
+def _encode(value: Any) -> Any:
+    from .calibration import AccuracyZone, Benchmark
+
+    if isinstance(value, Benchmark):
+        return {_BENCHMARK_TAG: {k: _encode(v) for k, v in asdict(value).items()}}
+    if isinstance(value, AccuracyZone):
+        return {_ZONE_TAG: value.value}
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_encode(v) for v in value)
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1:
+            from .calibration import AccuracyZone, Benchmark
+
+            if _ZONE_TAG in value:
+                return AccuracyZone(value[_ZONE_TAG])
+            if _BENCHMARK_TAG in value:
+                return Benchmark(**{k: _decode(v) for k, v in value[_BENCHMARK_TAG].items()})
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_decode(v) for v in value)
+    return value
+
+
+def _is_table(name: str, value: Any) -> bool:
+    return name.isupper() and not name.startswith("_") and isinstance(value, (dict, list, tuple))
+
+
+def collect_tables(modules: Optional[List[ModuleType]] = None) -> Dict[str, Any]:
+    """
+    Gather every upper-case calibration table from the source modules.
+
+    Later modules win on name clashes, matching how the engine resolves
+    `from .calibration_current import ...` after `.calibration`.
+    """
+    if modules is None:
+        from importlib import import_module
+        modules = [import_module(f".{name}", __package__) for name in SOURCE_MODULES]
+
+    tables: Dict[str, Any] = {}
+    for module in modules:
+        for name, value in vars(module).items():
+            if _is_table(name, value):
+                tables[name] = value
+    return tables
+
+
+# ═══════════════════════════════════════════════════════════════
+# BUILD
+# ═══════════════════════════════════════════════════════════════
+
+def build_snapshot(
+    path: str,
+    version: Optional[str] = None,
+    tables: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """
+    Compile calibration tables (default: the installed library) into a
+    snapshot file at `path` and return its sha256 checksum.
+
+    Builds are deterministic: the same tables and version always produce
+    the same bytes and checksum. The default version is the package
+    version plus a digest of the table contents.
+
+    The file is written to a temporary name and renamed into place, so
+    readers never see a partial snapshot.
+    """
+    from .calibration_current import CURRENT_CALIBRATION_RULES
+
+    if tables is None:
+        tables = collect_tables()
+
+    blobs: List[bytes] = []
+    offsets: Dict[str, Tuple[int, int]] = {}
+    position = 0
+    for name in sorted(tables):
+        blob = marshal.dumps(_encode(tables[name]), MARSHAL_VERSION)
+        offsets[name] = (position, len(blob))
+        blobs.append(blob)
+        position += len(blob)
+
+    data = b"".join(blobs)
+    if version is None:
+        # Content-derived, so rebuilding unchanged tables is reproducible
+        from . import __version__
+        version = f"{__version__}+{hashlib.sha256(data).hexdigest()[:12]}"
+
+    rules = tables.get("CURRENT_CALIBRATION_RULES", CURRENT_CALIBRATION_RULES)
+    index = marshal.dumps({
+        "version": version,
+        "tables": offsets,
+        "matchers": {
+            "current_calibration": KeywordMatcher([rule[0] for rule in rules]).to_spec(),
+        },
+    }, MARSHAL_VERSION)
+
+    body = index + data
+    digest = hashlib.sha256(body).digest()
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, MARSHAL_VERSION, len(index), len(body), digest
+    )
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return digest.hex()
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOAD
+# ═══════════════════════════════════════════════════════════════
+
+class CalibrationSnapshot(Mapping[str, Any]):
+    """
+    Read-only, memory-mapped view of a calibration snapshot.
+
+    Behaves as a mapping of table name to table. Tables are decoded from
+    the mapped file on first access and cached. With verify=True (the
+    default) the body's sha256 is checked against the header on open.
+    """
+
+    def __init__(self, path: str, verify: bool = True):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._body: Optional[memoryview] = None
+        try:
+            self._open(verify)
+        except Exception:
+            self._release()
+            raise
+
+        self._cache: Dict[str, Any] = {}
+        self._matchers: Dict[str, KeywordMatcher] = {}
+
+    def _open(self, verify: bool):
+        if len(self._mmap) < _HEADER.size:
+            raise SnapshotError(f"{self.path}: too short to be a calibration snapshot")
+
+        magic, fmt, marshal_version, index_len, body_len, digest = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{self.path}: not a calibration snapshot")
+        if fmt != SNAPSHOT_FORMAT:
+            raise SnapshotError(f"{self.path}: snapshot format {fmt}, expected {SNAPSHOT_FORMAT}")
+        if marshal_version > marshal.version:
+            raise SnapshotError(
+                f"{self.path}: built with marshal v{marshal_version}, this Python "
+                f"({sys.version.split()[0]}) reads up to v{marshal.version}; rebuild the snapshot"
+            )
+        if len(self._mmap) != _HEADER.size + body_len:
+            raise SnapshotError(f"{self.path}: truncated snapshot")
+
+        self._body = memoryview(self._mmap)[_HEADER.size:]
+        self.checksum = digest.hex()
+        if verify and hashlib.sha256(self._body).digest() != digest:
+            raise SnapshotError(f"{self.path}: checksum mismatch")
+
+        try:
+            index = marshal.loads(self._body[:index_len])
+        except (EOFError, ValueError, TypeError) as e:
+            # Only reachable with verify=False
+            raise SnapshotError(f"{self.path}: corrupt index ({e})") from e
+        self._data_start = index_len
+        self.version: str = index["version"]
+        self._offsets: Dict[str, Tuple[int, int]] = index["tables"]
+        self._matcher_specs: Dict[str, Dict[str, Any]] = index["matchers"]
+
+    # ───────────────────────────────────────────────────────────
+    # Mapping interface
+    # ───────────────────────────────────────────────────────────
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        offset, length = self._offsets[name]
+        start = self._data_start + offset
+        value = _decode(marshal.loads(self._body[start:start + length]))
+        self._cache[name] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._offsets
+
+    # ───────────────────────────────────────────────────────────
+    # Compiled lookups
+    # ───────────────────────────────────────────────────────────
+
+    def matcher(self, name: str) -> KeywordMatcher:
+        """A keyword matcher compiled into the snapshot at build time."""
+        matcher = self._matchers.get(name)
+        if matcher is None:
+            matcher = KeywordMatcher.from_spec(self._matcher_specs[name])
+            self._matchers[name] = matcher
+        return matcher
+
+    def current_calibration(self, topic: str) -> Optional[dict]:
+        """get_current_calibration() answered from this snapshot's tables."""
+        from .calibration_current import resolve_current_calibration
+
+        index = self.matcher("current_calibration").first(topic.lower())
+        if index is None:
+            return None
+        return resolve_current_calibration(self["CURRENT_CALIBRATION_RULES"][index], self)
+
+    def info(self) -> Dict[str, Any]:
+        """Version, checksum and size, e.g. for health endpoints."""
+        return {
+            "path": self.path,
+            "version": self.version,
+            "checksum": self.checksum,
+            "tables": len(self._offsets),
+            "bytes": len(self._mmap),
+        }
+
+    def close(self):
+        self._cache.clear()
+        self._release()
+
+    def _release(self):
+        # The mmap cannot close while a memoryview of it is alive
+        if self._body is not None:
+            self._body.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "CalibrationSnapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def verify_snapshot(path: str) -> Dict[str, Any]:
+    """Open `path` with checksum verification and return its info()."""
+    with CalibrationSnapshot(path, verify=True) as snapshot:
+        return snapshot.info()
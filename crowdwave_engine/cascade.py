@@ -0,0 +1,186 @@
+"""
+Crowdwave Cascade Walker
+One parse of a rule cascade such as CrowdwaveEngine._get_base_distribution,
+listing every return statement with the conditions that lead to it. The
+precomputed pipeline table, calibration retrieval, the profiler's rule
+labels and the registry's list of non-reloadable rules all read the
+cascade through this module.
+"""
+
+import ast
+import inspect
+import textwrap
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CascadeReturn:
+    """
+    One return statement of the cascade.
+
+    `conditions` are the `if` statements whose body holds the return,
+    outermost first; `chain` also includes the `if` of every `elif` /
+    `else` branch on the way. `question_type` is the type required by
+    the innermost `question.type == ...` condition, if any. `partisan`
+    marks returns inside a top-level branch whose condition tests
+    `party`. `setup` holds the simple statements (assignments and the
+    like) that run before the return in its enclosing blocks.
+    """
+    statement: ast.Return
+    line: int
+    question_type: Optional[str]
+    conditions: Tuple[ast.If, ...]
+    chain: Tuple[ast.If, ...]
+    partisan: bool
+    setup: Tuple[ast.stmt, ...] = ()
+
+    def reads(self, name: str) -> bool:
+        """Whether the return value, its conditions or its setup read `name`."""
+        nodes = (self.statement, *self.setup, *(c.test for c in self.conditions))
+        return any(
+            isinstance(n, ast.Name) and n.id == name
+            for node in nodes for n in ast.walk(node)
+        )
+
+
+@dataclass(frozen=True)
+class Cascade:
+    """A parsed cascade: its source lines and returns in source order."""
+    function: ast.FunctionDef
+    lines: Tuple[str, ...]
+    first_line: int
+    returns: Tuple[CascadeReturn, ...]
+
+    def line_of(self, node: ast.AST) -> int:
+        """Line of `node` in the source file."""
+        return self.first_line + node.lineno - 1
+
+    def comments_above(self, node: ast.AST) -> List[str]:
+        """Comment lines directly above `node`, top to bottom."""
+        block = []
+        index = node.lineno - 2
+        while index >= 0 and self.lines[index].lstrip().startswith("#"):
+            block.append(self.lines[index].lstrip().lstrip("#").strip())
+            index -= 1
+        return block[::-1]
+
+    def trailing_comment(self, node: ast.AST) -> str:
+        """The `  # ...` comment at the end of `node`'s first line."""
+        _, _, comment = self.lines[node.lineno - 1].partition("  #")
+        return comment.strip()
+
+    def heading(self, node: ast.AST) -> Optional[str]:
+        """Top line of the comment block above `node`, below any ═══ banner."""
+        block = self.comments_above(node)
+        banners = [i for i, line in enumerate(block) if "═" in line]
+        if banners:
+            block = block[banners[-1] + 1:]
+        return block[0] if block else None
+
+    def label(self, branch: CascadeReturn) -> str:
+        """
+        Rule label of a return: the heading of the innermost enclosing
+        `if`/`elif` chain (e.g. "Tariffs (Feb 2026)"), else the comment
+        directly above the return, else the line number.
+        """
+        label = next((h for h in map(self.heading, reversed(branch.chain)) if h), None)
+        return label or self.heading(branch.statement) or f"line {branch.line}"
+
+
+def required_type(test: ast.expr) -> Optional[str]:
+    """Question type a condition requires (`question.type == "scale"`), if any."""
+    for node in ast.walk(test):
+        if (
+            isinstance(node, ast.Compare) and len(node.ops) == 1
+            and isinstance(node.ops[0], ast.Eq) and isinstance(node.left, ast.Attribute)
+            and node.left.attr == "type" and isinstance(node.comparators[0], ast.Constant)
+        ):
+            return node.comparators[0].value
+    return None
+
+
+def _returns(function: ast.FunctionDef, first_line: int) -> List[CascadeReturn]:
+    found: List[CascadeReturn] = []
+
+    def visit(
+        statements: List[ast.stmt],
+        question_type: Optional[str],
+        conditions: Tuple[ast.If, ...],
+        chain: Tuple[ast.If, ...],
+        partisan: bool,
+        top: bool,
+        setup: Tuple[ast.stmt, ...]
+    ):
+        for statement in statements:
+            if isinstance(statement, ast.If):
+                in_party = partisan or (top and "party" in ast.unparse(statement.test))
+                visit(
+                    statement.body, required_type(statement.test) or question_type,
+                    conditions + (statement,), chain + (statement,), in_party, False, setup,
+                )
+                # `elif` / `else` branches sit in the chain of their `if`
+                visit(statement.orelse, question_type, conditions, chain + (statement,), partisan, top, setup)
+            elif isinstance(statement, ast.Return):
+                found.append(CascadeReturn(
+                    statement=statement,
+                    line=first_line + statement.lineno - 1,
+                    question_type=question_type,
+                    conditions=conditions,
+                    chain=chain,
+                    partisan=partisan,
+                    setup=setup,
+                ))
+            elif not isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                children = [
+                    child for child in ast.iter_child_nodes(statement)
+                    if isinstance(child, (ast.stmt, ast.excepthandler))
+                ]
+                if not children:
+                    setup += (statement,)
+                for child in children:
+                    if isinstance(child, ast.stmt):
+                        visit([child], question_type, conditions, chain, partisan, False, setup)
+                    else:
+                        visit(child.body, question_type, conditions, chain, partisan, False, setup)
+
+    visit(function.body, None, (), (), False, True, ())
+    return found
+
+
+@lru_cache(maxsize=None)
+def walk_cascade(fn: Callable) -> Cascade:
+    """Parse a function (or method) and list its returns."""
+    fn = getattr(fn, "__func__", fn)
+    lines, first_line = inspect.getsourcelines(fn)
+    function = ast.parse(textwrap.dedent("".join(lines))).body[0]
+    return Cascade(
+        function=function,
+        lines=tuple(lines),
+        first_line=first_line,
+        returns=tuple(_returns(function, first_line)),
+    )
+
+
+def base_distribution_cascade() -> Cascade:
+    """The cascade of CrowdwaveEngine._get_base_distribution."""
+    from .crowdwave import CrowdwaveEngine
+
+    return walk_cascade(CrowdwaveEngine._get_base_distribution)
+
+
+@lru_cache(maxsize=None)
+def fixed_base_rules() -> Dict[str, Tuple[str, ...]]:
+    """
+    Labels of _get_base_distribution rules that return a distribution
+    written in the code instead of one read from the calibration tables,
+    split into "partisan" and "topic" rules. Loading a calibration
+    snapshot does not change them. The result is shared; do not mutate.
+    """
+    cascade = base_distribution_cascade()
+    fixed: Dict[str, Dict[str, None]] = {"partisan": {}, "topic": {}}
+    for branch in cascade.returns:
+        if not branch.reads("tables"):
+            fixed["partisan" if branch.partisan else "topic"][cascade.label(branch)] = None
+    return {kind: tuple(labels) for kind, labels in fixed.items()}
@@ -107,29 +107,28 @@ def run_simulation(args):
 
 def show_benchmarks(args):
     """Show relevant benchmarks."""
-    from .calibration import NPS_BENCHMARKS, DEMOGRAPHIC_MULTIPLIERS, get_nps_benchmark
+    from .calibration import NPS_BENCHMARKS, DEMOGRAPHIC_MULTIPLIERS
+    from .calibration_queries import builtin_queries
     
+    queries = builtin_queries()
     if args.industry:
-        nps = get_nps_benchmark(args.industry, args.b2b)
+        nps = queries.nps_benchmark(args.industry, args.b2b)
         print(f"📈 NPS Benchmark for {args.industry}{'(B2B)' if args.b2b else ''}: {nps}")
         
         # Show industry details
-        industry_key = args.industry.lower().replace(" ", "_")
-        for key, data in NPS_BENCHMARKS["by_industry"].items():
-            if industry_key in key:
-                print(f"   Full data: {data}")
-                break
+        match = queries.nps_industry(args.industry)
+        if match:
+            print(f"   Full data: {match[1]}")
     
     if args.demographic:
-        demo_key = args.demographic.lower().replace(" ", "_").replace("-", "_")
-        for key, modifiers in DEMOGRAPHIC_MULTIPLIERS.items():
-            if demo_key in key or key in demo_key:
-                print(f"\n👥 Demographic modifiers for {key}:")
-                for mod_key, value in modifiers.items():
-                    if mod_key != "source":
-                        print(f"   {mod_key}: {value}")
-                print(f"   Source: {modifiers.get('source', 'N/A')}")
-                break
+        match = queries.demographic(args.demographic)
+        if match:
+            key, modifiers = match
+            print(f"\n👥 Demographic modifiers for {key}:")
+            for mod_key, value in modifiers.items():
+                if mod_key != "source":
+                    print(f"   {mod_key}: {value}")
+            print(f"   Source: {modifiers.get('source', 'N/A')}")
     
     if not args.industry and not args.demographic:
         print("📊 Available benchmarks:")
@@ -0,0 +1,347 @@
+"""
+Crowdwave Compact Results
+Columnar storage for large batches of question results. A
+SimulationResult holds its own distribution dict, tag lists and trace
+dict, so a million of them cost gigabytes of small objects; here every
+field is a column in a typed array and repeated values are stored once.
+
+Usage:
+    store = CompactResults.from_reports(r.report for r in batch_results)
+    store = CompactResults(slim=True)          # drop methodology traces
+    store.add_report(report)
+
+    store[0].distribution["Yes"]               # lazy, read-only dict view
+    store[0].to_result()                       # a regular SimulationResult
+    store.means(), store.distributions(option_set)   # numpy columns
+
+Layout:
+- Option labels are interned. Each distinct label tuple is one "option
+  set", shared by every result that has it.
+- Distributions are float32 values in one array, at each result's offset,
+  in option-set order. Views round them to 4 decimals, so percentages
+  with up to 4 decimals read back exactly. Unrounded values, e.g. after
+  a bias correction, come back within 5e-5 points (the rounding) plus
+  float32 error (under 4e-6 points below 100).
+- Question id/text pairs, tag lists (biases, corrections, warnings) and
+  traces are interned, and each result stores ids into those tables.
+- mean, sd and confidence are float64 columns (NaN for None).
+
+In slim mode traces are not stored and `methodology_trace` reads as {}.
+Views share interned objects: traces returned by the views are shared
+between results with identical traces, so treat them as read-only.
+to_result() returns independent copies.
+"""
+
+import copy
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .crowdwave import AccuracyZone, SimulationReport, SimulationResult
+
+
+# Percentages are stored as float32 and read back rounded to this many
+# decimals; float32 is within ~4e-6 below 100, so values with up to 4
+# decimals round-trip
+_DECIMALS = 4
+
+_ZONES = list(AccuracyZone)
+_ZONE_CODES = {zone: code for code, zone in enumerate(_ZONES)}
+
+
+class _Interner:
+    """Each distinct hashable value stored once, behind a dense int id."""
+    __slots__ = ("ids", "values")
+
+    def __init__(self):
+        self.ids: Dict[Hashable, int] = {}
+        self.values: List[Any] = []
+
+    def __call__(self, key: Hashable, value: Any = None) -> int:
+        """Id of `key`, storing `value` (default: the key) the first time it is seen."""
+        index = self.ids.get(key)
+        if index is None:
+            index = self.ids[key] = len(self.values)
+            self.values.append(key if value is None else value)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _strings(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(str(value)) for value in values)
+
+
+# ═══════════════════════════════════════════════════════════════
+# VIEWS
+# ═══════════════════════════════════════════════════════════════
+
+class DistributionView(Mapping):
+    """Read-only option -> percentage view of one stored distribution."""
+    __slots__ = ("_labels", "_positions", "_values", "_offset")
+
+    def __init__(self, labels: Tuple[str, ...], positions: Dict[str, int], values: array, offset: int):
+        self._labels = labels
+        self._positions = positions
+        self._values = values
+        self._offset = offset
+
+    def __getitem__(self, label: str) -> float:
+        return round(self._values[self._offset + self._positions[label]], _DECIMALS)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._labels)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._positions
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CompactResult:
+    """
+    One stored result, read through with the attribute names of
+    SimulationResult. Lists are fresh on every access; the distribution
+    is a DistributionView.
+    """
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "CompactResults", index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def question_id(self) -> str:
+        return self._store._questions.values[self._store._question[self._index]][0]
+
+    @property
+    def question_text(self) -> str:
+        return self._store._questions.values[self._store._question[self._index]][1]
+
+    @property
+    def distribution(self) -> DistributionView:
+        return self._store.distribution(self._index)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._store._optional(self._store._mean, self._index)
+
+    @property
+    def sd(self) -> Optional[float]:
+        return self._store._optional(self._store._sd, self._index)
+
+    @property
+    def confidence(self) -> float:
+        return self._store._confidence[self._index]
+
+    @property
+    def accuracy_zone(self) -> AccuracyZone:
+        return _ZONES[self._store._zone[self._index]]
+
+    @property
+    def biases_detected(self) -> List[str]:
+        return list(self._store._tags.values[self._store._biases[self._index]])
+
+    @property
+    def corrections_applied(self) -> List[str]:
+        return list(self._store._tags.values[self._store._corrections[self._index]])
+
+    @property
+    def validation_warnings(self) -> List[str]:
+        return list(self._store._tags.values[self._store._warnings[self._index]])
+
+    @property
+    def methodology_trace(self) -> Dict[str, Any]:
+        if self._store.slim:
+            return {}
+        return self._store._traces.values[self._store._trace[self._index]]
+
+    @property
+    def report(self) -> int:
+        """Position of the source report in add_report() order, or -1."""
+        return self._store._report[self._index]
+
+    def to_result(self) -> SimulationResult:
+        """An independent SimulationResult with this result's values."""
+        return SimulationResult(
+            question_id=self.question_id,
+            question_text=self.question_text,
+            distribution=dict(self.distribution),
+            mean=self.mean,
+            sd=self.sd,
+            confidence=self.confidence,
+            accuracy_zone=self.accuracy_zone,
+            biases_detected=self.biases_detected,
+            corrections_applied=self.corrections_applied,
+            validation_warnings=self.validation_warnings,
+            methodology_trace=copy.deepcopy(self.methodology_trace),
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactResult(question_id={self.question_id!r}, distribution={self.distribution!r})"
+
+
+# ═══════════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════════
+
+class CompactResults:
+    """
+    Append-only columnar store of question results (see module docstring).
+
+    Each result costs about 60 bytes plus 4 per option. Interned tables
+    grow only with distinct questions, option sets, tag lists and
+    traces.
+    """
+
+    def __init__(self, slim: bool = False):
+        self.slim = slim
+        self._reports = 0
+
+        # Interned tables
+        self._options = _Interner()     # label tuple -> (labels, label positions)
+        self._questions = _Interner()   # (question id, question text)
+        self._tags = _Interner()        # tuple of bias / correction / warning strings
+        self._traces = _Interner()      # trace repr -> first trace dict seen
+
+        # Columns, one entry per result
+        self._values = array("f")       # distribution values, all results back to back
+        self._offset = array("q")
+        self._option_set = array("i")
+        self._question = array("i")
+        self._mean = array("d")
+        self._sd = array("d")
+        self._confidence = array("d")
+        self._zone = array("B")
+        self._biases = array("i")
+        self._corrections = array("i")
+        self._warnings = array("i")
+        self._trace = array("i")
+        self._report = array("i")
+
+    @classmethod
+    def from_reports(cls, reports: Iterable[Optional[SimulationReport]], slim: bool = False) -> "CompactResults":
+        """Store every result of every report (None entries, e.g. failed batch jobs, count as empty reports)."""
+        store = cls(slim=slim)
+        for report in reports:
+            store.add_report(report)
+        return store
+
+    def add_report(self, report: Optional[SimulationReport]) -> int:
+        """Append a report's results; returns the report's position."""
+        position = self._reports
+        self._reports += 1
+        if report is not None:
+            self.extend(report.results, report=position)
+        return position
+
+    def extend(self, results: Iterable[SimulationResult], report: int = -1):
+        for result in results:
+            self.append(result, report)
+
+    def append(self, result: SimulationResult, report: int = -1):
+        distribution = result.distribution
+        labels = tuple(distribution)
+        option_set = self._options.ids.get(labels)
+        if option_set is None:
+            interned = _strings(labels)
+            option_set = self._options(labels, (interned, {label: i for i, label in enumerate(interned)}))
+
+        question = (result.question_id, result.question_text)
+        if question not in self._questions.ids:
+            question = _strings(question)
+
+        self._offset.append(len(self._values))
+        self._values.extend(distribution.values())
+        self._option_set.append(option_set)
+        self._question.append(self._questions(question))
+        self._mean.append(np.nan if result.mean is None else result.mean)
+        self._sd.append(np.nan if result.sd is None else result.sd)
+        self._confidence.append(result.confidence)
+        self._zone.append(_ZONE_CODES[result.accuracy_zone])
+        self._biases.append(self._tag_list(result.biases_detected))
+        self._corrections.append(self._tag_list(result.corrections_applied))
+        self._warnings.append(self._tag_list(result.validation_warnings))
+        if not self.slim:
+            trace = result.methodology_trace
+            # Traces are dicts of builtins, whose repr is a cheap content key
+            self._trace.append(self._traces(repr(trace), trace))
+        self._report.append(report)
+
+    def _tag_list(self, tags: List[str]) -> int:
+        key = tuple(tags)
+        index = self._tags.ids.get(key)
+        return index if index is not None else self._tags(_strings(key))
+
+    @staticmethod
+    def _optional(column: array, index: int) -> Optional[float]:
+        value = column[index]
+        return None if value != value else value
+
+    # ─── Access ───────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._offset)
+
+    def __getitem__(self, index: int) -> CompactResult:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactResults index out of range")
+        return CompactResult(self, index)
+
+    def __iter__(self) -> Iterator[CompactResult]:
+        return (CompactResult(self, index) for index in range(len(self)))
+
+    def distribution(self, index: int) -> DistributionView:
+        labels, positions = self._options.values[self._option_set[index]]
+        return DistributionView(labels, positions, self._values, self._offset[index])
+
+    @property
+    def option_sets(self) -> List[Tuple[str, ...]]:
+        """Distinct option-label tuples; a result's `option_set` indexes this list."""
+        return [labels for labels, _ in self._options.values]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns (interned tables excluded)."""
+        columns = (
+            self._values, self._offset, self._option_set, self._question, self._mean, self._sd,
+            self._confidence, self._zone, self._biases, self._corrections, self._warnings,
+            self._trace, self._report,
+        )
+        return sum(column.itemsize * len(column) for column in columns)
+
+    # Numpy copies of the columns (the arrays keep growing, so no views)
+
+    def means(self) -> np.ndarray:
+        return np.array(self._mean, dtype=np.float64)
+
+    def sds(self) -> np.ndarray:
+        return np.array(self._sd, dtype=np.float64)
+
+    def confidences(self) -> np.ndarray:
+        return np.array(self._confidence, dtype=np.float64)
+
+    def option_set_ids(self) -> np.ndarray:
+        return np.array(self._option_set, dtype=np.int32)
+
+    def distributions(self, option_set: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (result indices, results × options float32 matrix) for every
+        result with one option set, columns in option_sets[option_set]
+        order.
+        """
+        indices = np.flatnonzero(self.option_set_ids() == option_set)
+        width = len(self._options.values[option_set][0])
+        values = np.frombuffer(self._values, dtype=np.float32).copy()
+        offsets = np.array(self._offset, dtype=np.int64)[indices]
+        return indices, values[offsets[:, None] + np.arange(width)]
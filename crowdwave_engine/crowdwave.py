@@ -4,10 +4,11 @@ Production-ready survey simulation with calibrated accuracy.
 """
 
 import json
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
+from time import perf_counter
 
 from .calibration import (
     AccuracyZone, 
@@ -28,6 +29,7 @@ from .calibration import (
     get_mental_health_distribution,
 )
 from .bias_corrections import (
+    BiasDetection,
     BiasType,
     detect_biases,
     apply_emotional_bonding_correction,
@@ -37,6 +39,12 @@ from .bias_corrections import (
     apply_economic_rebalance,
     validate_distribution,
 )
+from .profiling import SimulationProfiler
+from .pipeline_table import lookup_pipeline_output
+from .calibration_registry import CalibrationRegistry, default_registry
+from .calibration_queries import CalibrationQueries
+from .matching import TRIGGERS
+from .features import QuestionFeatures, QuestionText, detect_generation, detect_party
 from .calibration_current import (
     IMMIGRATION_ENFORCEMENT_FEB2026,
     AI_JOB_CONCERNS_2026,
@@ -50,6 +58,77 @@ from .calibration_current import (
 )
 
 
+# ═══════════════════════════════════════════════════════════════
+# TRIGGER VOCABULARIES
+# ═══════════════════════════════════════════════════════════════
+
+# get_accuracy_guidance(): domain -> (keywords, expected error, confidence)
+GUIDANCE_CALIBRATED_DOMAINS = {
+    "mental_health": (["mental health", "anxiety", "depression", "therapy", "well-being"], "0.5-2pt", "HIGH"),
+    "executives": (["ceo", "c-suite", "executive", "cfo", "board"], "3-6pt", "MEDIUM"),
+    "pet_owners": (["pet owner", "dog owner", "cat owner"], "2-4pt", "HIGH"),
+    "tech_seniors": (["50+", "60+", "senior", "aarp", "older adult"], "2-4pt", "HIGH"),
+    "political": (["democrat", "republican", "political", "party affil"], "2-3pt", "HIGH"),
+    "trust_institutions": (["trust", "confidence in"], "2-3pt", "HIGH"),
+    "satisfaction": (["satisfaction", "satisfied"], "3-4pt", "MEDIUM"),
+    "nps": (["recommend", "nps", "net promoter"], "4-5pt", "MEDIUM"),
+}
+
+GUIDANCE_RISKY_DOMAINS = {
+    "pricing": (["price", "pricing", "willingness to pay", "wtp"], "10-20pt", "LOW"),
+    "purchase_intent": (["purchase intent", "would you buy", "likelihood to buy"], "8-15pt", "LOW"),
+    "conversion": (["conversion", "sign up", "subscribe"], "10-20pt", "LOW"),
+}
+
+# _check_calibration_coverage(): calibrated domains (validated with human data)
+COVERAGE_CALIBRATED_DOMAINS = {
+    "mental_health": ["mental health", "anxiety", "depression", "well-being", "wellbeing", "therapy"],
+    "pet_owners": ["pet", "dog", "cat", "animal"],
+    "executives": ["ceo", "c-suite", "executive", "cfo", "chro", "board"],
+    "tech_adoption_seniors": ["50+", "60+", "65+", "senior", "older", "aarp"],
+    "political": ["democrat", "republican", "political", "party", "vote"],
+    "trust": ["trust", "confidence", "believe"],
+    "nps": ["recommend", "nps", "promoter"],
+    "satisfaction": ["satisfied", "satisfaction"],
+}
+
+# _check_calibration_coverage(): high-risk uncalibrated domains
+COVERAGE_RISKY_DOMAINS = {
+    "pricing": ["price", "pricing", "willingness to pay", "wtp", "how much"],
+    "purchase_intent": ["purchase", "buy", "intent to", "likelihood to buy"],
+    "b2b_specific": ["enterprise", "procurement", "vendor selection"],
+    "medical_claims": ["cure", "treatment efficacy", "clinical"],
+    "legal_regulatory": ["compliance", "legal", "regulatory"],
+}
+
+# Compiled into the shared trigger scanner with the bias vocabularies, so
+# each audience/topic and question text is scanned once per process.
+_GUIDANCE_CALIBRATED = TRIGGERS.add_all(
+    "guidance.calibrated", {d: kws for d, (kws, _, _) in GUIDANCE_CALIBRATED_DOMAINS.items()}
+)
+_GUIDANCE_RISKY = TRIGGERS.add_all(
+    "guidance.risky", {d: kws for d, (kws, _, _) in GUIDANCE_RISKY_DOMAINS.items()}
+)
+_COVERAGE_CALIBRATED = TRIGGERS.add_all("coverage.calibrated", COVERAGE_CALIBRATED_DOMAINS)
+_COVERAGE_RISKY = TRIGGERS.add_all("coverage.risky", COVERAGE_RISKY_DOMAINS)
+_Q_PURCHASE = TRIGGERS.add("question.purchase", ["would you buy", "purchase", "likelihood to buy"])
+_Q_PRICING = TRIGGERS.add("question.pricing", ["how much would you pay", "willingness to pay", "price point"])
+_Q_GENERIC_CALIBRATED = TRIGGERS.add(
+    "question.generic_calibrated", ["important", "satisfied", "concern", "worried", "trust", "recommend"]
+)
+_ZONE_HIGH = TRIGGERS.add("zone.high", ["aware", "familiar", "trust", "confidence", "party"])
+_ZONE_LOW = TRIGGERS.add("zone.low", ["intent", "purchase", "pay", "price", "switch"])
+_Q_ADOPTION = TRIGGERS.add("question.adoption", ["use", "adopt", "try", "online", "digital"])
+_Q_CONCERN = TRIGGERS.add("question.concern", ["concern", "worry", "fear", "anxious"])
+
+# (run type, rationale) for the Phase 5 ensemble, in run order
+ENSEMBLE_RUNS = (
+    ("conservative", "Heavy anchor on priors, modest stimulus effects, compressed to center"),
+    ("signal_forward", "Meaningful stimulus impact, weight recent sources heavily"),
+    ("heterogeneity", "Higher variance, audience segments respond differently"),
+)
+
+
 # ═══════════════════════════════════════════════════════════════
 # DATA STRUCTURES
 # ═══════════════════════════════════════════════════════════════
@@ -78,7 +157,7 @@ class Question:
     labels: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     """Result of simulating a single question."""
     question_id: str
@@ -94,7 +173,7 @@ class SimulationResult:
     methodology_trace: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnsembleRun:
     """A single run in the 3-run ensemble."""
     run_type: str  # "conservative", "signal_forward", "heterogeneity"
@@ -111,6 +190,8 @@ class SimulationReport:
     overall_confidence: float
     flags: List[str]
     generated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    calibration_version: str = ""
+    calibration_checksum: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -124,11 +205,32 @@ class CrowdwaveEngine:
     Usage:
         engine = CrowdwaveEngine()
         results = engine.simulate(survey_config, questions)
+    
+    Pass a SimulationProfiler to record per-phase timings and matched
+    base-distribution rules; with no profiler the pipeline is untimed.
+    
+    Calibration tables come from a CalibrationRegistry (the process-wide
+    default unless one is given). Each simulate() call uses the version
+    active when it starts, and stamps it on the report.
+    
+    Questions whose base distribution is one of the cascade's fixed
+    calibrations take their ensemble, statistics and validation from the
+    precomputed table in pipeline_outputs.py; pass precomputed=False to
+    run every phase live.
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        profiler: Optional[SimulationProfiler] = None,
+        calibration: Optional[CalibrationRegistry] = None,
+        precomputed: bool = True
+    ):
         self.verbose = verbose
         self.priors_cache = {}
+        self.profiler = profiler
+        self.calibration = calibration or default_registry()
+        self.precomputed = precomputed
     
     def get_accuracy_guidance(self, audience: str, topic: str = "") -> Dict[str, Any]:
         """
@@ -140,37 +242,18 @@ class CrowdwaveEngine:
             - warnings: list of accuracy warnings
             - recommendations: usage recommendations
         """
-        combined = (audience + " " + topic).lower()
-        
-        # Calibrated domains
-        calibrated = {
-            "mental_health": (["mental health", "anxiety", "depression", "therapy", "well-being"], "0.5-2pt", "HIGH"),
-            "executives": (["ceo", "c-suite", "executive", "cfo", "board"], "3-6pt", "MEDIUM"),
-            "pet_owners": (["pet owner", "dog owner", "cat owner"], "2-4pt", "HIGH"),
-            "tech_seniors": (["50+", "60+", "senior", "aarp", "older adult"], "2-4pt", "HIGH"),
-            "political": (["democrat", "republican", "political", "party affil"], "2-3pt", "HIGH"),
-            "trust_institutions": (["trust", "confidence in"], "2-3pt", "HIGH"),
-            "satisfaction": (["satisfaction", "satisfied"], "3-4pt", "MEDIUM"),
-            "nps": (["recommend", "nps", "net promoter"], "4-5pt", "MEDIUM"),
-        }
-        
-        # High-risk domains
-        risky = {
-            "pricing": (["price", "pricing", "willingness to pay", "wtp"], "10-20pt", "LOW"),
-            "purchase_intent": (["purchase intent", "would you buy", "likelihood to buy"], "8-15pt", "LOW"),
-            "conversion": (["conversion", "sign up", "subscribe"], "10-20pt", "LOW"),
-        }
+        hits = TRIGGERS.scan((audience + " " + topic).lower())
         
         # Check matches
         matched_calibrated = None
-        for domain, (keywords, error, confidence) in calibrated.items():
-            if any(kw in combined for kw in keywords):
+        for name, (domain, (_, error, confidence)) in zip(_GUIDANCE_CALIBRATED, GUIDANCE_CALIBRATED_DOMAINS.items()):
+            if hits.any(name):
                 matched_calibrated = (domain, error, confidence)
                 break
         
         matched_risky = None
-        for domain, (keywords, error, confidence) in risky.items():
-            if any(kw in combined for kw in keywords):
+        for name, (domain, (_, error, confidence)) in zip(_GUIDANCE_RISKY, GUIDANCE_RISKY_DOMAINS.items()):
+            if hits.any(name):
                 matched_risky = (domain, error, confidence)
                 break
         
@@ -232,8 +315,59 @@ class CrowdwaveEngine:
         Returns:
             SimulationReport with results for all questions
         """
-        # Parse config
-        survey_config = SurveyConfig(
+        profiler = self.profiler
+        t = perf_counter() if profiler else 0.0
+        
+        # Pin one calibration version for the whole report
+        bundle = self.calibration.current()
+        
+        survey_config = self._parse_config(config)
+        parsed_questions = self._parse_questions(questions)
+        if profiler:
+            t = profiler.lap("parse", t)
+        
+        # Normalize and keyword-scan each question once for all phases
+        features = QuestionFeatures.extract_all(
+            parsed_questions, survey_config.topic, survey_config.audience
+        )
+        if profiler:
+            t = profiler.lap("features", t)
+        
+        return self._simulate_survey(survey_config, parsed_questions, features, bundle, t)
+    
+    def compile(
+        self,
+        questions: List[Dict[str, Any]],
+        config: Optional[Dict[str, Any]] = None
+    ) -> "CompiledSurvey":
+        """
+        Parse and keyword-scan a questionnaire once, for simulating it
+        against many audiences (see CompiledSurvey).
+        
+        Args:
+            questions: List of question dicts
+            config: Survey configuration dict shared by every audience
+        """
+        return CompiledSurvey(self, questions, config)
+    
+    def simulate_segmented(
+        self,
+        config: Dict[str, Any],
+        questions: List[Dict[str, Any]],
+        generation: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> "SegmentedReport":
+        """
+        Simulate the audience split into Democrat, Republican and
+        Independent segments in one pass, plus their population-weighted
+        total (see CompiledSurvey.simulate_segments).
+        """
+        return self.compile(questions, config).simulate_segments(
+            config.get("audience", "General population"), generation, weights
+        )
+    
+    def _parse_config(self, config: Dict[str, Any]) -> SurveyConfig:
+        return SurveyConfig(
             audience=config.get("audience", "General population"),
             geography=config.get("geography", "USA"),
             sample_size=config.get("sample_size", 500),
@@ -241,9 +375,9 @@ class CrowdwaveEngine:
             screeners=config.get("screeners", []),
             stimuli=config.get("stimuli", []),
         )
-        
-        # Parse questions
-        parsed_questions = [
+    
+    def _parse_questions(self, questions: List[Dict[str, Any]]) -> List[Question]:
+        return [
             Question(
                 id=q.get("id", f"Q{i+1}"),
                 text=q.get("text", ""),
@@ -254,21 +388,51 @@ class CrowdwaveEngine:
             )
             for i, q in enumerate(questions)
         ]
+    
+    def _simulate_survey(
+        self,
+        survey_config: SurveyConfig,
+        parsed_questions: List[Question],
+        features: List[QuestionFeatures],
+        bundle: Any,
+        t: float = 0.0
+    ) -> SimulationReport:
+        """Phases 1-9 for parsed questions and their features."""
+        profiler = self.profiler
+        tables = bundle.tables
         
         # Phase 1: Establish priors
-        priors = self._establish_priors(survey_config, parsed_questions)
+        priors = self._establish_priors(survey_config, parsed_questions, tables, features)
+        if profiler:
+            t = profiler.lap("priors", t)
         
         # Phase 2-9: Simulate each question
         results = []
-        for question in parsed_questions:
-            result = self._simulate_question(survey_config, question, priors)
+        for question, question_features in zip(parsed_questions, features):
+            result = self._simulate_question(survey_config, question, priors, tables, question_features)
             results.append(result)
         
+        # Collect flags and add calibration warnings
+        if profiler:
+            t = perf_counter()
+        flags = self._check_calibration_coverage(survey_config, parsed_questions, features)
+        if profiler:
+            profiler.lap("coverage", t)
+        
+        return self._survey_report(survey_config, results, priors, flags, bundle)
+    
+    def _survey_report(
+        self,
+        survey_config: SurveyConfig,
+        results: List[SimulationResult],
+        priors: List[Dict],
+        flags: List[str],
+        bundle: Any
+    ) -> SimulationReport:
+        """Report for simulated questions, adding per-question flags to the coverage `flags`."""
         # Calculate overall confidence
         overall_confidence = sum(r.confidence for r in results) / len(results)
         
-        # Collect flags and add calibration warnings
-        flags = self._check_calibration_coverage(survey_config, parsed_questions)
         for r in results:
             if r.accuracy_zone == AccuracyZone.LOW:
                 flags.append(f"{r.question_id}: Low accuracy zone - validate results")
@@ -281,12 +445,16 @@ class CrowdwaveEngine:
             priors_used=priors,
             overall_confidence=overall_confidence,
             flags=flags,
+            calibration_version=bundle.version,
+            calibration_checksum=bundle.checksum,
         )
     
     def generate_respondents(
         self,
         report: SimulationReport,
-        n: int = None
+        n: int = None,
+        correlation: Any = None,
+        seed: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate synthetic respondent-level data from simulation results.
@@ -294,6 +462,10 @@ class CrowdwaveEngine:
         Args:
             report: SimulationReport from simulate()
             n: Number of respondents (default: config.sample_size)
+            correlation: None samples each question independently;
+                "construct" or a question × question matrix correlates
+                answers through a Gaussian copula (see respondents.CopulaSampler)
+            seed: Random seed for correlated sampling
             
         Returns:
             List of respondent dicts with demographic info and responses
@@ -301,6 +473,9 @@ class CrowdwaveEngine:
         import random
         
         n = n or report.config.sample_size
+        if correlation is not None:
+            from .respondents import CopulaSampler
+            return CopulaSampler(report, correlation, seed).respondents(n)
         respondents = []
         
         for i in range(n):
@@ -332,7 +507,9 @@ class CrowdwaveEngine:
         self,
         report: SimulationReport,
         filepath: str = None,
-        n: int = None
+        n: int = None,
+        correlation: Any = None,
+        seed: Optional[int] = None
     ) -> str:
         """
         Export simulation results as respondent-level CSV.
@@ -341,6 +518,8 @@ class CrowdwaveEngine:
             report: SimulationReport from simulate()
             filepath: Path to save CSV (if None, returns string)
             n: Number of respondents (default: config.sample_size)
+            correlation, seed: As for generate_respondents(); correlated
+                files are streamed in chunks rather than built in memory
             
         Returns:
             CSV string (if filepath is None) or filepath
@@ -348,6 +527,17 @@ class CrowdwaveEngine:
         import csv
         import io
         
+        if correlation is not None:
+            from .respondents import CopulaSampler
+            sampler = CopulaSampler(report, correlation, seed)
+            n = n or report.config.sample_size
+            if filepath:
+                sampler.write_csv(filepath, n)
+                return filepath
+            output = io.StringIO()
+            sampler.write_csv(output, n)
+            return output.getvalue()
+        
         respondents = self.generate_respondents(report, n)
         
         if not respondents:
@@ -369,76 +559,55 @@ class CrowdwaveEngine:
             writer.writerows(respondents)
             return output.getvalue()
     
+    def _calibration_queries(self, tables: Mapping[str, Any]) -> CalibrationQueries:
+        """Lookups over `tables`, reusing the active bundle's indexes when they are its tables."""
+        bundle = self.calibration.current()
+        if tables is bundle.tables:
+            return bundle.queries
+        return CalibrationQueries(tables)
+    
+    def _binary_split(self, opt0: str, opt1: str, share: float) -> Dict[str, float]:
+        """Two-option distribution from a calibrated 0-1 share for the first option."""
+        pct = round(share * 100.0, 1)
+        return {opt0: pct, opt1: round(100.0 - pct, 1)}
+    
     def _detect_generation(self, audience: str) -> Optional[str]:
         """Detect generation from audience description."""
-        audience_lower = audience.lower()
-        
-        if any(t in audience_lower for t in ["gen z", "genz", "18-24", "18-25", "zoomers"]):
-            return "gen_z"
-        elif any(t in audience_lower for t in ["millennial", "25-40", "25-44", "gen y"]):
-            return "millennial"
-        elif any(t in audience_lower for t in ["gen x", "genx", "40-55", "45-60"]):
-            return "gen_x"
-        elif any(t in audience_lower for t in ["boomer", "55+", "60+", "65+", "senior", "older"]):
-            return "boomer"
-        return None
+        return detect_generation(audience)
     
     def _check_calibration_coverage(
         self,
         config: SurveyConfig,
-        questions: List[Question]
+        questions: List[Question],
+        features: Optional[List[QuestionFeatures]] = None
     ) -> List[str]:
         """
         Check calibration coverage and return accuracy warnings.
         """
+        if features is None:
+            features = QuestionFeatures.extract_all(questions, config.topic, config.audience)
         warnings = []
-        audience_lower = config.audience.lower()
         topic_lower = config.topic.lower() if config.topic else ""
-        combined = audience_lower + " " + topic_lower
-        
-        # Calibrated domains (validated with human data)
-        calibrated_domains = {
-            "mental_health": ["mental health", "anxiety", "depression", "well-being", "wellbeing", "therapy"],
-            "pet_owners": ["pet", "dog", "cat", "animal"],
-            "executives": ["ceo", "c-suite", "executive", "cfo", "chro", "board"],
-            "tech_adoption_seniors": ["50+", "60+", "65+", "senior", "older", "aarp"],
-            "political": ["democrat", "republican", "political", "party", "vote"],
-            "trust": ["trust", "confidence", "believe"],
-            "nps": ["recommend", "nps", "promoter"],
-            "satisfaction": ["satisfied", "satisfaction"],
-        }
+        hits = TRIGGERS.scan(config.audience.lower() + " " + topic_lower)
         
         # Check if any calibrated domain matches
-        matched_domain = None
-        for domain, keywords in calibrated_domains.items():
-            if any(kw in combined for kw in keywords):
-                matched_domain = domain
-                break
+        matched_domain = hits.first(_COVERAGE_CALIBRATED)
         
         # High-risk uncalibrated domains
-        risky_domains = {
-            "pricing": ["price", "pricing", "willingness to pay", "wtp", "how much"],
-            "purchase_intent": ["purchase", "buy", "intent to", "likelihood to buy"],
-            "b2b_specific": ["enterprise", "procurement", "vendor selection"],
-            "medical_claims": ["cure", "treatment efficacy", "clinical"],
-            "legal_regulatory": ["compliance", "legal", "regulatory"],
-        }
-        
-        for domain, keywords in risky_domains.items():
-            if any(kw in combined for kw in keywords):
+        for name, domain in zip(_COVERAGE_RISKY, COVERAGE_RISKY_DOMAINS):
+            if hits.any(name):
                 warnings.append(f"ACCURACY WARNING: {domain.replace('_', ' ').title()} questions have 8-15pt error range. Validate with real data.")
         
         # Check question types
-        for q in questions:
-            q_lower = q.text.lower()
-            
+        question_hits = [f.hits for f in features]
+        for q, q_hits in zip(questions, question_hits):
             # Purchase intent warning
-            if any(t in q_lower for t in ["would you buy", "purchase", "likelihood to buy"]):
+            if q_hits.any(_Q_PURCHASE):
                 if "ACCURACY WARNING" not in str(warnings):
                     warnings.append("ACCURACY WARNING: Purchase intent predictions have high error (8-15pts). Use for directional insights only.")
             
             # Pricing warning
-            if any(t in q_lower for t in ["how much would you pay", "willingness to pay", "price point"]):
+            if q_hits.any(_Q_PRICING):
                 warnings.append(f"{q.id}: Pricing questions have LOW accuracy (10-20pt error). Recommend real-world validation.")
             
             # Open-ended warning
@@ -448,8 +617,7 @@ class CrowdwaveEngine:
         # General calibration status
         if not matched_domain:
             # Check for generic patterns that are still reasonably calibrated
-            generic_calibrated = ["important", "satisfied", "concern", "worried", "trust", "recommend"]
-            has_generic = any(any(g in q.text.lower() for g in generic_calibrated) for q in questions)
+            has_generic = any(q_hits.any(_Q_GENERIC_CALIBRATED) for q_hits in question_hits)
             
             if not has_generic:
                 warnings.insert(0, f"NOTE: '{config.topic or config.audience}' is not a calibrated domain. Results use general benchmarks (3-5pt expected error).")
@@ -459,28 +627,34 @@ class CrowdwaveEngine:
     def _establish_priors(
         self,
         config: SurveyConfig,
-        questions: List[Question]
+        questions: List[Question],
+        tables: Optional[Dict[str, Any]] = None,
+        features: Optional[List[QuestionFeatures]] = None
     ) -> List[Dict]:
         """
         Phase 2: Establish priors from calibration library.
         """
+        if tables is None:
+            tables = self.calibration.current().tables
+        if features is None:
+            features = QuestionFeatures.extract_all(questions, config.topic, config.audience)
         priors = []
         
         # Audience priors
         audience_lower = config.audience.lower()
         
         # Detect generation
-        generation = self._detect_generation(config.audience)
+        generation = features[0].generation if features else self._detect_generation(config.audience)
         if generation:
             priors.append({
                 "type": "generation",
                 "generation": generation,
-                "party_id": PARTY_IDENTIFICATION_2025["by_generation"].get(generation, {}),
+                "party_id": tables["PARTY_IDENTIFICATION_2025"]["by_generation"].get(generation, {}),
                 "relevance": 4,
             })
         
         # Check for demographic matches
-        for demo_key, modifiers in DEMOGRAPHIC_MULTIPLIERS.items():
+        for demo_key, modifiers in tables["DEMOGRAPHIC_MULTIPLIERS"].items():
             demo_parts = demo_key.replace("_", " ")
             if any(part in audience_lower for part in demo_parts.split()):
                 priors.append({
@@ -494,25 +668,25 @@ class CrowdwaveEngine:
         if any(t in audience_lower for t in ["ceo", "executive", "c-suite", "cfo", "chro"]):
             priors.append({
                 "type": "executive",
-                "data": EXECUTIVE_MULTIPLIERS,
+                "data": tables["EXECUTIVE_MULTIPLIERS"],
                 "relevance": 5,
             })
         
         # Topic-specific priors
-        for q in questions:
-            q_text = q.text.lower()
+        for q, q_features in zip(questions, features):
+            q_text = q_features.text
             
             # NPS questions
             if q.type == "nps" or "recommend" in q_text:
                 priors.append({
                     "type": "nps_benchmark",
-                    "data": NPS_BENCHMARKS,
+                    "data": tables["NPS_BENCHMARKS"],
                     "relevance": 4,
                 })
             
             # Satisfaction questions
             if "satisf" in q_text:
-                benchmark = get_benchmark(config.topic, "satisfaction")
+                benchmark = self._calibration_queries(tables).benchmark(config.topic, "satisfaction")
                 if benchmark:
                     priors.append({
                         "type": "satisfaction_benchmark",
@@ -526,23 +700,74 @@ class CrowdwaveEngine:
         self,
         config: SurveyConfig,
         question: Question,
-        priors: List[Dict]
+        priors: List[Dict],
+        tables: Optional[Dict[str, Any]] = None,
+        features: Optional[QuestionFeatures] = None,
+        biases: Optional[List[BiasDetection]] = None,
+        base: Optional[Dict[str, float]] = None,
+        ensembles: Optional[Dict[Tuple, Tuple[Tuple, Optional[float]]]] = None
     ) -> SimulationResult:
         """
         Simulate a single question through phases 3-9.
+        
+        Callers simulating many configurations (see scenarios.py) can pass in
+        work they share: `biases` detected for this audience, the `base`
+        distribution for this audience and topic, and `ensembles`, a memo
+        of reconciled ensembles keyed by base distribution and stimuli
+        presence. Each is computed live when None; passing them must not
+        change output.
         """
+        if features is None:
+            features = QuestionFeatures.extract(question, config.topic, config.audience)
+        profiler = self.profiler
+        trace = {}
+        if profiler:
+            timings = {}
+            t = perf_counter()
+        
         # Phase 3: Detect biases
-        biases = detect_biases(question.text, config.audience, question.type)
+        if biases is None:
+            biases = detect_biases(question.text, config.audience, question.type, features.audience_hits)
         biases_detected = [b.bias_type.value for b in biases]
+        if profiler:
+            t = profiler.lap("bias_detection", t, timings)
         
         # Phase 4: Determine accuracy zone
-        accuracy_zone = self._determine_accuracy_zone(question)
-        
-        # Phase 5: Run ensemble (3 independent estimates)
-        runs = self._run_ensemble(config, question, priors)
+        accuracy_zone = self._determine_accuracy_zone(question, features)
+        if profiler:
+            t = profiler.lap("accuracy_zone", t, timings)
+        
+        # Phase 5: Run ensemble (3 independent estimates). Fixed calibrated
+        # distributions have phases 5-9 precomputed (pipeline_table.py).
+        if base is None:
+            base = self._traced_base_distribution(config, question, priors, trace, tables, features)
+        precomputed = None
+        if self.precomputed:
+            precomputed = lookup_pipeline_output(question.type, base, config.stimuli, config.audience)
+        reconciled = None
+        if precomputed is None:
+            if ensembles is not None:
+                ensemble_key = (tuple(base.items()), bool(config.stimuli))
+                reconciled = ensembles.get(ensemble_key)
+            if reconciled is None:
+                runs = self._ensemble_runs(base, config)
+        if profiler:
+            t = profiler.lap("ensemble", t, timings)
         
         # Phase 6: Reconcile ensemble
-        distribution = self._reconcile_ensemble(runs)
+        if precomputed is not None:
+            distribution = dict(zip(base, precomputed.distribution))
+            spread = precomputed.spread
+        elif reconciled is not None:
+            distribution = dict(reconciled[0])
+            spread = reconciled[1]
+        else:
+            distribution = self._reconcile_ensemble(runs)
+            spread = self._ensemble_spread(runs)
+            if ensembles is not None:
+                ensembles[ensemble_key] = (tuple(distribution.items()), spread)
+        if profiler:
+            t = profiler.lap("reconciliation", t, timings)
         
         # Phase 7: Apply bias corrections (only for appropriate question types)
         corrections_applied = []
@@ -552,8 +777,7 @@ class CrowdwaveEngine:
                 corrections_applied.append("emotional_bonding_+20%")
             elif bias.bias_type == BiasType.SENIOR_DIGITAL and question.type in ["scale", "nps"]:
                 # Only apply to adoption-related metrics, not all questions
-                q_lower = question.text.lower()
-                if any(t in q_lower for t in ["use", "adopt", "try", "online", "digital"]):
+                if features.hits.any(_Q_ADOPTION):
                     for key in distribution:
                         distribution[key] = apply_senior_digital_correction(
                             distribution[key], config.audience, question.text
@@ -562,23 +786,42 @@ class CrowdwaveEngine:
                     corrections_applied.append(f"senior_digital_×{bias.correction['factor']}")
             elif bias.bias_type == BiasType.HEALTHCARE_CONCERN and question.type == "scale":
                 # Only for concern questions, not all healthcare
-                q_lower = question.text.lower()
-                if any(t in q_lower for t in ["concern", "worry", "fear", "anxious"]):
+                if features.hits.any(_Q_CONCERN):
                     for key in distribution:
                         distribution[key] = apply_healthcare_concern_correction(
                             distribution[key], question.text
                         )
                     distribution = self._normalize(distribution)
                     corrections_applied.append("healthcare_concern_+15-30%")
+        if profiler:
+            t = profiler.lap("corrections", t, timings)
+        
+        # Phases 8-9 depend only on the distribution, so the precomputed
+        # outputs hold unless a correction changed it
+        if precomputed is not None and corrections_applied:
+            precomputed = None
         
         # Phase 8: Calculate statistics
-        mean, sd = self._calculate_stats(distribution, question)
+        if precomputed is None:
+            mean, sd = self._calculate_stats(distribution, question)
+        else:
+            mean, sd = precomputed.mean, precomputed.sd
+        if profiler:
+            t = profiler.lap("stats", t, timings)
         
         # Phase 9: Validate output
-        validation = validate_distribution(distribution, question.type, config.audience)
+        if precomputed is None:
+            validation = validate_distribution(distribution, question.type, config.audience)
+        else:
+            validation = precomputed.validation()
+        if profiler:
+            t = profiler.lap("validation", t, timings)
         
         # Phase 10: Calculate confidence
-        confidence = self._calculate_confidence(priors, runs, validation)
+        confidence = self._calculate_confidence(priors, spread, validation)
+        if profiler:
+            profiler.lap("confidence", t, timings)
+            trace["timings_ms"] = timings
         
         return SimulationResult(
             question_id=question.id,
@@ -592,26 +835,35 @@ class CrowdwaveEngine:
             corrections_applied=corrections_applied,
             validation_warnings=validation.warnings,
             methodology_trace={
-                "ensemble_runs": [{"type": r.run_type, "rationale": r.rationale} for r in runs],
+                "ensemble_runs": [
+                    {"type": run_type, "rationale": rationale} for run_type, rationale in ENSEMBLE_RUNS
+                ],
                 "priors_count": len(priors),
                 "validation_passed": validation.passed,
+                **trace,
             }
         )
     
-    def _determine_accuracy_zone(self, question: Question) -> AccuracyZone:
+    def _determine_accuracy_zone(
+        self,
+        question: Question,
+        features: Optional[QuestionFeatures] = None
+    ) -> AccuracyZone:
         """Determine expected accuracy zone for a question type."""
-        q_text = question.text.lower()
+        if features is None:
+            features = QuestionFeatures.extract(question)
+        hits = features.hits
         
         # High accuracy
-        if any(t in q_text for t in ["aware", "familiar", "trust", "confidence", "party"]):
+        if hits.any(_ZONE_HIGH):
             return AccuracyZone.HIGH
         
         # Low accuracy
-        if any(t in q_text for t in ["intent", "purchase", "pay", "price", "switch"]):
+        if hits.any(_ZONE_LOW):
             return AccuracyZone.LOW
         
         # Check for polarized topics
-        if requires_partisan_segmentation(question.text):
+        if features.partisan:
             return AccuracyZone.LOW
         
         # Default to medium
@@ -621,72 +873,95 @@ class CrowdwaveEngine:
         self,
         config: SurveyConfig,
         question: Question,
-        priors: List[Dict]
+        priors: List[Dict],
+        trace: Optional[Dict[str, Any]] = None,
+        tables: Optional[Dict[str, Any]] = None,
+        features: Optional[QuestionFeatures] = None
     ) -> List[EnsembleRun]:
         """
         Phase 5: Generate 3 independent distribution estimates.
+        
+        When profiling with rule tracing, the matched base-distribution
+        rule is recorded in `trace["base_rule"]`.
         """
-        runs = []
-        
-        # Get base distribution from benchmarks
-        base = self._get_base_distribution(question, priors, config.topic, config.audience)
-        
-        # Run 1: Conservative (anchor on priors, compress toward center)
-        conservative = self._apply_conservative_shift(base)
-        runs.append(EnsembleRun(
-            run_type="conservative",
-            distribution=conservative,
-            rationale="Heavy anchor on priors, modest stimulus effects, compressed to center"
-        ))
-        
-        # Run 2: Signal-forward (allow larger shifts from baseline)
-        signal_forward = self._apply_signal_shift(base, config)
-        runs.append(EnsembleRun(
-            run_type="signal_forward",
-            distribution=signal_forward,
-            rationale="Meaningful stimulus impact, weight recent sources heavily"
-        ))
-        
-        # Run 3: Heterogeneity (higher variance, segment differences)
-        heterogeneity = self._apply_heterogeneity_shift(base)
-        runs.append(EnsembleRun(
-            run_type="heterogeneity",
-            distribution=heterogeneity,
-            rationale="Higher variance, audience segments respond differently"
-        ))
-        
-        return runs
+        base = self._traced_base_distribution(config, question, priors, trace, tables, features)
+        return self._ensemble_runs(base, config)
+    
+    def _traced_base_distribution(
+        self,
+        config: SurveyConfig,
+        question: Question,
+        priors: List[Dict],
+        trace: Optional[Dict[str, Any]] = None,
+        tables: Optional[Dict[str, Any]] = None,
+        features: Optional[QuestionFeatures] = None
+    ) -> Dict[str, float]:
+        """Base distribution from benchmarks, with rule tracing when profiling."""
+        if self.profiler and self.profiler.trace_rules:
+            base, rule = self.profiler.trace_rule(
+                self._get_base_distribution, question.type,
+                question, priors, config.topic, config.audience, tables, features
+            )
+            if trace is not None:
+                trace["base_rule"] = rule
+            return base
+        return self._get_base_distribution(
+            question, priors, config.topic, config.audience, tables, features
+        )
+    
+    def _ensemble_runs(self, base: Dict[str, float], config: SurveyConfig) -> List[EnsembleRun]:
+        """The conservative, signal-forward and heterogeneity runs from a base distribution."""
+        rationales = dict(ENSEMBLE_RUNS)
+        return [
+            # Run 1: Conservative (anchor on priors, compress toward center)
+            EnsembleRun(
+                run_type="conservative",
+                distribution=self._apply_conservative_shift(base),
+                rationale=rationales["conservative"],
+            ),
+            # Run 2: Signal-forward (allow larger shifts from baseline)
+            EnsembleRun(
+                run_type="signal_forward",
+                distribution=self._apply_signal_shift(base, config),
+                rationale=rationales["signal_forward"],
+            ),
+            # Run 3: Heterogeneity (higher variance, segment differences)
+            EnsembleRun(
+                run_type="heterogeneity",
+                distribution=self._apply_heterogeneity_shift(base),
+                rationale=rationales["heterogeneity"],
+            ),
+        ]
     
     def _get_base_distribution(
         self,
         question: Question,
         priors: List[Dict],
         topic: str = "",
-        audience: str = ""
+        audience: str = "",
+        tables: Optional[Dict[str, Any]] = None,
+        features: Optional[QuestionFeatures] = None
     ) -> Dict[str, float]:
         """Get base distribution from benchmarks or defaults."""
-        q_lower = question.text.lower()
-        topic_lower = topic.lower() if topic else ""
-        audience_lower = audience.lower() if audience else ""
-        combined_context = q_lower + " " + topic_lower + " " + audience_lower
+        if tables is None:
+            tables = self.calibration.current().tables
+        if features is None:
+            features = QuestionFeatures.extract(question, topic, audience)
+        q_lower = features.text
+        audience_lower = features.audience
+        combined_context = features.context
         
         # ═══════════════════════════════════════════════════════════════
         # PARTISAN CALIBRATION (for political topics with party audiences)
         # ═══════════════════════════════════════════════════════════════
         
-        # Detect party affiliation in audience
-        party = None
-        if any(t in audience_lower for t in ["democrat", "democrats", "dem ", "liberal"]):
-            party = "democrat"
-        elif any(t in audience_lower for t in ["republican", "republicans", "gop", "conservative"]):
-            party = "republican"
-        elif any(t in audience_lower for t in ["independent", "independents", "unaffiliated"]):
-            party = "independent"
+        # Party affiliation detected in audience
+        party = features.party
         
         # Handle binary questions with partisan framing
         if question.type == "binary" and len(question.options) == 2 and party:
             opt0, opt1 = question.options[0], question.options[1]
-            opt0_lower, opt1_lower = opt0.lower(), opt1.lower()
+            opt0_lower, opt1_lower = features.options
             
             # Transparency/release questions
             if any(t in q_lower for t in ["release", "disclose", "transparency", "public"]):
@@ -819,15 +1094,13 @@ class CrowdwaveEngine:
         
         if question.type == "scale" and question.scale:
             min_val, max_val = question.scale
-            n_points = max_val - min_val + 1
+            n_points = features.scale_points
             
             if n_points == 5:
                 # Check for current calibrations first
                 
                 # Mental health calibrations (validated N=873, 0.5pt MAE)
                 if any(t in combined_context for t in ["mental health", "anxiety", "depression", "well-being", "wellbeing"]):
-                    from .calibration import get_mental_health_distribution
-                    
                     # Determine if importance or concept rating
                     is_concept = any(t in q_lower for t in ["rate", "rating", "ideal", "concept"])
                     q_type = "concept" if is_concept else "importance"
@@ -835,45 +1108,49 @@ class CrowdwaveEngine:
                     # Match attribute (order matters - check speed before effectiveness since
                     # speed questions may mention "symptoms" as context)
                     if any(t in q_lower for t in ["quick", "fast", "speed", "soon", "quickly"]):
-                        return get_mental_health_distribution("speed", q_type)
+                        attribute = "speed"
                     elif any(t in q_lower for t in ["effective", "symptom", "reduc"]):
-                        return get_mental_health_distribution("effectiveness", q_type)
+                        attribute = "effectiveness"
                     elif any(t in q_lower for t in ["safe", "safety"]):
-                        return get_mental_health_distribution("safety", q_type)
+                        attribute = "safety"
                     elif any(t in q_lower for t in ["afford", "cost", "price"]):
-                        return get_mental_health_distribution("affordability", q_type)
+                        attribute = "affordability"
                     elif any(t in q_lower for t in ["privacy", "private", "confidential"]):
-                        return get_mental_health_distribution("privacy", q_type)
+                        attribute = "privacy"
                     elif any(t in q_lower for t in ["convenient", "convenience", "schedule", "fit"]):
-                        return get_mental_health_distribution("convenience", q_type)
+                        attribute = "convenience"
                     elif any(t in q_lower for t in ["enjoy", "fun", "pleasant"]):
-                        return get_mental_health_distribution("enjoyability", q_type)
+                        attribute = "enjoyability"
                     elif any(t in q_lower for t in ["easy", "ease", "simple"]):
-                        return get_mental_health_distribution("ease", q_type)
+                        attribute = "ease"
                     elif any(t in q_lower for t in ["time", "invest", "commitment"]):
-                        return get_mental_health_distribution("time_investment", q_type)
+                        attribute = "time_investment"
                     else:
                         # Generic mental health importance distribution
-                        return get_mental_health_distribution("generic", q_type)
+                        attribute = "generic"
+                    return get_mental_health_distribution(attribute, q_type, tables["MENTAL_HEALTH_BENCHMARKS"])
                 
                 # Health importance questions (general, not mental health specific)
                 if any(t in combined_context for t in ["health", "medical", "treatment", "therapy", "solution"]):
                     if any(t in q_lower for t in ["important", "importance"]):
-                        from .calibration import HEALTH_IMPORTANCE_BENCHMARKS
-                        
-                        # Match attribute to benchmark range
-                        if any(t in q_lower for t in ["effective"]):
-                            return {"1": 3.0, "2": 5.0, "3": 17.0, "4": 44.0, "5": 31.0}  # 75% T2B
-                        elif any(t in q_lower for t in ["safe"]):
-                            return {"1": 3.0, "2": 6.0, "3": 21.0, "4": 46.0, "5": 24.0}  # 70% T2B
-                        elif any(t in q_lower for t in ["afford"]):
-                            return {"1": 3.0, "2": 5.0, "3": 19.0, "4": 43.0, "5": 30.0}  # 73% T2B
-                        elif any(t in q_lower for t in ["privat"]):
-                            return {"1": 3.0, "2": 7.0, "3": 24.0, "4": 42.0, "5": 24.0}  # 66% T2B
-                        elif any(t in q_lower for t in ["convenient"]):
-                            return {"1": 3.0, "2": 6.0, "3": 24.0, "4": 47.0, "5": 20.0}  # 67% T2B
-                        elif any(t in q_lower for t in ["enjoy"]):
-                            return {"1": 5.0, "2": 12.0, "3": 35.0, "4": 36.0, "5": 12.0}  # 48% T2B
+                        # Match attribute to benchmark distribution
+                        if "effective" in q_lower:
+                            attribute = "effectiveness"
+                        elif "safe" in q_lower:
+                            attribute = "safety"
+                        elif "afford" in q_lower:
+                            attribute = "affordability"
+                        elif "privat" in q_lower:
+                            attribute = "privacy"
+                        elif "convenient" in q_lower:
+                            attribute = "convenience"
+                        elif "enjoy" in q_lower:
+                            attribute = "enjoyability"
+                        else:
+                            attribute = None
+                        distributions = tables["HEALTH_IMPORTANCE_BENCHMARKS"].get("distributions", {})
+                        if attribute in distributions:
+                            return dict(distributions[attribute])
                 
                 # Inflation concern specifically
                 if any(t in q_lower for t in ["inflation"]) and any(t in q_lower for t in ["concern", "worried"]):
@@ -1007,7 +1284,7 @@ class CrowdwaveEngine:
         
         elif question.type == "binary" and len(question.options) == 2:
             opt0, opt1 = question.options[0], question.options[1]
-            opt0_lower, opt1_lower = opt0.lower(), opt1.lower()
+            opt0_lower, opt1_lower = features.options
             
             # Tariffs (Feb 2026)
             if any(t in combined_context for t in ["tariff", "trade war", "import tax"]):
@@ -1018,30 +1295,30 @@ class CrowdwaveEngine:
                     # 60% disapprove
                     return {opt0: 60.0, opt1: 40.0}
             
-            # Presidential approval (Feb 2026)
+            # Presidential approval (IMMIGRATION_ENFORCEMENT_FEB2026)
             if any(t in combined_context for t in ["trump", "president", "administration"]) and any(t in q_lower for t in ["approve", "approval"]):
+                approval = tables["IMMIGRATION_ENFORCEMENT_FEB2026"]["trump_approval"]
                 if "approve" in opt0_lower:
-                    # 39% approve, 56% disapprove (Feb 2026)
-                    return {opt0: 39.0, opt1: 61.0}
+                    return self._binary_split(opt0, opt1, approval["approve"])
                 elif "disapprove" in opt0_lower:
-                    return {opt0: 56.0, opt1: 44.0}
+                    return self._binary_split(opt0, opt1, approval["disapprove"])
             
-            # Current calibrations - Immigration (Feb 2026)
+            # Current calibrations - Immigration (IMMIGRATION_ENFORCEMENT_FEB2026)
             if any(t in combined_context for t in ["immigration", "ice", "deportation", "enforcement"]):
+                approval = tables["IMMIGRATION_ENFORCEMENT_FEB2026"]["ice_job_approval"]
                 if "approve" in opt0_lower:
-                    # 33% approve ICE, 60% disapprove (Feb 2026)
-                    return {opt0: 33.0, opt1: 67.0}
+                    return self._binary_split(opt0, opt1, approval["approve"])
                 elif "disapprove" in opt0_lower:
-                    return {opt0: 60.0, opt1: 40.0}
+                    return self._binary_split(opt0, opt1, approval["disapprove"])
             
-            # AI workplace adoption (Feb 2026)
+            # AI workplace adoption (AI_JOB_CONCERNS_2026)
             if any(t in combined_context for t in ["ai ", "artificial intelligence"]):
                 if any(t in q_lower for t in ["employer", "workplace", "company", "using"]):
-                    # 53% say workplace uses AI
+                    uses_ai = tables["AI_JOB_CONCERNS_2026"]["workplace_uses_ai"]
                     if "yes" in opt0_lower:
-                        return {opt0: 53.0, opt1: 47.0}
+                        return self._binary_split(opt0, opt1, uses_ai)
                     else:
-                        return {opt0: 47.0, opt1: 53.0}
+                        return self._binary_split(opt0, opt1, 1.0 - uses_ai)
                 elif "good" in opt0_lower or "positive" in opt0_lower:
                     # Mixed on AI being good for workers
                     return {opt0: 48.0, opt1: 52.0}
@@ -1204,9 +1481,10 @@ class CrowdwaveEngine:
             if any(t in combined_context for t in ["party", "political", "democrat", "republican", "independent"]):
                 if any(t in q_lower for t in ["identify", "affiliation", "party"]):
                     # Detect generation from audience for calibration
-                    generation = self._detect_generation(audience) if hasattr(self, '_detect_generation') else None
-                    if generation and generation in PARTY_IDENTIFICATION_2025["by_generation"]:
-                        gen_data = PARTY_IDENTIFICATION_2025["by_generation"][generation]
+                    generation = features.generation
+                    party_id = tables["PARTY_IDENTIFICATION_2025"]
+                    if generation and generation in party_id["by_generation"]:
+                        gen_data = party_id["by_generation"][generation]
                         if "democrat" in opt0_lower:
                             return {opt0: gen_data["democrat"] * 100, opt1: (1 - gen_data["democrat"]) * 100}
                         elif "republican" in opt0_lower:
@@ -1215,7 +1493,7 @@ class CrowdwaveEngine:
                             return {opt0: gen_data["independent"] * 100, opt1: (1 - gen_data["independent"]) * 100}
                     else:
                         # Use overall
-                        overall = PARTY_IDENTIFICATION_2025["overall"]
+                        overall = party_id["overall"]
                         if "independent" in opt0_lower:
                             return {opt0: 45.0, opt1: 55.0}  # Record high
                         elif "democrat" in opt0_lower:
@@ -2193,17 +2471,19 @@ class CrowdwaveEngine:
         except (ValueError, ZeroDivisionError):
             return None, None
     
-    def _calculate_confidence(
-        self,
-        priors: List[Dict],
-        runs: List[EnsembleRun],
-        validation
-    ) -> float:
-        """
-        Calculate confidence score.
-        
-        confidence = base_score × prior_weight × agreement_factor
-        """
+    def _ensemble_spread(self, runs: List[EnsembleRun]) -> Optional[float]:
+        """Largest gap between ensemble runs on any option (None for fewer than 2 runs)."""
+        if len(runs) < 2:
+            return None
+        keys = list(runs[0].distribution.keys())
+        max_diff = 0
+        for key in keys:
+            values = [r.distribution.get(key, 0) for r in runs]
+            max_diff = max(max_diff, max(values) - min(values))
+        return max_diff
+    
+    def _prior_factors(self, priors: List[Dict]) -> Tuple[float, float]:
+        """(base_score, prior_weight): everything confidence reads from the priors."""
         # Base score from prior availability
         if len(priors) >= 3:
             base_score = 0.85
@@ -2219,17 +2499,28 @@ class CrowdwaveEngine:
         else:
             prior_weight = 0.5
         
+        return base_score, prior_weight
+    
+    def _calculate_confidence(
+        self,
+        priors: List[Dict],
+        spread: Optional[float],
+        validation
+    ) -> float:
+        """
+        Calculate confidence score.
+        
+        confidence = base_score × prior_weight × agreement_factor
+        
+        `spread` is the ensemble disagreement from _ensemble_spread().
+        """
+        base_score, prior_weight = self._prior_factors(priors)
+        
         # Agreement factor (how much runs agree)
-        if len(runs) >= 2:
-            keys = list(runs[0].distribution.keys())
-            max_diff = 0
-            for key in keys:
-                values = [r.distribution.get(key, 0) for r in runs]
-                max_diff = max(max_diff, max(values) - min(values))
-            
-            if max_diff <= 10:
+        if spread is not None:
+            if spread <= 10:
                 agreement_factor = 1.0
-            elif max_diff <= 15:
+            elif spread <= 15:
                 agreement_factor = 0.8
             else:
                 agreement_factor = 0.6
@@ -2309,3 +2600,246 @@ class CrowdwaveEngine:
             return str(obj)
         
         return json.dumps(serialize(report), indent=2)
+
+
+# ═══════════════════════════════════════════════════════════════
+# COMPILED SURVEYS
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class AudienceComparison:
+    """
+    One questionnaire simulated for several audiences, stacked for
+    comparison. `reports[i]` is the full report for `audiences[i]`.
+    """
+    audiences: List[str]
+    question_ids: List[str]
+    reports: List[SimulationReport]
+    
+    def result(self, audience: str, question_id: str) -> SimulationResult:
+        """The result for one audience and question."""
+        report = self.reports[self.audiences.index(audience)]
+        return report.results[self.question_ids.index(question_id)]
+    
+    def options(self, question_id: str) -> List[str]:
+        """Answer options of a question across every audience, in first-seen order."""
+        index = self.question_ids.index(question_id)
+        options: Dict[str, None] = {}
+        for report in self.reports:
+            options.update(dict.fromkeys(report.results[index].distribution))
+        return list(options)
+    
+    def distributions(self, question_id: str):
+        """
+        Percentages for a question as an audiences × options numpy array,
+        columns ordered as options(); options an audience never produced
+        are 0.
+        """
+        import numpy as np
+        
+        index = self.question_ids.index(question_id)
+        options = self.options(question_id)
+        return np.array([
+            [report.results[index].distribution.get(option, 0.0) for option in options]
+            for report in self.reports
+        ], dtype=float).reshape(len(self.reports), len(options))
+    
+    def values(self, attribute: str = "mean"):
+        """
+        A per-result attribute ("mean", "sd" or "confidence") as an
+        audiences × questions numpy array, NaN where it is None.
+        """
+        import numpy as np
+        
+        return np.array([
+            [
+                np.nan if getattr(result, attribute) is None else getattr(result, attribute)
+                for result in report.results
+            ]
+            for report in self.reports
+        ], dtype=float).reshape(len(self.reports), len(self.question_ids))
+
+
+# Audience wording for each party segment and generation; each is picked
+# up by the party/generation detection in features.py
+PARTY_SEGMENTS = {"democrat": "Democrats", "republican": "Republicans", "independent": "Independents"}
+GENERATION_SEGMENTS = {"gen_z": "Gen Z", "millennial": "Millennials", "gen_x": "Gen X", "boomer": "Boomers"}
+
+
+@dataclass
+class SegmentedReport:
+    """
+    A survey simulated per party segment, with the population-weighted
+    total. `segments.reports[i]` is the report for party
+    `parties[i]`, weighted by `weights[parties[i]]`; `total` mixes them.
+    """
+    parties: List[str]
+    weights: Dict[str, float]
+    segments: AudienceComparison
+    total: SimulationReport
+    generation: Optional[str] = None
+
+
+class CompiledSurvey:
+    """
+    A questionnaire parsed and keyword-scanned once, then simulated for
+    any number of audiences.
+    
+    Usage:
+        compiled = engine.compile(questions, {"topic": "streaming"})
+        comparison = compiled.simulate_audiences(["Gen Z", "Boomers", "Parents"])
+        comparison.distributions("Q1")   # audiences × options
+        comparison.values("mean")        # audiences × questions
+    
+    Question parsing and the audience-independent text features (lower-
+    cased text and options, scale size, keyword matches) are computed
+    here once. Per audience only the audience scan, the question × audience
+    trigger matches (built from the cached question scan plus the seam,
+    see TriggerScanner.scan_joined) and the simulation phases run. Base
+    distribution selection stays per audience because the calibration
+    cascade tests audience text and party. Each report is identical to
+    engine.simulate() for the same config and questions.
+    """
+    
+    def __init__(
+        self,
+        engine: CrowdwaveEngine,
+        questions: List[Dict[str, Any]],
+        config: Optional[Dict[str, Any]] = None
+    ):
+        self.engine = engine
+        self.config = dict(config or {})
+        self.questions = engine._parse_questions(questions)
+        self.texts = [QuestionText.extract(question) for question in self.questions]
+    
+    def __len__(self) -> int:
+        return len(self.questions)
+    
+    def simulate(self, audience: Any) -> SimulationReport:
+        """
+        Simulate for one audience: a description, or a config dict whose
+        keys override the compiled config for this audience.
+        """
+        engine = self.engine
+        profiler = engine.profiler
+        t = perf_counter() if profiler else 0.0
+        
+        bundle = engine.calibration.current()
+        overrides = audience if isinstance(audience, dict) else {"audience": audience}
+        survey_config = engine._parse_config({**self.config, **overrides})
+        features = QuestionFeatures.combine(self.texts, survey_config.topic, survey_config.audience)
+        if profiler:
+            t = profiler.lap("features", t)
+        
+        return engine._simulate_survey(survey_config, self.questions, features, bundle, t)
+    
+    def simulate_audiences(self, audiences: List[Any]) -> AudienceComparison:
+        """Simulate for each audience (descriptions or config dicts, as for simulate())."""
+        reports = [self.simulate(audience) for audience in audiences]
+        return AudienceComparison(
+            audiences=[report.config.audience for report in reports],
+            question_ids=[question.id for question in self.questions],
+            reports=reports,
+        )
+    
+    def simulate_segments(
+        self,
+        audience: Optional[str] = None,
+        generation: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> SegmentedReport:
+        """
+        Simulate each party segment of an audience and mix them into a
+        population-weighted total.
+        
+        Args:
+            audience: Base audience (default: the compiled config's); must
+                not already name a party
+            generation: "gen_z", "millennial", "gen_x" or "boomer" to weight
+                by that generation's party mix (and add it to the segment
+                audiences if not already named); defaults to the generation
+                the audience names, if any, and must agree with it
+            weights: Party shares overriding PARTY_IDENTIFICATION_2025
+        
+        The total's distributions are the weighted mix of the segments'
+        (one matrix product per question), with mean, SD and validation
+        recomputed from the mix.
+        """
+        import numpy as np
+        
+        engine = self.engine
+        audience = audience or self.config.get("audience", "General population")
+        if detect_party(audience):
+            raise ValueError(f"Audience {audience!r} already names a party; pass the unsegmented audience")
+        
+        named_generation = detect_generation(audience)
+        generation = generation or named_generation
+        if generation is not None and generation not in GENERATION_SEGMENTS:
+            raise ValueError(f"Unknown generation {generation!r}; expected one of {list(GENERATION_SEGMENTS)}")
+        if named_generation and generation != named_generation:
+            raise ValueError(
+                f"Audience {audience!r} already names generation {named_generation!r}, "
+                f"which conflicts with generation={generation!r}"
+            )
+        if generation and generation != named_generation:
+            audience = f"{GENERATION_SEGMENTS[generation]} {audience}"
+        
+        if weights is None:
+            party_id = engine.calibration.current().tables["PARTY_IDENTIFICATION_2025"]
+            weights = party_id["by_generation"][generation] if generation else party_id["overall"]
+        parties = list(PARTY_SEGMENTS)
+        shares = np.array([weights.get(party, 0.0) for party in parties], dtype=float)
+        if shares.sum() <= 0:
+            raise ValueError("Segment weights must have a positive total")
+        shares /= shares.sum()
+        
+        segments = self.simulate_audiences(
+            [f"{audience} - {PARTY_SEGMENTS[party]}" for party in parties]
+        )
+        
+        results = []
+        for index, question in enumerate(self.questions):
+            segment_results = [report.results[index] for report in segments.reports]
+            options = segments.options(question.id)
+            mixed = shares @ segments.distributions(question.id)
+            distribution = engine._normalize({
+                option: round(float(value), 1) for option, value in zip(options, mixed)
+            }) if options else {}
+            mean, sd = engine._calculate_stats(distribution, question)
+            validation = validate_distribution(distribution, question.type, audience)
+            results.append(SimulationResult(
+                question_id=question.id,
+                question_text=question.text,
+                distribution=distribution,
+                mean=mean,
+                sd=sd,
+                confidence=round(float(shares @ [r.confidence for r in segment_results]), 3),
+                accuracy_zone=segment_results[0].accuracy_zone,
+                biases_detected=list(dict.fromkeys(b for r in segment_results for b in r.biases_detected)),
+                corrections_applied=list(dict.fromkeys(c for r in segment_results for c in r.corrections_applied)),
+                validation_warnings=validation.warnings,
+                methodology_trace={
+                    "segments": dict(zip(parties, shares.tolist())),
+                    "validation_passed": validation.passed,
+                },
+            ))
+        
+        first = segments.reports[0]
+        total = SimulationReport(
+            config=replace(first.config, audience=audience),
+            results=results,
+            priors_used=[],
+            overall_confidence=sum(r.confidence for r in results) / len(results),
+            flags=list(dict.fromkeys(
+                flag for report in segments.reports for flag in report.flags
+            )),
+            calibration_version=first.calibration_version,
+            calibration_checksum=first.calibration_checksum,
+        )
+        return SegmentedReport(
+            parties=parties,
+            weights=dict(zip(parties, shares.tolist())),
+            segments=segments,
+            total=total,
+            generation=generation,
+        )
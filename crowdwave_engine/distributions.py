@@ -4,10 +4,13 @@ Statistically rigorous distribution generation for survey simulation.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import math
 import random
 
+import numpy as np
+
 
 @dataclass
 class DistributionParams:
@@ -20,12 +23,456 @@ class DistributionParams:
     max_val: float = 5.0
     
 
+# ═══════════════════════════════════════════════════════════════
+# VECTORIZED GENERATORS
+# ═══════════════════════════════════════════════════════════════
+
+# Parameters may be scalars or 1-d sequences of equal length (scalars are
+# broadcast). Each call returns a DistributionBatch holding an (m, k)
+# probability matrix, one row per parameter set.
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass
+class DistributionBatch:
+    """
+    m distributions over the same k scale points.
+
+    `probabilities` is an (m, k) array whose rows sum to 1; `keys` are the
+    scale point labels ("1".."5", "0".."10", ...). Percentage dicts like
+    those returned by the scalar generators are built only on request.
+    """
+    probabilities: np.ndarray
+    keys: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return self.probabilities.shape[0]
+
+    def to_dict(self, index: int) -> Dict[str, float]:
+        """Row `index` as {key: percentage rounded to 0.1}."""
+        return {
+            key: round(p * 100, 1)
+            for key, p in zip(self.keys, self.probabilities[index].tolist())
+        }
+
+    def to_dicts(self) -> List[Dict[str, float]]:
+        """Every row as a percentage dict."""
+        keys = self.keys
+        return [
+            {key: round(p * 100, 1) for key, p in zip(keys, row)}
+            for row in self.probabilities.tolist()
+        ]
+
+
+def _params(*values: ArrayLike) -> List[np.ndarray]:
+    """Broadcast scalar / 1-d parameters to a common (m,) shape."""
+    arrays = [np.asarray(v, dtype=float) for v in values]
+    if any(a.ndim > 1 for a in arrays):
+        raise ValueError("distribution parameters must be scalars or 1-d sequences")
+    arrays = [a.reshape(-1) for a in arrays]
+    m = max(a.shape[0] for a in arrays)
+    # broadcast_to raises on mismatched lengths
+    return [a if a.shape[0] == m else np.broadcast_to(a, (m,)) for a in arrays]
+
+
+def _check_sd(sd: np.ndarray):
+    if (sd == 0).any():
+        raise ValueError("sd must be non-zero")
+
+
+@lru_cache(maxsize=64)
+def _scale_keys(min_val: float, n_points: int) -> Tuple[str, ...]:
+    return tuple(str(int(min_val + i)) for i in range(n_points))
+
+
+def _normalize_rows(pdf: np.ndarray) -> np.ndarray:
+    # cumsum accumulates left to right (unlike numpy's pairwise sum), so
+    # row totals match a running Python total bit for bit.
+    totals = np.cumsum(pdf, axis=1)[:, -1:]
+    if not (np.isfinite(totals) & (totals > 0)).all():
+        # e.g. a near-zero SD whose density under- or overflows at every point
+        raise ValueError("distribution has no finite mass on the scale points; check mean and sd")
+    return pdf / totals
+
+
+def _gaussian_kernel(points: np.ndarray, mean: np.ndarray, sd: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(z, exp(-z²/2)) on an (m, k) grid."""
+    z = (points[None, :] - mean[:, None]) / sd[:, None]
+    return z, np.exp(-0.5 * z * z)
+
+
+def _beta_shape(
+    mean: np.ndarray,
+    sd: np.ndarray,
+    min_val: float,
+    max_val: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Beta (alpha, beta) matching a scale mean and SD (method of moments)."""
+    # Normalize to [0, 1] and clamp
+    range_size = max_val - min_val
+    normalized_mean = np.minimum(0.99, np.maximum(0.01, (mean - min_val) / range_size))
+    normalized_sd = np.minimum(0.4, np.maximum(0.01, sd / range_size))
+
+    common = (normalized_mean * (1 - normalized_mean) / normalized_sd ** 2) - 1
+    alpha = np.maximum(0.5, normalized_mean * common)
+    beta = np.maximum(0.5, (1 - normalized_mean) * common)
+    return alpha, beta
+
+
+def beta_distributions(
+    mean: ArrayLike,
+    sd: ArrayLike,
+    min_val: float = 1.0,
+    max_val: float = 5.0,
+    n_points: int = 5,
+    exact: bool = False
+) -> DistributionBatch:
+    """
+    Vectorized generate_beta_distribution().
+
+    With exact=True each point gets the beta probability of its bin
+    (see exact_beta_probabilities) instead of the PDF at the bin midpoint.
+    """
+    mean, sd = _params(mean, sd)
+    _check_sd(sd)
+    if exact:
+        return DistributionBatch(
+            _exact_batch("beta", mean, sd, min_val, max_val, n_points),
+            _scale_keys(min_val, n_points),
+        )
+
+    alpha, beta = _beta_shape(mean, sd, min_val, max_val)
+
+    # Beta PDF (simplified) at bin midpoints
+    x = (np.arange(n_points) + 0.5) / n_points
+    pdf = x[None, :] ** (alpha[:, None] - 1) * (1 - x[None, :]) ** (beta[:, None] - 1)
+
+    return DistributionBatch(_normalize_rows(pdf), _scale_keys(min_val, n_points))
+
+
+def truncated_normal_distributions(
+    mean: ArrayLike,
+    sd: ArrayLike,
+    min_val: float = 1.0,
+    max_val: float = 5.0,
+    n_points: int = 5,
+    exact: bool = False
+) -> DistributionBatch:
+    """
+    Vectorized generate_truncated_normal().
+
+    With exact=True each point gets the truncated-normal probability of
+    its unit-width bin (see exact_truncated_normal_probabilities) instead
+    of a normalized Gaussian kernel at the point.
+    """
+    mean, sd = _params(mean, sd)
+    _check_sd(sd)
+    if exact:
+        return DistributionBatch(
+            _exact_batch("truncated_normal", mean, sd, min_val, max_val, n_points),
+            _scale_keys(min_val, n_points),
+        )
+
+    points = min_val + np.arange(n_points)
+    _, pdf = _gaussian_kernel(points, mean, sd)
+    return DistributionBatch(_normalize_rows(pdf), _scale_keys(min_val, n_points))
+
+
+def skewed_distributions(
+    mean: ArrayLike,
+    sd: ArrayLike,
+    skew: ArrayLike,
+    min_val: float = 1.0,
+    max_val: float = 5.0,
+    n_points: int = 5
+) -> DistributionBatch:
+    """Vectorized generate_skewed_distribution()."""
+    mean, sd, skew = _params(mean, sd, skew)
+    _check_sd(sd)
+    points = min_val + np.arange(n_points)
+    z, pdf = _gaussian_kernel(points, mean, sd)
+
+    # Exponential tilt (exp(0) == 1 leaves unskewed rows unchanged)
+    pdf = np.maximum(0.001, pdf * np.exp(skew[:, None] * z * 0.5))
+    return DistributionBatch(_normalize_rows(pdf), _scale_keys(min_val, n_points))
+
+
+def bimodal_distributions(
+    mode1: ArrayLike,
+    mode2: ArrayLike,
+    weight1: ArrayLike = 0.5,
+    sd: ArrayLike = 0.8,
+    min_val: float = 1.0,
+    max_val: float = 5.0,
+    n_points: int = 5
+) -> DistributionBatch:
+    """Vectorized generate_bimodal_distribution()."""
+    mode1, mode2, weight1, sd = _params(mode1, mode2, weight1, sd)
+    _check_sd(sd)
+    points = min_val + np.arange(n_points)
+    _, pdf1 = _gaussian_kernel(points, mode1, sd)
+    _, pdf2 = _gaussian_kernel(points, mode2, sd)
+    pdf = weight1[:, None] * pdf1 + (1.0 - weight1)[:, None] * pdf2
+    return DistributionBatch(_normalize_rows(pdf), _scale_keys(min_val, n_points))
+
+
+def nps_distributions(
+    mean: ArrayLike,
+    sd: ArrayLike,
+    promoter_boost: ArrayLike = 0.0
+) -> DistributionBatch:
+    """Vectorized generate_nps_distribution()."""
+    mean, sd, promoter_boost = _params(mean, sd, promoter_boost)
+    _check_sd(sd)
+    _, pdf = _gaussian_kernel(np.arange(11, dtype=float), mean, sd)
+
+    # Promoter boost on 9-10 (only where positive)
+    boosted = promoter_boost > 0
+    if boosted.any():
+        pdf[boosted, 9:] *= (1 + promoter_boost[boosted])[:, None]
+
+    pdf = np.maximum(0.001, pdf)
+    return DistributionBatch(_normalize_rows(pdf), _scale_keys(0, 11))
+
+
+# ═══════════════════════════════════════════════════════════════
+# EXACT DISCRETIZATION
+# ═══════════════════════════════════════════════════════════════
+
+# Exact generators round mean and SD to this grid, so scalar lookups can
+# be cached and batch rows agree with cached rows. A 0.0005 shift in mean
+# or SD moves no bin by more than ~0.02 percentage points. Only scalar
+# lookups go through the LRU cache (_exact_row); a batch computes each
+# distinct quantized (mean, SD) once per call (_exact_batch).
+EXACT_QUANTUM = 1e-3
+EXACT_CACHE_SIZE = 4096
+
+# Continued-fraction controls for the incomplete beta function
+_BETACF_MAX_ITER = 1000
+_BETACF_EPS = 1e-15
+_FPMIN = 1e-300
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+_lgamma = np.frompyfunc(math.lgamma, 1, 1)
+
+
+def _quantize(values: np.ndarray) -> np.ndarray:
+    return np.rint(values / EXACT_QUANTUM) * EXACT_QUANTUM
+
+
+def _normal_cdf_sf(z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (P(Z <= z), P(Z > z)) for a standard normal, each computed from the
+    smaller tail so neither loses precision far from the mean.
+    """
+    tail = 0.5 * np.asarray(_erfc(np.abs(z) / math.sqrt(2)), dtype=float)
+    lower = z < 0
+    return np.where(lower, tail, 1.0 - tail), np.where(lower, 1.0 - tail, tail)
+
+
+def _betacf(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Continued fraction for the incomplete beta (modified Lentz)."""
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    c = np.ones_like(x)
+    d = 1.0 - qab * x / qap
+    d = 1.0 / np.where(np.abs(d) < _FPMIN, _FPMIN, d)
+    h = d.copy()
+    for m in range(1, _BETACF_MAX_ITER + 1):
+        m2 = 2 * m
+        for aa in (
+            m * (b - m) * x / ((qam + m2) * (a + m2)),
+            -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2)),
+        ):
+            d = 1.0 + aa * d
+            d = 1.0 / np.where(np.abs(d) < _FPMIN, _FPMIN, d)
+            c = 1.0 + aa / c
+            c = np.where(np.abs(c) < _FPMIN, _FPMIN, c)
+            delta = d * c
+            h *= delta
+        if np.all(np.abs(delta - 1.0) < _BETACF_EPS):
+            break
+    return h
+
+
+def regularized_incomplete_beta(a: ArrayLike, b: ArrayLike, x: ArrayLike) -> np.ndarray:
+    """
+    I_x(a, b), the beta CDF, elementwise over broadcast arrays.
+
+    Uses the continued fraction on whichever of I_x(a, b) and
+    1 - I_(1-x)(b, a) converges fastest.
+    """
+    return _beta_cdf_sf(a, b, x)[0]
+
+
+def _beta_cdf_sf(a: ArrayLike, b: ArrayLike, x: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (I_x(a, b), 1 - I_x(a, b)), each taken from the continued fraction
+    where that side is the small one, so neither loses precision near 1.
+    """
+    a, b, x = np.broadcast_arrays(
+        np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(x, dtype=float)
+    )
+    inner = (x > 0) & (x < 1)
+    xs = np.where(inner, x, 0.5)
+
+    ln_front = (
+        a * np.log(xs) + b * np.log1p(-xs)
+        - np.asarray(_lgamma(a) + _lgamma(b) - _lgamma(a + b), dtype=float)
+    )
+    front = np.exp(ln_front)
+
+    direct = xs < (a + 1.0) / (a + b + 2.0)
+    fraction = _betacf(
+        np.where(direct, a, b), np.where(direct, b, a), np.where(direct, xs, 1.0 - xs)
+    )
+    small = np.where(direct, front * fraction / a, front * fraction / b)
+    cdf = np.where(inner, np.where(direct, small, 1.0 - small), np.where(x >= 1, 1.0, 0.0))
+    sf = np.where(inner, np.where(direct, 1.0 - small, small), np.where(x >= 1, 0.0, 1.0))
+    return cdf, sf
+
+
+def _bin_masses(lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Mass between two CDF values (or survival values, high edge first),
+    clipped at 0. Callers pass the side that is small over the bin, so
+    the difference keeps its precision in the tails.
+    """
+    return np.maximum(0.0, upper - lower)
+
+
+def exact_beta_probabilities(
+    mean: np.ndarray,
+    sd: np.ndarray,
+    min_val: float = 1.0,
+    max_val: float = 5.0,
+    n_points: int = 5
+) -> np.ndarray:
+    """
+    (m, k) bin probabilities of the beta distribution fitted by moments.
+
+    The unit interval is split into `n_points` equal bins (the ones whose
+    midpoints the approximate generator samples), and each point gets
+    I(upper edge) - I(lower edge), or the same mass from the upper tail
+    for bins above the median.
+    """
+    alpha, beta = _beta_shape(mean, sd, min_val, max_val)
+    edges = np.arange(n_points + 1) / n_points
+    cdf, sf = _beta_cdf_sf(alpha[:, None], beta[:, None], edges[None, :])
+    return np.where(
+        cdf[:, :-1] >= 0.5,
+        _bin_masses(sf[:, 1:], sf[:, :-1]),
+        _bin_masses(cdf[:, :-1], cdf[:, 1:]),
+    )
+
+
+def exact_truncated_normal_probabilities(
+    mean: np.ndarray,
+    sd: np.ndarray,
+    min_val: float = 1.0,
+    max_val: float = 5.0,
+    n_points: int = 5
+) -> np.ndarray:
+    """
+    (m, k) bin probabilities of a normal truncated to the scale.
+
+    Point `p` owns [p - 0.5, p + 0.5]; masses are normal CDF differences
+    renormalized over [min_val - 0.5, min_val + n_points - 0.5]. Rows whose
+    mass underflows entirely (mean far off the scale) put everything on
+    the nearest point.
+    """
+    sd = np.abs(sd)
+    edges = min_val - 0.5 + np.arange(n_points + 1)
+    cdf, sf = _normal_cdf_sf((edges[None, :] - mean[:, None]) / sd[:, None])
+
+    # Above the mean, upper-tail differences keep their precision
+    upper_half = edges[None, :-1] >= mean[:, None]
+    masses = np.where(
+        upper_half,
+        _bin_masses(sf[:, 1:], sf[:, :-1]),
+        _bin_masses(cdf[:, :-1], cdf[:, 1:]),
+    )
+
+    total = np.cumsum(masses, axis=1)[:, -1:]
+    empty = total[:, 0] == 0
+    if empty.any():
+        nearest = np.clip(np.rint(mean[empty] - min_val), 0, n_points - 1).astype(int)
+        masses[empty] = 0.0
+        masses[np.flatnonzero(empty), nearest] = 1.0
+        total[empty] = 1.0
+    return masses / total
+
+
+_EXACT_KERNELS = {
+    "beta": exact_beta_probabilities,
+    "truncated_normal": exact_truncated_normal_probabilities,
+}
+
+
+def _exact_batch(
+    kind: str,
+    mean: np.ndarray,
+    sd: np.ndarray,
+    min_val: float,
+    max_val: float,
+    n_points: int
+) -> np.ndarray:
+    """(m, k) exact rows, computing each distinct quantized (mean, SD) once."""
+    pairs, inverse = np.unique(
+        np.stack([_quantize(mean), _quantize(sd)], axis=1), axis=0, return_inverse=True
+    )
+    rows = _EXACT_KERNELS[kind](pairs[:, 0], pairs[:, 1], min_val, max_val, n_points)
+    return rows[inverse.reshape(-1)]
+
+
+@lru_cache(maxsize=EXACT_CACHE_SIZE)
+def _exact_row(
+    kind: str,
+    mean_steps: int,
+    sd_steps: int,
+    min_val: float,
+    max_val: float,
+    n_points: int
+) -> Tuple[float, ...]:
+    """One exact distribution, keyed on mean/SD in EXACT_QUANTUM steps."""
+    row = _EXACT_KERNELS[kind](
+        np.array([mean_steps * EXACT_QUANTUM]),
+        np.array([sd_steps * EXACT_QUANTUM]),
+        min_val, max_val, n_points,
+    )
+    return tuple(row[0].tolist())
+
+
+def _exact_dict(
+    kind: str,
+    mean: float,
+    sd: float,
+    min_val: float,
+    max_val: float,
+    n_points: int
+) -> Dict[str, float]:
+    if sd == 0:
+        raise ValueError("sd must be non-zero")
+    row = _exact_row(
+        kind, round(mean / EXACT_QUANTUM), round(sd / EXACT_QUANTUM),
+        float(min_val), float(max_val), n_points,
+    )
+    return {key: round(p * 100, 1) for key, p in zip(_scale_keys(min_val, n_points), row)}
+
+
+# ═══════════════════════════════════════════════════════════════
+# SCALAR GENERATORS
+# ═══════════════════════════════════════════════════════════════
+
 def generate_beta_distribution(
     mean: float,
     sd: float,
     min_val: float = 1.0,
     max_val: float = 5.0,
-    n_points: int = 5
+    n_points: int = 5,
+    exact: bool = False
 ) -> Dict[str, float]:
     """
     Generate a bounded distribution using beta distribution properties.
@@ -34,52 +481,13 @@ def generate_beta_distribution(
     - It's bounded on [0, 1] (can scale to any range)
     - It can model various shapes (uniform, skewed, bimodal)
     - Parameters directly relate to mean and variance
-    """
-    # Normalize mean to [0, 1] range
-    range_size = max_val - min_val
-    normalized_mean = (mean - min_val) / range_size
-    normalized_sd = sd / range_size
-    
-    # Clamp to valid range
-    normalized_mean = max(0.01, min(0.99, normalized_mean))
-    normalized_sd = max(0.01, min(0.4, normalized_sd))
-    
-    # Calculate beta parameters from mean and variance
-    # For beta distribution: mean = a/(a+b), var = ab/((a+b)^2(a+b+1))
-    variance = normalized_sd ** 2
-    
-    # Solve for alpha and beta
-    # Using method of moments
-    common = (normalized_mean * (1 - normalized_mean) / variance) - 1
-    alpha = normalized_mean * common
-    beta = (1 - normalized_mean) * common
-    
-    # Ensure valid parameters
-    alpha = max(0.5, alpha)
-    beta = max(0.5, beta)
-    
-    # Generate distribution points
-    distribution = {}
-    total = 0.0
-    
-    for i in range(n_points):
-        # Map point to [0, 1]
-        x = (i + 0.5) / n_points
-        
-        # Beta PDF (simplified)
-        if alpha == 1 and beta == 1:
-            pdf = 1.0
-        else:
-            pdf = (x ** (alpha - 1)) * ((1 - x) ** (beta - 1))
-        
-        distribution[str(int(min_val + i))] = pdf
-        total += pdf
     
-    # Normalize to percentages
-    for key in distribution:
-        distribution[key] = round(distribution[key] / total * 100, 1)
-    
-    return distribution
+    By default the beta PDF is sampled at bin midpoints. exact=True
+    integrates it over each bin instead (cached per quantized mean/SD).
+    """
+    if exact:
+        return _exact_dict("beta", mean, sd, min_val, max_val, n_points)
+    return beta_distributions(mean, sd, min_val, max_val, n_points).to_dict(0)
 
 
 def generate_truncated_normal(
@@ -87,7 +495,8 @@ def generate_truncated_normal(
     sd: float,
     min_val: float = 1.0,
     max_val: float = 5.0,
-    n_points: int = 5
+    n_points: int = 5,
+    exact: bool = False
 ) -> Dict[str, float]:
     """
     Generate a truncated normal distribution.
@@ -95,24 +504,14 @@ def generate_truncated_normal(
     More appropriate when:
     - The scale has natural boundaries
     - You want symmetric-ish distributions
-    """
-    distribution = {}
-    total = 0.0
     
-    for i in range(n_points):
-        point = min_val + i
-        # Standard normal PDF, shifted and scaled
-        z = (point - mean) / sd
-        pdf = math.exp(-0.5 * z * z)
-        
-        distribution[str(int(point))] = pdf
-        total += pdf
-    
-    # Normalize
-    for key in distribution:
-        distribution[key] = round(distribution[key] / total * 100, 1)
-    
-    return distribution
+    By default a Gaussian kernel is evaluated at each point. exact=True
+    uses normal CDF differences over each point's bin instead (cached per
+    quantized mean/SD).
+    """
+    if exact:
+        return _exact_dict("truncated_normal", mean, sd, min_val, max_val, n_points)
+    return truncated_normal_distributions(mean, sd, min_val, max_val, n_points).to_dict(0)
 
 
 def generate_skewed_distribution(
@@ -131,31 +530,7 @@ def generate_skewed_distribution(
     - skew = 0: Symmetric
     - skew > 0: Right/positive skew (tail on right, mass on left)
     """
-    distribution = {}
-    total = 0.0
-    
-    for i in range(n_points):
-        point = min_val + i
-        
-        # Base normal component
-        z = (point - mean) / sd
-        normal_pdf = math.exp(-0.5 * z * z)
-        
-        # Skewness adjustment using exponential tilt
-        if skew != 0:
-            tilt = math.exp(skew * z * 0.5)
-            pdf = normal_pdf * tilt
-        else:
-            pdf = normal_pdf
-        
-        distribution[str(int(point))] = max(0.001, pdf)
-        total += distribution[str(int(point))]
-    
-    # Normalize
-    for key in distribution:
-        distribution[key] = round(distribution[key] / total * 100, 1)
-    
-    return distribution
+    return skewed_distributions(mean, sd, skew, min_val, max_val, n_points).to_dict(0)
 
 
 def generate_bimodal_distribution(
@@ -172,27 +547,7 @@ def generate_bimodal_distribution(
     
     Useful for polarized topics or segmented audiences.
     """
-    distribution = {}
-    weight2 = 1.0 - weight1
-    
-    for i in range(n_points):
-        point = min_val + i
-        
-        # Two Gaussian peaks
-        z1 = (point - mode1) / sd
-        z2 = (point - mode2) / sd
-        
-        pdf1 = math.exp(-0.5 * z1 * z1)
-        pdf2 = math.exp(-0.5 * z2 * z2)
-        
-        distribution[str(int(point))] = weight1 * pdf1 + weight2 * pdf2
-    
-    # Normalize
-    total = sum(distribution.values())
-    for key in distribution:
-        distribution[key] = round(distribution[key] / total * 100, 1)
-    
-    return distribution
+    return bimodal_distributions(mode1, mode2, weight1, sd, min_val, max_val, n_points).to_dict(0)
 
 
 def generate_nps_distribution(
@@ -208,25 +563,7 @@ def generate_nps_distribution(
     - Scores cluster at 7-8 (passives) and 9-10 (promoters)
     - Detractors (0-6) are typically sparse unless major issues
     """
-    distribution = {}
-    
-    # Generate base normal distribution
-    for i in range(11):
-        z = (i - mean) / sd
-        pdf = math.exp(-0.5 * z * z)
-        
-        # Apply promoter boost to 9-10
-        if i >= 9 and promoter_boost > 0:
-            pdf *= (1 + promoter_boost)
-        
-        distribution[str(i)] = max(0.001, pdf)
-    
-    # Normalize
-    total = sum(distribution.values())
-    for key in distribution:
-        distribution[key] = round(distribution[key] / total * 100, 1)
-    
-    return distribution
+    return nps_distributions(mean, sd, promoter_boost).to_dict(0)
 
 
 def generate_binary_distribution(
@@ -395,3 +732,300 @@ def calculate_distribution_stats(
         "t2b": round(t2b * 100, 1),
         "b2b": round(b2b * 100, 1)
     }
+
+
+
+# ═══════════════════════════════════════════════════════════════
+# INVERSE FITTING
+# ═══════════════════════════════════════════════════════════════
+
+# Fitted distributions are the maximum-entropy distributions with the
+# target statistics: on a scale rescaled to u in [0, 1],
+#
+#     p(u) ∝ exp(θ₁·u + θ₂·u² + θ₃·[u in top 2 boxes])
+#
+# i.e. a Gaussian kernel (the truncated_normal shape) with a top-2-box
+# weight (like nps_distributions' promoter boost). Matching mean, SD and
+# T2B is a convex problem in θ, solved by batched Newton steps from a
+# warm start looked up in a per-scale grid index. Errors are measured in
+# fractions of the scale range (mean, SD) and as a share (T2B).
+#
+# The top-2 weight is a step, so targets that pull T2B away from what
+# mean and SD imply are met by a spike in the top boxes over an empty
+# valley (0-10, mean 7.5, SD 2.0, T2B 60 puts 58% on "9" and 0.6% on
+# "8"). Such fits are refit on mean and SD alone (see _has_valley).
+
+FIT_TOLERANCE = 1e-4
+FIT_MAX_ITER = 30
+
+# A point below this share of the smaller peak on either side is a valley
+FIT_VALLEY_RATIO = 0.5
+
+# Warm-start index: grid sizes for location, curvature and top-2 weight,
+# and the target-space cells (mean, SD, T2B) the grid is bucketed into
+_FIT_GRID = (41, 40, 25)
+_FIT_CELLS = (64, 48, 40)
+_FIT_THETA_LIMIT = 2000.0
+_FIT_MAX_HALVINGS = 40
+
+
+@dataclass
+class DistributionFit:
+    """
+    Best-fit distributions for a batch of target statistics.
+
+    `batch` holds the fitted distributions and `theta` their (m, 3)
+    coefficients (see INVERSE FITTING above). `achieved` is an (m, 3)
+    array of the fitted mean, SD and T2B (percent, as in
+    calculate_distribution_stats). `converged` marks rows within the
+    tolerance of every target; other rows are the closest the solver got
+    to targets no distribution on the scale can meet. `smoothed` marks
+    rows whose T2B fit had a valley and were refit on mean and SD alone;
+    their T2B is not matched, so they are not converged.
+    """
+    batch: DistributionBatch
+    theta: np.ndarray
+    achieved: np.ndarray
+    error: np.ndarray
+    converged: np.ndarray
+    smoothed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+
+@dataclass(frozen=True)
+class _FitIndex:
+    features: np.ndarray    # (k, 3): u, u², top-2 indicator
+    grid: np.ndarray        # (g, 3) θ
+    full: np.ndarray        # cell -> grid row, over (mean, SD, T2B)
+    untilted: np.ndarray    # cell -> grid row, over (mean, SD), θ₃ == 0
+
+
+def _maxent(theta: np.ndarray, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(m, k) probabilities and (m,) log partition function."""
+    logits = theta @ features.T
+    peak = logits.max(axis=1, keepdims=True)
+    weights = np.exp(logits - peak)
+    total = weights.sum(axis=1, keepdims=True)
+    return weights / total, (peak + np.log(total))[:, 0]
+
+
+def _unit_stats(moments: np.ndarray) -> np.ndarray:
+    """(m, 3) mean, SD and T2B share from E[u], E[u²], E[top 2]."""
+    mean = moments[:, 0]
+    sd = np.sqrt(np.maximum(0.0, moments[:, 1] - mean * mean))
+    return np.stack([mean, sd, moments[:, 2]], axis=1)
+
+
+def _cell_coords(stats: np.ndarray, cells: Tuple[int, ...]) -> np.ndarray:
+    # SD on [0, 1] is at most 1/2, so 2·SD spans [0, 1] like the others
+    unit = stats[:, :len(cells)] * np.array([1.0, 2.0, 1.0])[:len(cells)]
+    return np.clip((unit * cells).astype(np.int64), 0, np.array(cells) - 1)
+
+
+def _cell_table(stats: np.ndarray, cells: Tuple[int, ...]) -> np.ndarray:
+    """Map each target-space cell to the grid row nearest its centre."""
+    coords = _cell_coords(stats, cells)
+    unit = stats[:, :len(cells)] * np.array([1.0, 2.0, 1.0])[:len(cells)]
+    distance = ((unit - (coords + 0.5) / cells) ** 2).sum(axis=1)
+    flat = np.ravel_multi_index(coords.T, cells)
+
+    order = np.lexsort((distance, flat))
+    first = np.r_[True, flat[order][1:] != flat[order][:-1]]
+    table = np.full(cells, -1, dtype=np.int64)
+    table.reshape(-1)[flat[order][first]] = order[first]
+
+    # Cells no grid point reaches take a neighbour's entry
+    while (table < 0).any():
+        for axis in range(table.ndim):
+            for src, dst in ((slice(None, -1), slice(1, None)), (slice(1, None), slice(None, -1))):
+                source = table[(slice(None),) * axis + (src,)]
+                target = table[(slice(None),) * axis + (dst,)]
+                fill = (target < 0) & (source >= 0)
+                target[fill] = source[fill]
+    return table
+
+
+@lru_cache(maxsize=8)
+def _fit_index(n_points: int) -> _FitIndex:
+    """θ grid for an n-point scale, bucketed by the statistics it produces."""
+    u = np.arange(n_points) / (n_points - 1)
+    features = np.stack([u, u * u, (np.arange(n_points) >= n_points - 2).astype(float)], axis=1)
+
+    # θ₁ = -2·θ₂·location puts the kernel's peak (θ₂ < 0) or trough
+    # (θ₂ > 0, polarized shapes) at `location`
+    location = np.linspace(-0.5, 1.5, _FIT_GRID[0])
+    n_peaked = _FIT_GRID[1] * 3 // 4
+    curvature = np.r_[-np.geomspace(0.1, 500.0, n_peaked), np.geomspace(0.1, 20.0, _FIT_GRID[1] - n_peaked)]
+    tilt = np.linspace(-6.0, 6.0, _FIT_GRID[2])  # odd count: includes 0
+    loc, curv, tilt = (a.reshape(-1) for a in np.meshgrid(location, curvature, tilt, indexing="ij"))
+    grid = np.stack([-2.0 * curv * loc, curv, tilt], axis=1)
+
+    probs, _ = _maxent(grid, features)
+    stats = _unit_stats(probs @ features)
+    untilted = np.flatnonzero(grid[:, 2] == 0)
+    return _FitIndex(
+        features=features,
+        grid=grid,
+        full=_cell_table(stats, _FIT_CELLS),
+        untilted=untilted[_cell_table(stats[untilted], _FIT_CELLS[:2])],
+    )
+
+
+def _has_valley(probs: np.ndarray) -> np.ndarray:
+    """
+    Rows with an interior point below FIT_VALLEY_RATIO of the smaller
+    peak on either side. Polarized rows, whose peaks on both sides are
+    the end points, do not count.
+    """
+    n_points = probs.shape[1]
+    found = np.zeros(len(probs), dtype=bool)
+    for i in range(1, n_points - 1):
+        left, right = probs[:, :i], probs[:, i + 1:]
+        deep = probs[:, i] < FIT_VALLEY_RATIO * np.minimum(left.max(axis=1), right.max(axis=1))
+        polarized = (left.argmax(axis=1) == 0) & (right.argmax(axis=1) == n_points - i - 2)
+        found |= deep & ~polarized
+    return found
+
+
+def fit_distributions(
+    mean: ArrayLike,
+    sd: ArrayLike,
+    t2b: Optional[ArrayLike] = None,
+    min_val: float = 1.0,
+    n_points: int = 5,
+    tolerance: float = FIT_TOLERANCE,
+    max_iter: int = FIT_MAX_ITER,
+    smooth: bool = True
+) -> DistributionFit:
+    """
+    Fit distributions to target mean, SD and top-2-box.
+
+    Usage:
+        fit = fit_distributions([3.8, 4.1], [0.9, 1.0], [65, 72])
+        fit.batch.to_dicts(), fit.converged, fit.smoothed
+
+    `t2b` is in percent (like calculate_distribution_stats); pass None,
+    or NaN for individual rows, to fit mean and SD alone with a plain
+    Gaussian-kernel shape. Use min_val=0, n_points=11 for 0-10 scales.
+
+    With smooth=True, T2B fits with a valley between two peaks (a spike
+    in the top boxes) are replaced by the mean-and-SD fit and flagged in
+    `smoothed`; pass smooth=False to keep them.
+    """
+    if n_points < 3:
+        raise ValueError("n_points must be at least 3")
+    if t2b is None:
+        t2b = np.nan
+    mean, sd, t2b = _params(mean, sd, t2b)
+    span = n_points - 1
+    target = np.stack([(mean - min_val) / span, sd / span, t2b / 100.0], axis=1)
+    has_t2b = ~np.isnan(target[:, 2])
+    target[~has_t2b, 2] = 0.0
+    free = np.ones_like(target)
+    free[:, 2] = has_t2b
+
+    # E[u], E[u²], E[top 2] implied by the targets
+    target_moments = target.copy()
+    target_moments[:, 1] = target[:, 1] ** 2 + target[:, 0] ** 2
+
+    # Warm start from the grid index
+    index = _fit_index(n_points)
+    features = index.features
+    coords = _cell_coords(target, _FIT_CELLS)
+    start = np.where(
+        has_t2b,
+        index.full[tuple(coords.T)],
+        index.untilted[tuple(coords[:, :2].T)],
+    )
+    theta = index.grid[start]
+
+    def error_of(moments: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        return (np.abs(_unit_stats(moments) - target[rows]) * free[rows]).max(axis=1)
+
+    rows = np.arange(len(target))
+    probs, log_z = _maxent(theta, features)
+    moments = probs @ features
+    objective = log_z - (theta * target_moments).sum(axis=1)
+    error = error_of(moments, rows)
+    active = error > tolerance
+
+    for _ in range(max_iter):
+        rows = np.flatnonzero(active)
+        if not rows.size:
+            break
+
+        # Newton step on the convex dual: gradient E[f] - target,
+        # Hessian Cov[f]; a held θ₃ gets an identity row
+        mask = free[rows]
+        grad = (moments[rows] - target_moments[rows]) * mask
+        cov = np.einsum("mk,ki,kj->mij", probs[rows], features, features)
+        cov -= moments[rows, :, None] * moments[rows, None, :]
+        hess = cov * mask[:, :, None] * mask[:, None, :] + (1.0 - mask)[:, :, None] * np.eye(3)
+        direction = -np.linalg.solve(hess + 1e-12 * np.eye(3), grad[:, :, None])[:, :, 0]
+        slope = (grad * direction).sum(axis=1)
+
+        # Backtracking line search within the θ bounds
+        pending = np.arange(rows.size)
+        alpha = 1.0
+        for _ in range(_FIT_MAX_HALVINGS):
+            at = rows[pending]
+            candidate = np.clip(
+                theta[at] + alpha * direction[pending], -_FIT_THETA_LIMIT, _FIT_THETA_LIMIT
+            )
+            cand_probs, cand_log_z = _maxent(candidate, features)
+            cand_objective = cand_log_z - (candidate * target_moments[at]).sum(axis=1)
+            ok = cand_objective <= objective[at] + 1e-4 * alpha * slope[pending]
+            accepted = at[ok]
+            theta[accepted] = candidate[ok]
+            probs[accepted] = cand_probs[ok]
+            moments[accepted] = cand_probs[ok] @ features
+            objective[accepted] = cand_objective[ok]
+            pending = pending[~ok]
+            if not pending.size:
+                break
+            alpha *= 0.5
+
+        error[rows] = error_of(moments[rows], rows)
+        active[rows] = error[rows] > tolerance
+        active[rows[pending]] = False  # no further progress possible
+
+    smoothed = np.zeros(len(target), dtype=bool)
+    if smooth:
+        smoothed = has_t2b & _has_valley(probs)
+    if smoothed.any():
+        # The untilted kernel is log-concave or log-convex, so never has a valley
+        rows = np.flatnonzero(smoothed)
+        refit = fit_distributions(
+            mean[rows], sd[rows], None, min_val, n_points, tolerance, max_iter, smooth=False
+        )
+        theta[rows] = refit.theta
+        probs[rows] = refit.batch.probabilities
+        moments[rows] = probs[rows] @ features
+        error[rows] = error_of(moments[rows], rows)
+
+    stats = _unit_stats(moments)
+    return DistributionFit(
+        batch=DistributionBatch(probs, _scale_keys(min_val, n_points)),
+        theta=theta,
+        achieved=np.stack([min_val + stats[:, 0] * span, stats[:, 1] * span, stats[:, 2] * 100], axis=1),
+        error=error,
+        converged=error <= tolerance,
+        smoothed=smoothed,
+    )
+
+
+def fit_distribution(
+    mean: float,
+    sd: float,
+    t2b: Optional[float] = None,
+    min_val: float = 1.0,
+    n_points: int = 5
+) -> Dict[str, float]:
+    """
+    Distribution matching a target mean, SD and (optionally) T2B percent.
+
+    See fit_distributions() for batches, convergence and smoothing flags.
+    """
+    return fit_distributions(mean, sd, t2b, min_val, n_points).batch.to_dict(0)
@@ -5,9 +5,10 @@ Tracks accuracy metrics and calibration performance.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
-import math
+
+from . import metrics as _metrics
 
 
 @dataclass
@@ -35,6 +36,78 @@ class CalibrationMetrics:
     mean_brier: float = 0.0
     accuracy_by_zone: Dict[str, float] = field(default_factory=dict)
     accuracy_by_type: Dict[str, float] = field(default_factory=dict)
+    # Populated by get_metrics(confidence_intervals=True)
+    mean_ece: Optional[float] = None
+    mae_ci: Optional[Tuple[float, float]] = None
+    brier_ci: Optional[Tuple[float, float]] = None
+    ece_ci: Optional[Tuple[float, float]] = None
+    accuracy_by_zone_ci: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    accuracy_by_type_ci: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+
+def _attach_confidence_intervals(
+    metrics: CalibrationMetrics,
+    records: List[PredictionRecord],
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None
+) -> CalibrationMetrics:
+    """
+    Fill the bootstrap CI fields of `metrics` from validated records.
+
+    ECE is computed over every (predicted share, actual share) option pair,
+    resampling whole records so options of one question stay together.
+    """
+    scored = [r for r in records if r.mae is not None]
+    maes = [r.mae for r in scored]
+    briers = [r.brier_score for r in records if r.brier_score is not None]
+
+    mae = _metrics.bootstrap_mean(maes, n_resamples, confidence, seed)
+    brier = _metrics.bootstrap_mean(briers, n_resamples, confidence, seed)
+    metrics.mae_ci = mae.ci
+    metrics.brier_ci = brier.ci
+
+    for attr, groups in (("accuracy_by_zone_ci", [r.accuracy_zone for r in scored]),
+                         ("accuracy_by_type_ci", [r.question_type for r in scored])):
+        estimates = _metrics.bootstrap_group_means(maes, groups, n_resamples, confidence, seed)
+        setattr(metrics, attr, {label: est.ci for label, est in estimates.items()})
+
+    probs, outcomes, units = [], [], []
+    for i, r in enumerate(records):
+        if not r.actual_distribution:
+            continue
+        for key in set(r.predicted_distribution) | set(r.actual_distribution):
+            probs.append(r.predicted_distribution.get(key, 0.0) / 100.0)
+            outcomes.append(r.actual_distribution.get(key, 0.0) / 100.0)
+            units.append(i)
+    if probs:
+        ece = _metrics.bootstrap_ece(
+            probs, outcomes, units,
+            n_resamples=n_resamples, confidence=confidence, seed=seed
+        )
+        metrics.mean_ece = ece.value
+        metrics.ece_ci = ece.ci
+
+    return metrics
+
+
+@dataclass
+class _RunningMean:
+    """Running sum/count pair so aggregate means stay O(1) to read."""
+    total: float = 0.0
+    count: int = 0
+
+    def add(self, value: float):
+        self.total += value
+        self.count += 1
+
+    def remove(self, value: float):
+        self.total -= value
+        self.count -= 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
 
 
 class EvaluationTracker:
@@ -45,12 +118,32 @@ class EvaluationTracker:
     - Brier score for probability calibration
     - MAE for point estimates
     - Zone-specific accuracy tracking
+    
+    Records are held in an id-indexed dict with secondary indexes by
+    accuracy zone and question type. Aggregate metrics are maintained as
+    running sums on validate, so get_metrics() does not rescan records.
     """
     
     def __init__(self, storage_path: Optional[str] = None):
-        self.records: List[PredictionRecord] = []
         self.storage_path = storage_path
-        
+        self._reset()
+    
+    def _reset(self):
+        """Drop all records, indexes and running sums."""
+        self._records: Dict[str, PredictionRecord] = {}
+        self._by_zone: Dict[str, Dict[str, PredictionRecord]] = {}
+        self._by_type: Dict[str, Dict[str, PredictionRecord]] = {}
+        self._validated_count = 0
+        self._mae = _RunningMean()
+        self._brier = _RunningMean()
+        self._zone_mae: Dict[str, _RunningMean] = {}
+        self._type_mae: Dict[str, _RunningMean] = {}
+    
+    @property
+    def records(self) -> List[PredictionRecord]:
+        """All records in insertion order."""
+        return list(self._records.values())
+    
     def record_prediction(
         self,
         prediction_id: str,
@@ -59,7 +152,11 @@ class EvaluationTracker:
         predicted_distribution: Dict[str, float],
         accuracy_zone: str = "unknown"
     ) -> PredictionRecord:
-        """Record a new prediction."""
+        """
+        Record a new prediction.
+        
+        Recording an existing prediction_id replaces the earlier record.
+        """
         record = PredictionRecord(
             prediction_id=prediction_id,
             timestamp=datetime.now().isoformat(),
@@ -68,9 +165,52 @@ class EvaluationTracker:
             predicted_distribution=predicted_distribution,
             accuracy_zone=accuracy_zone
         )
-        self.records.append(record)
+        self._add_record(record)
         return record
     
+    def _add_record(self, record: PredictionRecord):
+        """Insert a record into the primary and secondary indexes."""
+        existing = self._records.pop(record.prediction_id, None)
+        if existing is not None:
+            self._remove_from_indexes(existing)
+        
+        self._records[record.prediction_id] = record
+        self._by_zone.setdefault(record.accuracy_zone, {})[record.prediction_id] = record
+        self._by_type.setdefault(record.question_type, {})[record.prediction_id] = record
+        if record.validated:
+            self._accumulate(record)
+    
+    def _remove_from_indexes(self, record: PredictionRecord):
+        """Remove a record from the secondary indexes and running sums."""
+        if record.validated:
+            self._retract(record)
+        self._by_zone.get(record.accuracy_zone, {}).pop(record.prediction_id, None)
+        self._by_type.get(record.question_type, {}).pop(record.prediction_id, None)
+    
+    def _accumulate(self, record: PredictionRecord):
+        """Add a validated record's errors to the running sums."""
+        self._validated_count += 1
+        if record.mae is not None:
+            self._mae.add(record.mae)
+            self._zone_mae.setdefault(record.accuracy_zone, _RunningMean()).add(record.mae)
+            self._type_mae.setdefault(record.question_type, _RunningMean()).add(record.mae)
+        if record.brier_score is not None:
+            self._brier.add(record.brier_score)
+    
+    def _retract(self, record: PredictionRecord):
+        """Undo _accumulate for a record that is being re-validated or replaced."""
+        self._validated_count -= 1
+        if record.mae is not None:
+            self._mae.remove(record.mae)
+            for index, key in ((self._zone_mae, record.accuracy_zone),
+                               (self._type_mae, record.question_type)):
+                running = index[key]
+                running.remove(record.mae)
+                if running.count == 0:
+                    del index[key]
+        if record.brier_score is not None:
+            self._brier.remove(record.brier_score)
+    
     def validate_prediction(
         self,
         prediction_id: str,
@@ -87,9 +227,14 @@ class EvaluationTracker:
         record = self._find_record(prediction_id)
         if not record:
             return None
+        
+        if record.validated:
+            self._retract(record)
             
         record.actual_mean = actual_mean
         record.actual_distribution = actual_distribution
+        record.mae = None
+        record.brier_score = None
         
         # Calculate MAE
         if record.predicted_mean is not None and actual_mean is not None:
@@ -103,6 +248,7 @@ class EvaluationTracker:
             )
         
         record.validated = True
+        self._accumulate(record)
         return record
     
     def _calculate_brier(
@@ -126,58 +272,54 @@ class EvaluationTracker:
     
     def _find_record(self, prediction_id: str) -> Optional[PredictionRecord]:
         """Find a record by ID."""
-        for record in self.records:
-            if record.prediction_id == prediction_id:
-                return record
-        return None
+        return self._records.get(prediction_id)
     
-    def get_metrics(self) -> CalibrationMetrics:
-        """Calculate aggregate metrics."""
-        metrics = CalibrationMetrics()
-        metrics.total_predictions = len(self.records)
+    def records_by_zone(self, accuracy_zone: str) -> List[PredictionRecord]:
+        """All records in an accuracy zone."""
+        return list(self._by_zone.get(accuracy_zone, {}).values())
+    
+    def records_by_type(self, question_type: str) -> List[PredictionRecord]:
+        """All records of a question type."""
+        return list(self._by_type.get(question_type, {}).values())
+    
+    def get_metrics(
+        self,
+        confidence_intervals: bool = False,
+        n_resamples: int = 1000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None
+    ) -> CalibrationMetrics:
+        """
+        Return aggregate metrics from the running sums.
         
-        validated = [r for r in self.records if r.validated]
-        metrics.validated_predictions = len(validated)
+        With confidence_intervals=True, also bootstraps CIs for MAE, Brier,
+        per-zone/per-type MAE and ECE (this scans validated records).
+        """
+        metrics = CalibrationMetrics()
+        metrics.total_predictions = len(self._records)
+        metrics.validated_predictions = self._validated_count
         
-        if not validated:
+        if not self._validated_count:
             return metrics
         
-        # Calculate means
-        maes = [r.mae for r in validated if r.mae is not None]
-        briers = [r.brier_score for r in validated if r.brier_score is not None]
-        
-        if maes:
-            metrics.mean_mae = sum(maes) / len(maes)
-        if briers:
-            metrics.mean_brier = sum(briers) / len(briers)
-        
-        # Accuracy by zone
-        zone_records: Dict[str, List[float]] = {}
-        for r in validated:
-            if r.mae is not None:
-                if r.accuracy_zone not in zone_records:
-                    zone_records[r.accuracy_zone] = []
-                zone_records[r.accuracy_zone].append(r.mae)
-        
-        for zone, maes in zone_records.items():
-            metrics.accuracy_by_zone[zone] = sum(maes) / len(maes)
-        
-        # Accuracy by type
-        type_records: Dict[str, List[float]] = {}
-        for r in validated:
-            if r.mae is not None:
-                if r.question_type not in type_records:
-                    type_records[r.question_type] = []
-                type_records[r.question_type].append(r.mae)
+        metrics.mean_mae = self._mae.mean
+        metrics.mean_brier = self._brier.mean
+        metrics.accuracy_by_zone = {
+            zone: running.mean for zone, running in self._zone_mae.items()
+        }
+        metrics.accuracy_by_type = {
+            qtype: running.mean for qtype, running in self._type_mae.items()
+        }
         
-        for qtype, maes in type_records.items():
-            metrics.accuracy_by_type[qtype] = sum(maes) / len(maes)
+        if confidence_intervals:
+            validated = [r for r in self._records.values() if r.validated]
+            _attach_confidence_intervals(metrics, validated, n_resamples, confidence, seed)
         
         return metrics
     
-    def generate_report(self) -> str:
+    def generate_report(self, confidence_intervals: bool = False) -> str:
         """Generate a human-readable accuracy report."""
-        metrics = self.get_metrics()
+        metrics = self.get_metrics(confidence_intervals=confidence_intervals)
         
         lines = [
             "=" * 60,
@@ -193,23 +335,30 @@ class EvaluationTracker:
             lines.extend([
                 "AGGREGATE METRICS",
                 "-" * 40,
-                f"Mean Absolute Error: {metrics.mean_mae:.2f} points",
-                f"Mean Brier Score: {metrics.mean_brier:.4f}",
-                "",
+                f"Mean Absolute Error: {metrics.mean_mae:.2f} points{_format_ci(metrics.mae_ci, '.2f')}",
+                f"Mean Brier Score: {metrics.mean_brier:.4f}{_format_ci(metrics.brier_ci, '.4f')}",
             ])
+            if metrics.mean_ece is not None:
+                lines.append(
+                    f"Expected Calibration Error: {metrics.mean_ece:.4f}"
+                    f"{_format_ci(metrics.ece_ci, '.4f')}"
+                )
+            lines.append("")
             
             if metrics.accuracy_by_zone:
                 lines.append("ACCURACY BY ZONE")
                 lines.append("-" * 40)
                 for zone, mae in sorted(metrics.accuracy_by_zone.items()):
-                    lines.append(f"  {zone}: MAE {mae:.2f}")
+                    ci = _format_ci(metrics.accuracy_by_zone_ci.get(zone), '.2f')
+                    lines.append(f"  {zone}: MAE {mae:.2f}{ci}")
                 lines.append("")
             
             if metrics.accuracy_by_type:
                 lines.append("ACCURACY BY QUESTION TYPE")
                 lines.append("-" * 40)
                 for qtype, mae in sorted(metrics.accuracy_by_type.items()):
-                    lines.append(f"  {qtype}: MAE {mae:.2f}")
+                    ci = _format_ci(metrics.accuracy_by_type_ci.get(qtype), '.2f')
+                    lines.append(f"  {qtype}: MAE {mae:.2f}{ci}")
                 lines.append("")
         
         lines.append("=" * 60)
@@ -236,11 +385,11 @@ class EvaluationTracker:
                     "accuracy_zone": r.accuracy_zone,
                     "validated": r.validated,
                 }
-                for r in self.records
+                for r in self._records.values()
             ],
             "metrics": {
-                "total": len(self.records),
-                "validated": len([r for r in self.records if r.validated]),
+                "total": len(self._records),
+                "validated": self._validated_count,
             }
         }
         
@@ -257,13 +406,19 @@ class EvaluationTracker:
             with open(path, "r") as f:
                 data = json.load(f)
             
-            self.records = [
-                PredictionRecord(**r) for r in data.get("records", [])
-            ]
+            self._reset()
+            for r in data.get("records", []):
+                self._add_record(PredictionRecord(**r))
         except FileNotFoundError:
             pass
 
 
+def _format_ci(ci: Optional[Tuple[float, float]], spec: str) -> str:
+    if ci is None:
+        return ""
+    return f" (CI {ci[0]:{spec}}-{ci[1]:{spec}})"
+
+
 # Convenience functions
 def calculate_mae(predicted: float, actual: float) -> float:
     """Calculate Mean Absolute Error between two values."""
@@ -282,11 +437,7 @@ def calculate_rmse(predictions: List[float], actuals: List[float]) -> float:
     if len(predictions) != len(actuals):
         raise ValueError("Predictions and actuals must have same length")
     
-    if not predictions:
-        return 0.0
-    
-    squared_errors = [(p - a) ** 2 for p, a in zip(predictions, actuals)]
-    return math.sqrt(sum(squared_errors) / len(squared_errors))
+    return _metrics.rmse(predictions, actuals)
 
 
 def calculate_calibration_score(
@@ -297,32 +448,11 @@ def calculate_calibration_score(
     Calculate calibration score (expected calibration error).
     
     Groups predictions into bins and compares predicted vs actual.
+    Outcomes count as 1.0 or 0.0 by truthiness; use
+    metrics.expected_calibration_error for observed frequencies.
     """
     if len(predicted_probs) != len(actual_outcomes):
         raise ValueError("Predictions and outcomes must have same length")
     
-    if not predicted_probs:
-        return 0.0
-    
-    # Create bins
-    n_bins = 10
-    bins = [[] for _ in range(n_bins)]
-    
-    for prob, outcome in zip(predicted_probs, actual_outcomes):
-        bin_idx = min(int(prob * n_bins), n_bins - 1)
-        bins[bin_idx].append((prob, 1.0 if outcome else 0.0))
-    
-    # Calculate ECE
-    ece = 0.0
-    total = len(predicted_probs)
-    
-    for bin_data in bins:
-        if not bin_data:
-            continue
-        
-        avg_pred = sum(p for p, _ in bin_data) / len(bin_data)
-        avg_actual = sum(a for _, a in bin_data) / len(bin_data)
-        
-        ece += (len(bin_data) / total) * abs(avg_pred - avg_actual)
-    
-    return ece
+    outcomes = [1.0 if outcome else 0.0 for outcome in actual_outcomes]
+    return _metrics.expected_calibration_error(predicted_probs, outcomes)
@@ -0,0 +1,390 @@
+"""
+Crowdwave Evaluation Store
+SQLite-backed prediction/validation storage for the evaluation framework.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .evaluation import (
+    CalibrationMetrics,
+    EvaluationTracker,
+    PredictionRecord,
+    _attach_confidence_intervals,
+)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SCHEMA
+# ═══════════════════════════════════════════════════════════════
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    prediction_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    predicted_mean REAL,
+    predicted_distribution TEXT NOT NULL,
+    accuracy_zone TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_predictions_zone ON predictions (accuracy_zone);
+CREATE INDEX IF NOT EXISTS idx_predictions_type ON predictions (question_type);
+
+-- Append-only: re-validating a prediction adds a row, the latest row wins.
+CREATE TABLE IF NOT EXISTS validations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    prediction_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    actual_mean REAL,
+    actual_distribution TEXT,
+    mae REAL,
+    brier_score REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_validations_prediction ON validations (prediction_id, id);
+
+CREATE VIEW IF NOT EXISTS latest_validations AS
+    SELECT v.* FROM validations v
+    JOIN (
+        SELECT prediction_id, MAX(id) AS id FROM validations GROUP BY prediction_id
+    ) latest ON v.id = latest.id;
+"""
+
+_RECORD_QUERY = """
+    SELECT p.prediction_id, p.timestamp, p.question_type, p.predicted_mean,
+           p.predicted_distribution, p.accuracy_zone,
+           v.actual_mean, v.actual_distribution, v.mae, v.brier_score,
+           v.id IS NOT NULL
+    FROM predictions p
+    LEFT JOIN latest_validations v ON v.prediction_id = p.prediction_id
+"""
+
+# One prediction by primary key, with its latest validation found through
+# idx_validations_prediction rather than the full-table latest_validations
+_FIND_QUERY = """
+    SELECT p.prediction_id, p.timestamp, p.question_type, p.predicted_mean,
+           p.predicted_distribution, p.accuracy_zone,
+           v.actual_mean, v.actual_distribution, v.mae, v.brier_score,
+           v.id IS NOT NULL
+    FROM predictions p
+    LEFT JOIN validations v ON v.id = (
+        SELECT id FROM validations
+        WHERE prediction_id = p.prediction_id
+        ORDER BY id DESC LIMIT 1
+    )
+    WHERE p.prediction_id = ?
+"""
+
+
+class SQLiteEvaluationTracker(EvaluationTracker):
+    """
+    EvaluationTracker backed by a SQLite database in WAL mode.
+
+    Usage:
+        tracker = SQLiteEvaluationTracker("evaluations.db")
+        tracker.record_prediction("q1", "scale", 3.5, {"1": 10, ...})
+        tracker.validate_prediction("q1", actual_mean=3.7)
+        print(tracker.generate_report())
+        tracker.close()
+
+    Writes are buffered and flushed as one transaction every `batch_size`
+    operations (and on save/close or before any read). Validations are
+    appended rather than rewritten, so concurrent writers in separate
+    processes do not clobber each other. Metrics are computed with SQL
+    aggregates, so generate_report() never loads the full history.
+    """
+
+    def __init__(self, storage_path: str, batch_size: int = 500):
+        self.storage_path = storage_path
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._pending_predictions: Dict[str, PredictionRecord] = {}
+        self._pending_validations: List[Tuple] = []
+
+        self._conn = sqlite3.connect(storage_path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    # ───────────────────────────────────────────────────────────
+    # Writes
+    # ───────────────────────────────────────────────────────────
+
+    def record_prediction(
+        self,
+        prediction_id: str,
+        question_type: str,
+        predicted_mean: Optional[float],
+        predicted_distribution: Dict[str, float],
+        accuracy_zone: str = "unknown"
+    ) -> PredictionRecord:
+        """
+        Record a new prediction.
+
+        Recording an existing prediction_id replaces the earlier record
+        and discards its validations.
+        """
+        record = PredictionRecord(
+            prediction_id=prediction_id,
+            timestamp=datetime.now().isoformat(),
+            question_type=question_type,
+            predicted_mean=predicted_mean,
+            predicted_distribution=predicted_distribution,
+            accuracy_zone=accuracy_zone
+        )
+        with self._lock:
+            self._pending_validations = [
+                v for v in self._pending_validations if v[0] != prediction_id
+            ]
+            self._pending_predictions[prediction_id] = record
+            self._maybe_flush()
+        return record
+
+    def validate_prediction(
+        self,
+        prediction_id: str,
+        actual_mean: Optional[float] = None,
+        actual_distribution: Optional[Dict[str, float]] = None
+    ) -> Optional[PredictionRecord]:
+        """
+        Validate a prediction against actual results.
+
+        Appends a validation row; the latest validation per prediction
+        is the one used in metrics.
+        """
+        with self._lock:
+            record = self._find_record(prediction_id)
+            if not record:
+                return None
+
+            record.actual_mean = actual_mean
+            record.actual_distribution = actual_distribution
+            record.mae = None
+            record.brier_score = None
+
+            if record.predicted_mean is not None and actual_mean is not None:
+                record.mae = abs(record.predicted_mean - actual_mean)
+
+            if actual_distribution:
+                record.brier_score = self._calculate_brier(
+                    record.predicted_distribution,
+                    actual_distribution
+                )
+
+            record.validated = True
+            self._pending_validations.append((
+                prediction_id,
+                datetime.now().isoformat(),
+                actual_mean,
+                json.dumps(actual_distribution) if actual_distribution is not None else None,
+                record.mae,
+                record.brier_score,
+            ))
+            self._maybe_flush()
+            return record
+
+    def _maybe_flush(self):
+        pending = len(self._pending_predictions) + len(self._pending_validations)
+        if pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered predictions and validations in one transaction."""
+        with self._lock:
+            if not self._pending_predictions and not self._pending_validations:
+                return
+
+            predictions = [
+                (
+                    r.prediction_id,
+                    r.timestamp,
+                    r.question_type,
+                    r.predicted_mean,
+                    json.dumps(r.predicted_distribution),
+                    r.accuracy_zone,
+                )
+                for r in self._pending_predictions.values()
+            ]
+
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM validations WHERE prediction_id = ?",
+                    [(p[0],) for p in predictions]
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?, ?, ?)",
+                    predictions
+                )
+                self._conn.executemany(
+                    "INSERT INTO validations (prediction_id, timestamp, actual_mean, "
+                    "actual_distribution, mae, brier_score) VALUES (?, ?, ?, ?, ?, ?)",
+                    self._pending_validations
+                )
+
+            self._pending_predictions = {}
+            self._pending_validations = []
+
+    def save(self, path: Optional[str] = None):
+        """Flush buffered writes (data is already persisted in SQLite)."""
+        self.flush()
+
+    def load(self, path: Optional[str] = None):
+        """No-op: records are read from SQLite on demand."""
+        self.flush()
+
+    def close(self):
+        """Flush and close the database connection."""
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ───────────────────────────────────────────────────────────
+    # Reads
+    # ───────────────────────────────────────────────────────────
+
+    def _row_to_record(self, row) -> PredictionRecord:
+        return PredictionRecord(
+            prediction_id=row[0],
+            timestamp=row[1],
+            question_type=row[2],
+            predicted_mean=row[3],
+            predicted_distribution=json.loads(row[4]),
+            actual_mean=row[6],
+            actual_distribution=json.loads(row[7]) if row[7] is not None else None,
+            mae=row[8],
+            brier_score=row[9],
+            accuracy_zone=row[5],
+            validated=bool(row[10]),
+        )
+
+    def _query_records(self, where: str = "", params: Tuple = ()) -> List[PredictionRecord]:
+        self.flush()
+        rows = self._conn.execute(f"{_RECORD_QUERY} {where} ORDER BY p.rowid", params)
+        return [self._row_to_record(row) for row in rows]
+
+    def _find_record(self, prediction_id: str) -> Optional[PredictionRecord]:
+        """
+        Find a record by ID without flushing: buffered predictions first,
+        then a primary-key lookup with any buffered validation applied.
+        """
+        record = self._pending_predictions.get(prediction_id)
+        if record is not None:
+            return record
+
+        row = self._conn.execute(_FIND_QUERY, (prediction_id,)).fetchone()
+        if row is None:
+            return None
+        record = self._row_to_record(row)
+
+        for validation in reversed(self._pending_validations):
+            if validation[0] == prediction_id:
+                _, _, record.actual_mean, actual_distribution, record.mae, record.brier_score = validation
+                record.actual_distribution = (
+                    json.loads(actual_distribution) if actual_distribution is not None else None
+                )
+                record.validated = True
+                break
+        return record
+
+    @property
+    def records(self) -> List[PredictionRecord]:
+        """All records in insertion order (loads the full history)."""
+        return self._query_records()
+
+    def records_by_zone(self, accuracy_zone: str) -> List[PredictionRecord]:
+        """All records in an accuracy zone."""
+        return self._query_records("WHERE p.accuracy_zone = ?", (accuracy_zone,))
+
+    def records_by_type(self, question_type: str) -> List[PredictionRecord]:
+        """All records of a question type."""
+        return self._query_records("WHERE p.question_type = ?", (question_type,))
+
+    def get_metrics(
+        self,
+        confidence_intervals: bool = False,
+        n_resamples: int = 1000,
+        confidence: float = 0.95,
+        seed: Optional[int] = None
+    ) -> CalibrationMetrics:
+        """
+        Calculate aggregate metrics with SQL aggregates.
+
+        Confidence intervals need the per-record errors, so requesting
+        them loads the validated records.
+        """
+        self.flush()
+        metrics = CalibrationMetrics()
+
+        metrics.total_predictions = self._conn.execute(
+            "SELECT COUNT(*) FROM predictions"
+        ).fetchone()[0]
+
+        validated, mean_mae, mean_brier = self._conn.execute(
+            "SELECT COUNT(*), AVG(mae), AVG(brier_score) FROM latest_validations"
+        ).fetchone()
+        metrics.validated_predictions = validated
+
+        if not validated:
+            return metrics
+
+        metrics.mean_mae = mean_mae or 0.0
+        metrics.mean_brier = mean_brier or 0.0
+
+        for column, target in (("accuracy_zone", metrics.accuracy_by_zone),
+                               ("question_type", metrics.accuracy_by_type)):
+            rows = self._conn.execute(
+                f"SELECT p.{column}, AVG(v.mae) FROM latest_validations v "
+                f"JOIN predictions p ON p.prediction_id = v.prediction_id "
+                f"WHERE v.mae IS NOT NULL GROUP BY p.{column}"
+            )
+            target.update(dict(rows))
+
+        if confidence_intervals:
+            validated = self._query_records("WHERE v.id IS NOT NULL")
+            _attach_confidence_intervals(metrics, validated, n_resamples, confidence, seed)
+
+        return metrics
+
+
+# ═══════════════════════════════════════════════════════════════
+# MIGRATION
+# ═══════════════════════════════════════════════════════════════
+
+def migrate_json_to_sqlite(json_path: str, db_path: str, batch_size: int = 5000) -> int:
+    """
+    One-shot migration from EvaluationTracker.save() JSON to SQLite.
+
+    Stored MAE and Brier scores are carried over as-is rather than
+    recomputed. Returns the number of records migrated.
+    """
+    with open(json_path, "r") as f:
+        data = json.load(f)
+
+    records = [PredictionRecord(**r) for r in data.get("records", [])]
+
+    with SQLiteEvaluationTracker(db_path, batch_size=batch_size) as tracker:
+        for record in records:
+            tracker._pending_predictions[record.prediction_id] = record
+            if record.validated:
+                tracker._pending_validations.append((
+                    record.prediction_id,
+                    record.timestamp,
+                    record.actual_mean,
+                    json.dumps(record.actual_distribution)
+                    if record.actual_distribution is not None else None,
+                    record.mae,
+                    record.brier_score,
+                ))
+            tracker._maybe_flush()
+
+    return len(records)
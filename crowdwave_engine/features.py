@@ -0,0 +1,173 @@
+"""
+Crowdwave Question Features
+Text features extracted once per question and shared by every simulation
+phase, instead of each phase lower-casing and re-scanning the same text.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .calibration import requires_partisan_segmentation
+from .matching import TRIGGERS, TriggerHits
+
+
+# ═══════════════════════════════════════════════════════════════
+# AUDIENCE VOCABULARIES
+# ═══════════════════════════════════════════════════════════════
+
+# Party affiliation named in the audience, checked in order
+PARTY_TRIGGERS = {
+    "democrat": ["democrat", "democrats", "dem ", "liberal"],
+    "republican": ["republican", "republicans", "gop", "conservative"],
+    "independent": ["independent", "independents", "unaffiliated"],
+}
+
+# Generation named in the audience, checked in order
+GENERATION_TRIGGERS = {
+    "gen_z": ["gen z", "genz", "18-24", "18-25", "zoomers"],
+    "millennial": ["millennial", "25-40", "25-44", "gen y"],
+    "gen_x": ["gen x", "genx", "40-55", "45-60"],
+    "boomer": ["boomer", "55+", "60+", "65+", "senior", "older"],
+}
+
+# (vocabulary name, key) pairs on the shared scanner
+_PARTIES = list(zip(TRIGGERS.add_all("audience.party", PARTY_TRIGGERS), PARTY_TRIGGERS))
+_GENERATIONS = list(zip(TRIGGERS.add_all("audience.generation", GENERATION_TRIGGERS), GENERATION_TRIGGERS))
+
+
+def _first_key(hits: TriggerHits, vocabularies: List[Tuple[str, str]]) -> Optional[str]:
+    for name, key in vocabularies:
+        if hits.any(name):
+            return key
+    return None
+
+
+def detect_party(audience: str) -> Optional[str]:
+    """Party affiliation named in an audience description, if any."""
+    return _first_key(TRIGGERS.scan(audience.lower()), _PARTIES)
+
+
+def detect_generation(audience: str) -> Optional[str]:
+    """Generation named in an audience description, if any."""
+    return _first_key(TRIGGERS.scan(audience.lower()), _GENERATIONS)
+
+
+# ═══════════════════════════════════════════════════════════════
+# QUESTION FEATURES
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class QuestionText:
+    """
+    The audience-independent features of one question: lower-cased text
+    and options, scale size and keyword matches. Extracted once per
+    question and combined with each survey's topic and audience by
+    QuestionFeatures.combine().
+    """
+    text: str
+    options: Tuple[str, ...]
+    scale_points: Optional[int]
+    hits: TriggerHits = field(repr=False, compare=False)
+
+    @cached_property
+    def partisan(self) -> bool:
+        """Whether the question needs a partisan breakdown (computed on first use)."""
+        return requires_partisan_segmentation(self.text)
+
+    @classmethod
+    def extract(cls, question: Any) -> "QuestionText":
+        text = question.text.lower()
+        scale_points = None
+        if question.type == "scale" and question.scale:
+            scale_points = question.scale[1] - question.scale[0] + 1
+        return cls(
+            text=text,
+            options=tuple(option.lower() for option in question.options),
+            scale_points=scale_points,
+            hits=TRIGGERS.scan(text),
+        )
+
+
+@dataclass(frozen=True)
+class QuestionFeatures:
+    """
+    Normalized text and keyword matches for one question in one survey.
+
+    Usage:
+        features = QuestionFeatures.extract(question, topic, audience)
+        features.hits.any("zone.high")
+        features.party, features.scale_points
+
+    All text fields are lower-cased. `hits` covers the question text
+    alone; `audience_hits` covers the question text followed by the
+    audience, as scanned by detect_biases(). Both answer every vocabulary
+    registered on the shared TRIGGERS scanner. `question` is the
+    audience-independent part these were built from.
+    """
+    text: str
+    topic: str
+    audience: str
+    context: str
+    options: Tuple[str, ...]
+    party: Optional[str]
+    generation: Optional[str]
+    scale_points: Optional[int]
+    hits: TriggerHits = field(repr=False, compare=False)
+    audience_hits: TriggerHits = field(repr=False, compare=False)
+    question: QuestionText = field(repr=False, compare=False)
+
+    @property
+    def partisan(self) -> bool:
+        """Whether the question needs a partisan breakdown (shared by every audience)."""
+        return self.question.partisan
+
+    @classmethod
+    def extract(cls, question: Any, topic: str = "", audience: str = "") -> "QuestionFeatures":
+        """Features of a single question (see extract_all for a survey)."""
+        return cls.extract_all([question], topic, audience)[0]
+
+    @classmethod
+    def extract_all(
+        cls,
+        questions: Sequence[Any],
+        topic: str = "",
+        audience: str = "",
+    ) -> List["QuestionFeatures"]:
+        """
+        Features of every question in a survey. Audience-level features
+        (party, generation) are computed once and shared.
+        """
+        return cls.combine([QuestionText.extract(question) for question in questions], topic, audience)
+
+    @classmethod
+    def combine(
+        cls,
+        texts: Sequence[QuestionText],
+        topic: str = "",
+        audience: str = "",
+    ) -> List["QuestionFeatures"]:
+        """Features of already-extracted questions for one topic and audience."""
+        topic_lower = topic.lower() if topic else ""
+        audience_lower = audience.lower() if audience else ""
+        audience_scan = TRIGGERS.scan(audience_lower)
+        party = _first_key(audience_scan, _PARTIES)
+        generation = _first_key(audience_scan, _GENERATIONS)
+        context_suffix = " " + topic_lower + " " + audience_lower
+
+        return [
+            cls(
+                text=question.text,
+                topic=topic_lower,
+                audience=audience_lower,
+                context=question.text + context_suffix,
+                options=question.options,
+                party=party,
+                generation=generation,
+                scale_points=question.scale_points,
+                hits=question.hits,
+                audience_hits=TRIGGERS.scan_joined(question.text, audience_lower),
+                question=question,
+            )
+            for question in texts
+        ]
@@ -0,0 +1,145 @@
+"""
+Crowdwave Incremental Re-simulation
+Keep the last report of each survey (by id) and, when the survey is
+edited and re-run, simulate only the questions whose inputs changed.
+
+Usage:
+    incremental = IncrementalSimulator(engine)
+    incremental.simulate("survey-42", config, questions)
+    questions[3]["text"] = "How satisfied are you with checkout?"
+    update = incremental.simulate("survey-42", config, questions)
+    update.recomputed      # ["Q4"]
+    update.report          # identical to engine.simulate(config, questions)
+
+A question's result depends on the question itself, the audience, the
+topic, whether stimuli are present and the calibration version, and on
+the survey's priors only through the two confidence factors
+(CrowdwaveEngine._prior_factors). A question is reused when it is
+unchanged (same id, text, type, options, scale and labels) and none of
+those inputs changed; its keyword features are reused whenever audience,
+topic and calibration are unchanged. Priors and coverage flags also
+depend on the questions (NPS and satisfaction priors, pricing warnings),
+so they are rebuilt from the cached features on every call, which takes
+no text scanning beyond the audience and topic.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .crowdwave import CrowdwaveEngine, Question, SimulationReport
+from .features import QuestionFeatures
+
+
+@dataclass
+class IncrementalReport:
+    """A survey's merged report and the ids of the questions simulated for it."""
+    report: SimulationReport
+    recomputed: List[str]
+
+
+@dataclass
+class _SurveyState:
+    context: Tuple[str, Optional[str], str, str]  # calibration version, checksum, audience, topic
+    questions: List[Question]
+    features: List[QuestionFeatures]
+    report: SimulationReport
+
+
+class IncrementalSimulator:
+    """
+    Per-survey incremental simulation on top of a CrowdwaveEngine.
+
+    The last report of up to `max_surveys` surveys is kept, least
+    recently simulated dropped first. Safe to call from several threads;
+    concurrent runs for the same survey id each diff against the state
+    they started from, and the last to finish is kept.
+    """
+
+    def __init__(self, engine: Optional[CrowdwaveEngine] = None, max_surveys: int = 1024):
+        self.engine = engine or CrowdwaveEngine()
+        self.max_surveys = max_surveys
+        self._surveys: "OrderedDict[str, _SurveyState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._surveys)
+
+    def __contains__(self, survey_id: str) -> bool:
+        return survey_id in self._surveys
+
+    def forget(self, survey_id: str) -> bool:
+        """Drop a survey's cached report; returns whether one was kept."""
+        with self._lock:
+            return self._surveys.pop(survey_id, None) is not None
+
+    def simulate(
+        self,
+        survey_id: str,
+        config: Dict[str, Any],
+        questions: List[Dict[str, Any]]
+    ) -> IncrementalReport:
+        """
+        Simulate a survey, reusing the results of unchanged questions from
+        its last run. The report is identical to engine.simulate(config,
+        questions); reused results are the previous report's objects, with
+        `methodology_trace["priors_count"]` updated if the prior count
+        changed.
+        """
+        engine = self.engine
+        bundle = engine.calibration.current()
+        survey_config = engine._parse_config(config)
+        parsed = engine._parse_questions(questions)
+        context = (bundle.version, bundle.checksum, survey_config.audience, survey_config.topic)
+        with self._lock:
+            state = self._surveys.get(survey_id)
+
+        # Previous question, features and result by question id
+        previous: Dict[str, Tuple[Question, QuestionFeatures, Any]] = {}
+        if state is not None and state.context == context:
+            previous = {
+                question.id: (question, question_features, result)
+                for question, question_features, result in zip(
+                    state.questions, state.features, state.report.results
+                )
+            }
+        unchanged = [question.id in previous and previous[question.id][0] == question for question in parsed]
+
+        # Keyword features of edited questions only
+        edited = [question for question, same in zip(parsed, unchanged) if not same]
+        fresh = iter(QuestionFeatures.extract_all(edited, survey_config.topic, survey_config.audience))
+        features = [
+            previous[question.id][1] if same else next(fresh)
+            for question, same in zip(parsed, unchanged)
+        ]
+
+        priors = engine._establish_priors(survey_config, parsed, bundle.tables, features)
+        reusable = bool(previous) and (
+            bool(state.report.config.stimuli) == bool(survey_config.stimuli)
+            and engine._prior_factors(state.report.priors_used) == engine._prior_factors(priors)
+        )
+
+        results = []
+        recomputed = []
+        for question, question_features, same in zip(parsed, features, unchanged):
+            if reusable and same:
+                result = previous[question.id][2]
+                if result.methodology_trace.get("priors_count") != len(priors):
+                    result = replace(
+                        result, methodology_trace={**result.methodology_trace, "priors_count": len(priors)}
+                    )
+            else:
+                result = engine._simulate_question(survey_config, question, priors, bundle.tables, question_features)
+                recomputed.append(question.id)
+            results.append(result)
+
+        flags = engine._check_calibration_coverage(survey_config, parsed, features)
+        report = engine._survey_report(survey_config, results, priors, flags, bundle)
+
+        with self._lock:
+            self._surveys[survey_id] = _SurveyState(context, parsed, features, report)
+            self._surveys.move_to_end(survey_id)
+            while len(self._surveys) > self.max_surveys:
+                self._surveys.popitem(last=False)
+        return IncrementalReport(report=report, recomputed=recomputed)
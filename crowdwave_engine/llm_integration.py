@@ -5,9 +5,12 @@ Web-search priors and enhanced simulation via Claude/GPT.
 
 import json
 import os
+import time
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+from .telemetry import LLM_ERRORS, LLM_LATENCY, LLM_TOKENS
+
 
 @dataclass
 class Prior:
@@ -126,13 +129,25 @@ OUTPUT FORMAT (JSON):
 class LLMClient:
     """Base class for LLM clients."""
     
+    provider = "unknown"
+    
     def complete(self, prompt: str, system: str = None) -> str:
         raise NotImplementedError
+    
+    def _record_call(self, start: float, input_tokens: Optional[int], output_tokens: Optional[int]):
+        """Record latency and token usage for one completion."""
+        LLM_LATENCY.observe(time.perf_counter() - start, provider=self.provider)
+        if input_tokens:
+            LLM_TOKENS.inc(input_tokens, provider=self.provider, direction="input")
+        if output_tokens:
+            LLM_TOKENS.inc(output_tokens, provider=self.provider, direction="output")
 
 
 class AnthropicClient(LLMClient):
     """Claude client via Anthropic API."""
     
+    provider = "anthropic"
+    
     def __init__(self, api_key: str = None, model: str = "claude-sonnet-4-20250514"):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
@@ -158,13 +173,27 @@ class AnthropicClient(LLMClient):
         if system:
             kwargs["system"] = system
         
-        response = client.messages.create(**kwargs)
+        start = time.perf_counter()
+        try:
+            response = client.messages.create(**kwargs)
+        except Exception:
+            LLM_ERRORS.inc(provider=self.provider)
+            raise
+        
+        usage = getattr(response, "usage", None)
+        self._record_call(
+            start,
+            getattr(usage, "input_tokens", None),
+            getattr(usage, "output_tokens", None),
+        )
         return response.content[0].text
 
 
 class OpenAIClient(LLMClient):
     """GPT client via OpenAI API."""
     
+    provider = "openai"
+    
     def __init__(self, api_key: str = None, model: str = "gpt-4o"):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.model = model
@@ -185,10 +214,22 @@ class OpenAIClient(LLMClient):
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
         
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            max_tokens=4096,
+        start = time.perf_counter()
+        try:
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=4096,
+            )
+        except Exception:
+            LLM_ERRORS.inc(provider=self.provider)
+            raise
+        
+        usage = getattr(response, "usage", None)
+        self._record_call(
+            start,
+            getattr(usage, "prompt_tokens", None),
+            getattr(usage, "completion_tokens", None),
         )
         return response.choices[0].message.content
 
@@ -0,0 +1,270 @@
+"""
+Crowdwave Keyword Matching
+Compile `any(kw in text for kw in [...])` rule cascades into one regex scan.
+"""
+
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .telemetry import record_cache
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Regex matching any of `keywords`, factored into a trie so each text
+    position is tested against one branch per distinct next character
+    rather than against every keyword. Greedy, so the longest keyword
+    starting at a position wins.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    A list of keyword rules matched by substring, compiled into a single
+    regex so the text is scanned once instead of once per keyword.
+
+    Usage:
+        matcher = KeywordMatcher([["immigration", "border"], ["vaccine"]])
+        matcher.first("border security")   # -> 0
+        matcher.matches("vaccine border")  # -> frozenset({0, 1})
+
+    Semantics are exactly those of `kw in text`: no word boundaries and
+    no case folding (lower-case the text first, as the rule cascades do).
+    """
+
+    def __init__(self, rules: Sequence[Sequence[str]]):
+        self.rules = tuple(tuple(keywords) for keywords in rules)
+
+        # Rule indexes (ascending) that contain each keyword
+        owners: Dict[str, List[int]] = {}
+        for index, keywords in enumerate(self.rules):
+            for keyword in keywords:
+                if keyword and index not in owners.setdefault(keyword, []):
+                    owners[keyword].append(index)
+        self._owners = {keyword: tuple(indexes) for keyword, indexes in owners.items()}
+
+        # A lookahead match reports the longest keyword at each start
+        # position; shorter keywords at the same position are prefixes of
+        # it and are checked explicitly.
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(
+                other for other in self._owners
+                if other != keyword and keyword.startswith(other)
+            )
+            for keyword in self._owners
+        }
+
+        # Longest keyword length, bounding how far a match can reach
+        self.longest = max(map(len, self._owners), default=0)
+
+        if self._owners:
+            self.pattern = "(?=(" + _trie_pattern(self._owners) + "))"
+        else:
+            self.pattern = "(?!)"
+        self._regex = re.compile(self.pattern)
+
+    def keywords(self, text: str) -> Set[str]:
+        """Every keyword occurring in `text`."""
+        found: Set[str] = set()
+        prefixes = self._prefixes
+        for match in self._regex.finditer(text):
+            keyword = match.group(1)
+            if keyword in found:
+                continue
+            found.add(keyword)
+            start = match.start()
+            for other in prefixes[keyword]:
+                if other not in found and text.startswith(other, start):
+                    found.add(other)
+        return found
+
+    def first(self, text: str) -> Optional[int]:
+        """Index of the first rule with a keyword in `text`, or None."""
+        found = self.keywords(text)
+        if not found:
+            return None
+        return min(self._owners[keyword][0] for keyword in found)
+
+    def matches(self, text: str) -> FrozenSet[int]:
+        """Indexes of every rule with a keyword in `text`."""
+        return frozenset(
+            index for keyword in self.keywords(text) for index in self._owners[keyword]
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # Serialization (for calibration snapshots)
+    # ───────────────────────────────────────────────────────────
+
+    def to_spec(self) -> Dict[str, Any]:
+        """Plain-data form of the compiled matcher."""
+        return {
+            "rules": [list(keywords) for keywords in self.rules],
+            "pattern": self.pattern,
+            "owners": {kw: list(indexes) for kw, indexes in self._owners.items()},
+            "prefixes": {kw: list(others) for kw, others in self._prefixes.items() if others},
+        }
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "KeywordMatcher":
+        """Rebuild a matcher from to_spec() output without recompiling the rules."""
+        matcher = cls.__new__(cls)
+        matcher.rules = tuple(tuple(keywords) for keywords in spec["rules"])
+        matcher._owners = {kw: tuple(indexes) for kw, indexes in spec["owners"].items()}
+        matcher._prefixes = {kw: tuple(spec["prefixes"].get(kw, ())) for kw in matcher._owners}
+        matcher.longest = max(map(len, matcher._owners), default=0)
+        matcher.pattern = spec["pattern"]
+        matcher._regex = re.compile(matcher.pattern)
+        return matcher
+
+
+# ═══════════════════════════════════════════════════════════════
+# TRIGGER VOCABULARIES
+# ═══════════════════════════════════════════════════════════════
+
+class TriggerHits:
+    """The keywords found in one text, queried by vocabulary name."""
+
+    __slots__ = ("found", "_vocabularies")
+
+    def __init__(self, found: FrozenSet[str], vocabularies: Mapping[str, Tuple[Tuple[str, ...], FrozenSet[str]]]):
+        self.found = found
+        self._vocabularies = vocabularies
+
+    def any(self, name: str) -> bool:
+        """True if any keyword of vocabulary `name` occurs in the text."""
+        return not self.found.isdisjoint(self._vocabularies[name][1])
+
+    def hits(self, name: str) -> List[str]:
+        """Keywords of vocabulary `name` found in the text, in vocabulary order."""
+        found = self.found
+        return [keyword for keyword in self._vocabularies[name][0] if keyword in found]
+
+    def first(self, names: Iterable[str]) -> Optional[str]:
+        """The first of `names` whose vocabulary matched, or None."""
+        for name in names:
+            if self.any(name):
+                return name
+        return None
+
+
+class TriggerScanner:
+    """
+    Named keyword vocabularies from across the engine, compiled into one
+    KeywordMatcher so each text is scanned once for all of them.
+
+    Modules register vocabularies at import time with add(); the matcher
+    is compiled on the first scan. Scans are cached by text (bounded,
+    oldest-first eviction), so repeated questions and audiences within and
+    across simulate() calls are never re-scanned. Cache lookups are
+    counted in telemetry under `cache_name`.
+    """
+
+    def __init__(self, cache_size: int = 4096, cache_name: str = "question"):
+        self.cache_size = cache_size
+        self.cache_name = cache_name
+        self._vocabularies: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+        self._compiled: Optional[Tuple[KeywordMatcher, Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]]]] = None
+        self._cache: Dict[str, TriggerHits] = {}
+
+    def add(self, name: str, keywords: Sequence[str]) -> str:
+        """Register (or replace) vocabulary `name` and return the name."""
+        with self._lock:
+            self._vocabularies[name] = tuple(keywords)
+            self._compiled = None
+            self._cache = {}
+        return name
+
+    def add_all(self, prefix: str, vocabularies: Mapping[str, Sequence[str]]) -> List[str]:
+        """Register several vocabularies as `prefix.<key>`, in order."""
+        return [self.add(f"{prefix}.{key}", keywords) for key, keywords in vocabularies.items()]
+
+    def _compile(self):
+        with self._lock:
+            compiled = self._compiled
+            if compiled is None:
+                vocabularies = {
+                    name: (keywords, frozenset(keywords))
+                    for name, keywords in self._vocabularies.items()
+                }
+                matcher = KeywordMatcher([keywords for keywords, _ in vocabularies.values()])
+                compiled = self._compiled = (matcher, vocabularies)
+            return compiled
+
+    def scan(self, text: str) -> TriggerHits:
+        """Find every registered keyword in `text` (already lower-cased)."""
+        cache = self._cache
+        hits = cache.get(text)
+        if hits is not None:
+            record_cache(self.cache_name, True)
+            return hits
+        record_cache(self.cache_name, False)
+
+        compiled = self._compiled or self._compile()
+        matcher, vocabularies = compiled
+        hits = TriggerHits(frozenset(matcher.keywords(text)), vocabularies)
+
+        if len(cache) >= self.cache_size:
+            try:
+                cache.pop(next(iter(cache)), None)
+            except (StopIteration, RuntimeError):
+                pass
+        cache[text] = hits
+        return hits
+
+    def scan_joined(self, left: str, right: str) -> TriggerHits:
+        """
+        scan(left + " " + right), built on a cache miss from the cached
+        scans of each part plus a scan of the seam between them. A keyword
+        crossing the seam lies within `longest - 1` characters of it, so
+        the result is exact, and a question text scanned once is never
+        re-scanned for each new audience it is paired with.
+        """
+        text = left + " " + right
+        cache = self._cache
+        hits = cache.get(text)
+        if hits is not None:
+            record_cache(self.cache_name, True)
+            return hits
+        record_cache(self.cache_name, False)
+
+        found = self.scan(left).found | self.scan(right).found
+        matcher, vocabularies = self._compiled or self._compile()
+        reach = matcher.longest - 1
+        if reach > 0:
+            found |= matcher.keywords(left[max(0, len(left) - reach):] + " " + right[:reach])
+        hits = TriggerHits(frozenset(found), vocabularies)
+
+        if len(cache) >= self.cache_size:
+            try:
+                cache.pop(next(iter(cache)), None)
+            except (StopIteration, RuntimeError):
+                pass
+        cache[text] = hits
+        return hits
+
+    def clear_cache(self):
+        self._cache = {}
+
+
+# Process-wide scanner shared by bias detection, accuracy zones, coverage
+# checks and accuracy guidance.
+TRIGGERS = TriggerScanner()
@@ -0,0 +1,278 @@
+"""
+Crowdwave Accuracy Metrics
+Vectorized accuracy metrics with bootstrap confidence intervals.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Upper bound on resample-weight cells held in memory at once
+# (resamples × observations). Bootstraps are chunked to stay under it.
+MAX_BOOTSTRAP_CELLS = 4_000_000
+
+
+@dataclass
+class MetricEstimate:
+    """A point estimate with a bootstrap confidence interval."""
+    value: float
+    ci_low: float
+    ci_high: float
+    n: int
+
+    @property
+    def ci(self) -> Tuple[float, float]:
+        return (self.ci_low, self.ci_high)
+
+
+# ═══════════════════════════════════════════════════════════════
+# POINT METRICS
+# ═══════════════════════════════════════════════════════════════
+
+def absolute_errors(predicted: Sequence[float], actual: Sequence[float]) -> np.ndarray:
+    """Element-wise absolute errors."""
+    predicted = np.asarray(predicted, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    if predicted.shape != actual.shape:
+        raise ValueError("Predictions and actuals must have same length")
+    return np.abs(predicted - actual)
+
+
+def rmse(predicted: Sequence[float], actual: Sequence[float]) -> float:
+    """Root mean square error."""
+    errors = absolute_errors(predicted, actual)
+    if errors.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(errors ** 2)))
+
+
+def distribution_matrix(
+    distributions: Sequence[Optional[Dict[str, float]]],
+    keys: Optional[List[str]] = None
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Stack percentage distributions into a (n, k) probability matrix.
+
+    Returns (matrix, present, keys) where `present` marks which keys each
+    distribution defines. Missing entries are 0.
+    """
+    if keys is None:
+        seen: Dict[str, None] = {}
+        for dist in distributions:
+            if dist:
+                seen.update(dict.fromkeys(dist))
+        keys = list(seen)
+
+    column = {key: j for j, key in enumerate(keys)}
+    matrix = np.zeros((len(distributions), len(keys)))
+    present = np.zeros((len(distributions), len(keys)), dtype=bool)
+
+    for i, dist in enumerate(distributions):
+        if not dist:
+            continue
+        for key, value in dist.items():
+            j = column.get(key)
+            if j is not None:
+                matrix[i, j] = value / 100.0
+                present[i, j] = True
+
+    return matrix, present, keys
+
+
+def brier_scores(
+    predicted: Sequence[Dict[str, float]],
+    actual: Sequence[Dict[str, float]]
+) -> np.ndarray:
+    """
+    Per-row Brier scores for paired percentage distributions.
+
+    Each row is averaged over the union of keys in that pair, matching
+    EvaluationTracker._calculate_brier.
+    """
+    if len(predicted) != len(actual):
+        raise ValueError("Predictions and actuals must have same length")
+
+    _, _, keys = distribution_matrix(list(predicted) + list(actual))
+    pred, pred_present, _ = distribution_matrix(predicted, keys)
+    act, act_present, _ = distribution_matrix(actual, keys)
+
+    union = (pred_present | act_present).sum(axis=1)
+    squared = ((pred - act) ** 2).sum(axis=1)
+    return np.divide(squared, union, out=np.zeros(len(predicted)), where=union > 0)
+
+
+def _bin_index(probs: np.ndarray, n_bins: int) -> np.ndarray:
+    return np.clip((probs * n_bins).astype(int), 0, n_bins - 1)
+
+
+def expected_calibration_error(
+    probs: Sequence[float],
+    outcomes: Sequence[float],
+    n_bins: int = 10
+) -> float:
+    """
+    Expected calibration error.
+
+    Outcomes may be booleans or observed frequencies in [0, 1].
+    """
+    probs = np.asarray(probs, dtype=float)
+    outcomes = np.asarray(outcomes, dtype=float)
+    if probs.shape != outcomes.shape:
+        raise ValueError("Predictions and outcomes must have same length")
+    if probs.size == 0:
+        return 0.0
+
+    bins = _bin_index(probs, n_bins)
+    gap = (np.bincount(bins, probs, minlength=n_bins)
+           - np.bincount(bins, outcomes, minlength=n_bins))
+    return float(np.abs(gap).sum() / probs.size)
+
+
+def group_means(values: Sequence[float], groups: Sequence[str]) -> Dict[str, float]:
+    """Mean of `values` per group label in a single pass."""
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return {}
+    labels, codes = np.unique(np.asarray(groups, dtype=object).astype(str), return_inverse=True)
+    sums = np.bincount(codes, values, minlength=len(labels))
+    counts = np.bincount(codes, minlength=len(labels))
+    return {str(label): float(s / c) for label, s, c in zip(labels, sums, counts)}
+
+
+# ═══════════════════════════════════════════════════════════════
+# BOOTSTRAP
+# ═══════════════════════════════════════════════════════════════
+
+def _resample_weights(
+    n: int,
+    n_resamples: int,
+    rng: np.random.Generator,
+    width: Optional[int] = None
+):
+    """
+    Yield (chunk, n) multinomial bootstrap weight matrices.
+
+    Row r holds how many times each observation appears in resample r,
+    so any weighted sum over a row is that resample's statistic. `width`
+    is the row length callers expand each chunk to (default n); chunks
+    are sized so chunk × width stays under MAX_BOOTSTRAP_CELLS.
+    """
+    per_chunk = max(1, MAX_BOOTSTRAP_CELLS // max(n if width is None else width, n, 1))
+    pvals = np.full(n, 1.0 / n)
+    for start in range(0, n_resamples, per_chunk):
+        size = min(per_chunk, n_resamples - start)
+        yield rng.multinomial(n, pvals, size=size).astype(float)
+
+
+def _interval(samples: np.ndarray, confidence: float) -> Tuple[float, float]:
+    alpha = (1.0 - confidence) / 2.0
+    low, high = np.nanpercentile(samples, [alpha * 100, (1 - alpha) * 100], axis=0)
+    return low, high
+
+
+def _one_hot(codes: np.ndarray, n_groups: int) -> np.ndarray:
+    matrix = np.zeros((codes.size, n_groups))
+    matrix[np.arange(codes.size), codes] = 1.0
+    return matrix
+
+
+def bootstrap_mean(
+    values: Sequence[float],
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None
+) -> MetricEstimate:
+    """Mean with a percentile bootstrap confidence interval."""
+    values = np.asarray(values, dtype=float)
+    n = values.size
+    if n == 0:
+        return MetricEstimate(0.0, 0.0, 0.0, 0)
+
+    rng = np.random.default_rng(seed)
+    samples = np.concatenate([
+        weights @ values / n for weights in _resample_weights(n, n_resamples, rng)
+    ])
+    low, high = _interval(samples, confidence)
+    return MetricEstimate(float(values.mean()), float(low), float(high), n)
+
+
+def bootstrap_group_means(
+    values: Sequence[float],
+    groups: Sequence[str],
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None
+) -> Dict[str, MetricEstimate]:
+    """
+    Per-group means with bootstrap confidence intervals.
+
+    Observations are resampled jointly and every group is reduced with one
+    matrix product per chunk, so the cost does not grow with group count.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.size
+    if n == 0:
+        return {}
+
+    labels, codes = np.unique(np.asarray(groups, dtype=object).astype(str), return_inverse=True)
+    onehot = _one_hot(codes, len(labels))
+    counts = np.bincount(codes, minlength=len(labels))
+    points = np.bincount(codes, values, minlength=len(labels)) / counts
+
+    rng = np.random.default_rng(seed)
+    chunks = []
+    for weights in _resample_weights(n, n_resamples, rng):
+        sums = (weights * values) @ onehot
+        totals = weights @ onehot
+        with np.errstate(invalid="ignore", divide="ignore"):
+            chunks.append(np.where(totals > 0, sums / totals, np.nan))
+    low, high = _interval(np.vstack(chunks), confidence)
+
+    return {
+        str(label): MetricEstimate(float(points[g]), float(low[g]), float(high[g]), int(counts[g]))
+        for g, label in enumerate(labels)
+    }
+
+
+def bootstrap_ece(
+    probs: Sequence[float],
+    outcomes: Sequence[float],
+    units: Optional[Sequence[int]] = None,
+    n_bins: int = 10,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None
+) -> MetricEstimate:
+    """
+    Expected calibration error with a bootstrap confidence interval.
+
+    `units` maps each (prob, outcome) pair to the record it came from, so
+    that all options of one predicted distribution are resampled together.
+    Defaults to resampling pairs independently.
+    """
+    probs = np.asarray(probs, dtype=float)
+    outcomes = np.asarray(outcomes, dtype=float)
+    if probs.size == 0:
+        return MetricEstimate(0.0, 0.0, 0.0, 0)
+
+    if units is None:
+        units = np.arange(probs.size)
+    else:
+        _, units = np.unique(np.asarray(units), return_inverse=True)
+    n_units = int(units.max()) + 1
+
+    onehot = _one_hot(_bin_index(probs, n_bins), n_bins)
+    point = expected_calibration_error(probs, outcomes, n_bins)
+
+    rng = np.random.default_rng(seed)
+    chunks = []
+    # Each chunk is expanded to one column per pair, so size it by pairs
+    for unit_weights in _resample_weights(n_units, n_resamples, rng, width=probs.size):
+        weights = unit_weights[:, units]
+        gap = (weights * probs) @ onehot - (weights * outcomes) @ onehot
+        chunks.append(np.abs(gap).sum(axis=1) / weights.sum(axis=1))
+    low, high = _interval(np.concatenate(chunks), confidence)
+
+    return MetricEstimate(point, float(low), float(high), n_units)
@@ -0,0 +1,453 @@
+"""
+Precomputed pipeline outputs for fixed calibrated distributions.
+
+GENERATED by `python -m crowdwave_engine calibration pipeline` - do not edit.
+See pipeline_table.py for the key and value layout.
+"""
+
+PIPELINE_OUTPUTS = {
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 5.0, 7.0, 40.0, 45.0), False, False): ((3.0, 5.0, 8.7, 40.0, 43.3), 5.800000000000001, 4.16, 0.98, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 5.0, 7.0, 40.0, 45.0), False, True): ((3.0, 5.0, 8.7, 40.0, 43.3), 5.800000000000001, 4.16, 0.98, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 5.0, 7.0, 40.0, 45.0), True, False): ((2.1, 3.6, 8.6, 40.8, 44.9), 8.700000000000003, 4.23, 0.9, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 5.0, 7.0, 40.0, 45.0), True, True): ((2.1, 3.6, 8.6, 40.8, 44.9), 8.700000000000003, 4.23, 0.9, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 15.0, 42.0, 30.0), False, False): ((5.0, 8.0, 15.9, 42.0, 29.1), 5.699999999999999, 3.82, 1.09, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 15.0, 42.0, 30.0), False, True): ((5.0, 8.0, 15.9, 42.0, 29.1), 5.699999999999999, 3.82, 1.09, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 15.0, 42.0, 30.0), True, False): ((3.6, 6.6, 15.9, 43.0, 30.9), 8.0, 3.91, 1.02, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 15.0, 42.0, 30.0), True, True): ((3.6, 6.6, 15.9, 43.0, 30.9), 8.0, 3.91, 1.02, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 6.0, 11.0, 44.0, 35.0), False, False): ((4.0, 6.0, 12.1, 44.0, 33.9), 5.6, 3.98, 1.03, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 6.0, 11.0, 44.0, 35.0), False, True): ((4.0, 6.0, 12.1, 44.0, 33.9), 5.6, 3.98, 1.03, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 6.0, 11.0, 44.0, 35.0), True, False): ((2.8, 4.6, 12.1, 45.0, 35.5), 8.299999999999997, 4.06, 0.95, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 6.0, 11.0, 44.0, 35.0), True, True): ((2.8, 4.6, 12.1, 45.0, 35.5), 8.299999999999997, 4.06, 0.95, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 16.0, 26.0, 30.0, 18.0), False, False): ((10.0, 16.0, 26.1, 30.0, 17.9), 6.699999999999999, 3.3, 1.22, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 16.0, 26.0, 30.0, 18.0), False, True): ((10.0, 16.0, 26.1, 30.0, 17.9), 6.699999999999999, 3.3, 1.22, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 16.0, 26.0, 30.0, 18.0), True, False): ((8.6, 14.6, 26.1, 31.1, 19.6), 6.800000000000001, 3.38, 1.2, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 16.0, 26.0, 30.0, 18.0), True, True): ((8.6, 14.6, 26.1, 31.1, 19.6), 6.800000000000001, 3.38, 1.2, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 28.0, 23.0, 10.0, 4.0), False, False): ((33.9, 28.0, 23.7, 10.0, 4.4), 7.299999999999997, 2.23, 1.15, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 28.0, 23.0, 10.0, 4.0), False, True): ((33.9, 28.0, 23.7, 10.0, 4.4), 7.299999999999997, 2.23, 1.15, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 28.0, 23.0, 10.0, 4.0), True, False): ((32.5, 26.6, 23.7, 11.1, 6.1), 7.299999999999997, 2.32, 1.21, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 28.0, 23.0, 10.0, 4.0), True, True): ((32.5, 26.6, 23.7, 11.1, 6.1), 7.299999999999997, 2.32, 1.21, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 32.0, 26.0, 12.0), False, False): ((12.0, 18.0, 31.8, 26.0, 12.2), 7.199999999999999, 3.08, 1.18, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 32.0, 26.0, 12.0), False, True): ((12.0, 18.0, 31.8, 26.0, 12.2), 7.199999999999999, 3.08, 1.18, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 32.0, 26.0, 12.0), True, False): ((10.6, 16.6, 31.8, 27.0, 14.0), 7.199999999999999, 3.17, 1.18, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 32.0, 26.0, 12.0), True, True): ((10.6, 16.6, 31.8, 27.0, 14.0), 7.199999999999999, 3.17, 1.18, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 24.0, 34.0, 20.0), False, False): ((8.0, 14.0, 24.2, 34.0, 19.8), 6.400000000000002, 3.44, 1.18, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 24.0, 34.0, 20.0), False, True): ((8.0, 14.0, 24.2, 34.0, 19.8), 6.400000000000002, 3.44, 1.18, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 24.0, 34.0, 20.0), True, False): ((6.6, 12.6, 24.2, 35.1, 21.5), 7.0, 3.52, 1.15, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 24.0, 34.0, 20.0), True, True): ((6.6, 12.6, 24.2, 35.1, 21.5), 7.0, 3.52, 1.15, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 15.0, 38.0, 35.0), False, False): ((4.1, 8.0, 16.0, 37.9, 34.0), 6.099999999999998, 3.9, 1.09, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 15.0, 38.0, 35.0), False, True): ((4.1, 8.0, 16.0, 37.9, 34.0), 6.099999999999998, 3.9, 1.09, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 15.0, 38.0, 35.0), True, False): ((2.8, 6.6, 16.0, 39.0, 35.6), 8.299999999999997, 3.98, 1.02, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 15.0, 38.0, 35.0), True, True): ((2.8, 6.6, 16.0, 39.0, 35.6), 8.299999999999997, 3.98, 1.02, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 17.0, 40.0, 30.0), False, False): ((5.0, 8.0, 17.8, 40.0, 29.2), 6.1, 3.8, 1.1, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 17.0, 40.0, 30.0), False, True): ((5.0, 8.0, 17.8, 40.0, 29.2), 6.1, 3.8, 1.1, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 17.0, 40.0, 30.0), True, False): ((3.6, 6.6, 17.8, 41.1, 30.9), 8.0, 3.89, 1.03, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 8.0, 17.0, 40.0, 30.0), True, True): ((3.6, 6.6, 17.8, 41.1, 30.9), 8.0, 3.89, 1.03, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (25.0, 18.0, 20.0, 22.0, 15.0), False, False): ((24.2, 18.0, 20.9, 22.0, 14.9), 7.0, 2.85, 1.39, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (25.0, 18.0, 20.0, 22.0, 15.0), False, True): ((24.2, 18.0, 20.9, 22.0, 14.9), 7.0, 2.85, 1.39, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (25.0, 18.0, 20.0, 22.0, 15.0), True, False): ((22.9, 16.6, 20.9, 23.0, 16.6), 7.0, 2.94, 1.4, (), ('SD too high (1.40) - may indicate extreme polarization',)),
+    ('scale', ('1', '2', '3', '4', '5'), (25.0, 18.0, 20.0, 22.0, 15.0), True, True): ((22.9, 16.6, 20.9, 23.0, 16.6), 7.0, 2.94, 1.4, (), ('SD too high (1.40) - may indicate extreme polarization', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (2.0, 5.0, 10.0, 35.0, 48.0), False, False): ((2.1, 5.0, 11.6, 35.0, 46.3), 6.5, 4.18, 0.97, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (2.0, 5.0, 10.0, 35.0, 48.0), False, True): ((2.1, 5.0, 11.6, 35.0, 46.3), 6.5, 4.18, 0.97, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (2.0, 5.0, 10.0, 35.0, 48.0), True, False): ((1.5, 3.6, 11.6, 35.7, 47.6), 8.399999999999999, 4.24, 0.9, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (2.0, 5.0, 10.0, 35.0, 48.0), True, True): ((1.5, 3.6, 11.6, 35.7, 47.6), 8.399999999999999, 4.24, 0.9, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (30.0, 15.0, 18.0, 22.0, 15.0), False, False): ((29.1, 15.0, 19.1, 22.0, 14.8), 7.199999999999999, 2.78, 1.44, (), ('SD too high (1.44) - may indicate extreme polarization',)),
+    ('scale', ('1', '2', '3', '4', '5'), (30.0, 15.0, 18.0, 22.0, 15.0), False, True): ((29.1, 15.0, 19.1, 22.0, 14.8), 7.199999999999999, 2.78, 1.44, (), ('SD too high (1.44) - may indicate extreme polarization', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (30.0, 15.0, 18.0, 22.0, 15.0), True, False): ((27.6, 13.6, 19.1, 23.1, 16.6), 7.199999999999999, 2.88, 1.46, (), ('SD too high (1.46) - may indicate extreme polarization',)),
+    ('scale', ('1', '2', '3', '4', '5'), (30.0, 15.0, 18.0, 22.0, 15.0), True, True): ((27.6, 13.6, 19.1, 23.1, 16.6), 7.199999999999999, 2.88, 1.46, (), ('SD too high (1.46) - may indicate extreme polarization', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 15.0, 28.0, 35.0, 14.0), False, False): ((8.1, 15.0, 27.8, 35.0, 14.1), 6.399999999999999, 3.32, 1.13, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 15.0, 28.0, 35.0, 14.0), False, True): ((8.1, 15.0, 27.8, 35.0, 14.1), 6.399999999999999, 3.32, 1.13, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 15.0, 28.0, 35.0, 14.0), True, False): ((6.7, 13.6, 27.8, 36.1, 15.8), 6.4, 3.41, 1.11, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 15.0, 28.0, 35.0, 14.0), True, True): ((6.7, 13.6, 27.8, 36.1, 15.8), 6.4, 3.41, 1.11, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 22.0, 38.0, 25.0), False, False): ((5.1, 10.0, 22.4, 38.0, 24.5), 6.300000000000001, 3.67, 1.1, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 22.0, 38.0, 25.0), False, True): ((5.1, 10.0, 22.4, 38.0, 24.5), 6.300000000000001, 3.67, 1.1, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 22.0, 38.0, 25.0), True, False): ((3.7, 8.6, 22.4, 39.1, 26.2), 7.5, 3.75, 1.05, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 22.0, 38.0, 25.0), True, True): ((3.7, 8.6, 22.4, 39.1, 26.2), 7.5, 3.75, 1.05, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (48.0, 20.0, 10.0, 14.0, 8.0), False, False): ((46.2, 20.0, 11.9, 14.0, 7.9), 7.1, 2.17, 1.35, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (48.0, 20.0, 10.0, 14.0, 8.0), False, True): ((46.2, 20.0, 11.9, 14.0, 7.9), 7.1, 2.17, 1.35, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (48.0, 20.0, 10.0, 14.0, 8.0), True, False): ((44.7, 18.6, 11.9, 15.1, 9.7), 7.1, 2.27, 1.4, (), ('SD too high (1.40) - may indicate extreme polarization',)),
+    ('scale', ('1', '2', '3', '4', '5'), (48.0, 20.0, 10.0, 14.0, 8.0), True, True): ((44.7, 18.6, 11.9, 15.1, 9.7), 7.1, 2.27, 1.4, (), ('SD too high (1.40) - may indicate extreme polarization', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 12.0, 15.0, 35.0, 30.0), False, False): ((7.9, 12.0, 16.0, 35.0, 29.1), 6.0, 3.65, 1.23, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 12.0, 15.0, 35.0, 30.0), False, True): ((7.9, 12.0, 16.0, 35.0, 29.1), 6.0, 3.65, 1.23, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 12.0, 15.0, 35.0, 30.0), True, False): ((6.5, 10.6, 16.0, 36.0, 30.9), 8.0, 3.74, 1.19, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 12.0, 15.0, 35.0, 30.0), True, True): ((6.5, 10.6, 16.0, 36.0, 30.9), 8.0, 3.74, 1.19, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 25.0, 32.0, 13.0), False, False): ((11.9, 18.0, 25.1, 32.0, 13.0), 6.300000000000001, 3.16, 1.21, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 25.0, 32.0, 13.0), False, True): ((11.9, 18.0, 25.1, 32.0, 13.0), 6.300000000000001, 3.16, 1.21, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 25.0, 32.0, 13.0), True, False): ((10.5, 16.6, 25.1, 33.0, 14.8), 6.300000000000001, 3.25, 1.2, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 18.0, 25.0, 32.0, 13.0), True, True): ((10.5, 16.6, 25.1, 33.0, 14.8), 6.300000000000001, 3.25, 1.2, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 18.0, 40.0, 30.0), False, False): ((4.1, 8.0, 18.7, 40.0, 29.2), 6.099999999999998, 3.82, 1.07, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 18.0, 40.0, 30.0), False, True): ((4.1, 8.0, 18.7, 40.0, 29.2), 6.099999999999998, 3.82, 1.07, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 18.0, 40.0, 30.0), True, False): ((2.9, 6.6, 18.6, 41.0, 30.9), 7.799999999999997, 3.9, 1.01, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 8.0, 18.0, 40.0, 30.0), True, True): ((2.9, 6.6, 18.6, 41.0, 30.9), 7.799999999999997, 3.9, 1.01, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 24.0, 34.0, 18.0), False, False): ((9.9, 14.0, 24.2, 34.1, 17.8), 6.400000000000002, 3.36, 1.21, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 24.0, 34.0, 18.0), False, True): ((9.9, 14.0, 24.2, 34.1, 17.8), 6.400000000000002, 3.36, 1.21, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 24.0, 34.0, 18.0), True, False): ((8.5, 12.6, 24.2, 35.1, 19.6), 6.800000000000001, 3.45, 1.18, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 24.0, 34.0, 18.0), True, True): ((8.5, 12.6, 24.2, 35.1, 19.6), 6.800000000000001, 3.45, 1.18, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 22.0, 18.0, 15.0, 10.0), False, False): ((33.9, 22.0, 19.1, 15.0, 10.0), 7.199999999999999, 2.45, 1.35, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 22.0, 18.0, 15.0, 10.0), False, True): ((33.9, 22.0, 19.1, 15.0, 10.0), 7.199999999999999, 2.45, 1.35, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 22.0, 18.0, 15.0, 10.0), True, False): ((32.4, 20.6, 19.1, 16.1, 11.8), 7.199999999999999, 2.54, 1.39, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (35.0, 22.0, 18.0, 15.0, 10.0), True, True): ((32.4, 20.6, 19.1, 16.1, 11.8), 7.199999999999999, 2.54, 1.39, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 10.0, 16.0, 40.0, 28.0), False, False): ((6.0, 10.0, 16.8, 40.0, 27.2), 5.799999999999999, 3.72, 1.14, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 10.0, 16.0, 40.0, 28.0), False, True): ((6.0, 10.0, 16.8, 40.0, 27.2), 5.799999999999999, 3.72, 1.14, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 10.0, 16.0, 40.0, 28.0), True, False): ((4.6, 8.6, 16.8, 41.0, 29.0), 7.800000000000001, 3.81, 1.09, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 10.0, 16.0, 40.0, 28.0), True, True): ((4.6, 8.6, 16.8, 41.0, 29.0), 7.800000000000001, 3.81, 1.09, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 22.0, 32.0, 19.0), False, False): ((11.8, 15.0, 22.4, 32.1, 18.7), 6.400000000000002, 3.31, 1.26, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 22.0, 32.0, 19.0), False, True): ((11.8, 15.0, 22.4, 32.1, 18.7), 6.400000000000002, 3.31, 1.26, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 22.0, 32.0, 19.0), True, False): ((10.4, 13.6, 22.4, 33.1, 20.5), 6.899999999999999, 3.4, 1.24, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 22.0, 32.0, 19.0), True, True): ((10.4, 13.6, 22.4, 33.1, 20.5), 6.899999999999999, 3.4, 1.24, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (29.0, 25.0, 14.0, 22.0, 10.0), False, False): ((28.1, 25.0, 15.0, 22.0, 9.9), 5.999999999999998, 2.61, 1.35, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (29.0, 25.0, 14.0, 22.0, 10.0), False, True): ((28.1, 25.0, 15.0, 22.0, 9.9), 5.999999999999998, 2.61, 1.35, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (29.0, 25.0, 14.0, 22.0, 10.0), True, False): ((26.6, 23.6, 15.0, 23.1, 11.7), 6.0, 2.7, 1.38, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (29.0, 25.0, 14.0, 22.0, 10.0), True, True): ((26.6, 23.6, 15.0, 23.1, 11.7), 6.0, 2.7, 1.38, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (24.0, 30.0, 24.0, 16.0, 6.0), False, False): ((23.4, 30.0, 24.3, 16.0, 6.3), 6.600000000000001, 2.52, 1.19, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (24.0, 30.0, 24.0, 16.0, 6.0), False, True): ((23.4, 30.0, 24.3, 16.0, 6.3), 6.600000000000001, 2.52, 1.19, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (24.0, 30.0, 24.0, 16.0, 6.0), True, False): ((22.0, 28.5, 24.3, 17.1, 8.1), 6.600000000000001, 2.61, 1.23, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (24.0, 30.0, 24.0, 16.0, 6.0), True, True): ((22.0, 28.5, 24.3, 17.1, 8.1), 6.600000000000001, 2.61, 1.23, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 19.0, 36.0, 30.0), False, False): ((5.1, 10.0, 19.7, 36.0, 29.2), 6.399999999999999, 3.74, 1.13, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 19.0, 36.0, 30.0), False, True): ((5.1, 10.0, 19.7, 36.0, 29.2), 6.399999999999999, 3.74, 1.13, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 19.0, 36.0, 30.0), True, False): ((3.7, 8.6, 19.7, 37.0, 31.0), 8.0, 3.83, 1.07, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 19.0, 36.0, 30.0), True, True): ((3.7, 8.6, 19.7, 37.0, 31.0), 8.0, 3.83, 1.07, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 18.0, 30.0, 25.0), False, False): ((11.8, 15.0, 18.8, 30.0, 24.4), 6.399999999999999, 3.4, 1.32, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 18.0, 30.0, 25.0), False, True): ((11.8, 15.0, 18.8, 30.0, 24.4), 6.399999999999999, 3.4, 1.32, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 18.0, 30.0, 25.0), True, False): ((10.4, 13.6, 18.8, 31.1, 26.1), 7.5, 3.49, 1.29, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (12.0, 15.0, 18.0, 30.0, 25.0), True, True): ((10.4, 13.6, 18.8, 31.1, 26.1), 7.5, 3.49, 1.29, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 10.0, 12.0, 35.0, 35.0), False, False): ((7.9, 10.0, 13.3, 34.9, 33.9), 6.100000000000001, 3.77, 1.24, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 10.0, 12.0, 35.0, 35.0), False, True): ((7.9, 10.0, 13.3, 34.9, 33.9), 6.100000000000001, 3.77, 1.24, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 10.0, 12.0, 35.0, 35.0), True, False): ((6.5, 8.6, 13.3, 36.0, 35.6), 8.5, 3.86, 1.18, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 10.0, 12.0, 35.0, 35.0), True, True): ((6.5, 8.6, 13.3, 36.0, 35.6), 8.5, 3.86, 1.18, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 18.0, 34.0, 24.0), False, False): ((9.9, 14.0, 18.7, 34.0, 23.4), 6.099999999999998, 3.47, 1.26, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 18.0, 34.0, 24.0), False, True): ((9.9, 14.0, 18.7, 34.0, 23.4), 6.099999999999998, 3.47, 1.26, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 18.0, 34.0, 24.0), True, False): ((8.5, 12.6, 18.7, 35.0, 25.2), 7.399999999999999, 3.56, 1.23, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (10.0, 14.0, 18.0, 34.0, 24.0), True, True): ((8.5, 12.6, 18.7, 35.0, 25.2), 7.399999999999999, 3.56, 1.23, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 18.0, 38.0, 29.0), False, False): ((5.1, 10.0, 18.7, 38.0, 28.2), 6.099999999999998, 3.74, 1.12, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 18.0, 38.0, 29.0), False, True): ((5.1, 10.0, 18.7, 38.0, 28.2), 6.099999999999998, 3.74, 1.12, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 18.0, 38.0, 29.0), True, False): ((3.7, 8.6, 18.7, 39.0, 30.0), 7.899999999999999, 3.83, 1.07, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 10.0, 18.0, 38.0, 29.0), True, True): ((3.7, 8.6, 18.7, 39.0, 30.0), 7.899999999999999, 3.83, 1.07, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 14.0, 26.0, 34.0, 20.0), False, False): ((6.2, 14.0, 26.1, 33.9, 19.8), 6.5, 3.47, 1.14, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 14.0, 26.0, 34.0, 20.0), False, True): ((6.2, 14.0, 26.1, 33.9, 19.8), 6.5, 3.47, 1.14, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 14.0, 26.0, 34.0, 20.0), True, False): ((4.8, 12.6, 26.1, 35.0, 21.5), 7.0, 3.56, 1.1, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 14.0, 26.0, 34.0, 20.0), True, True): ((4.8, 12.6, 26.1, 35.0, 21.5), 7.0, 3.56, 1.1, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 11.0, 22.0, 38.0, 24.0), False, False): ((5.1, 11.0, 22.3, 38.1, 23.5), 6.199999999999999, 3.64, 1.11, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 11.0, 22.0, 38.0, 24.0), False, True): ((5.1, 11.0, 22.3, 38.1, 23.5), 6.199999999999999, 3.64, 1.11, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 11.0, 22.0, 38.0, 24.0), True, False): ((3.7, 9.6, 22.3, 39.1, 25.3), 7.399999999999999, 3.73, 1.06, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (5.0, 11.0, 22.0, 38.0, 24.0), True, True): ((3.7, 9.6, 22.3, 39.1, 25.3), 7.399999999999999, 3.73, 1.06, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 8.0, 18.0, 42.0, 29.0), False, False): ((3.2, 8.0, 18.6, 42.0, 28.2), 5.899999999999999, 3.84, 1.02, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 8.0, 18.0, 42.0, 29.0), False, True): ((3.2, 8.0, 18.6, 42.0, 28.2), 5.899999999999999, 3.84, 1.02, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 8.0, 18.0, 42.0, 29.0), True, False): ((2.3, 6.6, 18.5, 42.8, 29.8), 7.399999999999999, 3.91, 0.97, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (3.0, 8.0, 18.0, 42.0, 29.0), True, True): ((2.3, 6.6, 18.5, 42.8, 29.8), 7.399999999999999, 3.91, 0.97, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 9.0, 20.0, 40.0, 27.0), False, False): ((4.1, 9.0, 20.5, 40.0, 26.4), 6.100000000000001, 3.76, 1.07, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 9.0, 20.0, 40.0, 27.0), False, True): ((4.1, 9.0, 20.5, 40.0, 26.4), 6.100000000000001, 3.76, 1.07, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 9.0, 20.0, 40.0, 27.0), True, False): ((2.9, 7.6, 20.5, 40.9, 28.1), 7.5, 3.84, 1.01, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('scale', ('1', '2', '3', '4', '5'), (4.0, 9.0, 20.0, 40.0, 27.0), True, True): ((2.9, 7.6, 20.5, 40.9, 28.1), 7.5, 3.84, 1.01, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 28.0, 32.0, 18.0), False, False): ((8.1, 14.0, 28.0, 32.0, 17.9), 6.800000000000001, 3.38, 1.17, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 28.0, 32.0, 18.0), False, True): ((8.1, 14.0, 28.0, 32.0, 17.9), 6.800000000000001, 3.38, 1.17, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 28.0, 32.0, 18.0), True, False): ((6.7, 12.6, 28.0, 33.0, 19.7), 6.800000000000001, 3.46, 1.14, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (8.0, 14.0, 28.0, 32.0, 18.0), True, True): ((6.7, 12.6, 28.0, 33.0, 19.7), 6.800000000000001, 3.46, 1.14, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 12.0, 24.0, 35.0, 23.0), False, False): ((6.1, 12.0, 24.3, 35.0, 22.6), 6.5, 3.56, 1.14, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 12.0, 24.0, 35.0, 23.0), False, True): ((6.1, 12.0, 24.3, 35.0, 22.6), 6.5, 3.56, 1.14, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 12.0, 24.0, 35.0, 23.0), True, False): ((4.7, 10.6, 24.3, 36.0, 24.4), 7.300000000000001, 3.65, 1.1, (), ()),
+    ('scale', ('1', '2', '3', '4', '5'), (6.0, 12.0, 24.0, 35.0, 23.0), True, True): ((4.7, 10.6, 24.3, 36.0, 24.4), 7.300000000000001, 3.65, 1.1, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (38.0, 62.0), False, False): ((38.0, 62.0), 0, None, None, (), ()),
+    ('binary', None, (38.0, 62.0), False, True): ((38.0, 62.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (38.0, 62.0), True, False): ((37.6, 62.4), 1.0, None, None, (), ()),
+    ('binary', None, (38.0, 62.0), True, True): ((37.6, 62.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (60.0, 40.0), False, False): ((60.0, 40.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (60.0, 40.0), False, True): ((60.0, 40.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (60.0, 40.0), True, False): ((59.6, 40.4), 1.0, None, None, (), ()),
+    ('binary', None, (60.0, 40.0), True, True): ((59.6, 40.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (48.0, 52.0), False, False): ((48.0, 52.0), 0, None, None, (), ()),
+    ('binary', None, (48.0, 52.0), False, True): ((48.0, 52.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (48.0, 52.0), True, False): ((47.7, 52.3), 1.0, None, None, (), ()),
+    ('binary', None, (48.0, 52.0), True, True): ((47.7, 52.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (91.0, 9.0), False, False): ((91.0, 9.0), 0, None, None, (), ()),
+    ('binary', None, (91.0, 9.0), False, True): ((91.0, 9.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (91.0, 9.0), True, False): ((90.7, 9.3), 1.0, None, None, (), ()),
+    ('binary', None, (91.0, 9.0), True, True): ((90.7, 9.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (9.0, 91.0), False, False): ((9.0, 91.0), 0, None, None, (), ()),
+    ('binary', None, (9.0, 91.0), False, True): ((9.0, 91.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (9.0, 91.0), True, False): ((8.7, 91.3), 1.0, None, None, (), ()),
+    ('binary', None, (9.0, 91.0), True, True): ((8.7, 91.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (35.0, 65.0), False, False): ((35.0, 65.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (35.0, 65.0), False, True): ((35.0, 65.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (35.0, 65.0), True, False): ((34.6, 65.4), 1.0, None, None, (), ()),
+    ('binary', None, (35.0, 65.0), True, True): ((34.6, 65.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (65.0, 35.0), False, False): ((65.0, 35.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (65.0, 35.0), False, True): ((65.0, 35.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (65.0, 35.0), True, False): ((64.6, 35.4), 1.0, None, None, (), ()),
+    ('binary', None, (65.0, 35.0), True, True): ((64.6, 35.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (16.0, 84.0), False, False): ((16.0, 84.0), 0, None, None, (), ()),
+    ('binary', None, (16.0, 84.0), False, True): ((16.0, 84.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (16.0, 84.0), True, False): ((15.7, 84.3), 1.0, None, None, (), ()),
+    ('binary', None, (16.0, 84.0), True, True): ((15.7, 84.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (84.0, 16.0), False, False): ((84.0, 16.0), 0, None, None, (), ()),
+    ('binary', None, (84.0, 16.0), False, True): ((84.0, 16.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (84.0, 16.0), True, False): ((83.6, 16.4), 1.0, None, None, (), ()),
+    ('binary', None, (84.0, 16.0), True, True): ((83.6, 16.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (33.0, 67.0), False, False): ((33.0, 67.0), 0, None, None, (), ()),
+    ('binary', None, (33.0, 67.0), False, True): ((33.0, 67.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (33.0, 67.0), True, False): ((32.6, 67.4), 1.0, None, None, (), ()),
+    ('binary', None, (33.0, 67.0), True, True): ((32.6, 67.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (40.0, 60.0), False, False): ((40.0, 60.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (40.0, 60.0), False, True): ((40.0, 60.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (40.0, 60.0), True, False): ((39.6, 60.4), 1.0, None, None, (), ()),
+    ('binary', None, (40.0, 60.0), True, True): ((39.6, 60.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (14.0, 86.0), False, False): ((14.0, 86.0), 0, None, None, (), ()),
+    ('binary', None, (14.0, 86.0), False, True): ((14.0, 86.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (14.0, 86.0), True, False): ((13.7, 86.3), 1.0, None, None, (), ()),
+    ('binary', None, (14.0, 86.0), True, True): ((13.7, 86.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (86.0, 14.0), False, False): ((86.0, 14.0), 0, None, None, (), ()),
+    ('binary', None, (86.0, 14.0), False, True): ((86.0, 14.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (86.0, 14.0), True, False): ((85.6, 14.4), 1.0, None, None, (), ()),
+    ('binary', None, (86.0, 14.0), True, True): ((85.6, 14.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (28.0, 72.0), False, False): ((28.0, 72.0), 0, None, None, (), ()),
+    ('binary', None, (28.0, 72.0), False, True): ((28.0, 72.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (28.0, 72.0), True, False): ((27.6, 72.4), 1.0, None, None, (), ()),
+    ('binary', None, (28.0, 72.0), True, True): ((27.6, 72.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (72.0, 28.0), False, False): ((72.0, 28.0), 0, None, None, (), ()),
+    ('binary', None, (72.0, 28.0), False, True): ((72.0, 28.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (72.0, 28.0), True, False): ((71.6, 28.4), 1.0, None, None, (), ()),
+    ('binary', None, (72.0, 28.0), True, True): ((71.6, 28.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (6.0, 94.0), False, False): ((6.0, 94.0), 0, None, None, (), ()),
+    ('binary', None, (6.0, 94.0), False, True): ((6.0, 94.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (6.0, 94.0), True, False): ((5.7, 94.3), 1.0, None, None, (), ()),
+    ('binary', None, (6.0, 94.0), True, True): ((5.7, 94.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (69.0, 31.0), False, False): ((69.0, 31.0), 0, None, None, (), ()),
+    ('binary', None, (69.0, 31.0), False, True): ((69.0, 31.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (69.0, 31.0), True, False): ((68.6, 31.4), 1.0, None, None, (), ()),
+    ('binary', None, (69.0, 31.0), True, True): ((68.6, 31.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (58.0, 42.0), False, False): ((58.0, 42.0), 0, None, None, (), ()),
+    ('binary', None, (58.0, 42.0), False, True): ((58.0, 42.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (58.0, 42.0), True, False): ((57.6, 42.4), 1.0, None, None, (), ()),
+    ('binary', None, (58.0, 42.0), True, True): ((57.6, 42.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (75.0, 25.0), False, False): ((75.0, 25.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (75.0, 25.0), False, True): ((75.0, 25.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (75.0, 25.0), True, False): ((74.6, 25.4), 1.0, None, None, (), ()),
+    ('binary', None, (75.0, 25.0), True, True): ((74.6, 25.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (83.0, 17.0), False, False): ((83.0, 17.0), 0, None, None, (), ()),
+    ('binary', None, (83.0, 17.0), False, True): ((83.0, 17.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (83.0, 17.0), True, False): ((82.6, 17.4), 1.0, None, None, (), ()),
+    ('binary', None, (83.0, 17.0), True, True): ((82.6, 17.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (32.0, 68.0), False, False): ((32.0, 68.0), 0, None, None, (), ()),
+    ('binary', None, (32.0, 68.0), False, True): ((32.0, 68.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (32.0, 68.0), True, False): ((31.6, 68.4), 1.0, None, None, (), ()),
+    ('binary', None, (32.0, 68.0), True, True): ((31.6, 68.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (63.0, 37.0), False, False): ((63.0, 37.0), 0, None, None, (), ()),
+    ('binary', None, (63.0, 37.0), False, True): ((63.0, 37.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (63.0, 37.0), True, False): ((62.6, 37.4), 1.0, None, None, (), ()),
+    ('binary', None, (63.0, 37.0), True, True): ((62.6, 37.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (68.0, 32.0), False, False): ((68.0, 32.0), 0, None, None, (), ()),
+    ('binary', None, (68.0, 32.0), False, True): ((68.0, 32.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (68.0, 32.0), True, False): ((67.6, 32.4), 1.0, None, None, (), ()),
+    ('binary', None, (68.0, 32.0), True, True): ((67.6, 32.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (26.0, 74.0), False, False): ((26.0, 74.0), 0, None, None, (), ()),
+    ('binary', None, (26.0, 74.0), False, True): ((26.0, 74.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (26.0, 74.0), True, False): ((25.6, 74.4), 1.0, None, None, (), ()),
+    ('binary', None, (26.0, 74.0), True, True): ((25.6, 74.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (21.0, 79.0), False, False): ((21.0, 79.0), 0, None, None, (), ()),
+    ('binary', None, (21.0, 79.0), False, True): ((21.0, 79.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (21.0, 79.0), True, False): ((20.6, 79.4), 1.0, None, None, (), ()),
+    ('binary', None, (21.0, 79.0), True, True): ((20.6, 79.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (55.0, 45.0), False, False): ((55.0, 45.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (55.0, 45.0), False, True): ((55.0, 45.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (55.0, 45.0), True, False): ((54.7, 45.3), 1.0, None, None, (), ()),
+    ('binary', None, (55.0, 45.0), True, True): ((54.7, 45.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (19.0, 81.0), False, False): ((19.0, 81.0), 0, None, None, (), ()),
+    ('binary', None, (19.0, 81.0), False, True): ((19.0, 81.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (19.0, 81.0), True, False): ((18.6, 81.4), 1.0, None, None, (), ()),
+    ('binary', None, (19.0, 81.0), True, True): ((18.6, 81.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (66.0, 34.0), False, False): ((66.0, 34.0), 0, None, None, (), ()),
+    ('binary', None, (66.0, 34.0), False, True): ((66.0, 34.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (66.0, 34.0), True, False): ((65.6, 34.4), 1.0, None, None, (), ()),
+    ('binary', None, (66.0, 34.0), True, True): ((65.6, 34.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (54.0, 46.0), False, False): ((54.0, 46.0), 0, None, None, (), ()),
+    ('binary', None, (54.0, 46.0), False, True): ((54.0, 46.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (54.0, 46.0), True, False): ((53.6, 46.4), 1.0, None, None, (), ()),
+    ('binary', None, (54.0, 46.0), True, True): ((53.6, 46.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (45.0, 55.0), False, False): ((45.0, 55.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (45.0, 55.0), False, True): ((45.0, 55.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (45.0, 55.0), True, False): ((44.6, 55.4), 1.0, None, None, (), ()),
+    ('binary', None, (45.0, 55.0), True, True): ((44.6, 55.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (27.0, 73.0), False, False): ((27.0, 73.0), 0, None, None, (), ()),
+    ('binary', None, (27.0, 73.0), False, True): ((27.0, 73.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (27.0, 73.0), True, False): ((26.6, 73.4), 1.0, None, None, (), ()),
+    ('binary', None, (27.0, 73.0), True, True): ((26.6, 73.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (37.0, 63.0), False, False): ((37.0, 63.0), 0, None, None, (), ()),
+    ('binary', None, (37.0, 63.0), False, True): ((37.0, 63.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (37.0, 63.0), True, False): ((36.6, 63.4), 1.0, None, None, (), ()),
+    ('binary', None, (37.0, 63.0), True, True): ((36.6, 63.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (30.0, 70.0), False, False): ((30.0, 70.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (30.0, 70.0), False, True): ((30.0, 70.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (30.0, 70.0), True, False): ((29.6, 70.4), 1.0, None, None, (), ()),
+    ('binary', None, (30.0, 70.0), True, True): ((29.6, 70.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (3.0, 97.0), False, False): ((3.0, 97.0), 0, None, None, (), ()),
+    ('binary', None, (3.0, 97.0), False, True): ((3.0, 97.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (3.0, 97.0), True, False): ((2.7, 97.3), 1.0, None, None, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('binary', None, (3.0, 97.0), True, True): ((2.7, 97.3), 1.0, None, None, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (56.0, 44.0), False, False): ((56.0, 44.0), 0, None, None, (), ()),
+    ('binary', None, (56.0, 44.0), False, True): ((56.0, 44.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (56.0, 44.0), True, False): ((55.6, 44.4), 1.0, None, None, (), ()),
+    ('binary', None, (56.0, 44.0), True, True): ((55.6, 44.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (47.0, 53.0), False, False): ((47.0, 53.0), 0, None, None, (), ()),
+    ('binary', None, (47.0, 53.0), False, True): ((47.0, 53.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (47.0, 53.0), True, False): ((46.6, 53.4), 1.0, None, None, (), ()),
+    ('binary', None, (47.0, 53.0), True, True): ((46.6, 53.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (24.0, 76.0), False, False): ((24.0, 76.0), 0, None, None, (), ()),
+    ('binary', None, (24.0, 76.0), False, True): ((24.0, 76.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (24.0, 76.0), True, False): ((23.6, 76.4), 1.0, None, None, (), ()),
+    ('binary', None, (24.0, 76.0), True, True): ((23.6, 76.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (5.0, 95.0), False, False): ((5.0, 95.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (5.0, 95.0), False, True): ((5.0, 95.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (5.0, 95.0), True, False): ((4.7, 95.3), 1.0, None, None, (), ()),
+    ('binary', None, (5.0, 95.0), True, True): ((4.7, 95.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (36.0, 64.0), False, False): ((36.0, 64.0), 0, None, None, (), ()),
+    ('binary', None, (36.0, 64.0), False, True): ((36.0, 64.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (36.0, 64.0), True, False): ((35.6, 64.4), 1.0, None, None, (), ()),
+    ('binary', None, (36.0, 64.0), True, True): ((35.6, 64.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (31.0, 69.0), False, False): ((31.0, 69.0), 0, None, None, (), ()),
+    ('binary', None, (31.0, 69.0), False, True): ((31.0, 69.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (31.0, 69.0), True, False): ((30.6, 69.4), 1.0, None, None, (), ()),
+    ('binary', None, (31.0, 69.0), True, True): ((30.6, 69.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (42.0, 58.0), False, False): ((42.0, 58.0), 0, None, None, (), ()),
+    ('binary', None, (42.0, 58.0), False, True): ((42.0, 58.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (42.0, 58.0), True, False): ((41.6, 58.4), 1.0, None, None, (), ()),
+    ('binary', None, (42.0, 58.0), True, True): ((41.6, 58.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (13.0, 87.0), False, False): ((13.0, 87.0), 0, None, None, (), ()),
+    ('binary', None, (13.0, 87.0), False, True): ((13.0, 87.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (13.0, 87.0), True, False): ((12.6, 87.4), 1.0, None, None, (), ()),
+    ('binary', None, (13.0, 87.0), True, True): ((12.6, 87.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (82.0, 18.0), False, False): ((82.0, 18.0), 0, None, None, (), ()),
+    ('binary', None, (82.0, 18.0), False, True): ((82.0, 18.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (82.0, 18.0), True, False): ((81.6, 18.4), 1.0, None, None, (), ()),
+    ('binary', None, (82.0, 18.0), True, True): ((81.6, 18.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (59.0, 41.0), False, False): ((59.0, 41.0), 0, None, None, (), ()),
+    ('binary', None, (59.0, 41.0), False, True): ((59.0, 41.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (59.0, 41.0), True, False): ((58.6, 41.4), 1.0, None, None, (), ()),
+    ('binary', None, (59.0, 41.0), True, True): ((58.6, 41.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (52.0, 48.0), False, False): ((52.0, 48.0), 0, None, None, (), ()),
+    ('binary', None, (52.0, 48.0), False, True): ((52.0, 48.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (52.0, 48.0), True, False): ((51.6, 48.4), 1.0, None, None, (), ()),
+    ('binary', None, (52.0, 48.0), True, True): ((51.6, 48.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (90.0, 10.0), False, False): ((90.0, 10.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (90.0, 10.0), False, True): ((90.0, 10.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (90.0, 10.0), True, False): ((89.7, 10.3), 1.0, None, None, (), ()),
+    ('binary', None, (90.0, 10.0), True, True): ((89.7, 10.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (92.0, 8.0), False, False): ((92.0, 8.0), 0, None, None, (), ()),
+    ('binary', None, (92.0, 8.0), False, True): ((92.0, 8.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (92.0, 8.0), True, False): ((91.7, 8.3), 1.0, None, None, (), ()),
+    ('binary', None, (92.0, 8.0), True, True): ((91.7, 8.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (80.0, 20.0), False, False): ((80.0, 20.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (80.0, 20.0), False, True): ((80.0, 20.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (80.0, 20.0), True, False): ((79.6, 20.4), 1.0, None, None, (), ()),
+    ('binary', None, (80.0, 20.0), True, True): ((79.6, 20.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (70.0, 30.0), False, False): ((70.0, 30.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (70.0, 30.0), False, True): ((70.0, 30.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (70.0, 30.0), True, False): ((69.6, 30.4), 1.0, None, None, (), ()),
+    ('binary', None, (70.0, 30.0), True, True): ((69.6, 30.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (81.0, 19.0), False, False): ((81.0, 19.0), 0, None, None, (), ()),
+    ('binary', None, (81.0, 19.0), False, True): ((81.0, 19.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (81.0, 19.0), True, False): ((80.6, 19.4), 1.0, None, None, (), ()),
+    ('binary', None, (81.0, 19.0), True, True): ((80.6, 19.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (20.0, 80.0), False, False): ((20.0, 80.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (20.0, 80.0), False, True): ((20.0, 80.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (20.0, 80.0), True, False): ((19.6, 80.4), 1.0, None, None, (), ()),
+    ('binary', None, (20.0, 80.0), True, True): ((19.6, 80.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (12.0, 88.0), False, False): ((12.0, 88.0), 0, None, None, (), ()),
+    ('binary', None, (12.0, 88.0), False, True): ((12.0, 88.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (12.0, 88.0), True, False): ((11.7, 88.3), 1.0, None, None, (), ()),
+    ('binary', None, (12.0, 88.0), True, True): ((11.7, 88.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (57.0, 43.0), False, False): ((57.0, 43.0), 0, None, None, (), ()),
+    ('binary', None, (57.0, 43.0), False, True): ((57.0, 43.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (57.0, 43.0), True, False): ((56.7, 43.3), 1.0, None, None, (), ()),
+    ('binary', None, (57.0, 43.0), True, True): ((56.7, 43.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (51.0, 49.0), False, False): ((51.0, 49.0), 0, None, None, (), ()),
+    ('binary', None, (51.0, 49.0), False, True): ((51.0, 49.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (51.0, 49.0), True, False): ((50.6, 49.4), 1.0, None, None, (), ()),
+    ('binary', None, (51.0, 49.0), True, True): ((50.6, 49.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (34.0, 66.0), False, False): ((34.0, 66.0), 0, None, None, (), ()),
+    ('binary', None, (34.0, 66.0), False, True): ((34.0, 66.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (34.0, 66.0), True, False): ((33.6, 66.4), 1.0, None, None, (), ()),
+    ('binary', None, (34.0, 66.0), True, True): ((33.6, 66.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (50.0, 50.0), False, False): ((50.0, 50.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (50.0, 50.0), False, True): ((50.0, 50.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (50.0, 50.0), True, False): ((49.6, 50.4), 1.0, None, None, (), ()),
+    ('binary', None, (50.0, 50.0), True, True): ((49.6, 50.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (73.0, 27.0), False, False): ((73.0, 27.0), 0, None, None, (), ()),
+    ('binary', None, (73.0, 27.0), False, True): ((73.0, 27.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (73.0, 27.0), True, False): ((72.6, 27.4), 1.0, None, None, (), ()),
+    ('binary', None, (73.0, 27.0), True, True): ((72.6, 27.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (76.0, 24.0), False, False): ((76.0, 24.0), 0, None, None, (), ()),
+    ('binary', None, (76.0, 24.0), False, True): ((76.0, 24.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (76.0, 24.0), True, False): ((75.6, 24.4), 1.0, None, None, (), ()),
+    ('binary', None, (76.0, 24.0), True, True): ((75.6, 24.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (25.0, 75.0), False, False): ((25.0, 75.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (25.0, 75.0), False, True): ((25.0, 75.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (25.0, 75.0), True, False): ((24.6, 75.4), 1.0, None, None, (), ()),
+    ('binary', None, (25.0, 75.0), True, True): ((24.6, 75.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (22.0, 78.0), False, False): ((22.0, 78.0), 0, None, None, (), ()),
+    ('binary', None, (22.0, 78.0), False, True): ((22.0, 78.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (22.0, 78.0), True, False): ((21.6, 78.4), 1.0, None, None, (), ()),
+    ('binary', None, (22.0, 78.0), True, True): ((21.6, 78.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (15.0, 85.0), False, False): ((15.0, 85.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (15.0, 85.0), False, True): ((15.0, 85.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (15.0, 85.0), True, False): ((14.6, 85.4), 1.0, None, None, (), ()),
+    ('binary', None, (15.0, 85.0), True, True): ((14.6, 85.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (53.0, 47.0), False, False): ((53.0, 47.0), 0, None, None, (), ()),
+    ('binary', None, (53.0, 47.0), False, True): ((53.0, 47.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (53.0, 47.0), True, False): ((52.7, 47.3), 1.0, None, None, (), ()),
+    ('binary', None, (53.0, 47.0), True, True): ((52.7, 47.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (94.0, 6.0), False, False): ((94.0, 6.0), 0, None, None, (), ()),
+    ('binary', None, (94.0, 6.0), False, True): ((94.0, 6.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (94.0, 6.0), True, False): ((93.7, 6.3), 1.0, None, None, (), ()),
+    ('binary', None, (94.0, 6.0), True, True): ((93.7, 6.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (79.0, 21.0), False, False): ((79.0, 21.0), 0, None, None, (), ()),
+    ('binary', None, (79.0, 21.0), False, True): ((79.0, 21.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (79.0, 21.0), True, False): ((78.6, 21.4), 1.0, None, None, (), ()),
+    ('binary', None, (79.0, 21.0), True, True): ((78.6, 21.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (39.0, 61.0), False, False): ((39.0, 61.0), 0, None, None, (), ()),
+    ('binary', None, (39.0, 61.0), False, True): ((39.0, 61.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (39.0, 61.0), True, False): ((38.6, 61.4), 1.0, None, None, (), ()),
+    ('binary', None, (39.0, 61.0), True, True): ((38.6, 61.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (7.0, 93.0), False, False): ((7.0, 93.0), 0, None, None, (), ()),
+    ('binary', None, (7.0, 93.0), False, True): ((7.0, 93.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (7.0, 93.0), True, False): ((6.7, 93.3), 1.0, None, None, (), ()),
+    ('binary', None, (7.0, 93.0), True, True): ((6.7, 93.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (8.0, 92.0), False, False): ((8.0, 92.0), 0, None, None, (), ()),
+    ('binary', None, (8.0, 92.0), False, True): ((8.0, 92.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (8.0, 92.0), True, False): ((7.7, 92.3), 1.0, None, None, (), ()),
+    ('binary', None, (8.0, 92.0), True, True): ((7.7, 92.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (41.0, 59.0), False, False): ((41.0, 59.0), 0, None, None, (), ()),
+    ('binary', None, (41.0, 59.0), False, True): ((41.0, 59.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (41.0, 59.0), True, False): ((40.7, 59.3), 1.0, None, None, (), ()),
+    ('binary', None, (41.0, 59.0), True, True): ((40.7, 59.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (12.5, 87.5), False, False): ((12.5, 87.5), 0, None, None, (), ()),
+    ('binary', None, (12.5, 87.5), False, True): ((12.5, 87.5), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (12.5, 87.5), True, False): ((12.1, 87.9), 1.0, None, None, (), ()),
+    ('binary', None, (12.5, 87.5), True, True): ((12.1, 87.9), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (46.0, 54.0), False, False): ((46.0, 54.0), 0, None, None, (), ()),
+    ('binary', None, (46.0, 54.0), False, True): ((46.0, 54.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (46.0, 54.0), True, False): ((45.6, 54.4), 1.0, None, None, (), ()),
+    ('binary', None, (46.0, 54.0), True, True): ((45.6, 54.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (43.0, 57.0), False, False): ((43.0, 57.0), 0, None, None, (), ()),
+    ('binary', None, (43.0, 57.0), False, True): ((43.0, 57.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (43.0, 57.0), True, False): ((42.6, 57.4), 1.0, None, None, (), ()),
+    ('binary', None, (43.0, 57.0), True, True): ((42.6, 57.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (95.0, 5.0), False, False): ((95.0, 5.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals',)),
+    ('binary', None, (95.0, 5.0), False, True): ((95.0, 5.0), 0, None, None, (), ('All percentages are round numbers - prefer realistic decimals', "'Open to X' audience - verify distribution differs from general pop")),
+    ('binary', None, (95.0, 5.0), True, False): ((94.7, 5.3), 1.0, None, None, (), ()),
+    ('binary', None, (95.0, 5.0), True, True): ((94.7, 5.3), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (71.0, 29.0), False, False): ((71.0, 29.0), 0, None, None, (), ()),
+    ('binary', None, (71.0, 29.0), False, True): ((71.0, 29.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (71.0, 29.0), True, False): ((70.6, 29.4), 1.0, None, None, (), ()),
+    ('binary', None, (71.0, 29.0), True, True): ((70.6, 29.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (44.0, 56.0), False, False): ((44.0, 56.0), 0, None, None, (), ()),
+    ('binary', None, (44.0, 56.0), False, True): ((44.0, 56.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (44.0, 56.0), True, False): ((43.6, 56.4), 1.0, None, None, (), ()),
+    ('binary', None, (44.0, 56.0), True, True): ((43.6, 56.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (77.0, 23.0), False, False): ((77.0, 23.0), 0, None, None, (), ()),
+    ('binary', None, (77.0, 23.0), False, True): ((77.0, 23.0), 0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('binary', None, (77.0, 23.0), True, False): ((76.6, 23.4), 1.0, None, None, (), ()),
+    ('binary', None, (77.0, 23.0), True, True): ((76.6, 23.4), 1.0, None, None, (), ("'Open to X' audience - verify distribution differs from general pop",)),
+    ('nps', ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10'), (1.0, 1.0, 2.0, 3.0, 4.0, 7.0, 9.0, 18.0, 24.0, 19.0, 12.0), False, False): ((1.1, 1.0, 2.0, 3.0, 4.0, 7.3, 9.0, 18.0, 23.9, 19.0, 11.7), 2.3000000000000007, 7.26, 2.15, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('nps', ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10'), (1.0, 1.0, 2.0, 3.0, 4.0, 7.0, 9.0, 18.0, 24.0, 19.0, 12.0), False, True): ((1.1, 1.0, 2.0, 3.0, 4.0, 7.3, 9.0, 18.0, 23.9, 19.0, 11.7), 2.3000000000000007, 7.26, 2.15, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+    ('nps', ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10'), (1.0, 1.0, 2.0, 3.0, 4.0, 7.0, 9.0, 18.0, 24.0, 19.0, 12.0), True, False): ((0.9, 0.8, 2.0, 2.9, 3.9, 7.1, 8.8, 17.6, 23.4, 19.6, 13.0), 5.1, 7.34, 2.12, (), ('Some options below 3% - consider if realistic for audience',)),
+    ('nps', ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10'), (1.0, 1.0, 2.0, 3.0, 4.0, 7.0, 9.0, 18.0, 24.0, 19.0, 12.0), True, True): ((0.9, 0.8, 2.0, 2.9, 3.9, 7.1, 8.8, 17.6, 23.4, 19.6, 13.0), 5.1, 7.34, 2.12, (), ('Some options below 3% - consider if realistic for audience', "'Open to X' audience - verify distribution differs from general pop")),
+}
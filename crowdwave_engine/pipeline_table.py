@@ -0,0 +1,207 @@
+"""
+Crowdwave Precomputed Pipeline Outputs
+For questions whose base distribution is one of the fixed calibrated
+literals in CrowdwaveEngine._get_base_distribution, everything from the
+ensemble through validation is deterministic. This module compiles those
+outputs into pipeline_outputs.py at build time so the engine can skip
+the ensemble for calibrated questions.
+
+Regenerate after changing the cascade, the ensemble shifts, statistics
+or validation:
+    python -m crowdwave_engine calibration pipeline
+
+Entries are keyed by the base distribution itself rather than by the
+cascade branch that returned it: every later phase only sees the
+distribution, so branches sharing a literal share an entry, and a
+question reaching an identical distribution by another route gets the
+same (correct) outputs. The other inputs are whether stimuli are present
+(the signal-forward run) and whether the audience is an "open to X"
+audience (a validation warning). Phase 7 corrections depend on audience
+and question text, so they are applied live, and statistics and
+validation are recomputed whenever one fires.
+"""
+
+import ast
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .bias_corrections import ValidationResult
+
+
+# Question types whose option labels feed statistics and validation
+# (float/int of the scale point); binary labels never do
+LABELLED_TYPES = ("scale", "nps")
+
+PipelineKey = Tuple[str, Optional[Tuple[str, ...]], Tuple[float, ...], bool, bool]
+
+
+@dataclass(frozen=True)
+class PipelineOutput:
+    """Phases 5-9 of the pipeline for one calibrated base distribution."""
+    distribution: Tuple[float, ...]  # reconciled values, in base-distribution order
+    spread: Optional[float]          # largest gap between ensemble runs
+    mean: Optional[float]
+    sd: Optional[float]
+    violations: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+
+    def validation(self) -> ValidationResult:
+        return ValidationResult(
+            passed=not self.violations,
+            violations=list(self.violations),
+            warnings=list(self.warnings),
+        )
+
+
+def pipeline_key(
+    question_type: str,
+    base: Mapping[str, float],
+    stimuli: Any,
+    audience: str
+) -> PipelineKey:
+    """Table key for a base distribution and the survey inputs that change its outputs."""
+    return (
+        question_type,
+        tuple(base) if question_type in LABELLED_TYPES else None,
+        tuple(base.values()),
+        bool(stimuli),
+        "open to" in audience.lower(),
+    )
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOOKUP
+# ═══════════════════════════════════════════════════════════════
+
+_table: Optional[Dict[PipelineKey, PipelineOutput]] = None
+
+
+def pipeline_table() -> Dict[PipelineKey, PipelineOutput]:
+    """The generated table, loaded on first use."""
+    global _table
+    if _table is None:
+        from .pipeline_outputs import PIPELINE_OUTPUTS
+        _table = {key: PipelineOutput(*value) for key, value in PIPELINE_OUTPUTS.items()}
+    return _table
+
+
+def lookup_pipeline_output(
+    question_type: str,
+    base: Mapping[str, float],
+    stimuli: Any,
+    audience: str
+) -> Optional[PipelineOutput]:
+    """Precomputed outputs for a base distribution, or None if it is not a fixed calibration."""
+    if not base:
+        return None
+    return pipeline_table().get(pipeline_key(question_type, base, stimuli, audience))
+
+
+# ═══════════════════════════════════════════════════════════════
+# COMPILATION
+# ═══════════════════════════════════════════════════════════════
+
+def _literal(node: ast.expr) -> Optional[Tuple[Optional[Tuple[str, ...]], Tuple[float, ...]]]:
+    """(constant labels or None, values) of a dict literal with constant values."""
+    if not isinstance(node, ast.Dict) or not node.keys:
+        return None
+    if not all(isinstance(value, ast.Constant) for value in node.values):
+        return None
+    values = tuple(float(value.value) for value in node.values)
+    if all(isinstance(key, ast.Constant) for key in node.keys):
+        return tuple(str(key.value) for key in node.keys), values
+    if all(isinstance(key, ast.Name) for key in node.keys):
+        return None, values
+    return None
+
+
+def calibrated_distributions() -> List[Tuple[str, Optional[Tuple[str, ...]], Tuple[float, ...]]]:
+    """
+    (question type, labels, values) for every distinct literal the
+    cascade in CrowdwaveEngine._get_base_distribution returns. Labels are
+    None for types whose labels don't affect the outputs.
+    """
+    from .cascade import base_distribution_cascade
+
+    found: Dict[Tuple[str, Optional[Tuple[str, ...]], Tuple[float, ...]], None] = {}
+    for branch in base_distribution_cascade().returns:
+        question_type = branch.question_type
+        if branch.statement.value is None or not question_type:
+            continue
+        literal = _literal(branch.statement.value)
+        if literal is None:
+            continue
+        labels, values = literal
+        if question_type not in LABELLED_TYPES:
+            labels = None
+        elif labels is None:
+            continue
+        found[(question_type, labels, values)] = None
+    return list(found)
+
+
+def compile_pipeline_outputs() -> Dict[PipelineKey, PipelineOutput]:
+    """Run phases 5-9 of the live pipeline for every calibrated literal and input combination."""
+    from .bias_corrections import validate_distribution
+    from .crowdwave import CrowdwaveEngine, Question, SurveyConfig
+
+    engine = CrowdwaveEngine(precomputed=False)
+    table = {}
+    for question_type, labels, values in calibrated_distributions():
+        keys = labels or tuple(f"opt{i}" for i in range(len(values)))
+        question = Question(id="pipeline", text="", type=question_type, options=list(keys))
+        base = dict(zip(keys, values))
+        for stimuli in (False, True):
+            for open_to in (False, True):
+                config = SurveyConfig(
+                    audience="open to" if open_to else "",
+                    stimuli=["stimulus"] if stimuli else [],
+                )
+                runs = engine._ensemble_runs(base, config)
+                distribution = engine._reconcile_ensemble(runs)
+                mean, sd = engine._calculate_stats(distribution, question)
+                validation = validate_distribution(distribution, question_type, config.audience)
+                table[pipeline_key(question_type, base, config.stimuli, config.audience)] = PipelineOutput(
+                    distribution=tuple(distribution[key] for key in keys),
+                    spread=engine._ensemble_spread(runs),
+                    mean=mean,
+                    sd=sd,
+                    violations=tuple(validation.violations),
+                    warnings=tuple(validation.warnings),
+                )
+    return table
+
+
+def render_pipeline_outputs(table: Mapping[PipelineKey, PipelineOutput]) -> str:
+    """Source of the generated pipeline_outputs module."""
+    lines = [
+        '"""',
+        "Precomputed pipeline outputs for fixed calibrated distributions.",
+        "",
+        "GENERATED by `python -m crowdwave_engine calibration pipeline` - do not edit.",
+        "See pipeline_table.py for the key and value layout.",
+        '"""',
+        "",
+        "PIPELINE_OUTPUTS = {",
+    ]
+    for key, output in table.items():
+        value = (
+            output.distribution, output.spread, output.mean, output.sd,
+            output.violations, output.warnings,
+        )
+        lines.append(f"    {key!r}: {value!r},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def build_pipeline_outputs(path: Optional[str] = None) -> int:
+    """Regenerate pipeline_outputs.py (next to this module by default); returns the entry count."""
+    table = compile_pipeline_outputs()
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pipeline_outputs.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_pipeline_outputs(table))
+    global _table
+    _table = None
+    return len(table)
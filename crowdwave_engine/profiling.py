@@ -0,0 +1,232 @@
+"""
+Crowdwave Simulation Profiling
+Opt-in per-phase timing and rule-match counters for the simulation pipeline.
+"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Phases recorded by CrowdwaveEngine.simulate, in pipeline order.
+PHASES = (
+    "parse",
+    "features",
+    "priors",
+    "bias_detection",
+    "accuracy_zone",
+    "ensemble",
+    "reconciliation",
+    "corrections",
+    "stats",
+    "validation",
+    "confidence",
+    "coverage",
+)
+
+
+class _ThreadStats:
+    """Per-thread accumulators, so recording never takes a lock."""
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}
+        self.rules: Dict[Tuple[str, str], int] = {}
+
+
+class SimulationProfiler:
+    """
+    Collect wall time and call counts per simulation phase, and counts of
+    which `_get_base_distribution` rule produced each base distribution.
+
+    Usage:
+        profiler = SimulationProfiler()
+        engine = CrowdwaveEngine(profiler=profiler)
+        engine.simulate(config, questions)
+        print(profiler.snapshot())
+
+    One profiler can be shared by engines running on many threads; each
+    thread writes to its own accumulators and snapshot() merges them.
+
+    Rule matching runs a copy of `_get_base_distribution` compiled with
+    every return tagged by its line, so no trace hook is installed and
+    debuggers and coverage tools keep working. The copy costs about the
+    same as the original; pass trace_rules=False to time phases only.
+    """
+
+    def __init__(self, trace_rules: bool = True):
+        self.trace_rules = trace_rules
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads: List[_ThreadStats] = []
+
+    def _stats(self) -> _ThreadStats:
+        stats = getattr(self._local, "stats", None)
+        if stats is None:
+            stats = _ThreadStats()
+            self._local.stats = stats
+            with self._lock:
+                self._threads.append(stats)
+        return stats
+
+    # ───────────────────────────────────────────────────────────
+    # Recording
+    # ───────────────────────────────────────────────────────────
+
+    def lap(self, phase: str, start: float, timings: Optional[Dict[str, float]] = None) -> float:
+        """
+        Record the time since `start` against `phase` and return now.
+
+        If `timings` is given, the elapsed milliseconds are also stored
+        there (used for per-question methodology traces).
+        """
+        now = time.perf_counter()
+        elapsed = now - start
+        entry = self._stats().phases.get(phase)
+        if entry is None:
+            self._stats().phases[phase] = [elapsed, 1]
+        else:
+            entry[0] += elapsed
+            entry[1] += 1
+        if timings is not None:
+            timings[phase] = round(elapsed * 1000, 4)
+        return now
+
+    def count_rule(self, family: str, rule: str):
+        """Count one match of a base-distribution rule."""
+        rules = self._stats().rules
+        key = (family, rule)
+        rules[key] = rules.get(key, 0) + 1
+
+    def trace_rule(
+        self,
+        fn: Callable,
+        family_prefix: str,
+        *args
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Call a rule cascade such as `_get_base_distribution` and report
+        which rule returned.
+
+        Returns (result, {"family", "rule", "line"}). The family is
+        `family_prefix`, prefixed with "partisan_" when the matching rule
+        sits in a party-conditioned section.
+        """
+        function = getattr(fn, "__func__", fn)
+        try:
+            tagged = _tagged(function)
+        except (OSError, TypeError):
+            result, line = fn(*args), None
+        else:
+            bound = getattr(fn, "__self__", None)
+            result, line = tagged(bound, *args) if bound is not None else tagged(*args)
+
+        partisan, label = _rule_labels(function).get(line, (False, f"line {line}"))
+        family = f"partisan_{family_prefix}" if partisan else family_prefix
+        self.count_rule(family, label)
+        return result, {"family": family, "rule": label, "line": line}
+
+    # ───────────────────────────────────────────────────────────
+    # Reporting
+    # ───────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Merge all threads' accumulators into a JSON-serializable dict."""
+        with self._lock:
+            threads = list(self._threads)
+
+        phases: Dict[str, List[float]] = {}
+        rules: Dict[Tuple[str, str], int] = {}
+        for stats in threads:
+            for phase, (total, count) in list(stats.phases.items()):
+                merged = phases.setdefault(phase, [0.0, 0])
+                merged[0] += total
+                merged[1] += count
+            for key, count in list(stats.rules.items()):
+                rules[key] = rules.get(key, 0) + count
+
+        families: Dict[str, int] = {}
+        for (family, _), count in rules.items():
+            families[family] = families.get(family, 0) + count
+
+        order = {phase: i for i, phase in enumerate(PHASES)}
+        return {
+            "phases": {
+                phase: {
+                    "calls": count,
+                    "total_ms": round(total * 1000, 3),
+                    "mean_ms": round(total * 1000 / count, 4),
+                }
+                for phase, (total, count) in sorted(
+                    phases.items(), key=lambda item: order.get(item[0], len(order))
+                )
+            },
+            "rule_families": dict(sorted(families.items(), key=lambda item: -item[1])),
+            "rules": {
+                f"{family}/{rule}": count
+                for (family, rule), count in sorted(rules.items(), key=lambda item: -item[1])
+            },
+        }
+
+    def reset(self):
+        """Clear all recorded timings and counts."""
+        with self._lock:
+            for stats in self._threads:
+                stats.phases.clear()
+                stats.rules.clear()
+
+
+@lru_cache(maxsize=None)
+def _rule_labels(fn: Callable) -> Dict[int, Tuple[bool, str]]:
+    """
+    Map each return line of a rule cascade to (partisan, label); see
+    Cascade.label. Partisan marks returns inside a top-level `if` whose
+    condition references `party`.
+    """
+    # Only needed when rule tracing is on; keeps it off the import path
+    from .cascade import walk_cascade
+
+    try:
+        cascade = walk_cascade(fn)
+    except (OSError, TypeError):
+        return {}
+    return {branch.line: (branch.partisan, cascade.label(branch)) for branch in cascade.returns}
+
+
+@lru_cache(maxsize=None)
+def _tagged(fn: Callable) -> Callable:
+    """
+    A copy of `fn` compiled from its source with every `return value`
+    rewritten to `return value, line`, where line is the return's line
+    in the source file. It runs in `fn`'s module globals.
+    """
+    # Only needed when rule tracing is on; keeps it off the import path
+    import ast
+    import inspect
+    import textwrap
+    from .cascade import walk_cascade
+
+    cascade = walk_cascade(fn)
+    tree = ast.parse(textwrap.dedent("".join(cascade.lines)))
+    function = tree.body[0]
+    function.decorator_list = []
+
+    class TagReturns(ast.NodeTransformer):
+        def visit_FunctionDef(self, node):
+            # Returns of nested functions are theirs, not the cascade's
+            return self.generic_visit(node) if node is function else node
+
+        visit_AsyncFunctionDef = visit_FunctionDef
+
+        def visit_Return(self, node):
+            value = node.value or ast.Constant(None)
+            node.value = ast.Tuple([value, ast.Constant(cascade.line_of(node))], ast.Load())
+            return node
+
+    TagReturns().visit(tree)
+    ast.fix_missing_locations(tree)
+    ast.increment_lineno(tree, cascade.first_line - 1)
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(tree, inspect.getsourcefile(fn) or "<cascade>", "exec"), fn.__globals__, namespace)
+    return namespace[function.name]
@@ -0,0 +1,305 @@
+"""
+Crowdwave Respondent Synthesis
+Correlated respondent-level data from simulated marginals via a Gaussian
+copula, so answers to related questions move together the way real
+respondents' answers do.
+"""
+
+import csv
+import re
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import IO, Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .matching import TRIGGERS
+
+
+# Upper bound on latent cells (respondents × questions) held in memory at
+# once. Synthesis is chunked by respondent to stay under it, so memory is
+# bounded regardless of sample size.
+MAX_SYNTHESIS_CELLS = 4_000_000
+
+
+# ═══════════════════════════════════════════════════════════════
+# CONSTRUCT SIMILARITY
+# ═══════════════════════════════════════════════════════════════
+
+# Constructs a question measures, by trigger phrase. Questions sharing
+# constructs (or subject words) get correlated latent responses.
+CONSTRUCT_TRIGGERS = {
+    "satisfaction": ["satisfied", "satisfaction", "happy with", "pleased"],
+    "loyalty": ["recommend", "loyal", "continue using", "renew", "switch"],
+    "trust": ["trust", "confidence", "confident", "reliable", "credible"],
+    "concern": ["concern", "worried", "worry", "anxious", "fear", "afraid"],
+    "intent": ["likely to", "intend", "plan to", "purchase", "buy", "try", "consider"],
+    "value": ["price", "value", "worth", "afford", "cost", "pay"],
+    "quality": ["quality", "effective", "performance", "works well"],
+    "acceptance": ["comfortable", "open to", "willing", "accept", "prefer"],
+    "importance": ["important", "importance", "priority"],
+    "awareness": ["aware", "familiar", "heard of"],
+}
+
+_CONSTRUCTS = list(zip(TRIGGERS.add_all("construct", CONSTRUCT_TRIGGERS), CONSTRUCT_TRIGGERS))
+
+# Correlation = base + (max - base) × similarity, where similarity blends
+# construct overlap and subject-word overlap (Jaccard indices)
+BASE_CORRELATION = 0.10     # halo / response-style correlation between any two items
+MAX_CORRELATION = 0.70
+CONSTRUCT_WEIGHT = 0.6
+SUBJECT_WEIGHT = 0.4
+
+_SUBJECT_STOPWORDS = frozenset({
+    "about", "after", "being", "could", "does", "from", "have", "each", "more",
+    "much", "that", "their", "them", "they", "this", "very", "what", "when",
+    "which", "will", "with", "would", "your", "likely", "following",
+})
+
+# Smallest eigenvalue kept when repairing a correlation matrix
+_MIN_EIGENVALUE = 1e-6
+
+
+def question_constructs(text: str) -> FrozenSet[str]:
+    """Constructs a question's text measures (keys of CONSTRUCT_TRIGGERS)."""
+    hits = TRIGGERS.scan(text.lower())
+    return frozenset(key for name, key in _CONSTRUCTS if hits.any(name))
+
+
+def _subject_words(text: str) -> FrozenSet[str]:
+    return frozenset(
+        word for word in re.findall(r"[a-z]+", text.lower())
+        if len(word) >= 4 and word not in _SUBJECT_STOPWORDS
+    )
+
+
+def _jaccard(sets: List[FrozenSet[str]]) -> np.ndarray:
+    n = len(sets)
+    similarity = np.zeros((n, n))
+    for i in range(n):
+        for j in range(i + 1, n):
+            union = len(sets[i] | sets[j])
+            if union:
+                similarity[i, j] = similarity[j, i] = len(sets[i] & sets[j]) / union
+    return similarity
+
+
+def construct_correlation(texts: Sequence[str]) -> np.ndarray:
+    """
+    Latent correlation matrix for questions, derived from how similar
+    their constructs and subjects are.
+
+    Usage:
+        R = construct_correlation([r.question_text for r in report.results])
+    """
+    similarity = (
+        CONSTRUCT_WEIGHT * _jaccard([question_constructs(t) for t in texts])
+        + SUBJECT_WEIGHT * _jaccard([_subject_words(t) for t in texts])
+    )
+    correlation = BASE_CORRELATION + (MAX_CORRELATION - BASE_CORRELATION) * similarity
+    np.fill_diagonal(correlation, 1.0)
+    return correlation
+
+
+def nearest_correlation(matrix: Union[np.ndarray, Sequence[Sequence[float]]]) -> np.ndarray:
+    """
+    A valid (positive definite) correlation matrix close to `matrix`.
+
+    Hand-specified matrices are often not positive semidefinite; negative
+    eigenvalues are clipped and the diagonal rescaled to 1. Raises
+    ValueError for matrices that are not square, symmetric correlations.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("correlation matrix must be square")
+    if not np.allclose(matrix, matrix.T):
+        raise ValueError("correlation matrix must be symmetric")
+    if not np.allclose(np.diagonal(matrix), 1.0) or (np.abs(matrix) > 1.0 + 1e-12).any():
+        raise ValueError("correlation matrix must have unit diagonal and entries in [-1, 1]")
+
+    values, vectors = np.linalg.eigh(matrix)
+    if values.min() >= _MIN_EIGENVALUE:
+        return matrix
+    repaired = (vectors * np.maximum(values, _MIN_EIGENVALUE)) @ vectors.T
+    scale = np.sqrt(np.diagonal(repaired))
+    repaired = repaired / scale[:, None] / scale[None, :]
+    np.fill_diagonal(repaired, 1.0)
+    return repaired
+
+
+# ═══════════════════════════════════════════════════════════════
+# MARGINALS
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class Marginal:
+    """
+    One question's answer distribution, as cut points on the latent
+    standard normal: answer k is drawn when cut[k-1] < z <= cut[k].
+    """
+    question_id: str
+    options: Tuple[str, ...]
+    cuts: np.ndarray
+
+    @classmethod
+    def from_distribution(cls, question_id: str, distribution: Dict[str, float]) -> "Marginal":
+        """
+        Options run low to high on the latent scale: numeric keys in
+        numeric order, other keys in the order listed.
+        """
+        options = list(distribution)
+        try:
+            options.sort(key=float)
+        except ValueError:
+            pass
+        weights = np.maximum(0.0, np.array([distribution[o] for o in options], dtype=float))
+        total = weights.sum()
+        if total <= 0:
+            raise ValueError(f"{question_id}: distribution has no mass")
+        cumulative = np.cumsum(weights[:-1]) / total
+        normal = NormalDist()
+        cuts = np.array([
+            normal.inv_cdf(min(max(c, 1e-12), 1 - 1e-12)) for c in cumulative.tolist()
+        ])
+        return cls(question_id, tuple(options), cuts)
+
+
+def marginals_from_report(report: Any) -> List[Marginal]:
+    """Marginals of every result in a SimulationReport."""
+    return [Marginal.from_distribution(r.question_id, r.distribution) for r in report.results]
+
+
+# ═══════════════════════════════════════════════════════════════
+# COPULA SAMPLER
+# ═══════════════════════════════════════════════════════════════
+
+CorrelationSpec = Union[str, np.ndarray, Sequence[Sequence[float]], None]
+
+
+class CopulaSampler:
+    """
+    Draws respondents whose answers keep each question's marginal
+    distribution while correlating across questions.
+
+    Usage:
+        sampler = CopulaSampler(report, correlation="construct", seed=7)
+        rows = sampler.respondents(500)               # generate_respondents() format
+        for codes in sampler.chunks(1_000_000):       # (rows, questions) option indices
+            ...
+        sampler.write_csv("respondents.csv", 1_000_000)
+
+    Each respondent is one draw from a multivariate normal with the given
+    correlation matrix; each coordinate is mapped to an answer through its
+    question's inverse CDF (cut points). `correlation` is a matrix over
+    the report's questions, "construct" to derive one from question text
+    (construct_correlation), or None for independent questions.
+    """
+
+    def __init__(
+        self,
+        report: Any,
+        correlation: CorrelationSpec = "construct",
+        seed: Optional[int] = None,
+        max_cells: int = MAX_SYNTHESIS_CELLS
+    ):
+        self.report = report
+        self.marginals = marginals_from_report(report)
+        self.seed = seed
+        n_questions = len(self.marginals)
+
+        if isinstance(correlation, str):
+            if correlation != "construct":
+                raise ValueError(f"unknown correlation: {correlation!r}")
+            correlation = construct_correlation([r.question_text for r in report.results])
+        elif correlation is None:
+            correlation = np.eye(n_questions)
+        self.correlation = nearest_correlation(correlation)
+        if self.correlation.shape[0] != n_questions:
+            raise ValueError(
+                f"correlation is {self.correlation.shape[0]}x{self.correlation.shape[0]} "
+                f"but the report has {n_questions} questions"
+            )
+        # Latent draws are float32: ample for sampling, half the memory
+        self._cholesky = np.linalg.cholesky(self.correlation).astype(np.float32)
+
+        # Cut points padded to a common width with +inf (never exceeded)
+        widest = max((len(m.options) for m in self.marginals), default=1)
+        self._cuts = np.full((n_questions, widest - 1), np.inf, dtype=np.float32)
+        for j, marginal in enumerate(self.marginals):
+            self._cuts[j, :len(marginal.cuts)] = marginal.cuts
+        self._dtype = np.uint8 if widest <= 256 else np.uint16
+        self.chunk_size = max(1, max_cells // max(1, n_questions))
+
+    @property
+    def question_ids(self) -> List[str]:
+        return [m.question_id for m in self.marginals]
+
+    def chunks(self, n: int) -> Iterator[np.ndarray]:
+        """
+        Option indices for n respondents, yielded as (rows, questions)
+        arrays of at most chunk_size rows. The same seed gives the same
+        respondents.
+        """
+        rng = np.random.default_rng(self.seed)
+        n_questions = len(self.marginals)
+        for start in range(0, n, self.chunk_size):
+            rows = min(self.chunk_size, n - start)
+            # Question-major, so each question's draws are contiguous
+            latent = self._cholesky @ rng.standard_normal((n_questions, rows), dtype=np.float32)
+            # Answer index = number of cut points below the draw
+            codes = np.zeros((n_questions, rows), dtype=self._dtype)
+            for k in range(self._cuts.shape[1]):
+                codes += latent > self._cuts[:, k:k + 1]
+            yield codes.T
+
+    def sample(self, n: int) -> np.ndarray:
+        """(n, questions) option indices; use chunks() to stream large n."""
+        if n <= 0:
+            return np.empty((0, len(self.marginals)), dtype=self._dtype)
+        return np.concatenate(list(self.chunks(n)))
+
+    def _labelled(self, n: int) -> Iterator[Tuple[int, List[List[str]]]]:
+        """(first respondent index, per-question answer labels) per chunk."""
+        options = [np.array(m.options, dtype=object) for m in self.marginals]
+        start = 0
+        for codes in self.chunks(n):
+            yield start, [opts[codes[:, j]].tolist() for j, opts in enumerate(options)]
+            start += codes.shape[0]
+
+    def respondents(self, n: int) -> List[Dict[str, Any]]:
+        """Respondent dicts in the CrowdwaveEngine.generate_respondents() format."""
+        config = self.report.config
+        ids = self.question_ids
+        rows = []
+        for start, columns in self._labelled(n):
+            for offset, answers in enumerate(zip(*columns)):
+                resp = {
+                    'respondent_id': start + offset + 1,
+                    'audience': config.audience,
+                    'geography': config.geography,
+                }
+                resp.update(zip(ids, answers))
+                rows.append(resp)
+        return rows
+
+    def write_csv(self, file: Union[str, IO[str]], n: int) -> int:
+        """
+        Stream n respondents to a CSV path or open text file, one chunk at
+        a time. Returns the number of rows written.
+        """
+        if isinstance(file, str):
+            with open(file, 'w', newline='', encoding='utf-8') as f:
+                return self.write_csv(f, n)
+
+        config = self.report.config
+        writer = csv.writer(file)
+        writer.writerow(['respondent_id', 'audience', 'geography'] + self.question_ids)
+        written = 0
+        for start, columns in self._labelled(n):
+            rows = len(columns[0]) if columns else 0
+            writer.writerows(
+                [start + i + 1, config.audience, config.geography, *answers]
+                for i, answers in enumerate(zip(*columns))
+            )
+            written += rows
+        return written
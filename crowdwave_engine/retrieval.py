@@ -0,0 +1,387 @@
+"""
+Crowdwave Calibration Retrieval
+A local TF-IDF index over descriptions of every calibrated distribution
+(the keyword cascade in CrowdwaveEngine._get_base_distribution and the
+calibration tables), so paraphrased questions still find their nearest
+calibrations instead of falling through to generic defaults.
+"""
+
+import ast
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+# Upper bound on (queries × documents) scores held in memory at once;
+# batched searches are chunked by query to stay under it
+MAX_SCORE_CELLS = 4_000_000
+
+# Share of the similarity carried by whole words vs character n-grams.
+# N-grams let "worry" meet "worried" and "vaccination" meet "vaccine".
+WORD_WEIGHT = 0.6
+CHAR_WEIGHT = 0.4
+CHAR_NGRAMS = (3, 4)
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+]*")
+_DATED = re.compile(r"^\d+$|^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\d{4}$")
+
+_STOPWORDS = frozenset({
+    "a", "about", "after", "all", "an", "and", "any", "are", "as", "at", "be",
+    "been", "being", "by", "can", "could", "do", "does", "for", "from", "has",
+    "have", "how", "i", "if", "in", "into", "is", "it", "its", "me", "more",
+    "much", "my", "of", "on", "or", "our", "over", "should", "so", "than",
+    "that", "the", "their", "them", "there", "these", "they", "this", "to",
+    "us", "very", "was", "we", "were", "what", "when", "which", "who", "will",
+    "with", "would", "you", "your",
+})
+
+
+def _tokens(text: str) -> List[str]:
+    return [
+        token for token in _TOKEN.findall(text.lower().replace("_", " "))
+        if token not in _STOPWORDS and not _DATED.match(token)
+    ]
+
+
+# ═══════════════════════════════════════════════════════════════
+# CALIBRATION DOCUMENTS
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class CalibrationDocument:
+    """
+    One calibrated distribution and the text it is retrieved by.
+
+    `id` is "crowdwave.py:<line>" for a cascade branch (the line of its
+    return statement) or "TABLE.key.path" for a calibration table entry.
+    `value` is the table entry, or the branch's distribution when it is a
+    literal (binary branches keyed "opt0"/"opt1"), else the source of its
+    return expression. `question_type` is None when any type applies.
+    """
+    id: str
+    text: str
+    question_type: Optional[str]
+    value: Any
+
+
+# Variables in _get_base_distribution holding question text; keyword
+# tests against option text ("yes" in opt0_lower) describe nothing
+_CASCADE_TEXT_NAMES = frozenset({"q_lower", "combined_context", "audience_lower"})
+
+
+def _test_keywords(test: ast.AST) -> List[str]:
+    """Keywords a condition looks for in question text."""
+    keywords: List[str] = []
+    for node in ast.walk(test):
+        if isinstance(node, ast.Compare) and len(node.ops) == 1:
+            target = node.comparators[0]
+            if (
+                isinstance(node.ops[0], ast.In) and isinstance(target, ast.Name)
+                and target.id in _CASCADE_TEXT_NAMES
+                and isinstance(node.left, ast.Constant) and isinstance(node.left.value, str)
+            ):
+                keywords.append(node.left.value)
+        elif isinstance(node, ast.GeneratorExp):
+            element = node.elt
+            if (
+                isinstance(element, ast.Compare) and isinstance(element.comparators[0], ast.Name)
+                and element.comparators[0].id in _CASCADE_TEXT_NAMES
+                and isinstance(node.generators[0].iter, (ast.List, ast.Tuple))
+            ):
+                keywords.extend(
+                    item.value for item in node.generators[0].iter.elts
+                    if isinstance(item, ast.Constant) and isinstance(item.value, str)
+                )
+    return keywords
+
+
+def _return_value(node: ast.expr) -> Any:
+    if isinstance(node, ast.Dict) and all(
+        isinstance(key, (ast.Constant, ast.Name)) for key in node.keys
+    ) and all(isinstance(value, ast.Constant) for value in node.values):
+        return {
+            key.value if isinstance(key, ast.Constant) else key.id: float(value.value)
+            for key, value in zip(node.keys, node.values)
+        }
+    return ast.unparse(node)
+
+
+def cascade_documents() -> List[CalibrationDocument]:
+    """
+    A document for every branch of the keyword cascade in
+    CrowdwaveEngine._get_base_distribution that returns a distribution,
+    described by the comments above it and the keywords its conditions
+    test. Branches whose conditions test no question text (fallbacks)
+    are left out.
+    """
+    from .cascade import base_distribution_cascade
+
+    cascade = base_distribution_cascade()
+    documents = []
+    for branch in cascade.returns:
+        statement = branch.statement
+        if statement.value is None:
+            continue
+        keywords = [word for condition in branch.conditions for word in _test_keywords(condition.test)]
+        if not keywords:
+            continue
+        comments = [line for condition in branch.conditions for line in cascade.comments_above(condition)]
+        comments += cascade.comments_above(statement)
+        comments.append(cascade.trailing_comment(statement))
+        documents.append(CalibrationDocument(
+            id=f"crowdwave.py:{branch.line}",
+            text=" ".join(comments + keywords),
+            question_type=branch.question_type,
+            value=_return_value(statement.value),
+        ))
+    return documents
+
+
+# Tables of multipliers, vocabularies and metadata rather than distributions
+_EXCLUDED_TABLE_SUFFIXES = ("_MULTIPLIERS", "_KEYWORDS", "_PATTERNS", "_RULES", "_CORRECTIONS")
+_EXCLUDED_TABLES = frozenset({"ACCURACY_BY_QUESTION_TYPE", "PARTISAN_TOPICS"})
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _table_entries(path: Tuple[str, ...], value: Any) -> Iterable[Tuple[Tuple[str, ...], Any, str]]:
+    """(key path, entry, extra description) for each calibrated entry under value."""
+    if _is_number(value) or (
+        isinstance(value, (tuple, list)) and value and all(_is_number(v) for v in value)
+    ):
+        yield path, value, ""
+    elif is_dataclass(value):
+        yield path, value, str(getattr(value, "construct", ""))
+    elif isinstance(value, Mapping):
+        if "distribution" in value or (value and all(_is_number(v) for v in value.values())):
+            yield path, value, " ".join(str(key) for key in value)
+            return
+        for key, entry in value.items():
+            yield from _table_entries(path + (str(key),), entry)
+
+
+def table_documents(tables: Mapping[str, Any]) -> List[CalibrationDocument]:
+    """A document for every calibrated entry of the calibration tables."""
+    documents = []
+    for name, table in tables.items():
+        if (
+            name in _EXCLUDED_TABLES or name.endswith(_EXCLUDED_TABLE_SUFFIXES)
+            or not isinstance(table, Mapping)
+        ):
+            continue
+        for path, value, extra in _table_entries((), table):
+            if not path:
+                continue
+            documents.append(CalibrationDocument(
+                id=".".join((name,) + path),
+                text=" ".join((name,) + path + (extra,)),
+                question_type=None,
+                value=value,
+            ))
+    return documents
+
+
+def calibration_documents(tables: Optional[Mapping[str, Any]] = None) -> List[CalibrationDocument]:
+    """Cascade branches plus table entries (the built-in tables by default)."""
+    if tables is None:
+        from .calibration_snapshot import collect_tables
+        tables = collect_tables()
+    return cascade_documents() + table_documents(tables)
+
+
+# ═══════════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class RetrievalHit:
+    """A retrieved calibration and its cosine similarity to the query (0-1)."""
+    document: CalibrationDocument
+    score: float
+
+
+def _features(text: str) -> Tuple[Counter, Counter]:
+    words = _tokens(text)
+    grams: List[str] = []
+    for word in words:
+        padded = f" {word} "
+        for n in CHAR_NGRAMS:
+            grams += [padded[i:i + n] for i in range(len(padded) - n + 1)]
+    return Counter(words), Counter(grams)
+
+
+class CalibrationIndex:
+    """
+    Top-k calibrations for question text, by TF-IDF cosine similarity
+    over word and character n-gram features.
+
+    Usage:
+        index = builtin_index()
+        for hit in index.search("How worried are you about losing your job to AI?", k=3):
+            print(hit.document.id, round(hit.score, 2))
+        index.search_many([q.text for q in questions], k=5, question_type="scale")
+
+    Documents are held as an inverted index (one posting list per
+    feature); a query only touches the postings of its own features, so
+    a search costs well under a millisecond and a batch of queries is
+    scored in one vectorized pass.
+    """
+
+    def __init__(self, documents: Sequence[CalibrationDocument]):
+        self.documents = list(documents)
+        n_docs = len(self.documents)
+        features = [_features(document.text) for document in self.documents]
+
+        # Per block (words, n-grams): feature -> (column, idf)
+        document_frequency: Tuple[Counter, Counter] = (Counter(), Counter())
+        for counts in features:
+            for frequency, counter in zip(document_frequency, counts):
+                frequency.update(counter.keys())
+        self._vocab: Tuple[Dict[str, Tuple[int, float]], ...] = ({}, {})
+        n_features = 0
+        for vocab, frequency in zip(self._vocab, document_frequency):
+            for feature in sorted(frequency):
+                idf = math.log((1 + n_docs) / (1 + frequency[feature])) + 1
+                vocab[feature] = (n_features, idf)
+                n_features += 1
+
+        rows: List[int] = []
+        columns: List[int] = []
+        weights: List[float] = []
+        for row, counts in enumerate(features):
+            for column, weight in self._weights(counts):
+                rows.append(row)
+                columns.append(column)
+                weights.append(weight)
+
+        # Postings sorted by feature: documents of feature f are
+        # _postings_doc[_postings_ptr[f]:_postings_ptr[f + 1]]
+        order = np.argsort(np.asarray(columns, dtype=np.int64), kind="stable")
+        self._postings_doc = np.asarray(rows, dtype=np.int64)[order]
+        self._postings_weight = np.asarray(weights)[order]
+        self._postings_ptr = np.zeros(n_features + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(np.asarray(columns, dtype=np.int64), minlength=n_features),
+            out=self._postings_ptr[1:],
+        )
+
+        self._type_masks: Dict[Optional[str], Optional[np.ndarray]] = {}
+        types = np.array([document.question_type or "" for document in self.documents], dtype=object)
+        untyped = types == ""
+        self._type_masks[None] = None
+        for question_type in set(types.tolist()) - {""}:
+            self._type_masks[question_type] = (types == question_type) | untyped
+        self._untyped = untyped
+
+    @classmethod
+    def build(cls, tables: Optional[Mapping[str, Any]] = None) -> "CalibrationIndex":
+        """Index over calibration_documents(tables)."""
+        return cls(calibration_documents(tables))
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _weights(self, counts: Tuple[Counter, Counter]) -> List[Tuple[int, float]]:
+        """(column, weight) pairs: sublinear TF-IDF, each block L2-normalized to its share."""
+        weighted = []
+        for counter, vocab, share in zip(counts, self._vocab, (WORD_WEIGHT, CHAR_WEIGHT)):
+            entries = []
+            for feature, count in counter.items():
+                known = vocab.get(feature)
+                if known is not None:
+                    entries.append((known[0], (1 + math.log(count)) * known[1]))
+            norm = math.sqrt(sum(weight * weight for _, weight in entries))
+            if norm:
+                scale = math.sqrt(share) / norm
+                weighted.extend((column, weight * scale) for column, weight in entries)
+        return weighted
+
+    def scores(self, queries: Sequence[str]) -> np.ndarray:
+        """(queries, documents) cosine similarities."""
+        query_rows: List[int] = []
+        query_columns: List[int] = []
+        query_weights: List[float] = []
+        for row, text in enumerate(queries):
+            for column, weight in self._weights(_features(text)):
+                query_rows.append(row)
+                query_columns.append(column)
+                query_weights.append(weight)
+
+        n_docs = len(self.documents)
+        columns = np.asarray(query_columns, dtype=np.int64)
+        starts = self._postings_ptr[columns]
+        lengths = self._postings_ptr[columns + 1] - starts
+        # Positions of every posting of every query feature, in one array
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+        cells = np.repeat(np.asarray(query_rows, dtype=np.int64), lengths) * n_docs
+        cells += self._postings_doc[positions]
+        contributions = self._postings_weight[positions] * np.repeat(query_weights, lengths)
+        return np.bincount(cells, contributions, minlength=len(queries) * n_docs).reshape(
+            len(queries), n_docs
+        )
+
+    def search(self, query: str, k: int = 5, question_type: Optional[str] = None) -> List[RetrievalHit]:
+        """The k calibrations most similar to query (fewer if fewer match at all)."""
+        return self.search_many([query], k, question_type)[0]
+
+    def search_many(
+        self,
+        queries: Sequence[str],
+        k: int = 5,
+        question_type: Union[str, Sequence[Optional[str]], None] = None
+    ) -> List[List[RetrievalHit]]:
+        """
+        search() for a batch of queries, e.g. every question in a survey.
+        `question_type` restricts cascade branches to that type ("scale",
+        "binary", ...) for all queries, or per query when a sequence.
+        """
+        if question_type is None or isinstance(question_type, str):
+            question_type = [question_type] * len(queries)
+        if len(question_type) != len(queries):
+            raise ValueError("question_type must have one entry per query")
+
+        n_docs = len(self.documents)
+        k = min(k, n_docs)
+        chunk = max(1, MAX_SCORE_CELLS // max(1, n_docs))
+        results: List[List[RetrievalHit]] = []
+        for start in range(0, len(queries), chunk):
+            scores = self.scores(queries[start:start + chunk])
+            for row, required in enumerate(question_type[start:start + chunk]):
+                mask = self._type_masks.get(required, self._untyped)
+                if mask is not None:
+                    scores[row, ~mask] = 0.0
+            if k <= 0:
+                results.extend([] for _ in range(scores.shape[0]))
+                continue
+            rows = np.arange(scores.shape[0])[:, None]
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top = top[rows, np.argsort(-scores[rows, top], axis=1, kind="stable")]
+            top_scores = scores[rows, top]
+            for documents, row_scores in zip(top.tolist(), top_scores.tolist()):
+                results.append([
+                    RetrievalHit(self.documents[document], score)
+                    for document, score in zip(documents, row_scores) if score > 0
+                ])
+        return results
+
+    def search_questions(self, questions: Sequence[Any], topic: str = "", k: int = 5) -> List[List[RetrievalHit]]:
+        """search_many() over Question objects, with the survey topic as added context."""
+        suffix = f" {topic}" if topic else ""
+        return self.search_many(
+            [question.text + suffix for question in questions], k,
+            [question.type for question in questions],
+        )
+
+
+@lru_cache(maxsize=None)
+def builtin_index() -> CalibrationIndex:
+    """Index over the cascade and the calibration tables shipped with the package."""
+    return CalibrationIndex.build()
@@ -0,0 +1,295 @@
+"""
+Crowdwave Scenario Sweeps
+Simulate one questionnaire over a grid of scenarios (every generation ×
+party × topic × with/without stimuli, say) and return the results as
+dense arrays with labeled axes.
+
+Usage:
+    result = sweep(
+        questions,
+        {
+            "generation": ["Gen Z", "Millennials", "Gen X", "Boomers"],
+            "party": ["Democrats", "Republicans", "Independents"],
+            "topic": ["immigration", "climate policy"],
+            "stimuli": [[], ["Ad: ..."]],
+        },
+        {"audience": "US adults", "sample_size": 1000},
+    )
+    result.distributions.shape                  # 4 × 3 × 2 × 2 × questions × options
+    result.sel("means", party="Democrats")      # 4 × 2 × 2 × questions
+    result.report(generation="Gen Z", party="Democrats", topic="immigration", stimuli=[])
+
+Each phase of the pipeline runs once per distinct value of the inputs it
+reads, not once per grid point: bias detection per audience, priors,
+base distributions and coverage flags per audience × topic, and the
+ensemble per distinct base distribution × stimuli presence. Scenarios
+differing only in values the simulation never reads (geography, sample
+size, screeners, stimulus wording) share one simulation.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .bias_corrections import BiasDetection, detect_biases
+from .crowdwave import CompiledSurvey, CrowdwaveEngine, SimulationReport, SurveyConfig
+from .features import QuestionFeatures
+
+
+# Axes that set a config key; any other axis qualifies the audience
+CONFIG_AXES = ("audience", "topic", "stimuli", "geography", "sample_size", "screeners")
+
+
+# ═══════════════════════════════════════════════════════════════
+# RESULTS
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class SweepResult:
+    """
+    A questionnaire simulated at every point of a scenario grid.
+
+    Arrays are indexed by the grid axes in `axes` order, then question,
+    then option: `distributions` is grid × questions × options, with
+    question j's columns ordered as `options[j]` (0 where a scenario never
+    produced that option, NaN past the question's last option); `means`,
+    `sds` and `confidences` are grid × questions, NaN where None.
+    `reports` holds each grid point's SimulationReport; points sharing a
+    simulation share result objects.
+    """
+    axes: Dict[str, List[Any]]
+    question_ids: List[str]
+    options: List[List[str]]
+    distributions: np.ndarray
+    means: np.ndarray
+    sds: np.ndarray
+    confidences: np.ndarray
+    reports: np.ndarray = field(repr=False)
+    simulations: int = 0
+
+    @property
+    def dims(self) -> Tuple[str, ...]:
+        """Dimension names of `distributions`."""
+        return (*self.axes, "question", "option")
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the scenario grid."""
+        return tuple(len(labels) for labels in self.axes.values())
+
+    def index(self, **labels: Any) -> Tuple[Any, ...]:
+        """
+        Array index selecting the given axis labels (and optionally a
+        `question` id); unnamed axes are kept whole.
+        """
+        unknown = set(labels) - set(self.axes) - {"question"}
+        if unknown:
+            raise KeyError(f"Unknown sweep axes: {sorted(unknown)}")
+        index = []
+        for name, axis_labels in self.axes.items():
+            if name in labels:
+                index.append(axis_labels.index(labels[name]))
+            else:
+                index.append(slice(None))
+        if "question" in labels:
+            index.append(self.question_ids.index(labels["question"]))
+        return tuple(index)
+
+    def sel(self, array: str = "distributions", **labels: Any) -> np.ndarray:
+        """
+        One of "distributions", "means", "sds" or "confidences" at the
+        given labels, e.g. sel("means", party="Democrats", topic="climate").
+        """
+        return getattr(self, array)[self.index(**labels)]
+
+    def report(self, **labels: Any) -> SimulationReport:
+        """The report at one grid point; every axis must be named."""
+        missing = set(self.axes) - set(labels)
+        if missing:
+            raise KeyError(f"report() needs a label for every axis; missing {sorted(missing)}")
+        return self.reports[self.index(**labels)]
+
+
+# ═══════════════════════════════════════════════════════════════
+# SWEEP
+# ═══════════════════════════════════════════════════════════════
+
+def _stimuli(value: Any) -> List[str]:
+    """A stimuli axis value: a list of stimuli, one stimulus, or None/empty for none."""
+    if isinstance(value, str):
+        return [value] if value else []
+    return list(value or [])
+
+
+def _point_config(config: Dict[str, Any], names: Sequence[str], values: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Config for one grid point. Config axes set their key; other axes'
+    values are prefixed to the audience, in axis order.
+    """
+    merged = dict(config)
+    qualifiers = []
+    for name, value in zip(names, values):
+        if name == "stimuli":
+            merged["stimuli"] = _stimuli(value)
+        elif name in CONFIG_AXES:
+            merged[name] = value
+        else:
+            qualifiers.append(str(value))
+    if qualifiers:
+        merged["audience"] = " ".join(qualifiers + [merged.get("audience", "General population")])
+    return merged
+
+
+class _SharedPhases:
+    """
+    Phase outputs shared between scenarios, each keyed by the config
+    values its phase reads.
+    """
+
+    def __init__(self, compiled: CompiledSurvey, bundle: Any):
+        self.engine = compiled.engine
+        self.questions = compiled.questions
+        self.texts = compiled.texts
+        self.bundle = bundle
+        # audience -> per-question bias detections
+        self.biases: Dict[str, List[List[BiasDetection]]] = {}
+        # (audience, topic) -> (features, priors, base distributions, coverage flags)
+        self.contexts: Dict[Tuple[str, str], Tuple] = {}
+        # (base distribution items, stimuli present) -> reconciled ensemble
+        self.ensembles: Dict[Tuple, Tuple] = {}
+
+    def context(self, config: SurveyConfig) -> Tuple:
+        key = (config.audience, config.topic)
+        if key not in self.contexts:
+            engine = self.engine
+            tables = self.bundle.tables
+            features = QuestionFeatures.combine(self.texts, config.topic, config.audience)
+            priors = engine._establish_priors(config, self.questions, tables, features)
+            # Rule tracing records the matched rule as the base is
+            # selected, so leave selection to each question when profiling
+            if engine.profiler and engine.profiler.trace_rules:
+                bases = [None] * len(self.questions)
+            else:
+                bases = [
+                    engine._get_base_distribution(
+                        question, priors, config.topic, config.audience, tables, question_features
+                    )
+                    for question, question_features in zip(self.questions, features)
+                ]
+            flags = engine._check_calibration_coverage(config, self.questions, features)
+            self.contexts[key] = (features, priors, bases, flags)
+        return self.contexts[key]
+
+    def audience_biases(self, audience: str, features: List[QuestionFeatures]) -> List[List[BiasDetection]]:
+        if audience not in self.biases:
+            self.biases[audience] = [
+                detect_biases(question.text, audience, question.type, question_features.audience_hits)
+                for question, question_features in zip(self.questions, features)
+            ]
+        return self.biases[audience]
+
+    def simulate(self, config: SurveyConfig) -> SimulationReport:
+        engine = self.engine
+        features, priors, bases, flags = self.context(config)
+        biases = self.audience_biases(config.audience, features)
+        results = [
+            engine._simulate_question(
+                config, question, priors, self.bundle.tables, question_features,
+                question_biases, base, self.ensembles
+            )
+            for question, question_features, question_biases, base in zip(
+                self.questions, features, biases, bases
+            )
+        ]
+        return engine._survey_report(config, results, priors, list(flags), self.bundle)
+
+
+def _stack(reports: List[SimulationReport], question_count: int):
+    """(options, distributions, means, sds, confidences) arrays over distinct reports."""
+    options = []
+    for j in range(question_count):
+        seen: Dict[str, None] = {}
+        for report in reports:
+            seen.update(dict.fromkeys(report.results[j].distribution))
+        options.append(list(seen))
+    width = max((len(question_options) for question_options in options), default=0)
+
+    distributions = np.full((len(reports), question_count, width), np.nan)
+    values = {name: np.full((len(reports), question_count), np.nan) for name in ("mean", "sd", "confidence")}
+    for u, report in enumerate(reports):
+        for j, result in enumerate(report.results):
+            distributions[u, j, :len(options[j])] = [result.distribution.get(o, 0.0) for o in options[j]]
+            for name, array in values.items():
+                value = getattr(result, name)
+                if value is not None:
+                    array[u, j] = value
+    return options, distributions, values["mean"], values["sd"], values["confidence"]
+
+
+def sweep(
+    questions: List[Dict[str, Any]],
+    axes: Dict[str, Sequence[Any]],
+    config: Optional[Dict[str, Any]] = None,
+    engine: Optional[CrowdwaveEngine] = None,
+) -> SweepResult:
+    """
+    Simulate a questionnaire at every point of a scenario grid.
+
+    Args:
+        questions: List of question dicts
+        axes: Axis name -> values, in array-dimension order. "audience",
+            "topic", "geography", "sample_size" and "screeners" set that
+            config key; "stimuli" values are lists of stimuli (or one
+            stimulus, or None/[] for none); any other axis (generation,
+            party, region, ...) is an audience qualifier, its value
+            prefixed to the audience
+        config: Survey configuration shared by every scenario
+        engine: Engine to simulate with (default: a new CrowdwaveEngine)
+
+    Each grid point's report is identical to engine.simulate() for that
+    point's config, with phases shared between points as described in
+    the module docstring.
+    """
+    if not axes:
+        raise ValueError("sweep needs at least one axis")
+    names = list(axes)
+    labels = [list(values) for values in axes.values()]
+    for name, axis_labels in zip(names, labels):
+        if name in ("question", "option"):
+            raise ValueError(f"{name!r} is reserved for the result dimensions")
+        if not axis_labels:
+            raise ValueError(f"Sweep axis {name!r} has no values")
+
+    engine = engine or CrowdwaveEngine()
+    compiled = engine.compile(questions, config)
+    shared = _SharedPhases(compiled, engine.calibration.current())
+
+    shape = tuple(len(axis_labels) for axis_labels in labels)
+    simulated: Dict[Tuple[str, str, bool], int] = {}
+    unique: List[SimulationReport] = []
+    index = np.empty(shape, dtype=np.intp)
+    reports = np.empty(shape, dtype=object)
+    for point in np.ndindex(*shape):
+        values = [axis_labels[i] for axis_labels, i in zip(labels, point)]
+        survey_config = engine._parse_config(_point_config(compiled.config, names, values))
+        key = (survey_config.audience, survey_config.topic, bool(survey_config.stimuli))
+        if key not in simulated:
+            simulated[key] = len(unique)
+            unique.append(shared.simulate(survey_config))
+        index[point] = simulated[key]
+        report = unique[index[point]]
+        reports[point] = report if report.config == survey_config else replace(report, config=survey_config)
+
+    options, distributions, means, sds, confidences = _stack(unique, len(compiled))
+    return SweepResult(
+        axes=dict(zip(names, labels)),
+        question_ids=[question.id for question in compiled.questions],
+        options=options,
+        distributions=distributions[index],
+        means=means[index],
+        sds=sds[index],
+        confidences=confidences[index],
+        reports=reports,
+        simulations=len(unique),
+    )
@@ -0,0 +1,301 @@
+"""
+Crowdwave Telemetry
+Prometheus-style operational metrics for the API server and LLM clients.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Latency buckets in seconds, from sub-millisecond simulations to slow LLM calls.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+class _Shards:
+    """
+    Per-thread value storage.
+
+    Each thread only ever writes to its own dict, so updates need no lock;
+    readers take a snapshot of every thread's dict and merge.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: List[Dict] = []
+
+    def mine(self) -> Dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            with self._lock:
+                self._all.append(shard)
+        return shard
+
+    def snapshot(self) -> List[Dict]:
+        with self._lock:
+            shards = list(self._all)
+        return [dict(shard) for shard in shards]
+
+    def clear(self):
+        with self._lock:
+            for shard in self._all:
+                shard.clear()
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._shards = _Shards()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _format_labels(self, key: Tuple[str, ...], extra: str = "") -> str:
+        parts = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def reset(self):
+        self._shards.clear()
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        shard = self._shards.mine()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        merged: Dict[Tuple[str, ...], float] = {}
+        for shard in self._shards.snapshot():
+            for key, value in shard.items():
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{self._format_labels(key)} {_number(value)}"
+            for key, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """
+    Gauge tracked as per-thread deltas (inc/dec), or sampled from a
+    callback at scrape time.
+    """
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labelnames)
+        self.callback = callback
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        if self.callback is not None:
+            return {(): float(self.callback())}
+        return super().values()
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        shard = self._shards.mine()
+        key = self._key(labels)
+        state = shard.get(key)
+        if state is None:
+            # [per-bucket counts..., +Inf count, sum]
+            state = [0] * (len(self.buckets) + 1) + [0.0]
+            shard[key] = state
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        else:
+            state[len(self.buckets)] += 1
+        state[-1] += value
+
+    def render(self) -> List[str]:
+        merged: Dict[Tuple[str, ...], List[float]] = {}
+        for shard in self._shards.snapshot():
+            for key, state in shard.items():
+                total = merged.setdefault(key, [0] * len(state))
+                for i, value in enumerate(list(state)):
+                    total[i] += value
+
+        lines = []
+        for key, state in sorted(merged.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = self._format_labels(key, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += state[len(self.buckets)]
+            inf = self._format_labels(key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_number(state[-1])}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    A set of metrics rendered together in the Prometheus text format.
+
+    Collectors registered with add_collector() are called at scrape time
+    and return already-formatted lines (used for derived values such as
+    cache hit ratios and profiler phase timings).
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = (),
+              callback: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(name, help, labelnames, callback))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], List[str]]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+# ═══════════════════════════════════════════════════════════════
+# SHARED METRICS
+# ═══════════════════════════════════════════════════════════════
+
+REGISTRY = MetricsRegistry()
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "crowdwave_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss).",
+    ("cache", "result"),
+)
+
+LLM_LATENCY = REGISTRY.histogram(
+    "crowdwave_llm_request_duration_seconds",
+    "LLM completion latency.",
+    ("provider",),
+)
+
+LLM_TOKENS = REGISTRY.counter(
+    "crowdwave_llm_tokens_total",
+    "LLM tokens consumed by provider and direction (input/output).",
+    ("provider", "direction"),
+)
+
+LLM_ERRORS = REGISTRY.counter(
+    "crowdwave_llm_errors_total",
+    "Failed LLM completions.",
+    ("provider",),
+)
+
+
+def record_cache(cache: str, hit: bool):
+    """Count one lookup against a named cache (e.g. "result", "question", "llm")."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def _cache_hit_ratios() -> List[str]:
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), count in CACHE_REQUESTS.values().items():
+        entry = totals.setdefault(cache, [0.0, 0.0])
+        entry[0 if result == "hit" else 1] += count
+
+    lines = [
+        "# HELP crowdwave_cache_hit_ratio Fraction of cache lookups that hit.",
+        "# TYPE crowdwave_cache_hit_ratio gauge",
+    ]
+    for cache, (hits, misses) in sorted(totals.items()):
+        if hits + misses:
+            lines.append(f'crowdwave_cache_hit_ratio{{cache="{_escape(cache)}"}} {_number(hits / (hits + misses))}')
+    return lines
+
+
+REGISTRY.add_collector(_cache_hit_ratios)
+
+
+def profiler_collector(profiler) -> Callable[[], List[str]]:
+    """Expose a SimulationProfiler's per-phase totals as counters."""
+
+    def collect() -> List[str]:
+        phases = profiler.snapshot()["phases"]
+        lines = [
+            "# HELP crowdwave_simulation_phase_seconds_total Time spent per simulation phase.",
+            "# TYPE crowdwave_simulation_phase_seconds_total counter",
+        ]
+        lines.extend(
+            f'crowdwave_simulation_phase_seconds_total{{phase="{phase}"}} {_number(stats["total_ms"] / 1000)}'
+            for phase, stats in phases.items()
+        )
+        lines.extend([
+            "# HELP crowdwave_simulation_phase_calls_total Executions per simulation phase.",
+            "# TYPE crowdwave_simulation_phase_calls_total counter",
+        ])
+        lines.extend(
+            f'crowdwave_simulation_phase_calls_total{{phase="{phase}"}} {stats["calls"]}'
+            for phase, stats in phases.items()
+        )
+        return lines
+
+    return collect
@@ -98,6 +98,23 @@ class TestBatchProcessor(unittest.TestCase):
         self.assertEqual(summary["successful"], 2)
         self.assertEqual(summary["failed"], 0)
         self.assertEqual(summary["success_rate"], 1.0)
+        self.assertNotIn("profile", summary)
+    
+    def test_summary_with_profile(self):
+        """Profiling should aggregate phase timings across parallel jobs."""
+        processor = BatchProcessor(max_workers=2, profile=True)
+        for i in range(3):
+            processor.add_job(
+                job_id=f"test_{i}",
+                config={"audience": "US consumers"},
+                questions=[{"id": "Q1", "text": "Test?", "type": "scale", "scale": [1, 5]}]
+            )
+        
+        summary = processor.summary(processor.run())
+        phases = summary["profile"]["phases"]
+        self.assertEqual(phases["parse"]["calls"], 3)
+        self.assertEqual(phases["confidence"]["calls"], 3)
+        self.assertEqual(sum(summary["profile"]["rule_families"].values()), 3)
     
     def test_export_csv(self):
         """Should export to CSV correctly."""
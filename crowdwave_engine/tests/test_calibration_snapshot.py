@@ -0,0 +1,479 @@
+"""
+Calibration Snapshot Tests
+Tests the compiled keyword matcher and trigger scanner, indexed
+calibration queries, calibration retrieval, memory-mapped calibration
+snapshots and the hot-reloadable calibration registry.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from crowdwave_engine import CrowdwaveEngine, Question
+from crowdwave_engine.api import FASTAPI_AVAILABLE
+from crowdwave_engine.benchmarks_executive import detect_executive_context
+from crowdwave_engine.calibration import (
+    AccuracyZone,
+    Benchmark,
+    get_nps_benchmark,
+    requires_partisan_segmentation,
+)
+from crowdwave_engine.calibration_current import get_current_calibration
+from crowdwave_engine.calibration_queries import CalibrationQueries, SubstringIndex
+from crowdwave_engine.calibration_registry import CalibrationRegistry
+from crowdwave_engine.calibration_snapshot import (
+    _HEADER,
+    CalibrationSnapshot,
+    SnapshotError,
+    build_snapshot,
+    collect_tables,
+)
+from crowdwave_engine.matching import KeywordMatcher, TriggerScanner
+from crowdwave_engine.retrieval import builtin_index, cascade_documents
+from crowdwave_engine.telemetry import CACHE_REQUESTS
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test that the compiled matcher agrees with `kw in text`."""
+
+    RULES = [
+        ["ai ", "automation"],
+        ["ai", "aim"],
+        ["ice", "nice", "police"],
+        ["health", "public health"],
+        [],
+        ["police", "x"],
+    ]
+
+    def test_matches_naive_cascade(self):
+        matcher = KeywordMatcher(self.RULES)
+        words = ["ai ", "aim", "nice", "police", "public health", "x", "ai", "automation"]
+        rng = random.Random(7)
+        for _ in range(2000):
+            text = "".join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+            expected = {
+                i for i, keywords in enumerate(self.RULES)
+                if any(kw in text for kw in keywords)
+            }
+            self.assertEqual(matcher.matches(text), expected, text)
+            self.assertEqual(matcher.first(text), min(expected) if expected else None, text)
+
+    def test_spec_round_trip(self):
+        matcher = KeywordMatcher(self.RULES)
+        restored = KeywordMatcher.from_spec(matcher.to_spec())
+        for text in ["aim high", "nice ai here", "public health", "nothing"]:
+            self.assertEqual(restored.matches(text), matcher.matches(text))
+
+
+class TestTriggerScanner(unittest.TestCase):
+    """Test named vocabularies scanned together and cached by text."""
+
+    def setUp(self):
+        self.scanner = TriggerScanner(cache_size=2, cache_name="test_triggers")
+        self.health = self.scanner.add("health", ["medical", "health", "treatment"])
+        self.concern = self.scanner.add("concern", ["worry", "concern"])
+        self.roles = self.scanner.add_all("role", {"exec": ["ceo", "cfo"], "staff": ["employee"]})
+
+    def _lookups(self, result: str) -> float:
+        return CACHE_REQUESTS.values().get(("test_triggers", result), 0.0)
+
+    def test_hits_in_vocabulary_order(self):
+        hits = self.scanner.scan("treatment and health concern for the cfo")
+        self.assertEqual(hits.hits(self.health), ["health", "treatment"])
+        self.assertTrue(hits.any(self.concern))
+        self.assertEqual(self.roles, ["role.exec", "role.staff"])
+        self.assertEqual(hits.first(self.roles), "role.exec")
+        self.assertIsNone(self.scanner.scan("nothing here").first(self.roles))
+
+    def test_cache_hits_recorded(self):
+        before_hits, before_misses = self._lookups("hit"), self._lookups("miss")
+        first = self.scanner.scan("health worry")
+        self.assertIs(self.scanner.scan("health worry"), first)
+        self.assertEqual(self._lookups("hit") - before_hits, 1)
+        self.assertEqual(self._lookups("miss") - before_misses, 1)
+
+        # Bounded: oldest entries are evicted
+        self.scanner.scan("a")
+        self.scanner.scan("b")
+        self.assertIsNot(self.scanner.scan("health worry"), first)
+
+    def test_add_invalidates(self):
+        self.scanner.scan("ceo")
+        self.scanner.add("role.exec", ["chief"])
+        self.assertFalse(self.scanner.scan("ceo").any("role.exec"))
+
+    def test_scan_joined_matches_scan(self):
+        """Keywords spanning the seam are found as in a scan of the joined text."""
+        self.scanner.add("phrase", ["health worry", "ceo employee", "t a"])
+        scanner = TriggerScanner(cache_size=64)
+        for name, keywords in self.scanner._vocabularies.items():
+            scanner.add(name, keywords)
+        rng = random.Random(11)
+        pieces = ["health", "worry", "ceo", "employee", "treatment", "medical", "t", "a", "", " "]
+        for _ in range(500):
+            left = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 3)))
+            right = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 3)))
+            self.assertEqual(
+                scanner.scan_joined(left, right).found,
+                self.scanner.scan(left + " " + right).found,
+                (left, right),
+            )
+
+
+
+class TestCalibrationQueries(unittest.TestCase):
+    """Test indexed calibration lookups against the original scans."""
+    
+    def test_substring_index_matches_naive_scan(self):
+        keys = ["women_60_plus", "women", "adults_50_plus", "gen_z", "z"]
+        index = SubstringIndex(keys)
+        rng = random.Random(3)
+        pieces = ["women", "_60", "_plus", "adults", "gen_z", "z", "x", "", "50"]
+        for _ in range(2000):
+            query = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 3)))
+            expected = next((i for i, key in enumerate(keys) if key in query or query in key), None)
+            self.assertEqual(index.first(query), expected, query)
+    
+    def test_wrappers(self):
+        self.assertEqual(get_nps_benchmark("Software", b2b=True), 29)
+        self.assertEqual(get_nps_benchmark("unknown industry"), 49)
+        self.assertTrue(requires_partisan_segmentation("Climate policy"))
+        # PARTISAN_TOPICS' "note" entry used to crash the scan
+        self.assertFalse(requires_partisan_segmentation("a note about gardening"))
+        context = detect_executive_context("CFO panel", "cyber security and AI")
+        self.assertEqual(context["role"], "CFO")
+        self.assertEqual(context["matched_topics"], ["cyberattacks", "cyberattacks", "ai_impact"])
+    
+    def test_memoized_copies(self):
+        queries = CalibrationQueries(collect_tables())
+        first = queries.current_calibration("ICE raids")
+        first["confidence"] = "mutated"
+        second = queries.current_calibration("ICE raids")
+        self.assertEqual(second, get_current_calibration("ICE raids"))
+        self.assertIs(second["data"], first["data"])  # served from the memo
+    
+    @unittest.skipUnless(FASTAPI_AVAILABLE, "FastAPI not installed")
+    def test_benchmark_endpoint_uses_matched_industry(self):
+        from fastapi.testclient import TestClient
+        from crowdwave_engine.api import create_app
+        
+        client = TestClient(create_app(calibration=CalibrationRegistry()))
+        body = client.post("/benchmark", json={"industry": "Digital Marketplaces B2B", "b2b": True}).json()
+        self.assertEqual(body["nps_benchmark"], 39)
+        self.assertEqual(body["industry_data"]["b2b"], 39)
+
+
+class TestCalibrationRetrieval(unittest.TestCase):
+    """Test the TF-IDF index over cascade branches and calibration tables."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = builtin_index()
+        cls.documents = {document.id: document for document in cls.index.documents}
+
+    def test_cascade_branches_described(self):
+        pets = [d for d in cascade_documents() if d.text.startswith("Pet ownership (2025) 68% own a pet")]
+        self.assertEqual(len(pets), 1)
+        self.assertEqual(pets[0].question_type, "binary")
+        self.assertEqual(pets[0].value, {"opt0": 68.0, "opt1": 32.0})
+        self.assertIn("dog", pets[0].text)
+        self.assertNotIn("yes", pets[0].text.split())  # option tests are not descriptions
+
+    def test_table_entries_indexed(self):
+        self.assertEqual(self.documents["AI_JOB_CONCERNS_2026.worried_about_ai_job_loss"].value, 0.51)
+        self.assertIn("MENTAL_HEALTH_BENCHMARKS.importance_distributions.effectiveness", self.documents)
+        self.assertFalse(any(key.startswith("ROLE_MULTIPLIERS") for key in self.documents))
+        self.assertFalse(any(key.endswith(".source") for key in self.documents))
+
+    def test_paraphrase_retrieved(self):
+        hits = self.index.search("Do you hold bitcoin or other crypto assets?", k=3, question_type="binary")
+        self.assertTrue(hits)
+        self.assertIn("rypto", hits[0].document.text)
+        scores = [hit.score for hit in hits]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_question_type_filter(self):
+        hits = self.index.search("How satisfied are you with remote work?", k=20, question_type="scale")
+        self.assertTrue(all(hit.document.question_type in (None, "scale") for hit in hits))
+        hits = self.index.search("How satisfied are you with remote work?", k=20, question_type="ranking")
+        self.assertTrue(all(hit.document.question_type is None for hit in hits))
+
+    def test_batch_matches_single(self):
+        queries = ["Do you trust scientists?", "Is a university education worth the money?", "", "zzz"]
+        batch = self.index.search_many(queries, k=4, question_type=["binary", "binary", None, None])
+        for query, question_type, hits in zip(queries, ["binary", "binary", None, None], batch):
+            single = self.index.search(query, k=4, question_type=question_type)
+            self.assertEqual([h.document.id for h in hits], [h.document.id for h in single])
+        self.assertEqual(batch[2], [])
+        self.assertEqual(batch[3], [])
+
+class TestCalibrationSnapshot(unittest.TestCase):
+    """Test building, verifying and reading snapshots."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "calibration.cwsnap")
+        self.checksum = build_snapshot(self.path, version="test-1")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tables_round_trip(self):
+        tables = collect_tables()
+        with CalibrationSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.version, "test-1")
+            self.assertEqual(snapshot.checksum, self.checksum)
+            self.assertEqual(set(snapshot), set(tables))
+            for name, table in tables.items():
+                self.assertEqual(snapshot[name], table, name)
+            benchmark = snapshot["SATISFACTION_BENCHMARKS"]["general_population"]
+            self.assertIsInstance(benchmark, Benchmark)
+            self.assertIsInstance(benchmark.accuracy_zone, AccuracyZone)
+
+    def test_current_calibration_matches_library(self):
+        with CalibrationSnapshot(self.path) as snapshot:
+            for topic in ["ICE enforcement", "AI jobs", "CDC trust", "Netflix", "gardening"]:
+                self.assertEqual(snapshot.current_calibration(topic), get_current_calibration(topic))
+
+    def test_build_is_deterministic(self):
+        other = os.path.join(self.tmp.name, "other.cwsnap")
+        self.assertEqual(build_snapshot(other, version="test-1"), self.checksum)
+
+    def test_corruption_detected(self):
+        with open(self.path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        with self.assertRaises(SnapshotError):
+            CalibrationSnapshot(self.path)
+        # Skipping verification still opens the (corrupt) file
+        CalibrationSnapshot(self.path, verify=False).close()
+
+    def test_corrupt_index_without_verify(self):
+        """An unreadable index raises SnapshotError, not a BufferError from closing."""
+        with open(self.path, "r+b") as f:
+            f.seek(_HEADER.size)
+            f.write(b"\xff" * 8)
+        with self.assertRaises(SnapshotError):
+            CalibrationSnapshot(self.path, verify=False)
+
+    def test_close_is_idempotent(self):
+        snapshot = CalibrationSnapshot(self.path)
+        snapshot["SATISFACTION_BENCHMARKS"]
+        snapshot.close()
+        snapshot.close()
+
+    def test_rejects_foreign_file(self):
+        bogus = os.path.join(self.tmp.name, "bogus.cwsnap")
+        with open(bogus, "wb") as f:
+            f.write(b"not a snapshot" * 10)
+        with self.assertRaises(SnapshotError):
+            CalibrationSnapshot(bogus)
+
+
+class TestCalibrationRegistry(unittest.TestCase):
+    """Test versioned hot-swapping of calibration bundles."""
+
+    AUDIENCE = {"audience": "Gen Z adults"}
+    QUESTIONS = [{"id": "Q1", "text": "Which party do you identify with?",
+                  "type": "binary", "options": ["Democrat", "Other"]}]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "calibration.cwsnap")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _build(self, version: str, gen_z_democrat: float):
+        tables = collect_tables()
+        party = dict(tables["PARTY_IDENTIFICATION_2025"])
+        party["by_generation"] = {
+            **party["by_generation"],
+            "gen_z": {"independent": 0.5, "democrat": gen_z_democrat, "republican": 0.1},
+        }
+        tables["PARTY_IDENTIFICATION_2025"] = party
+        return build_snapshot(self.path, version=version, tables=tables)
+
+    def _party_prior(self, report):
+        return next(p for p in report.priors_used if p["type"] == "generation")["party_id"]
+
+    def test_report_stamped_with_builtin_version(self):
+        report = CrowdwaveEngine(calibration=CalibrationRegistry()).simulate(
+            self.AUDIENCE, self.QUESTIONS
+        )
+        self.assertTrue(report.calibration_version.endswith("+builtin"))
+        self.assertIsNone(report.calibration_checksum)
+
+    def test_swap_changes_results_and_stamp(self):
+        registry = CalibrationRegistry()
+        engine = CrowdwaveEngine(calibration=registry)
+        before = engine.simulate(self.AUDIENCE, self.QUESTIONS)
+
+        checksum = self._build("v2", gen_z_democrat=0.4)
+        registry.load(self.path)
+        after = engine.simulate(self.AUDIENCE, self.QUESTIONS)
+
+        self.assertEqual(after.calibration_version, "v2")
+        self.assertEqual(after.calibration_checksum, checksum)
+        self.assertEqual(self._party_prior(after)["democrat"], 0.4)
+        self.assertNotEqual(after.results[0].distribution, before.results[0].distribution)
+
+    def test_old_bundle_survives_swap(self):
+        registry = CalibrationRegistry()
+        self._build("v2", gen_z_democrat=0.4)
+        registry.load(self.path)
+        in_flight = registry.current()
+
+        self._build("v3", gen_z_democrat=0.3)
+        registry.load(self.path)
+
+        self.assertEqual(registry.version, "v3")
+        self.assertEqual(in_flight.version, "v2")
+        gen_z = in_flight.tables["PARTY_IDENTIFICATION_2025"]["by_generation"]["gen_z"]
+        self.assertEqual(gen_z["democrat"], 0.4)
+
+    def test_reload_picks_up_rebuilt_file(self):
+        registry = CalibrationRegistry()
+        self._build("v2", gen_z_democrat=0.4)
+        registry.watch(self.path, interval=None)
+        self.assertFalse(registry.reload())
+
+        self._build("v3", gen_z_democrat=0.3)
+        self.assertTrue(registry.reload())
+        self.assertEqual(registry.version, "v3")
+        self.assertEqual([h["version"] for h in registry.info()["history"]][-2:], ["v2", "v3"])
+
+    def test_info_lists_code_defined_rules(self):
+        """Cascade rules written in the code are reported as not reloadable."""
+        fixed = CalibrationRegistry().info()["not_reloadable"]
+        self.assertIn("Climate policy by party", fixed["partisan"])
+        self.assertIn("Tariffs (Feb 2026)", fixed["topic"])
+        # Table-backed rules follow a reload
+        self.assertNotIn("Presidential approval (IMMIGRATION_ENFORCEMENT_FEB2026)", fixed["topic"])
+        self.assertNotIn("Mental health calibrations (validated N=873, 0.5pt MAE)", fixed["topic"])
+
+    def test_bad_snapshot_keeps_serving(self):
+        registry = CalibrationRegistry()
+        self._build("v2", gen_z_democrat=0.4)
+        registry.watch(self.path, interval=None)
+
+        with open(self.path, "wb") as f:
+            f.write(b"garbage")
+        self.assertFalse(registry.reload())
+        self.assertEqual(registry.version, "v2")
+        self.assertIn("SnapshotError", registry.last_error)
+
+    def test_bundle_queries_follow_swap(self):
+        tables = collect_tables()
+        nps = dict(tables["NPS_BENCHMARKS"])
+        nps["by_industry"] = {**nps["by_industry"], "software": {"median": 50, "b2b": 99}}
+        tables["NPS_BENCHMARKS"] = nps
+        build_snapshot(self.path, version="v2", tables=tables)
+        
+        registry = CalibrationRegistry()
+        self.assertEqual(registry.current().queries.nps_benchmark("software", b2b=True), 29)
+        registry.load(self.path)
+        self.assertEqual(registry.current().queries.nps_benchmark("software", b2b=True), 99)
+    
+    def test_cascade_tables_follow_swap(self):
+        """Satisfaction priors and table-backed cascade branches read the active bundle."""
+        tables = collect_tables()
+        satisfaction = dict(tables["SATISFACTION_BENCHMARKS"])
+        satisfaction["general_population"] = replace(satisfaction["general_population"], sample_size=1)
+        tables["SATISFACTION_BENCHMARKS"] = satisfaction
+        immigration = dict(tables["IMMIGRATION_ENFORCEMENT_FEB2026"])
+        immigration["ice_job_approval"] = {"approve": 0.45, "disapprove": 0.5}
+        tables["IMMIGRATION_ENFORCEMENT_FEB2026"] = immigration
+        mental_health = dict(tables["MENTAL_HEALTH_BENCHMARKS"])
+        mental_health["generic_importance"] = {"distribution": {"1": 10.0, "2": 20.0, "3": 40.0, "4": 20.0, "5": 10.0}}
+        tables["MENTAL_HEALTH_BENCHMARKS"] = mental_health
+        build_snapshot(self.path, version="v2", tables=tables)
+
+        registry = CalibrationRegistry()
+        engine = CrowdwaveEngine(calibration=registry)
+        ice = Question(id="Q1", text="Do you approve of ICE?", type="binary", options=["Approve", "Disapprove"])
+        wellbeing = Question(id="Q2", text="How important is support?", type="scale", scale=(1, 5))
+        satisfied = [{"id": "Q3", "text": "How satisfied are you?", "type": "scale", "scale": [1, 5]}]
+
+        def snapshot():
+            prior = next(
+                p for p in engine.simulate({"audience": "customers", "topic": "banking"}, satisfied).priors_used
+                if p["type"] == "satisfaction_benchmark"
+            )
+            return (
+                prior["data"].sample_size,
+                engine._get_base_distribution(ice, [], "immigration", "US adults"),
+                engine._get_base_distribution(wellbeing, [], "mental health", "adults with anxiety"),
+            )
+
+        self.assertEqual(snapshot(), (
+            10000,
+            {"Approve": 33.0, "Disapprove": 67.0},
+            {"1": 3.2, "2": 6.5, "3": 24.0, "4": 43.0, "5": 23.3},
+        ))
+        registry.load(self.path)
+        self.assertEqual(snapshot(), (
+            1,
+            {"Approve": 45.0, "Disapprove": 55.0},
+            {"1": 10.0, "2": 20.0, "3": 40.0, "4": 20.0, "5": 10.0},
+        ))
+
+    @unittest.skipUnless(FASTAPI_AVAILABLE, "FastAPI not installed")
+    def test_reload_endpoint(self):
+        from fastapi.testclient import TestClient
+        from crowdwave_engine.api import create_app
+
+        registry = CalibrationRegistry()
+        client = TestClient(create_app(calibration=registry))
+        self.assertTrue(client.get("/calibration").json()["version"].endswith("+builtin"))
+        self.assertEqual(client.post("/calibration/reload").status_code, 400)
+
+        self._build("v2", gen_z_democrat=0.4)
+        registry.watch(self.path, interval=None)
+        self._build("v3", gen_z_democrat=0.3)
+        response = client.post("/calibration/reload")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["version"], "v3")
+        self.assertIn("Tariffs (Feb 2026)", response.json()["not_reloadable"]["topic"])
+
+        survey = {"config": self.AUDIENCE, "questions": self.QUESTIONS}
+        self.assertEqual(client.post("/simulate", json=survey).json()["calibration_version"], "v3")
+        self.assertIn('crowdwave_calibration_info{version="v3"', client.get("/metrics").text)
+
+        # Clients cannot point the server at another file
+        response = client.post("/calibration/reload", json={"path": "/etc/passwd"})
+        self.assertEqual(response.json()["watching"], self.path)
+
+        with open(self.path, "wb") as f:
+            f.write(b"garbage")
+        self.assertEqual(client.post("/calibration/reload").status_code, 422)
+        self.assertEqual(registry.version, "v3")
+
+    @unittest.skipUnless(FASTAPI_AVAILABLE, "FastAPI not installed")
+    def test_calibrations_endpoints_follow_swap(self):
+        from fastapi.testclient import TestClient
+        from crowdwave_engine.api import create_app
+
+        tables = collect_tables()
+        nps = dict(tables["NPS_BENCHMARKS"])
+        nps["by_industry"] = {**nps["by_industry"], "widgets": {"median": 12, "b2b": 15}}
+        tables["NPS_BENCHMARKS"] = nps
+        build_snapshot(self.path, version="v2", tables=tables)
+
+        registry = CalibrationRegistry()
+        client = TestClient(create_app(calibration=registry))
+        self.assertNotIn("widgets", client.get("/calibrations").json()["industries_nps"])
+        registry.load(self.path)
+        self.assertIn("widgets", client.get("/calibrations").json()["industries_nps"])
+        self.assertEqual(client.get("/calibrations/nps").json()["by_industry"]["widgets"]["median"], 12)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,14 @@
 Tests for Crowdwave distribution generation.
 """
 
+import math
+import warnings
 import unittest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from crowdwave_engine.distributions import (
@@ -17,6 +21,18 @@ from crowdwave_engine.distributions import (
     generate_likert_distribution,
     calculate_distribution_stats,
     adjust_distribution_for_bias,
+    beta_distributions,
+    truncated_normal_distributions,
+    skewed_distributions,
+    bimodal_distributions,
+    nps_distributions,
+    regularized_incomplete_beta,
+    exact_beta_probabilities,
+    exact_truncated_normal_probabilities,
+    fit_distribution,
+    fit_distributions,
+    _beta_shape,
+    _exact_row,
 )
 
 
@@ -91,6 +107,201 @@ class TestDistributionGeneration(unittest.TestCase):
         self.assertIn("Excellent", dist)
 
 
+class TestVectorizedGeneration(unittest.TestCase):
+    """Test the (m, k) batch generators behind the scalar functions."""
+    
+    MEANS = [1.4, 2.5, 3.0, 3.8, 4.6]
+    SDS = [0.6, 0.9, 1.2, 0.8, 1.5]
+    
+    def test_rows_match_scalar_generators(self):
+        """Each batch row equals the corresponding scalar call."""
+        skews = [-1.5, 0.0, 0.5, 1.0, -0.3]
+        cases = [
+            (beta_distributions(self.MEANS, self.SDS),
+             [generate_beta_distribution(m, s) for m, s in zip(self.MEANS, self.SDS)]),
+            (truncated_normal_distributions(self.MEANS, self.SDS, 1, 7, 7),
+             [generate_truncated_normal(m, s, 1, 7, 7) for m, s in zip(self.MEANS, self.SDS)]),
+            (skewed_distributions(self.MEANS, self.SDS, skews),
+             [generate_skewed_distribution(m, s, k) for m, s, k in zip(self.MEANS, self.SDS, skews)]),
+            (bimodal_distributions(self.MEANS, 4.5, 0.3),
+             [generate_bimodal_distribution(m, 4.5, 0.3) for m in self.MEANS]),
+            (nps_distributions([m * 2 for m in self.MEANS], self.SDS, 0.4),
+             [generate_nps_distribution(m * 2, s, 0.4) for m, s in zip(self.MEANS, self.SDS)]),
+        ]
+        for batch, expected in cases:
+            self.assertEqual(batch.to_dicts(), expected)
+            self.assertEqual(batch.to_dict(2), expected[2])
+    
+    def test_matrix_shape_and_normalization(self):
+        """Probabilities are an (m, k) matrix with rows summing to 1."""
+        batch = truncated_normal_distributions(self.MEANS, 1.0)
+        self.assertEqual(batch.probabilities.shape, (5, 5))
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch.keys, ("1", "2", "3", "4", "5"))
+        for row in batch.probabilities:
+            self.assertAlmostEqual(float(row.sum()), 1.0, places=12)
+        self.assertEqual(nps_distributions(7.5, 2.0).keys[-1], "10")
+    
+    def test_invalid_parameters(self):
+        """Mismatched lengths, 2-d input and zero SD are rejected."""
+        with self.assertRaises(ValueError):
+            truncated_normal_distributions([3.0, 3.5], [1.0, 1.0, 1.0])
+        with self.assertRaises(ValueError):
+            truncated_normal_distributions([[3.0]], 1.0)
+        with self.assertRaises(ValueError):
+            skewed_distributions(3.0, [1.0, 0.0], 0.5)
+    
+    def test_degenerate_beta_raises(self):
+        """A zero SD, or one so small the beta PDF underflows, raises instead of returning NaN."""
+        for sd in (0, 0.05, 0.001):
+            with self.subTest(sd=sd), warnings.catch_warnings():
+                warnings.simplefilter("error")
+                with self.assertRaises(ValueError):
+                    generate_beta_distribution(3, sd)
+        with self.assertRaises(ValueError):
+            beta_distributions([3.0, 3.0], [1.0, 0.0])
+        with self.assertRaises(ValueError):
+            generate_beta_distribution(3, 0, exact=True)
+
+
+class TestExactDiscretization(unittest.TestCase):
+    """Test bin probabilities from CDF differences."""
+    
+    def test_incomplete_beta_closed_forms(self):
+        """I_x(1, b) = 1 - (1-x)^b, I_x(a, 1) = x^a, I_0.5(a, a) = 0.5."""
+        for x in [0.0, 0.05, 0.3, 0.5, 0.77, 1.0]:
+            self.assertAlmostEqual(float(regularized_incomplete_beta(1.0, 3.7, x)), 1 - (1 - x) ** 3.7, places=13)
+            self.assertAlmostEqual(float(regularized_incomplete_beta(2.5, 1.0, x)), x ** 2.5, places=13)
+        for a in [0.5, 2.0, 40.0, 900.0]:
+            self.assertAlmostEqual(float(regularized_incomplete_beta(a, a, 0.5)), 0.5, places=12)
+    
+    def test_beta_bins_match_numeric_integration(self):
+        """Exact beta bins agree with a fine midpoint-rule integral of the PDF."""
+        mean, sd = np.array([2.2, 3.9]), np.array([0.9, 0.7])
+        exact = exact_beta_probabilities(mean, sd)
+        alpha, beta = _beta_shape(mean, sd, 1.0, 5.0)
+        t = (np.arange(200_000) + 0.5) / 200_000
+        for row, a, b in zip(exact, alpha, beta):
+            pdf = np.exp((a - 1) * np.log(t) + (b - 1) * np.log1p(-t)
+                         - (math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)))
+            reference = pdf.reshape(5, -1).sum(axis=1) / 200_000
+            np.testing.assert_allclose(row, reference, atol=1e-6)
+    
+    def test_beta_upper_tail_bins_keep_precision(self):
+        """Bins above the median come from the upper tail, not 1 - CDF."""
+        mean, sd = np.array([1.3]), np.array([0.3])
+        alpha, beta = _beta_shape(mean, sd, 1.0, 5.0)
+        exact = exact_beta_probabilities(mean, sd)[0]
+        # 1 - I_x(a, b) = I_(1-x)(b, a), small and computed directly
+        tail = regularized_incomplete_beta(beta, alpha, [0.2, 0.4])
+        np.testing.assert_allclose(exact[-2:], [tail[1] - tail[0], tail[0]], rtol=1e-12)
+    
+    def test_truncated_normal_bins_match_erf(self):
+        """Exact truncated-normal bins are renormalized CDF differences."""
+        mean, sd = 3.6, 0.8
+        cdf = lambda v: 0.5 * (1 + math.erf((v - mean) / (sd * math.sqrt(2))))
+        masses = [cdf(p + 0.5) - cdf(p - 0.5) for p in range(1, 6)]
+        reference = [m / sum(masses) for m in masses]
+        exact = exact_truncated_normal_probabilities(np.array([mean]), np.array([sd]))[0]
+        np.testing.assert_allclose(exact, reference, atol=1e-14)
+        
+        # Far-off means collapse onto the nearest point instead of NaN
+        far = exact_truncated_normal_probabilities(np.array([60.0]), np.array([0.1]))[0]
+        self.assertEqual(far.tolist(), [0.0, 0.0, 0.0, 0.0, 1.0])
+    
+    def test_exact_generators_cached_and_consistent(self):
+        """Scalar exact lookups are cached and agree with exact batches."""
+        _exact_row.cache_clear()
+        first = generate_truncated_normal(3.2, 1.1, exact=True)
+        # Within the same quantum -> same cached row
+        self.assertEqual(generate_truncated_normal(3.2000001, 1.1, exact=True), first)
+        self.assertEqual(_exact_row.cache_info().hits, 1)
+        
+        means, sds = [1.4, 3.2, 4.6], [0.6, 1.1, 1.5]
+        for batch_fn, scalar_fn in [
+            (beta_distributions, generate_beta_distribution),
+            (truncated_normal_distributions, generate_truncated_normal),
+        ]:
+            self.assertEqual(
+                batch_fn(means, sds, exact=True).to_dicts(),
+                [scalar_fn(m, s, exact=True) for m, s in zip(means, sds)],
+            )
+        
+        # Repeated (quantized) parameters in a batch give identical rows
+        rows = beta_distributions([3.2, 1.4, 3.2000001], [1.1, 0.6, 1.1], exact=True).probabilities
+        self.assertEqual(rows[0].tolist(), rows[2].tolist())
+
+
+
+class TestInverseFitting(unittest.TestCase):
+    """Test fitting distributions to target mean / SD / T2B."""
+    
+    def _targets(self, n_points, min_val):
+        """Statistics of known distributions on the scale, to fit back."""
+        rng = np.random.default_rng(3)
+        points = min_val + np.arange(n_points)
+        probs = rng.dirichlet(np.full(n_points, 2.0), size=200)
+        mean = probs @ points
+        sd = np.sqrt(probs @ points ** 2 - mean ** 2)
+        return mean, sd, probs[:, -2:].sum(axis=1) * 100
+    
+    def test_fits_reachable_targets(self):
+        """Every reachable target converges, on 5- and 11-point scales."""
+        for n_points, min_val in [(5, 1), (11, 0)]:
+            mean, sd, t2b = self._targets(n_points, min_val)
+            fit = fit_distributions(mean, sd, t2b, min_val=min_val, n_points=n_points, smooth=False)
+            self.assertTrue(fit.converged.all(), n_points)
+            self.assertFalse(fit.smoothed.any())
+            np.testing.assert_allclose(fit.batch.probabilities.sum(axis=1), 1.0)
+            span = n_points - 1
+            np.testing.assert_allclose(fit.achieved[:, 0], mean, atol=1e-4 * span)
+            np.testing.assert_allclose(fit.achieved[:, 1], sd, atol=1e-4 * span)
+            np.testing.assert_allclose(fit.achieved[:, 2], t2b, atol=1e-2)
+    
+    def test_scalar_fit_matches_stats(self):
+        """calculate_distribution_stats of a fit recovers the targets."""
+        dist = fit_distribution(3.9, 0.95, 70)
+        self.assertEqual(list(dist), ["1", "2", "3", "4", "5"])
+        stats = calculate_distribution_stats(dist)
+        self.assertAlmostEqual(stats["mean"], 3.9, delta=0.02)
+        self.assertAlmostEqual(stats["sd"], 0.95, delta=0.02)
+        self.assertAlmostEqual(stats["t2b"], 70, delta=0.2)
+        self.assertEqual(list(fit_distribution(7.5, 2.0, min_val=0, n_points=11)), [str(i) for i in range(11)])
+    
+    def test_without_t2b_keeps_gaussian_shape(self):
+        """Rows without a T2B target fit mean and SD with no top-2 weight."""
+        fit = fit_distributions([2.5, 3.5, 4.0], [0.8, 1.1, 0.7], [np.nan, 60, np.nan])
+        self.assertTrue(fit.converged.all())
+        self.assertEqual(fit.theta[[0, 2], 2].tolist(), [0.0, 0.0])
+        self.assertNotEqual(fit.theta[1, 2], 0.0)
+        np.testing.assert_allclose(fit.achieved[:, 0], [2.5, 3.5, 4.0], atol=1e-3)
+    
+    def test_spiked_fit_smoothed(self):
+        """A T2B fit that spikes over an empty valley falls back to mean and SD."""
+        spiked = fit_distributions(7.5, 2.0, 60, min_val=0, n_points=11, smooth=False)
+        self.assertTrue(spiked.converged[0])
+        self.assertGreater(spiked.batch.probabilities[0, 9], 0.5)
+        self.assertLess(spiked.batch.probabilities[0, 8], 0.01)
+        
+        fit = fit_distributions([7.5, 8.0], [2.0, 1.8], [60, 55], min_val=0, n_points=11)
+        self.assertEqual(fit.smoothed.tolist(), [True, False])
+        self.assertEqual(fit.converged.tolist(), [False, True])
+        self.assertEqual(fit.theta[0, 2], 0.0)
+        np.testing.assert_allclose(fit.achieved[0, :2], [7.5, 2.0], atol=1e-3)
+        # The smoothed row rises to a single peak and falls off
+        row = fit.batch.probabilities[0]
+        peak = row.argmax()
+        self.assertTrue((np.diff(row[:peak + 1]) > 0).all() and (np.diff(row[peak:]) < 0).all())
+    
+    def test_unreachable_targets_flagged(self):
+        """Impossible targets stop unconverged but still give distributions."""
+        fit = fit_distributions([4.9, 3.5], [1.0, 1.0], [10, 50])
+        self.assertEqual(fit.converged.tolist(), [False, True])
+        self.assertGreater(fit.error[0], 0.01)
+        self.assertTrue(np.isfinite(fit.batch.probabilities).all())
+        with self.assertRaises(ValueError):
+            fit_distributions(1.5, 0.5, n_points=2)
+
 class TestDistributionStats(unittest.TestCase):
     """Test distribution statistics calculation."""
     
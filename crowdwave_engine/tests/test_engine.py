@@ -3,10 +3,16 @@ Crowdwave Engine Unit Tests
 Tests core simulation functionality.
 """
 
+import csv
+import io
+import itertools
 import unittest
 import sys
+from dataclasses import replace
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from crowdwave_engine import (
@@ -16,6 +22,11 @@ from crowdwave_engine import (
     validate_distribution,
     BiasType,
 )
+from crowdwave_engine.crowdwave import Question, SurveyConfig
+from crowdwave_engine.features import QuestionFeatures
+from crowdwave_engine.pipeline_table import compile_pipeline_outputs, pipeline_table
+from crowdwave_engine.profiling import SimulationProfiler
+from crowdwave_engine.respondents import CopulaSampler, construct_correlation, nearest_correlation
 
 
 class TestEngineBasics(unittest.TestCase):
@@ -234,5 +245,599 @@ class TestCalibrationApplication(unittest.TestCase):
         self.assertGreaterEqual(max(values), 55.0)  # Status quo wins 55-70%
 
 
+class TestQuestionFeatures(unittest.TestCase):
+    """Test the shared per-question feature extraction."""
+    
+    def setUp(self):
+        self.engine = CrowdwaveEngine()
+        self.questions = [
+            Question(id="Q1", text="How WORRIED are you about medical costs?", type="scale", scale=(1, 7)),
+            Question(id="Q2", text="Do you support stricter immigration enforcement?", type="binary",
+                     options=["Yes", "No"]),
+        ]
+    
+    def test_extract_all(self):
+        """Text is normalized and audience features are shared."""
+        features = QuestionFeatures.extract_all(self.questions, "Healthcare", "Gen Z Republicans")
+        first, second = features
+        self.assertEqual(first.text, "how worried are you about medical costs?")
+        self.assertEqual(first.context, first.text + " healthcare gen z republicans")
+        self.assertEqual((first.party, first.generation), ("republican", "gen_z"))
+        self.assertEqual(first.scale_points, 7)
+        self.assertIsNone(second.scale_points)
+        self.assertEqual(second.options, ("yes", "no"))
+        self.assertTrue(first.hits.any("bias.concern"))
+        self.assertTrue(second.audience_hits.any("audience.party.republican"))
+        self.assertFalse(second.hits.any("audience.party.republican"))
+    
+    def test_phases_agree_with_and_without_features(self):
+        """Passing precomputed features must not change any phase's output."""
+        config = SurveyConfig(audience="Independents", topic="border policy")
+        features = QuestionFeatures.extract_all(self.questions, config.topic, config.audience)
+        for question, f in zip(self.questions, features):
+            self.assertEqual(
+                self.engine._get_base_distribution(question, [], config.topic, config.audience, None, f),
+                self.engine._get_base_distribution(question, [], config.topic, config.audience),
+            )
+            self.assertEqual(
+                self.engine._determine_accuracy_zone(question, f),
+                self.engine._determine_accuracy_zone(question),
+            )
+        self.assertEqual(
+            self.engine._check_calibration_coverage(config, self.questions, features),
+            self.engine._check_calibration_coverage(config, self.questions),
+        )
+
+
+
+class TestCorrelatedRespondents(unittest.TestCase):
+    """Test Gaussian-copula respondent synthesis."""
+    
+    CONFIG = {"audience": "US adults", "geography": "USA"}
+    QUESTIONS = [
+        {"id": "Q1", "text": "How satisfied are you with your bank?", "type": "scale", "scale": [1, 5]},
+        {"id": "Q2", "text": "How satisfied are you with your bank's mobile app?", "type": "scale", "scale": [1, 5]},
+        {"id": "Q3", "text": "How likely are you to recommend your bank?", "type": "nps"},
+        {"id": "Q4", "text": "Do you own a car?", "type": "binary", "options": ["Yes", "No"]},
+    ]
+    
+    def setUp(self):
+        self.engine = CrowdwaveEngine()
+        self.report = self.engine.simulate(self.CONFIG, self.QUESTIONS)
+    
+    def test_marginals_preserved_and_correlated(self):
+        """Each question keeps its distribution; related questions correlate."""
+        sampler = CopulaSampler(self.report, seed=1)
+        codes = sampler.sample(100_000)
+        self.assertEqual(codes.shape, (100_000, 4))
+        for j, (marginal, result) in enumerate(zip(sampler.marginals, self.report.results)):
+            expected = np.array([result.distribution[o] for o in marginal.options])
+            observed = np.bincount(codes[:, j], minlength=len(marginal.options)) / len(codes)
+            np.testing.assert_allclose(observed, expected / expected.sum(), atol=0.01)
+        
+        observed = np.corrcoef(codes.T.astype(float))
+        self.assertGreater(observed[0, 1], 0.3)          # same construct and subject
+        self.assertGreater(observed[0, 1], observed[0, 3])
+        independent = CopulaSampler(self.report, correlation=None, seed=1).sample(100_000)
+        self.assertLess(abs(np.corrcoef(independent.T.astype(float))[0, 1]), 0.02)
+    
+    def test_chunked_and_seeded(self):
+        """Chunks cover n respondents and a seed reproduces them."""
+        sampler = CopulaSampler(self.report, seed=5, max_cells=4 * 1000)
+        chunks = list(sampler.chunks(2500))
+        self.assertEqual([len(c) for c in chunks], [1000, 1000, 500])
+        np.testing.assert_array_equal(np.concatenate(chunks), sampler.sample(2500))
+    
+    def test_engine_outputs(self):
+        """generate_respondents and to_csv accept a correlation."""
+        rows = self.engine.generate_respondents(self.report, 20, correlation="construct", seed=2)
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(rows[0]["respondent_id"], 1)
+        self.assertIn(rows[0]["Q4"], ["Yes", "No"])
+        
+        text = self.engine.to_csv(self.report, n=20, correlation="construct", seed=2)
+        parsed = list(csv.DictReader(io.StringIO(text)))
+        self.assertEqual([r["Q3"] for r in parsed], [r["Q3"] for r in rows])
+    
+    def test_correlation_matrices(self):
+        """Derived matrices are valid; bad matrices are repaired or rejected."""
+        derived = construct_correlation([q["text"] for q in self.QUESTIONS])
+        np.testing.assert_array_equal(np.diagonal(derived), 1.0)
+        self.assertGreater(derived[0, 1], derived[0, 3])
+        
+        # Pairwise-plausible but jointly impossible
+        repaired = nearest_correlation([[1, 0.9, -0.9], [0.9, 1, 0.9], [-0.9, 0.9, 1]])
+        self.assertGreater(np.linalg.eigvalsh(repaired).min(), 0)
+        np.testing.assert_allclose(np.diagonal(repaired), 1.0)
+        
+        with self.assertRaises(ValueError):
+            nearest_correlation([[1, 0.5], [0.2, 1]])
+        with self.assertRaises(ValueError):
+            CopulaSampler(self.report, correlation=np.eye(3))
+
+class TestProfiling(unittest.TestCase):
+    """Test opt-in per-phase profiling."""
+    
+    def setUp(self):
+        self.config = {"audience": "US adults", "topic": "trade policy"}
+        self.questions = [
+            {"id": "Q1", "text": "Do you support new tariffs?", "type": "binary",
+             "options": ["Support", "Oppose"]},
+            {"id": "Q2", "text": "How satisfied are you overall?", "type": "scale",
+             "scale": [1, 5]},
+        ]
+    
+    def test_disabled_by_default(self):
+        """Without a profiler the trace carries no timings."""
+        report = CrowdwaveEngine().simulate(self.config, self.questions)
+        self.assertNotIn("timings_ms", report.results[0].methodology_trace)
+    
+    def test_profiled_results_match_unprofiled(self):
+        """Profiling must not change simulation output."""
+        plain = CrowdwaveEngine().simulate(self.config, self.questions)
+        profiled = CrowdwaveEngine(profiler=SimulationProfiler()).simulate(
+            self.config, self.questions
+        )
+        for a, b in zip(plain.results, profiled.results):
+            self.assertEqual(a.distribution, b.distribution)
+    
+    def test_phase_timings_and_rules(self):
+        """Phases and the matched base-distribution rule are recorded."""
+        profiler = SimulationProfiler()
+        engine = CrowdwaveEngine(profiler=profiler)
+        report = engine.simulate(self.config, self.questions)
+        engine.simulate(self.config, self.questions)
+        
+        trace = report.results[0].methodology_trace
+        self.assertIn("ensemble", trace["timings_ms"])
+        self.assertEqual(trace["base_rule"]["family"], "binary")
+        self.assertEqual(trace["base_rule"]["rule"], "Tariffs (Feb 2026)")
+        
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["phases"]["parse"]["calls"], 2)
+        self.assertEqual(snapshot["phases"]["features"]["calls"], 2)
+        self.assertEqual(snapshot["phases"]["ensemble"]["calls"], 4)
+        self.assertEqual(snapshot["rule_families"]["binary"], 2)
+        self.assertEqual(snapshot["rules"]["binary/Tariffs (Feb 2026)"], 2)
+        
+        profiler.reset()
+        self.assertEqual(profiler.snapshot()["phases"], {})
+    
+    def test_partisan_rule_family(self):
+        """Rules in party-conditioned sections get a partisan family."""
+        profiler = SimulationProfiler()
+        report = CrowdwaveEngine(profiler=profiler).simulate(
+            {"audience": "Republicans"},
+            [{"id": "Q1", "text": "Do you support stricter immigration enforcement?",
+              "type": "binary", "options": ["Yes", "No"]}]
+        )
+        rule = report.results[0].methodology_trace["base_rule"]
+        self.assertEqual(rule["family"], "partisan_binary")
+    
+    def test_rule_tracing_keeps_existing_tracer(self):
+        """Rule tracing must not replace a debugger's or coverage tool's trace hook."""
+        seen = []
+
+        def tracer(frame, event, arg):
+            seen.append(frame.f_code.co_name)
+        
+        previous = sys.gettrace()
+        sys.settrace(tracer)
+        try:
+            CrowdwaveEngine(profiler=SimulationProfiler()).simulate(self.config, self.questions)
+            self.assertIs(sys.gettrace(), tracer)
+        finally:
+            sys.settrace(previous)
+        self.assertIn("_get_base_distribution", seen)
+
+
+class TestPrecomputedPipeline(unittest.TestCase):
+    """Test the precomputed outputs for fixed calibrated distributions."""
+    
+    AUDIENCES = [
+        "US adults",
+        "Adults open to switching providers",
+        "Seniors 65+ who use online banking",   # senior_digital correction
+        "Patients worried about medical costs",  # healthcare_concern correction
+        "Dog owners who love their pets",        # emotional_bonding correction
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
+        from crowdwave_engine.retrieval import cascade_documents
+        options = {"binary": [["Yes", "No"], ["Approve", "Disapprove"]], "scale": [[]], "nps": [[]]}
+        cls.questions = []
+        for doc in cascade_documents():
+            for question_type in ([doc.question_type] if doc.question_type else ["scale", "binary"]):
+                for opts in options.get(question_type, []):
+                    cls.questions.append({
+                        "id": f"Q{len(cls.questions)}", "text": doc.text, "type": question_type,
+                        "options": opts, "scale": [1, 5] if question_type == "scale" else None,
+                    })
+        cls.questions += [
+            {"id": "NPS", "text": "Would you recommend us?", "type": "nps"},
+            {"id": "ADOPT", "text": "How likely are you to use digital banking online?",
+             "type": "scale", "scale": [1, 5]},
+        ]
+    
+    def test_generated_table_is_current(self):
+        """pipeline_outputs.py matches the live pipeline (regenerate with `calibration pipeline`)."""
+        self.assertEqual(pipeline_table(), compile_pipeline_outputs())
+    
+    def test_parity_with_live_pipeline(self):
+        """Precomputed and live pipelines give identical results."""
+        fast, live = CrowdwaveEngine(), CrowdwaveEngine(precomputed=False)
+        for audience in self.AUDIENCES:
+            for stimuli in ([], ["Ad concept: a new savings app"]):
+                config = {"audience": audience, "stimuli": stimuli}
+                expected = live.simulate(config, self.questions).results
+                actual = fast.simulate(config, self.questions).results
+                for a, e in zip(actual, expected):
+                    self.assertEqual(a, e, f"{audience!r} / {a.question_text[:60]!r}")
+    
+    def test_calibrated_questions_hit_table(self):
+        """Most cascade questions reach a fixed calibration."""
+        from crowdwave_engine.pipeline_table import lookup_pipeline_output
+        engine = CrowdwaveEngine()
+        hits = 0
+        for q in self.questions:
+            question = Question(**{k: v for k, v in q.items() if v is not None})
+            base = engine._get_base_distribution(question, [])
+            hits += lookup_pipeline_output(question.type, base, [], "US adults") is not None
+        self.assertGreater(hits / len(self.questions), 0.5)
+        
+        report = engine.simulate(
+            {"audience": "US adults"},
+            [{"id": "Q1", "text": "Write a slogan", "type": "open_end"}]
+        )
+        self.assertEqual(report.results[0].distribution, {})
+
+
+class TestCompiledSurvey(unittest.TestCase):
+    """Test one questionnaire compiled once and simulated for many audiences."""
+    
+    def setUp(self):
+        self.engine = CrowdwaveEngine()
+        self.config = {"topic": "healthcare", "stimuli": ["New telehealth plan"]}
+        self.questions = [
+            {"id": "Q1", "text": "How worried are you about medical costs?", "type": "scale", "scale": [1, 5]},
+            {"id": "Q2", "text": "Do you support stricter immigration enforcement?", "type": "binary",
+             "options": ["Yes", "No"]},
+            {"id": "Q3", "text": "Would you recommend your health plan?", "type": "nps"},
+        ]
+        self.audiences = ["Gen Z Republicans", "Seniors 65+ online", "Democrats", "US adults open to switching"]
+    
+    def test_reports_match_simulate(self):
+        """Each audience's report equals a direct simulate() call."""
+        compiled = self.engine.compile(self.questions, self.config)
+        comparison = compiled.simulate_audiences(self.audiences + [{"audience": "Parents", "sample_size": 50}])
+        self.assertEqual(comparison.audiences[-1], "Parents")
+        for audience, report in zip(comparison.audiences, comparison.reports):
+            expected = self.engine.simulate(
+                {**self.config, "audience": audience,
+                 "sample_size": report.config.sample_size}, self.questions
+            )
+            self.assertEqual(report.results, expected.results)
+            self.assertEqual(report.flags, expected.flags)
+            self.assertEqual(report.priors_used, expected.priors_used)
+            self.assertEqual(report.config, replace(expected.config, as_of_date=report.config.as_of_date))
+    
+    def test_stacked_results(self):
+        comparison = self.engine.compile(self.questions, self.config).simulate_audiences(self.audiences)
+        self.assertEqual(comparison.question_ids, ["Q1", "Q2", "Q3"])
+        
+        stacked = comparison.distributions("Q2")
+        self.assertEqual(stacked.shape, (4, 2))
+        self.assertEqual(comparison.options("Q2"), ["Yes", "No"])
+        np.testing.assert_allclose(stacked.sum(axis=1), 100.0)
+        self.assertEqual(
+            list(stacked[2]), list(comparison.result("Democrats", "Q2").distribution.values())
+        )
+        
+        means = comparison.values("mean")
+        self.assertEqual(means.shape, (4, 3))
+        self.assertTrue(np.isnan(means[:, 1]).all())
+        self.assertEqual(means[0, 0], comparison.reports[0].results[0].mean)
+
+
+class TestSegmentedSimulation(unittest.TestCase):
+    """Test party-segmented simulation with a weighted total."""
+    
+    def setUp(self):
+        self.engine = CrowdwaveEngine()
+        self.config = {"audience": "US adults", "topic": "immigration policy"}
+        self.questions = [
+            {"id": "Q1", "text": "Do you support stricter immigration enforcement?", "type": "binary",
+             "options": ["Yes", "No"]},
+            {"id": "Q2", "text": "How concerned are you about climate change?", "type": "scale", "scale": [1, 5]},
+        ]
+    
+    def test_segments_and_weighted_total(self):
+        segmented = self.engine.simulate_segmented(self.config, self.questions)
+        self.assertEqual(segmented.parties, ["democrat", "republican", "independent"])
+        self.assertEqual(segmented.weights, {"democrat": 0.27, "republican": 0.28, "independent": 0.45})
+        
+        # Segments are exactly what simulating each party audience gives
+        for audience, report in zip(segmented.segments.audiences, segmented.segments.reports):
+            expected = self.engine.simulate({**self.config, "audience": audience}, self.questions)
+            self.assertEqual(report.results, expected.results)
+        yes = [r.results[0].distribution["Yes"] for r in segmented.segments.reports]
+        self.assertNotEqual(yes[0], yes[1])
+        
+        total = segmented.total.results[0]
+        expected_yes = sum(w * y for w, y in zip(segmented.weights.values(), yes))
+        self.assertAlmostEqual(total.distribution["Yes"], expected_yes, delta=0.06)
+        self.assertAlmostEqual(sum(total.distribution.values()), 100.0)
+        self.assertEqual(segmented.total.config.audience, "US adults")
+        self.assertIsNotNone(segmented.total.results[1].mean)
+    
+    def test_generation_weights(self):
+        segmented = self.engine.simulate_segmented({"audience": "Gen Z adults"}, self.questions)
+        self.assertEqual(segmented.generation, "gen_z")
+        self.assertEqual(segmented.weights["independent"], 0.56)
+        
+        segmented = self.engine.simulate_segmented(self.config, self.questions, generation="boomer")
+        self.assertEqual(segmented.weights["republican"], 0.32)
+        self.assertTrue(all("Boomers" in audience for audience in segmented.segments.audiences))
+    
+    def test_rejects_partisan_audience(self):
+        with self.assertRaises(ValueError):
+            self.engine.simulate_segmented({"audience": "Republicans"}, self.questions)
+        with self.assertRaises(ValueError):
+            self.engine.simulate_segmented(self.config, self.questions, generation="gen_alpha")
+        with self.assertRaises(ValueError):
+            self.engine.simulate_segmented({"audience": "Gen Z adults"}, self.questions, generation="boomer")
+        # Naming the same generation twice is fine
+        segmented = self.engine.simulate_segmented({"audience": "Gen Z adults"}, self.questions, generation="gen_z")
+        self.assertEqual(segmented.segments.audiences[0], "Gen Z adults - Democrats")
+
+
+class TestVariantComparison(unittest.TestCase):
+    """Test batched message-variant comparison."""
+    
+    def setUp(self):
+        self.engine = CrowdwaveEngine()
+        self.config = {"audience": "Market researchers", "topic": "AI research tool", "sample_size": 500}
+        self.questions = [
+            {"id": "q1", "type": "binary", "text": "Does the opening line make you want to read more?",
+             "options": ["Yes, hooked", "No"]},
+            {"id": "q2", "type": "scale", "text": "How satisfied are you with the post?", "scale": [1, 5]},
+            {"id": "q3", "type": "nps", "text": "Would you recommend this tool?"},
+        ]
+    
+    def test_deltas_and_significance(self):
+        from crowdwave_engine.variants import compare_variants
+        comparison = compare_variants(
+            self.config,
+            [{"name": "control"}, "Post A", {"name": "execs", "audience": "Republicans", "sample_size": 5000}],
+            self.questions, engine=self.engine,
+        )
+        self.assertEqual(comparison.variants, ["control", "V2", "execs"])
+        self.assertEqual(comparison.metrics, ["% Yes, hooked", "mean", "nps"])
+        self.assertEqual(comparison.values.shape, (3, 3))
+        np.testing.assert_array_equal(comparison.deltas[0], 0.0)
+        
+        # Reports are what simulate() gives for each variant's config
+        expected = self.engine.simulate({**self.config, "stimuli": ["Post A"]}, self.questions)
+        self.assertEqual(comparison.reports[1].results, expected.results)
+        self.assertEqual(comparison.reports[1].config.stimuli, ["Post A"])
+        self.assertEqual(comparison.values[1, 1], expected.results[1].mean)
+        
+        # Two-sample z-test on the first option's share
+        d = comparison.delta("execs", "q1")
+        p0, p1 = d.baseline, d.value
+        z = (p1 - p0) / np.sqrt(p1 * (100 - p1) / 5000 + p0 * (100 - p0) / 500)
+        self.assertAlmostEqual(d.z, z)
+        self.assertEqual(d.significant, d.p_value < 0.05)
+        
+        ranked = comparison.ranked("q1")
+        self.assertEqual([r.variant for r in ranked], sorted(
+            ["V2", "execs"], key=lambda v: -comparison.delta(v, "q1").delta
+        ))
+        self.assertEqual({v for v, _ in comparison.leaderboard()}, {"V2", "execs"})
+    
+    def test_identical_configs_share_simulation(self):
+        from crowdwave_engine.variants import compare_variants
+        comparison = compare_variants(self.config, [f"Message {i}" for i in range(200)], self.questions)
+        self.assertIs(comparison.reports[0].results, comparison.reports[199].results)
+        self.assertEqual(comparison.reports[199].config.stimuli, ["Message 199"])
+        self.assertEqual(comparison.significant(), [])
+
+
+class TestScenarioSweep(unittest.TestCase):
+    """Test scenario grids simulated with shared phases."""
+    
+    def setUp(self):
+        self.engine = CrowdwaveEngine()
+        self.config = {"audience": "dog owners who love their pets", "sample_size": 800}
+        self.questions = [
+            {"id": "q1", "type": "scale", "text": "How much do you love your pet?", "scale": [1, 5]},
+            {"id": "q2", "type": "nps", "text": "How likely are you to recommend digital banking online?"},
+            {"id": "q3", "type": "binary", "text": "Do you support stricter immigration policy?",
+             "options": ["Yes", "No"]},
+            {"id": "q4", "type": "scale", "text": "How concerned are you about healthcare costs?"},
+        ]
+        self.axes = {
+            "generation": ["Gen Z", "Boomers"],
+            "party": ["Democrats", "Republicans"],
+            "topic": ["immigration", "climate policy"],
+            "stimuli": [[], "Ad copy"],
+            "geography": ["USA", "UK"],
+        }
+    
+    def test_matches_simulate(self):
+        from crowdwave_engine.scenarios import sweep
+        result = sweep(self.questions, self.axes, self.config, self.engine)
+        self.assertEqual(result.dims, ("generation", "party", "topic", "stimuli", "geography", "question", "option"))
+        self.assertEqual(result.distributions.shape[:6], (2, 2, 2, 2, 2, 4))
+        
+        for point in itertools.product(*self.axes.values()):
+            generation, party, topic, stimuli, geography = point
+            config = {
+                **self.config, "audience": f"{generation} {party} {self.config['audience']}",
+                "topic": topic, "stimuli": [stimuli] if stimuli else [], "geography": geography,
+            }
+            expected = self.engine.simulate(config, self.questions)
+            report = result.report(**dict(zip(self.axes, point)))
+            self.assertEqual(report.config, expected.config)
+            self.assertEqual(report.results, expected.results)
+            self.assertEqual(report.flags, expected.flags)
+            self.assertEqual(report.overall_confidence, expected.overall_confidence)
+        
+        # Geography and stimulus wording aren't simulated inputs
+        self.assertEqual(result.simulations, 16)
+    
+    def test_labeled_arrays(self):
+        from crowdwave_engine.scenarios import sweep
+        result = sweep(self.questions, self.axes, self.config, self.engine)
+        report = result.report(generation="Boomers", party="Democrats", topic="climate policy",
+                               stimuli="Ad copy", geography="UK")
+        
+        means = result.sel("means", party="Democrats", topic="climate policy")
+        self.assertEqual(means.shape, (2, 2, 2, 4))
+        self.assertEqual(means[1, 1, 1, 0], report.results[0].mean)
+        
+        q3 = result.sel(generation="Boomers", party="Democrats", topic="climate policy",
+                        stimuli="Ad copy", geography="UK", question="q3")
+        self.assertEqual(result.options[2], ["Yes", "No"])
+        np.testing.assert_array_equal(q3[:2], [report.results[2].distribution[o] for o in ["Yes", "No"]])
+        self.assertTrue(np.isnan(q3[2:]).all())
+        
+        with self.assertRaises(KeyError):
+            result.report(generation="Gen Z")
+        with self.assertRaises(ValueError):
+            sweep(self.questions, {"topic": []})
+
+
+class TestIncrementalSimulation(unittest.TestCase):
+    """Test per-survey incremental re-simulation."""
+    
+    def setUp(self):
+        from crowdwave_engine.incremental import IncrementalSimulator
+        self.engine = CrowdwaveEngine()
+        self.incremental = IncrementalSimulator(self.engine, max_surveys=2)
+        self.config = {"audience": "Dog owners who love their pets", "topic": "pet food"}
+        self.questions = [
+            {"id": "q1", "type": "scale", "text": "How much do you love your pet?", "scale": [1, 5]},
+            {"id": "q2", "type": "binary", "text": "Do you buy premium pet food?", "options": ["Yes", "No"]},
+            {"id": "q3", "type": "scale", "text": "How satisfied are you with your pet food?"},
+        ]
+    
+    def assertMatchesSimulate(self, update, config, questions):
+        expected = self.engine.simulate(config, questions)
+        self.assertEqual(update.report.results, expected.results)
+        self.assertEqual(update.report.flags, expected.flags)
+        self.assertEqual(update.report.priors_used, expected.priors_used)
+        self.assertEqual(update.report.overall_confidence, expected.overall_confidence)
+    
+    def test_recomputes_only_edited_questions(self):
+        first = self.incremental.simulate("s1", self.config, self.questions)
+        self.assertEqual(first.recomputed, ["q1", "q2", "q3"])
+        
+        questions = [dict(q) for q in self.questions]
+        questions[1]["text"] = "Would you pay more for organic pet food?"
+        questions.append({"id": "q4", "type": "binary", "text": "Do you have a dog?", "options": ["Yes", "No"]})
+        update = self.incremental.simulate("s1", self.config, questions)
+        self.assertEqual(update.recomputed, ["q2", "q4"])
+        self.assertIs(update.report.results[0], first.report.results[0])
+        self.assertMatchesSimulate(update, self.config, questions)
+        
+        # Sample size and stimulus wording aren't simulated inputs
+        config = {**self.config, "sample_size": 2000}
+        self.assertEqual(self.incremental.simulate("s1", config, questions).recomputed, [])
+    
+    def test_survey_level_changes_recompute_everything(self):
+        self.incremental.simulate("s1", self.config, self.questions)
+        for config, questions in [
+            ({**self.config, "stimuli": ["New bag design"]}, self.questions),
+            ({**self.config, "audience": "Boomers who love their pets"}, self.questions),
+            # An NPS question adds a prior, changing every question's confidence
+            (self.config, self.questions + [{"id": "q4", "type": "nps", "text": "Recommend this food?"}]),
+        ]:
+            update = self.incremental.simulate("s1", config, questions)
+            self.assertEqual(update.recomputed, [q["id"] for q in questions])
+            self.assertMatchesSimulate(update, config, questions)
+    
+    def test_keeps_most_recent_surveys(self):
+        for survey_id in ("s1", "s2", "s3"):
+            self.incremental.simulate(survey_id, self.config, self.questions)
+        self.assertEqual(len(self.incremental), 2)
+        self.assertNotIn("s1", self.incremental)
+        self.assertTrue(self.incremental.forget("s2"))
+        self.assertFalse(self.incremental.forget("s2"))
+
+
+class TestCompactResults(unittest.TestCase):
+    """Test the columnar result store."""
+    
+    def setUp(self):
+        engine = CrowdwaveEngine()
+        questions = [
+            {"id": "q1", "type": "scale", "text": "How much do you love your pet?", "scale": [1, 5]},
+            {"id": "q2", "type": "binary", "text": "Do you buy premium pet food?", "options": ["Yes", "No"]},
+            {"id": "q3", "type": "nps", "text": "Would you recommend your vet?"},
+        ]
+        self.reports = [
+            engine.simulate({"audience": audience}, questions)
+            for audience in ("Dog owners who love their pets", "US adults")
+        ]
+    
+    def test_round_trip(self):
+        from crowdwave_engine.compact import CompactResults
+        store = CompactResults.from_reports([self.reports[0], None, self.reports[1]])
+        self.assertEqual(len(store), 6)
+        self.assertEqual(len(store.option_sets), 3)
+        
+        originals = self.reports[0].results + self.reports[1].results
+        for compact, original in zip(store, originals):
+            result = compact.to_result()
+            self.assertEqual(list(result.distribution), list(original.distribution))
+            for option, value in original.distribution.items():
+                self.assertAlmostEqual(compact.distribution[option], value, places=4)
+            self.assertEqual(replace(result, distribution=original.distribution), original)
+        self.assertEqual([r.report for r in store], [0, 0, 0, 2, 2, 2])
+        self.assertIn("Yes", store[1].distribution)
+        self.assertEqual(store[-1].question_id, "q3")
+        
+        slim = CompactResults.from_reports(self.reports, slim=True)
+        self.assertEqual(slim[0].methodology_trace, {})
+        self.assertEqual(slim[0].biases_detected, self.reports[0].results[0].biases_detected)
+    
+    def test_columns(self):
+        from crowdwave_engine.compact import CompactResults
+        store = CompactResults.from_reports(self.reports)
+        np.testing.assert_array_equal(store.confidences(), [r.confidence for rep in self.reports for r in rep.results])
+        self.assertTrue(np.isnan(store.means()[1]))
+        
+        indices, matrix = store.distributions(store.option_sets.index(("Yes", "No")))
+        np.testing.assert_array_equal(indices, [1, 4])
+        np.testing.assert_allclose(matrix[1], list(self.reports[1].results[1].distribution.values()), atol=1e-5)
+        self.assertFalse(hasattr(self.reports[0].results[0], "__dict__"))
+
+
+class TestLazyExports(unittest.TestCase):
+    """Test that package-level names resolve on first access."""
+
+    def test_all_exports_resolve(self):
+        import crowdwave_engine
+        for name in crowdwave_engine.__all__:
+            self.assertIn(name, dir(crowdwave_engine))
+            getattr(crowdwave_engine, name)
+        self.assertIsInstance(crowdwave_engine.LLM_AVAILABLE, bool)
+        self.assertIsInstance(crowdwave_engine.CLIENT_AVAILABLE, bool)
+
+    def test_resolved_names_match_submodules(self):
+        import crowdwave_engine
+        from crowdwave_engine.batch import BatchProcessor
+        from crowdwave_engine.metrics import bootstrap_mean
+        self.assertIs(crowdwave_engine.BatchProcessor, BatchProcessor)
+        self.assertIs(crowdwave_engine.bootstrap_mean, bootstrap_mean)
+
+    def test_unknown_attribute(self):
+        import crowdwave_engine
+        with self.assertRaises(AttributeError):
+            crowdwave_engine.not_a_real_export
+
+
 if __name__ == "__main__":
     unittest.main()
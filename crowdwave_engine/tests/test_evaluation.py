@@ -7,6 +7,8 @@ import sys
 from pathlib import Path
 import tempfile
 import json
+import time
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -19,6 +21,12 @@ from crowdwave_engine.evaluation import (
     calculate_rmse,
     calculate_calibration_score,
 )
+from crowdwave_engine.evaluation_store import (
+    SQLiteEvaluationTracker,
+    migrate_json_to_sqlite,
+)
+from crowdwave_engine import metrics
+from crowdwave_engine.accuracy_report import AccuracyReporter, generate_current_report
 
 
 class TestEvaluationTracker(unittest.TestCase):
@@ -128,6 +136,319 @@ class TestEvaluationTracker(unittest.TestCase):
             os.unlink(path)
 
 
+class TestIndexedTracker(unittest.TestCase):
+    """Test id/zone/type indexes and incrementally maintained metrics."""
+    
+    def setUp(self):
+        self.tracker = EvaluationTracker()
+        for i in range(6):
+            self.tracker.record_prediction(
+                prediction_id=f"p_{i}",
+                question_type="scale" if i % 2 else "binary",
+                predicted_mean=3.0 + i * 0.1,
+                predicted_distribution={"1": 20, "2": 20, "3": 20, "4": 20, "5": 20},
+                accuracy_zone="HIGH" if i < 3 else "LOW"
+            )
+    
+    def test_secondary_indexes(self):
+        """Records should be retrievable by zone and question type."""
+        self.assertEqual(len(self.tracker.records_by_zone("HIGH")), 3)
+        self.assertEqual(len(self.tracker.records_by_type("scale")), 3)
+        self.assertEqual(self.tracker.records_by_zone("MEDIUM"), [])
+    
+    def test_incremental_metrics_match_recompute(self):
+        """Running sums should match a full recomputation."""
+        for i in range(6):
+            self.tracker.validate_prediction(
+                f"p_{i}",
+                actual_mean=3.2,
+                actual_distribution={"1": 10, "2": 20, "3": 30, "4": 25, "5": 15}
+            )
+        
+        metrics = self.tracker.get_metrics()
+        maes = [r.mae for r in self.tracker.records]
+        high = [r.mae for r in self.tracker.records_by_zone("HIGH")]
+        
+        self.assertEqual(metrics.validated_predictions, 6)
+        self.assertAlmostEqual(metrics.mean_mae, sum(maes) / len(maes))
+        self.assertAlmostEqual(metrics.accuracy_by_zone["HIGH"], sum(high) / len(high))
+        self.assertIn("binary", metrics.accuracy_by_type)
+    
+    def test_revalidation_does_not_double_count(self):
+        """Validating the same prediction twice should replace its contribution."""
+        self.tracker.validate_prediction("p_0", actual_mean=4.0)
+        self.tracker.validate_prediction("p_0", actual_mean=3.0)
+        
+        metrics = self.tracker.get_metrics()
+        self.assertEqual(metrics.validated_predictions, 1)
+        self.assertAlmostEqual(metrics.mean_mae, 0.0)
+    
+    def test_duplicate_id_replaces_record(self):
+        """Recording an existing id should replace the earlier record."""
+        self.tracker.validate_prediction("p_0", actual_mean=4.0)
+        self.tracker.record_prediction(
+            prediction_id="p_0",
+            question_type="nps",
+            predicted_mean=7.0,
+            predicted_distribution={},
+            accuracy_zone="MEDIUM"
+        )
+        
+        metrics = self.tracker.get_metrics()
+        self.assertEqual(metrics.total_predictions, 6)
+        self.assertEqual(metrics.validated_predictions, 0)
+        self.assertEqual(len(self.tracker.records_by_zone("HIGH")), 2)
+        self.assertEqual(len(self.tracker.records_by_type("nps")), 1)
+    
+    def test_unknown_id_returns_none(self):
+        """Validating an unknown id should return None."""
+        self.assertIsNone(self.tracker.validate_prediction("missing", actual_mean=3.0))
+
+
+class TestSQLiteEvaluationTracker(unittest.TestCase):
+    """Test the SQLite-backed tracker and JSON migration."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmpdir.name) / "evals.db")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _populate(self, tracker):
+        for i in range(10):
+            tracker.record_prediction(
+                prediction_id=f"p_{i}",
+                question_type="scale" if i % 2 else "binary",
+                predicted_mean=3.0 + i * 0.1,
+                predicted_distribution={"1": 20, "2": 20, "3": 20, "4": 20, "5": 20},
+                accuracy_zone="HIGH" if i < 5 else "LOW"
+            )
+            tracker.validate_prediction(
+                f"p_{i}",
+                actual_mean=3.4,
+                actual_distribution={"1": 10, "2": 20, "3": 30, "4": 25, "5": 15}
+            )
+    
+    def test_sql_metrics_match_in_memory(self):
+        """SQL aggregates should match the in-memory tracker."""
+        memory = EvaluationTracker()
+        self._populate(memory)
+        
+        with SQLiteEvaluationTracker(self.db_path, batch_size=3) as tracker:
+            self._populate(tracker)
+            sql_metrics = tracker.get_metrics()
+        
+        mem_metrics = memory.get_metrics()
+        self.assertEqual(sql_metrics.total_predictions, 10)
+        self.assertEqual(sql_metrics.validated_predictions, 10)
+        self.assertAlmostEqual(sql_metrics.mean_mae, mem_metrics.mean_mae)
+        self.assertAlmostEqual(sql_metrics.mean_brier, mem_metrics.mean_brier)
+        for zone, mae in mem_metrics.accuracy_by_zone.items():
+            self.assertAlmostEqual(sql_metrics.accuracy_by_zone[zone], mae)
+        for qtype, mae in mem_metrics.accuracy_by_type.items():
+            self.assertAlmostEqual(sql_metrics.accuracy_by_type[qtype], mae)
+    
+    def test_persists_across_connections(self):
+        """Records written by one tracker should be visible to another."""
+        with SQLiteEvaluationTracker(self.db_path) as tracker:
+            self._populate(tracker)
+        
+        with SQLiteEvaluationTracker(self.db_path) as reopened:
+            self.assertEqual(len(reopened.records), 10)
+            self.assertEqual(len(reopened.records_by_zone("HIGH")), 5)
+            self.assertIn("CROWDWAVE ACCURACY REPORT", reopened.generate_report())
+    
+    def test_revalidation_appends_latest_wins(self):
+        """Re-validating should count only the latest validation."""
+        with SQLiteEvaluationTracker(self.db_path) as tracker:
+            tracker.record_prediction("p", "scale", 3.0, {"1": 100})
+            tracker.validate_prediction("p", actual_mean=4.0)
+            tracker.flush()
+            tracker.validate_prediction("p", actual_mean=3.5)
+            
+            metrics = tracker.get_metrics()
+            self.assertEqual(metrics.validated_predictions, 1)
+            self.assertAlmostEqual(metrics.mean_mae, 0.5)
+            
+            rows = tracker._conn.execute("SELECT COUNT(*) FROM validations").fetchone()[0]
+            self.assertEqual(rows, 2)
+    
+    def test_pending_validation_visible_without_flush(self):
+        """Lookups see buffered validations without writing them."""
+        with SQLiteEvaluationTracker(self.db_path, batch_size=100) as tracker:
+            tracker.record_prediction("p", "scale", 3.0, {"1": 100})
+            tracker.flush()
+            tracker.validate_prediction("p", actual_mean=4.0, actual_distribution={"1": 100})
+            
+            record = tracker._find_record("p")
+            self.assertTrue(record.validated)
+            self.assertEqual(record.actual_distribution, {"1": 100})
+            self.assertAlmostEqual(record.mae, 1.0)
+            self.assertEqual(len(tracker._pending_validations), 1)
+    
+    def test_validation_cost_independent_of_history(self):
+        """Validating persisted predictions doesn't slow down as the table grows."""
+        def time_validations(n_predictions, n_validations=500):
+            path = str(Path(self.tmpdir.name) / f"evals_{n_predictions}.db")
+            with SQLiteEvaluationTracker(path) as tracker:
+                for i in range(n_predictions):
+                    tracker.record_prediction(f"p_{i}", "scale", 3.0, {"1": 100})
+                    tracker.validate_prediction(f"p_{i}", actual_mean=3.5)
+                tracker.flush()
+                start = time.perf_counter()
+                for i in range(n_validations):
+                    tracker.validate_prediction(f"p_{i}", actual_mean=4.0)
+                return time.perf_counter() - start
+        
+        small, large = time_validations(500), time_validations(8000)
+        # A full-table scan per validation would make `large` ~16x `small`
+        self.assertLess(large, small * 4 + 0.05)
+    
+    def test_migrate_from_json(self):
+        """JSON saved by EvaluationTracker should migrate to SQLite."""
+        json_path = str(Path(self.tmpdir.name) / "evals.json")
+        memory = EvaluationTracker()
+        self._populate(memory)
+        memory.record_prediction("unvalidated", "nps", 7.0, {"9": 100})
+        memory.save(json_path)
+        
+        migrated = migrate_json_to_sqlite(json_path, self.db_path)
+        self.assertEqual(migrated, 11)
+        
+        with SQLiteEvaluationTracker(self.db_path) as tracker:
+            metrics = tracker.get_metrics()
+            self.assertEqual(metrics.total_predictions, 11)
+            self.assertEqual(metrics.validated_predictions, 10)
+            self.assertAlmostEqual(metrics.mean_mae, memory.get_metrics().mean_mae)
+            self.assertFalse(tracker._find_record("unvalidated").validated)
+
+
+class TestVectorizedMetrics(unittest.TestCase):
+    """Test the NumPy metrics module and its bootstrap intervals."""
+    
+    def setUp(self):
+        self.tracker = EvaluationTracker()
+        for i in range(40):
+            self.tracker.record_prediction(
+                prediction_id=f"p_{i}",
+                question_type=("scale", "binary", "nps")[i % 3],
+                predicted_mean=3.0 + (i % 7) * 0.1,
+                predicted_distribution={"1": 10, "2": 20, "3": 40, "4": 20, "5": 10},
+                accuracy_zone="HIGH" if i < 20 else "LOW"
+            )
+            self.tracker.validate_prediction(
+                f"p_{i}",
+                actual_mean=3.3,
+                actual_distribution={"1": 5, "2": 25, "3": 30, "4": 30, "5": 10}
+            )
+    
+    def test_brier_matches_scalar(self):
+        """Vectorized Brier should match the per-record calculation."""
+        predicted = [{"1": 30, "2": 70}, {"yes": 40, "no": 60}, {}]
+        actual = [{"1": 50, "2": 40, "3": 10}, {"yes": 45, "no": 55}, {}]
+        scores = metrics.brier_scores(predicted, actual)
+        for score, p, a in zip(scores, predicted, actual):
+            self.assertAlmostEqual(score, self.tracker._calculate_brier(p, a))
+    
+    def test_group_means(self):
+        """Group means should match a manual split."""
+        means = metrics.group_means([1.0, 2.0, 3.0, 5.0], ["a", "b", "a", "b"])
+        self.assertEqual(means, {"a": 2.0, "b": 3.5})
+    
+    def test_bootstrap_interval_brackets_estimate(self):
+        """Bootstrap CI should contain the point estimate and be seedable."""
+        values = [0.1 * i for i in range(50)]
+        first = metrics.bootstrap_mean(values, n_resamples=500, seed=7)
+        second = metrics.bootstrap_mean(values, n_resamples=500, seed=7)
+        self.assertEqual(first, second)
+        self.assertLess(first.ci_low, first.value)
+        self.assertGreater(first.ci_high, first.value)
+        self.assertEqual(first.n, 50)
+    
+    def test_bootstrap_chunking_is_consistent(self):
+        """Chunked resampling should give valid intervals for any chunk size."""
+        original = metrics.MAX_BOOTSTRAP_CELLS
+        metrics.MAX_BOOTSTRAP_CELLS = 100
+        try:
+            groups = metrics.bootstrap_group_means(
+                [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], ["a", "b"] * 3,
+                n_resamples=300, seed=1
+            )
+        finally:
+            metrics.MAX_BOOTSTRAP_CELLS = original
+        self.assertAlmostEqual(groups["a"].value, 3.0)
+        self.assertLessEqual(groups["a"].ci_low, groups["a"].ci_high)
+    
+    def test_bootstrap_ece_chunks_bounded_by_pairs(self):
+        """ECE chunks expanded to one column per pair stay under the cell cap."""
+        original = metrics.MAX_BOOTSTRAP_CELLS, metrics._resample_weights
+        expanded = []
+        
+        def recording(n, n_resamples, rng, width=None):
+            for chunk in original[1](n, n_resamples, rng, width):
+                expanded.append(chunk.shape[0] * (width or n))
+                yield chunk
+        
+        metrics.MAX_BOOTSTRAP_CELLS, metrics._resample_weights = 100, recording
+        try:
+            estimate = metrics.bootstrap_ece(
+                [0.1, 0.2, 0.3, 0.4] * 5, [0.0, 0.5, 0.25, 0.25] * 5,
+                units=np.repeat(np.arange(5), 4), n_resamples=50, seed=1
+            )
+        finally:
+            metrics.MAX_BOOTSTRAP_CELLS, metrics._resample_weights = original
+        self.assertEqual(estimate.n, 5)
+        self.assertTrue(expanded)
+        self.assertLessEqual(max(expanded), 100)
+    
+    def test_tracker_confidence_intervals(self):
+        """get_metrics should attach CIs only when requested."""
+        plain = self.tracker.get_metrics()
+        self.assertIsNone(plain.mae_ci)
+        
+        with_ci = self.tracker.get_metrics(confidence_intervals=True, n_resamples=200, seed=3)
+        self.assertAlmostEqual(with_ci.mean_mae, plain.mean_mae)
+        low, high = with_ci.mae_ci
+        self.assertLessEqual(low, with_ci.mean_mae)
+        self.assertGreaterEqual(high, with_ci.mean_mae)
+        self.assertEqual(set(with_ci.accuracy_by_zone_ci), {"HIGH", "LOW"})
+        self.assertEqual(set(with_ci.accuracy_by_type_ci), {"scale", "binary", "nps"})
+        self.assertIsNotNone(with_ci.mean_ece)
+        self.assertIn("CI", self.tracker.generate_report(confidence_intervals=True))
+    
+    def test_accuracy_report_breakdown(self):
+        """AccuracyReporter should split MAE by question type with CIs."""
+        report = generate_current_report()
+        self.assertEqual(set(report.error_by_type), {"binary", "scale"})
+        self.assertIsNone(report.mae_ci)
+        
+        reporter = AccuracyReporter()
+        reporter.add_calibration("A", "binary", 40.0, 42.0, "src")
+        reporter.add_calibration("B", "binary", 50.0, 49.0, "src")
+        report = reporter.generate_report(confidence_intervals=True, n_resamples=100, seed=0)
+        self.assertIsNotNone(report.mae_ci)
+        self.assertIn("MAE (binary)", reporter.to_markdown(report))
+        self.assertIn("error_by_type_ci", reporter.to_json(report))
+    
+    def test_accuracy_report_zone_and_topic_breakdown(self):
+        """AccuracyReporter should also split MAE by zone and topic with CIs."""
+        reporter = AccuracyReporter()
+        reporter.add_calibration("Immigration", "binary", 40.0, 42.0, "src", accuracy_zone="HIGH")
+        reporter.add_calibration("Immigration", "binary", 50.0, 54.0, "src", accuracy_zone="HIGH")
+        reporter.add_calibration("Crypto", "binary", 30.0, 20.0, "src", accuracy_zone="LOW")
+        report = reporter.generate_report(confidence_intervals=True, n_resamples=100, seed=0)
+        
+        self.assertEqual(report.error_by_zone, {"HIGH": 3.0, "LOW": 10.0})
+        self.assertEqual(report.error_by_topic, {"Crypto": 10.0, "Immigration": 3.0})
+        low, high = report.error_by_topic_ci["Immigration"]
+        self.assertLessEqual(low, 3.0)
+        self.assertGreaterEqual(high, 3.0)
+        self.assertEqual(set(report.error_by_zone_ci), {"HIGH", "LOW"})
+        self.assertIn("MAE (zone HIGH)", reporter.to_markdown(report))
+        self.assertIn("error_by_topic_ci", reporter.to_json(report))
+
+
 class TestCalculationFunctions(unittest.TestCase):
     """Test standalone calculation functions."""
     
@@ -168,6 +489,14 @@ class TestCalculationFunctions(unittest.TestCase):
         score = calculate_calibration_score(predicted, actual)
         # Should be relatively low for roughly calibrated predictions
         self.assertLess(score, 0.5)
+    
+    def test_calibration_score_outcomes_by_truthiness(self):
+        """Outcomes count as 1.0/0.0 by truthiness, not as frequencies."""
+        self.assertEqual(
+            calculate_calibration_score([0.2, 0.8], [0.3, 0]),
+            calculate_calibration_score([0.2, 0.8], [True, False]),
+        )
+        self.assertAlmostEqual(calculate_calibration_score([0.2, 0.8], ["yes", None]), 0.8)
 
 
 class TestBrierScore(unittest.TestCase):
@@ -0,0 +1,262 @@
+"""
+Tests for Crowdwave telemetry and the /metrics endpoint.
+"""
+
+import asyncio
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from crowdwave_engine.telemetry import CACHE_REQUESTS, MetricsRegistry, record_cache, REGISTRY
+from crowdwave_engine.api import FASTAPI_AVAILABLE, CoalescingCache, payload_key
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test counters, gauges and histograms."""
+    
+    def setUp(self):
+        self.registry = MetricsRegistry()
+    
+    def test_counter_merges_threads(self):
+        """Increments from many threads should all be counted."""
+        counter = self.registry.counter("jobs_total", "Jobs.", ("kind",))
+        
+        def work():
+            for _ in range(1000):
+                counter.inc(kind="a")
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        self.assertEqual(counter.values()[("a",)], 4000)
+        self.assertIn('jobs_total{kind="a"} 4000', self.registry.render())
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Bucket counts should be cumulative with +Inf equal to count."""
+        histogram = self.registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+        
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("latency_seconds_count 3", text)
+    
+    def test_gauge_inc_dec_and_callback(self):
+        """Gauges track deltas or sample a callback."""
+        gauge = self.registry.gauge("in_flight", "In flight.")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        self.registry.gauge("depth", "Depth.", callback=lambda: 7)
+        
+        self.assertEqual(gauge.values()[()], 1)
+        self.assertIn("depth 7", self.registry.render())
+    
+    def test_cache_hit_ratio(self):
+        """Cache lookups should produce a derived hit ratio."""
+        for hit in (True, True, True, False):
+            record_cache("test_cache", hit)
+        self.assertIn('crowdwave_cache_hit_ratio{cache="test_cache"} 0.75', REGISTRY.render())
+
+
+class TestCoalescingCache(unittest.TestCase):
+    """Test single-flight request coalescing and the response cache."""
+    
+    def setUp(self):
+        self.calls = 0
+        self.cancelled = False
+    
+    async def compute(self, delay=0.05, fail=False):
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if fail:
+            raise ValueError("boom")
+        return {"call": self.calls}
+    
+    def result_hits(self):
+        return CACHE_REQUESTS.values().get(("result", "hit"), 0)
+    
+    def test_payload_key_is_canonical(self):
+        self.assertEqual(payload_key({"a": 1, "b": [1, 2]}), payload_key({"b": [1, 2], "a": 1}))
+        self.assertNotEqual(payload_key({"a": 1}), payload_key({"a": 2}))
+    
+    def test_concurrent_requests_share_one_computation(self):
+        cache = CoalescingCache(ttl=0.1)
+        hits = self.result_hits()
+        
+        async def run():
+            first = await asyncio.gather(*[cache.get("k", self.compute) for _ in range(5)])
+            cached = await cache.get("k", self.compute)
+            await asyncio.sleep(0.15)
+            expired = await cache.get("k", self.compute)
+            return first, cached, expired
+        
+        first, cached, expired = asyncio.run(run())
+        self.assertEqual(first, [{"call": 1}] * 5)
+        self.assertEqual(cached, {"call": 1})
+        self.assertEqual(expired, {"call": 2})
+        self.assertEqual(self.result_hits() - hits, 5)
+    
+    def test_timeouts_and_cancellation(self):
+        cache = CoalescingCache(ttl=0)
+        
+        async def run():
+            # One caller timing out leaves the shared computation running
+            impatient = cache.get("k", self.compute, timeout=0.01)
+            patient = cache.get("k", self.compute)
+            outcomes = await asyncio.gather(impatient, patient, return_exceptions=True)
+            self.assertFalse(self.cancelled)
+            
+            # Once every caller has gone, the computation is cancelled
+            waiter = asyncio.ensure_future(cache.get("k", self.compute))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.sleep(0.01)
+            return outcomes
+        
+        impatient, patient = asyncio.run(run())
+        self.assertIsInstance(impatient, asyncio.TimeoutError)
+        self.assertEqual(patient, {"call": 1})
+        self.assertTrue(self.cancelled)
+        self.assertEqual(len(cache), 0)
+    
+    def test_failures_are_not_cached(self):
+        cache = CoalescingCache(ttl=10)
+        
+        async def run():
+            failed = await asyncio.gather(
+                *[cache.get("k", lambda: self.compute(fail=True)) for _ in range(2)], return_exceptions=True
+            )
+            return failed, await cache.get("k", self.compute)
+        
+        failed, retried = asyncio.run(run())
+        self.assertTrue(all(isinstance(f, ValueError) for f in failed))
+        self.assertEqual(retried, {"call": 2})
+
+
+@unittest.skipUnless(FASTAPI_AVAILABLE, "FastAPI not installed")
+class TestMetricsEndpoint(unittest.TestCase):
+    """Test the API /metrics endpoint."""
+    
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        from crowdwave_engine.api import create_app
+        self.client = TestClient(create_app())
+    
+    def test_metrics_after_simulation(self):
+        """Route latency, status counts and phase timings are exported."""
+        response = self.client.post("/simulate", json={
+            "config": {"audience": "US adults"},
+            "questions": [{"id": "Q1", "text": "How satisfied are you?", "type": "scale",
+                           "scale": [1, 5]}],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.client.get("/calibrations/unknown")
+        
+        text = self.client.get("/metrics").text
+        self.assertIn('crowdwave_http_request_duration_seconds_count{method="POST",route="/simulate"} 1', text)
+        self.assertIn('route="/calibrations/{category}",status="404"', text)
+        self.assertIn("crowdwave_simulations_in_flight 0", text)
+        self.assertIn("crowdwave_simulation_queue_depth 0", text)
+        self.assertIn('crowdwave_simulation_phase_calls_total{phase="ensemble"} 1', text)
+        self.assertIn("crowdwave_llm_request_duration_seconds", text)
+
+    
+    def test_incremental_simulation(self):
+        """Survey re-runs report the recomputed questions."""
+        request = {
+            "config": {"audience": "US adults"},
+            "questions": [
+                {"id": "Q1", "text": "How satisfied are you?", "type": "scale", "scale": [1, 5]},
+                {"id": "Q2", "text": "Do you shop online?", "type": "binary", "options": ["Yes", "No"]},
+            ],
+        }
+        first = self.client.post("/surveys/s1/simulate", json=request).json()
+        self.assertEqual(first["recomputed"], ["Q1", "Q2"])
+        
+        request["questions"][1]["text"] = "Do you shop in stores?"
+        update = self.client.post("/surveys/s1/simulate", json=request).json()
+        self.assertEqual(update["recomputed"], ["Q2"])
+        self.assertEqual(update["results"][0], first["results"][0])
+        self.assertEqual(update["results"], self.client.post("/simulate", json=request).json()["results"])
+        
+        self.assertEqual(self.client.delete("/surveys/s1").status_code, 200)
+        self.assertEqual(self.client.delete("/surveys/s1").status_code, 404)
+    
+    def test_simulate_reuses_responses(self):
+        """Repeated identical payloads are served from the result cache; timeouts give 504."""
+        request = {
+            "config": {"audience": "US adults", "topic": "streaming"},
+            "questions": [{"id": "Q1", "text": "How satisfied are you?", "type": "scale", "scale": [1, 5]}],
+        }
+        first = self.client.post("/simulate", json=request).json()
+        self.assertEqual(self.client.post("/simulate", json=request).json(), first)
+        text = self.client.get("/metrics").text
+        self.assertIn('crowdwave_simulation_phase_calls_total{phase="ensemble"} 1', text)
+        
+        request["config"]["topic"] = "news"
+        self.assertEqual(self.client.post("/simulate", json={**request, "timeout": 1e-9}).status_code, 504)
+
+    
+    def test_timeouts_keep_concurrency_bound(self):
+        """Timed-out simulations hold their worker slot until the thread finishes."""
+        import httpx
+        from unittest import mock
+        from crowdwave_engine.api import create_app
+        from crowdwave_engine.crowdwave import CrowdwaveEngine
+        
+        app = create_app(max_concurrent_simulations=1)
+        running, peak = [0], [0]
+        lock = threading.Lock()
+        
+        def slow_simulate(engine, config, questions):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.2)
+            with lock:
+                running[0] -= 1
+            return report
+        
+        report = CrowdwaveEngine().simulate({"audience": "US adults"}, [{"id": "Q1", "text": "Happy?"}])
+        
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                requests = [
+                    client.post("/simulate", json={
+                        "config": {"audience": "US adults", "topic": f"topic {i}"},
+                        "questions": [{"id": "Q1", "text": "Happy?", "type": "scale"}],
+                        "timeout": 0.05,
+                    })
+                    for i in range(4)
+                ]
+                statuses = [r.status_code for r in await asyncio.gather(*requests)]
+                during = (await client.get("/metrics")).text
+                await asyncio.sleep(0.3)
+                after = (await client.get("/metrics")).text
+                return statuses, during, after
+        
+        with mock.patch.object(CrowdwaveEngine, "simulate", slow_simulate):
+            statuses, during, after = asyncio.run(run())
+        self.assertEqual(statuses, [504] * 4)
+        self.assertEqual(peak[0], 1)
+        self.assertIn("crowdwave_simulations_in_flight 1", during)
+        self.assertIn("crowdwave_simulations_in_flight 0", after)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+"""
+Crowdwave Variant Comparison
+Simulate one questionnaire for many message variants (A/B creative tests,
+automated copy-testing sweeps) and rank each variant's difference from a
+baseline with a significance test at the survey's sample size.
+
+Usage:
+    comparison = compare_variants(
+        {"audience": "Market researchers on LinkedIn", "sample_size": 500},
+        ["Post A: founder story ...", "Post B: demo results ..."],
+        questions,
+    )
+    comparison.ranked("q1_hook")     # variants by delta on one question
+    comparison.leaderboard()         # variants by mean z across questions
+"""
+
+import math
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .crowdwave import CrowdwaveEngine, Question, SimulationReport
+
+
+# ═══════════════════════════════════════════════════════════════
+# RESULTS
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class VariantDelta:
+    """One variant's difference from the baseline on one question."""
+    variant: str
+    question_id: str
+    metric: str
+    value: float
+    baseline: float
+    delta: float
+    z: float
+    p_value: float
+    significant: bool
+
+
+@dataclass
+class VariantComparison:
+    """
+    Every variant × question metric with its delta from the baseline
+    variant, as variants × questions arrays.
+
+    The metric is the share choosing the first listed option for binary
+    and multiple-choice questions, the mean for scale questions and the
+    NPS score for NPS questions. z and p_value are a two-sided
+    two-sample z-test with each variant's sample_size respondents.
+    """
+    variants: List[str]
+    baseline: str
+    question_ids: List[str]
+    metrics: List[str]
+    values: np.ndarray
+    deltas: np.ndarray
+    z: np.ndarray
+    p_values: np.ndarray
+    reports: List[SimulationReport] = field(repr=False)
+    alpha: float = 0.05
+
+    def delta(self, variant: str, question_id: str) -> VariantDelta:
+        i = self.variants.index(variant)
+        j = self.question_ids.index(question_id)
+        return VariantDelta(
+            variant=variant,
+            question_id=question_id,
+            metric=self.metrics[j],
+            value=float(self.values[i, j]),
+            baseline=float(self.values[self.variants.index(self.baseline), j]),
+            delta=float(self.deltas[i, j]),
+            z=float(self.z[i, j]),
+            p_value=float(self.p_values[i, j]),
+            significant=bool(self.p_values[i, j] < self.alpha),
+        )
+
+    def ranked(self, question_id: str) -> List[VariantDelta]:
+        """Non-baseline variants on one question, largest delta first."""
+        j = self.question_ids.index(question_id)
+        order = np.argsort(-self.deltas[:, j], kind="stable")
+        return [
+            self.delta(self.variants[i], question_id)
+            for i in order if self.variants[i] != self.baseline
+        ]
+
+    def significant(self) -> List[VariantDelta]:
+        """Every significant variant × question delta, largest |z| first."""
+        rows, cols = np.nonzero(self.p_values < self.alpha)
+        order = np.argsort(-np.abs(self.z[rows, cols]), kind="stable")
+        return [self.delta(self.variants[rows[k]], self.question_ids[cols[k]]) for k in order]
+
+    def leaderboard(self) -> List[Tuple[str, float]]:
+        """
+        Non-baseline variants by mean z across questions (each clipped to
+        ±10), best first. This treats a higher metric as better on every
+        question.
+        """
+        z = np.clip(self.z, -10.0, 10.0)
+        scored = ~np.isnan(z)
+        counts = scored.sum(axis=1)
+        scores = np.where(scored, z, 0.0).sum(axis=1) / np.maximum(counts, 1)
+        order = np.argsort(-scores, kind="stable")
+        return [
+            (self.variants[i], float(scores[i]))
+            for i in order if self.variants[i] != self.baseline
+        ]
+
+
+# ═══════════════════════════════════════════════════════════════
+# COMPARISON
+# ═══════════════════════════════════════════════════════════════
+
+def _simulation_key(config: Dict[str, Any]) -> Tuple[str, str, bool]:
+    """
+    The config values simulated distributions depend on. Stimuli only
+    matter by presence (the signal-forward ensemble run), so variants
+    agreeing on these share one simulation.
+    """
+    return (
+        config.get("audience", "General population"),
+        config.get("topic", ""),
+        bool(config.get("stimuli")),
+    )
+
+
+def _variant_config(config: Dict[str, Any], variant: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """A variant's full config: a message is added to the stimuli; dict keys override config."""
+    if isinstance(variant, str):
+        variant = {"message": variant}
+    overrides = {key: value for key, value in variant.items() if key not in ("name", "message")}
+    merged = {**config, **overrides}
+    if variant.get("message"):
+        merged["stimuli"] = list(merged.get("stimuli", [])) + [variant["message"]]
+    return merged
+
+
+def _question_metrics(
+    report: SimulationReport,
+    questions: Sequence[Question]
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """(metric names, values, per-respondent variances) for each question of a report."""
+    names, values, variances = [], [], []
+    for question, result in zip(questions, report.results):
+        distribution = result.distribution
+        if question.type == "nps" and distribution:
+            promoters = (distribution.get("9", 0.0) + distribution.get("10", 0.0)) / 100
+            detractors = sum(distribution.get(str(k), 0.0) for k in range(7)) / 100
+            names.append("nps")
+            values.append(100 * (promoters - detractors))
+            variances.append(1e4 * (promoters + detractors - (promoters - detractors) ** 2))
+        elif question.type == "scale" and result.mean is not None:
+            names.append("mean")
+            values.append(result.mean)
+            variances.append(result.sd ** 2)
+        elif distribution:
+            option, share = next(iter(distribution.items()))
+            names.append(f"% {option}")
+            values.append(share)
+            variances.append(share * (100.0 - share))
+        else:
+            names.append("")
+            values.append(np.nan)
+            variances.append(np.nan)
+    return names, np.array(values, dtype=float), np.array(variances, dtype=float)
+
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+
+def compare_variants(
+    config: Dict[str, Any],
+    variants: Sequence[Union[str, Dict[str, Any]]],
+    questions: List[Dict[str, Any]],
+    engine: Optional[CrowdwaveEngine] = None,
+    baseline: Union[int, str] = 0,
+    alpha: float = 0.05,
+) -> VariantComparison:
+    """
+    Simulate every variant of a message against the same questions and
+    compare each with the baseline.
+
+    Args:
+        config: Survey configuration shared by every variant
+        variants: Message texts (added to the config's stimuli), or dicts
+            with an optional "name", an optional "message" and config keys
+            to override (audience, topic, sample_size, ...)
+        questions: List of question dicts
+        engine: Engine to simulate with (default: a new CrowdwaveEngine)
+        baseline: Index or name of the variant the others are compared to
+        alpha: Significance level
+
+    The questionnaire is compiled once, and variants that agree on
+    everything the simulation reads (audience, topic, whether stimuli are
+    present) share one simulation, so sweeps over thousands of variants
+    cost one simulation per distinct configuration. Each variant's report
+    carries its own config but shares result objects with such variants.
+    """
+    if not variants:
+        raise ValueError("compare_variants needs at least one variant")
+    engine = engine or CrowdwaveEngine()
+    compiled = engine.compile(questions, config)
+
+    names = []
+    configs = []
+    for i, variant in enumerate(variants):
+        name = variant.get("name") if isinstance(variant, dict) else None
+        names.append(name or f"V{i + 1}")
+        configs.append(_variant_config(config, variant))
+    if len(set(names)) != len(names):
+        raise ValueError("Variant names must be unique")
+    baseline_index = names.index(baseline) if isinstance(baseline, str) else baseline
+
+    # One simulation per distinct configuration
+    unique: Dict[Tuple[str, str, bool], int] = {}
+    simulated = []
+    index = np.empty(len(configs), dtype=np.intp)
+    for i, variant_config in enumerate(configs):
+        key = _simulation_key(variant_config)
+        if key not in unique:
+            unique[key] = len(simulated)
+            simulated.append(compiled.simulate(variant_config))
+        index[i] = unique[key]
+
+    metrics = [_question_metrics(report, compiled.questions) for report in simulated]
+    metric_names = metrics[0][0]
+    values = np.stack([m[1] for m in metrics])[index]
+    variances = np.stack([m[2] for m in metrics])[index]
+    n = np.array([c.get("sample_size", 500) for c in configs], dtype=float)[:, None]
+
+    deltas = values - values[baseline_index]
+    standard_error = np.sqrt(variances / n + variances[baseline_index] / n[baseline_index])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(standard_error > 0, deltas / standard_error, np.where(deltas == 0, 0.0, np.inf * np.sign(deltas)))
+    p_values = _erfc(np.abs(z) / math.sqrt(2)).astype(float)
+
+    reports = [
+        replace(simulated[u], config=engine._parse_config(c))
+        for u, c in zip(index.tolist(), configs)
+    ]
+    return VariantComparison(
+        variants=names,
+        baseline=names[baseline_index],
+        question_ids=[question.id for question in compiled.questions],
+        metrics=metric_names,
+        values=values,
+        deltas=deltas,
+        z=z,
+        p_values=p_values,
+        reports=reports,
+        alpha=alpha,
+    )
@@ -11,6 +11,7 @@ sys.stdout.reconfigure(encoding='utf-8') if hasattr(sys.stdout, 'reconfigure') e
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from crowdwave_engine.crowdwave import CrowdwaveEngine
+from crowdwave_engine.variants import compare_variants
 
 engine = CrowdwaveEngine()
 
@@ -110,10 +111,17 @@ segment_question = [{
     "options": ["Yes, interested", "No, not interested"]
 }]
 
-for segment_name, segment_config in segments:
-    result = engine.simulate(segment_config, segment_question)
+comparison = compare_variants(
+    config,
+    [{"name": segment_name, **segment_config} for segment_name, segment_config in segments],
+    segment_question,
+    engine=engine,
+)
+for segment_name, result in zip(comparison.variants, comparison.reports):
     print(f"\n[SEGMENT] {segment_name}")
     for opt, pct in result.results[0].distribution.items():
         print(f"   {opt}: {pct:.1f}%")
+for d in comparison.ranked("interest"):
+    print(f"   {d.variant} vs {comparison.baseline}: {d.delta:+.1f} pts (p={d.p_value:.3f})")
 
 print('\n' + '='*60)
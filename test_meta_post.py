@@ -8,6 +8,7 @@ sys.stdout.reconfigure(encoding='utf-8') if hasattr(sys.stdout, 'reconfigure') e
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from crowdwave_engine.crowdwave import CrowdwaveEngine
+from crowdwave_engine.variants import compare_variants
 
 engine = CrowdwaveEngine()
 
@@ -112,8 +113,13 @@ segment_questions = [
     }
 ]
 
-for segment_name, segment_config in segments:
-    result = engine.simulate(segment_config, segment_questions)
+comparison = compare_variants(
+    config,
+    [{"name": segment_name, **segment_config} for segment_name, segment_config in segments],
+    segment_questions,
+    engine=engine,
+)
+for segment_name, result in zip(comparison.variants, comparison.reports):
     print(f"\n[SEGMENT] {segment_name}")
     for qr in result.results:
         print(f"   {qr.question_text[:40]}...")